@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+#======================================================================================\
+#================= scripts/benchmarks/batch_engine_benchmark.py ==================\
+#======================================================================================\
+"""
+Batch Engine Throughput: per-particle loop vs vectorized engine
+
+Measures the throughput of ``simulate_system_batch`` for the two integration
+backends on the PSO workload (classical SMC on the simplified DIP plant) and
+reports particle-steps per second.  The vectorized engine is warmed up once
+before timing so JIT compilation is excluded.
+
+Usage:
+    python scripts/benchmarks/batch_engine_benchmark.py
+    python scripts/benchmarks/batch_engine_benchmark.py --particles 10 40 160 --sim-time 5.0
+
+Output:
+    Console table with wall time and particle-steps/sec per engine, and the
+    speedup of the vectorized engine over the loop.
+"""
+
+import argparse
+import time
+import warnings
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+from src.simulation.engines.vector_sim import simulate_system_batch
+
+
+def make_factory():
+    """Classical SMC factory sharing one simplified plant."""
+    dynamics = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+
+    def factory(gains):
+        ctrl = ClassicalSMC(gains, max_force=150.0, boundary_layer=0.02)
+        ctrl.dynamics_model = dynamics
+        return ctrl
+    return factory
+
+
+def time_engine(engine, particles, sim_time, dt, repeats):
+    """Return the best wall time over ``repeats`` runs."""
+    factory = make_factory()
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            simulate_system_batch(
+                controller_factory=factory,
+                particles=particles,
+                sim_time=sim_time,
+                dt=dt,
+                initial_state=[0.0, 0.1, -0.05, 0.0, 0.0, 0.0],
+                engine=engine,
+            )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark simulate_system_batch engines")
+    parser.add_argument("--particles", type=int, nargs="+", default=[10, 40, 160])
+    parser.add_argument("--sim-time", type=float, default=2.0)
+    parser.add_argument("--dt", type=float, default=0.001)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    steps = int(round(args.sim_time / args.dt))
+
+    # Warm up the JIT so compilation is not timed
+    time_engine("vectorized", np.array([[10, 8, 15, 12, 50, 5]], dtype=float), args.dt * 2, args.dt, 1)
+
+    print(f"{'B':>6} {'engine':>11} {'time [s]':>10} {'particle-steps/s':>18} {'speedup':>8}")
+    for n in args.particles:
+        particles = np.abs(rng.normal([10, 8, 15, 12, 50, 5], [2, 2, 3, 3, 10, 1], size=(n, 6)))
+        t_loop = time_engine("loop", particles, args.sim_time, args.dt, args.repeats)
+        t_vec = time_engine("vectorized", particles, args.sim_time, args.dt, args.repeats)
+        work = n * steps
+        print(f"{n:>6} {'loop':>11} {t_loop:>10.4f} {work / t_loop:>18.3e} {'':>8}")
+        print(f"{n:>6} {'vectorized':>11} {t_vec:>10.4f} {work / t_vec:>18.3e} {t_loop / t_vec:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
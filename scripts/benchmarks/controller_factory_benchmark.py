@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#======================================================================================\
+#=============== scripts/benchmarks/controller_factory_benchmark.py ===============\
+#======================================================================================\
+"""
+Controller Construction Throughput: create_controller vs PreparedControllerFactory
+
+Builds one controller per gain vector (as PSO does for every particle) with
+``create_controller(controller_type, config, gains)`` and with a
+``PreparedControllerFactory`` built once per run.  Gain vectors are drawn
+uniformly from the registry PSO bounds; STA vectors are sorted so K1 > K2.
+
+Usage:
+    python scripts/benchmarks/controller_factory_benchmark.py
+    python scripts/benchmarks/controller_factory_benchmark.py --n-gains 10000 --threads 4
+
+Output:
+    Console table with controllers per second for each path and the speedup
+    of the prepared factory.  With ``--threads`` the gain vectors are split
+    across a thread pool, which exposes contention on the factory lock.
+"""
+
+import argparse
+import logging
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.config import load_config
+from src.controllers.factory import (
+    PreparedControllerFactory,
+    create_controller,
+    get_gain_bounds_for_pso,
+)
+
+
+CONTROLLERS = ("classical_smc", "sta_smc", "adaptive_smc", "hybrid_adaptive_sta_smc")
+
+
+def sample_gains(controller_type, n, seed=0):
+    """Draw ``n`` valid gain vectors from the PSO bounds."""
+    lower, upper = get_gain_bounds_for_pso(controller_type)
+    gains = np.random.default_rng(seed).uniform(lower, upper, size=(n, len(lower)))
+    if controller_type == "sta_smc":
+        gains[:, :2] = np.sort(gains[:, :2], axis=1)[:, ::-1]
+    return gains
+
+
+def throughput(build, gains, threads):
+    """Return controllers built per second."""
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(build, gains, chunksize=max(1, len(gains) // (4 * threads))))
+    else:
+        for g in gains:
+            build(g)
+    return len(gains) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark controller construction throughput")
+    parser.add_argument("--n-gains", type=int, default=10000)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--config", default=str(REPO_ROOT / "config.yaml"))
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    config = load_config(args.config)
+
+    print(f"{args.n_gains} gain vectors, {args.threads} thread(s)")
+    print(f"{'controller':<26}{'create/s':>12}{'prepared/s':>12}{'speedup':>10}")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for controller_type in CONTROLLERS:
+            gains = sample_gains(controller_type, args.n_gains)
+
+            def direct(g, controller_type=controller_type):
+                return create_controller(controller_type, config, g)
+
+            prepared = PreparedControllerFactory(controller_type, config)
+            direct(gains[0]), prepared(gains[0])  # warm-up
+            base = throughput(direct, gains, args.threads)
+            fast = throughput(prepared, gains, args.threads)
+            print(f"{controller_type:<26}{base:>12.0f}{fast:>12.0f}{fast / base:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+#======================================================================================\\\
+#=================== scripts/benchmarks/mpc_condensed_benchmark.py ====================\\\
+#======================================================================================\\\
+"""
+MPC Solve Latency: sparse (X, U) QP with OSQP vs condensed QP with active set
+
+For each horizon, two ``MPCController`` instances are queried on the same
+sequence of states, a decaying oscillation about upright that keeps every
+QP feasible:
+
+- ``sparse``:    ``formulation="sparse"`` (parametric CVXPY problem, warm OSQP)
+- ``condensed``: ``formulation="condensed"`` (dense N-variable QP, cached
+  Hessian factorization, built-in active-set solver)
+
+The plant is the linearized upright model of ``mpc_latency_benchmark.py``
+with an analytic Jacobian, so the discrete model is identical at every step
+and the condensed QP is factorized once per controller.  The controller
+predicts in absolute coordinates, so upright is not a fixed point of its
+model; with the default limits the long horizons (N >= 30) are infeasible
+and both formulations fall back.  ``--state-limit`` (default 100) widens the
+cart and angle limits so every horizon yields a feasible QP; the input
+bounds stay at their defaults.
+
+Usage:
+    python scripts/benchmarks/mpc_condensed_benchmark.py
+    python scripts/benchmarks/mpc_condensed_benchmark.py --horizons 10 20 50 --steps 300
+
+Output:
+    Console table with p50/p99 per-step latency of both formulations, the
+    p50 speedup, the largest control difference (OSQP tolerance) and the
+    number of Hessian factorizations of the condensed controller.
+"""
+
+import argparse
+import logging
+import time
+import warnings
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.controllers.mpc.mpc_controller import MPCController
+
+
+class LinearizedUprightPlant:
+    """Double inverted pendulum linearized around upright, with its Jacobian."""
+
+    g, l1, l2, m1, m2, M = 9.81, 0.5, 0.5, 0.1, 0.1, 1.0
+
+    def f(self, x, u):
+        xdot = np.zeros(6)
+        xdot[:3] = x[3:]
+        xdot[3] = u / self.M - (self.m1 + self.m2) * self.g * (x[1] - np.pi) / self.M
+        xdot[4] = self.g / self.l1 * (x[1] - np.pi) + u / (self.M * self.l1)
+        xdot[5] = self.g / self.l2 * (x[2] - np.pi) + u / (self.M * self.l2)
+        return xdot
+
+    def compute_jacobian(self, x, u):
+        A = np.zeros((6, 6))
+        A[:3, 3:] = np.eye(3)
+        A[3, 1] = -(self.m1 + self.m2) * self.g / self.M
+        A[4, 1] = self.g / self.l1
+        A[5, 2] = self.g / self.l2
+        B = np.array([0.0, 0.0, 0.0, 1.0 / self.M, 1.0 / (self.M * self.l1), 1.0 / (self.M * self.l2)])
+        return A, B
+
+
+def state_sequence(steps, dt):
+    """Decaying oscillation about upright (x = [0, pi, pi, 0, 0, 0])."""
+    t = np.arange(steps) * dt
+    decay = np.exp(-t / 2.0)
+    x = np.zeros((steps, 6))
+    x[:, 0] = 0.3 * decay * np.sin(1.5 * t)
+    x[:, 1] = np.pi + 0.08 * decay * np.cos(3.0 * t)
+    x[:, 2] = np.pi - 0.05 * decay * np.cos(2.5 * t)
+    x[:, 3] = 0.45 * decay * np.cos(1.5 * t)
+    x[:, 4] = -0.24 * decay * np.sin(3.0 * t)
+    x[:, 5] = 0.125 * decay * np.sin(2.5 * t)
+    return x
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sparse vs condensed MPC solves")
+    parser.add_argument("--horizons", type=int, nargs="+", default=[10, 20, 30, 40, 50])
+    parser.add_argument("--dt", type=float, default=0.02)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--state-limit", type=float, default=100.0,
+                        help="max_cart_pos and max_theta_dev of both controllers")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    logging.disable(logging.WARNING)
+    plant = LinearizedUprightPlant()
+    states = state_sequence(args.steps, args.dt)
+
+    print(f"dt={args.dt}  steps={args.steps}  state limit={args.state_limit}  "
+          f"(latency in ms, first call excluded)")
+    print(f"{'N':>4} {'sparse p50':>11} {'p99':>7} {'condensed p50':>14} {'p99':>7} "
+          f"{'speedup':>8} {'max |du|':>9} {'factorizations':>15}")
+    for N in args.horizons:
+        controllers = {
+            name: MPCController(plant, horizon=N, dt=args.dt, formulation=name,
+                                max_cart_pos=args.state_limit, max_theta_dev=args.state_limit)
+            for name in ("sparse", "condensed")
+        }
+        latency = {name: np.empty(args.steps) for name in controllers}
+        controls = {name: np.empty(args.steps) for name in controllers}
+        for k, x in enumerate(states):
+            for name, mpc in controllers.items():
+                start = time.perf_counter()
+                controls[name][k] = mpc.compute_control(k * args.dt, x)
+                latency[name][k] = (time.perf_counter() - start) * 1e3
+
+        sp, co = latency["sparse"][1:], latency["condensed"][1:]
+        du = np.max(np.abs(controls["sparse"] - controls["condensed"]))
+        print(f"{N:>4} {np.percentile(sp, 50):>11.2f} {np.percentile(sp, 99):>7.2f} "
+              f"{np.percentile(co, 50):>14.3f} {np.percentile(co, 99):>7.3f} "
+              f"{np.percentile(sp, 50) / np.percentile(co, 50):>7.1f}x {du:>9.1e} "
+              f"{controllers['condensed'].qp_factorizations:>15d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+#======================================================================================\
+#================= scripts/benchmarks/mpc_latency_benchmark.py ================\
+#======================================================================================\
+"""
+MPC Latency: parametric QP vs per-step problem rebuild vs explicit MPC
+
+Runs a closed-loop recovery from a tilted initial state with
+``MPCController(reuse_problem=True)`` (QP built once, parameters updated
+each step, warm-started OSQP), ``reuse_problem=False`` (objective and
+constraints rebuilt on every call) and ``explicit_mpc=True`` (offline region
+table, online point location), and reports the p50/p99/max latency of
+``compute_control``.  The first call of each controller is reported
+separately because it includes the one-off CVXPY canonicalization, or the
+explicit table load/build.  The explicit table is persisted to
+``--explicit-table`` (default: the system temp directory) and reloaded
+on later runs.
+
+The plant is the linearized upright model used by the MPC unit tests
+(angles measured from the hanging position, upright at ``theta = pi``), so
+every step solves a feasible QP and both modes see identical problems.
+
+Usage:
+    python scripts/benchmarks/mpc_latency_benchmark.py
+    python scripts/benchmarks/mpc_latency_benchmark.py --horizon 30 --steps 500
+    python scripts/benchmarks/mpc_latency_benchmark.py --explicit-table /tmp/mpc_table.npz
+
+Output:
+    Console table with per-step latency percentiles in milliseconds, the
+    largest control difference between the two online modes and the share of
+    explicit steps answered by the table.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+import warnings
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.controllers.mpc.mpc_controller import MPCController
+
+
+class LinearizedUprightPlant:
+    """Double inverted pendulum linearized around the upright position."""
+
+    g, l1, l2, m1, m2, M = 9.81, 0.5, 0.5, 0.1, 0.1, 1.0
+
+    def f(self, x, u):
+        xdot = np.zeros(6)
+        xdot[:3] = x[3:]
+        xdot[3] = u / self.M - (self.m1 + self.m2) * self.g * (x[1] - np.pi) / self.M
+        xdot[4] = self.g / self.l1 * (x[1] - np.pi) + u / (self.M * self.l1)
+        xdot[5] = self.g / self.l2 * (x[2] - np.pi) + u / (self.M * self.l2)
+        return xdot
+
+
+def run_closed_loop(mpc_kwargs, args):
+    plant = LinearizedUprightPlant()
+    mpc = MPCController(plant, horizon=args.horizon, dt=args.dt, **mpc_kwargs)
+    x = np.array([0.0, np.pi + 0.05, np.pi - 0.03, 0.0, 0.0, 0.0])
+    latencies = np.empty(args.steps)
+    controls = np.empty(args.steps)
+    for k in range(args.steps):
+        start = time.perf_counter()
+        u = mpc.compute_control(k * args.dt, x)
+        latencies[k] = time.perf_counter() - start
+        controls[k] = u
+        x = x + args.dt * plant.f(x, u)
+    return latencies * 1e3, controls, mpc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MPC per-step latency")
+    parser.add_argument("--horizon", type=int, default=20)
+    parser.add_argument("--dt", type=float, default=0.02)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--explicit-table",
+                        default=str(Path(tempfile.gettempdir()) / "mpc_explicit_table.npz"),
+                        help="Region table cache (default: system temp directory)")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    logging.getLogger("src.controllers.mpc.mpc_controller").setLevel(logging.ERROR)
+
+    modes = {
+        "parametric": dict(reuse_problem=True),
+        "rebuild": dict(reuse_problem=False),
+        "explicit": dict(explicit_mpc=True, explicit_table_path=args.explicit_table),
+    }
+    results = {label: run_closed_loop(kwargs, args) for label, kwargs in modes.items()}
+
+    print(f"horizon={args.horizon}  dt={args.dt}  steps={args.steps}")
+    print(f"{'mode':>11} {'first [ms]':>11} {'p50 [ms]':>9} {'p99 [ms]':>9} {'max [ms]':>9}")
+    for label, (lat, _, _) in results.items():
+        steady = lat[1:]
+        print(f"{label:>11} {lat[0]:>11.2f} {np.percentile(steady, 50):>9.2f} "
+              f"{np.percentile(steady, 99):>9.2f} {steady.max():>9.2f}")
+
+    p50_speedup = np.percentile(results["rebuild"][0][1:], 50) / np.percentile(results["parametric"][0][1:], 50)
+    du = np.max(np.abs(results["parametric"][1] - results["rebuild"][1]))
+    print(f"p50 speedup: {p50_speedup:.1f}x   max |u_parametric - u_rebuild|: {du:.2e} N")
+    explicit = results["explicit"][2]
+    table = explicit.explicit_table
+    print(f"explicit: {table.n_regions} regions, "
+          f"{explicit.explicit_hits}/{explicit.explicit_hits + explicit.explicit_misses} steps from the table "
+          f"(misses use the online QP)")
+
+    # Lookup latency alone, over covered states drawn from the table's box
+    states = table.x_eq + np.random.default_rng(0).uniform(-table.box, table.box, size=(20000, 6))
+    states = states[[table.locate(x) >= 0 for x in states]]
+    lookup = np.empty(len(states))
+    for i, x in enumerate(states):
+        start = time.perf_counter()
+        table.evaluate(x)
+        lookup[i] = time.perf_counter() - start
+    print(f"explicit lookup over {len(states)} covered states: p50 {np.percentile(lookup, 50) * 1e6:.1f} us, "
+          f"p99 {np.percentile(lookup, 99) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#======================================================================================\\\
+#============== scripts/benchmarks/mpc_linearization_cache_benchmark.py ===============\\\
+#======================================================================================\\\
+"""
+MPC Linearization Cache: per-step re-linearization vs cached (Ad, Bd)
+
+Replays a slowly varying state sequence about upright through
+``MPCController`` with the linearization cache off (re-linearize and
+re-discretize every step), with ``relinearize_tol`` set to several distances,
+and with ``linearize_about_upright=True``.  Every controller sees the same
+states, so the reported differences come from the reused model only.
+
+The plant is a nonlinear double pendulum on a cart (``sin``/``cos`` of the
+angle from upright, unequal pendulum lengths) without an analytic Jacobian,
+so every linearization costs a finite-difference Jacobian plus a matrix
+exponential.  As in ``mpc_condensed_benchmark.py``, ``--state-limit``
+(default 100) widens the cart and angle limits: the controller predicts in
+absolute coordinates, so with the default limits most of these QPs are
+infeasible and the safe fallback answers instead.
+
+Usage:
+    python scripts/benchmarks/mpc_linearization_cache_benchmark.py
+    python scripts/benchmarks/mpc_linearization_cache_benchmark.py --formulation sparse --tols 0.02 0.1
+
+Output:
+    Per mode: p50 latency of ``compute_control`` and of the linearization
+    step, cache hit rate, the largest entry-wise error of the reused
+    ``(Ad, Bd)`` against a fresh linearization at the same state, the
+    largest control difference to the uncached controller and the number of
+    steps answered by the safe fallback.
+"""
+
+import argparse
+import logging
+import time
+import warnings
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.controllers.mpc.mpc_controller import MPCController, _discretize_exact, _linearize_continuous
+
+
+class NonlinearUprightPlant:
+    """Cart with two pendulums, upright at theta = pi, nonlinear in the angles."""
+
+    g, l1, l2, m1, m2, M = 9.81, 0.5, 0.35, 0.1, 0.1, 1.0
+
+    def f(self, x, u):
+        s1, s2 = np.sin(x[1] - np.pi), np.sin(x[2] - np.pi)
+        c1, c2 = np.cos(x[1] - np.pi), np.cos(x[2] - np.pi)
+        xdot = np.zeros(6)
+        xdot[:3] = x[3:]
+        xdot[3] = u / self.M - (self.m1 + self.m2) * self.g * s1 / self.M
+        xdot[4] = self.g / self.l1 * s1 + c1 * u / (self.M * self.l1)
+        xdot[5] = self.g / self.l2 * s2 + c2 * u / (self.M * self.l2)
+        return xdot
+
+
+def state_sequence(steps, dt):
+    """Decaying oscillation about upright (x = [0, pi, pi, 0, 0, 0])."""
+    t = np.arange(steps) * dt
+    decay = np.exp(-t / 3.0)
+    x = np.zeros((steps, 6))
+    x[:, 0] = 0.3 * decay * np.sin(1.5 * t)
+    x[:, 1] = np.pi + 0.3 * decay * np.cos(3.0 * t)
+    x[:, 2] = np.pi - 0.2 * decay * np.cos(2.5 * t)
+    x[:, 3] = 0.45 * decay * np.cos(1.5 * t)
+    x[:, 4] = -0.9 * decay * np.sin(3.0 * t)
+    x[:, 5] = 0.5 * decay * np.sin(2.5 * t)
+    return x
+
+
+def replay(plant, states, mpc_kwargs, args):
+    mpc = MPCController(plant, horizon=args.horizon, dt=args.dt, formulation=args.formulation,
+                        max_cart_pos=args.state_limit, max_theta_dev=args.state_limit, **mpc_kwargs)
+
+    lin_time = []
+    discrete_model = mpc._discrete_model
+
+    def timed_discrete_model(x0):
+        start = time.perf_counter()
+        model = discrete_model(x0)
+        lin_time.append(time.perf_counter() - start)
+        return model
+
+    fallbacks = []
+    safe_fallback = mpc._safe_fallback
+
+    def counted_fallback(x0):
+        fallbacks.append(1)
+        return safe_fallback(x0)
+
+    mpc._discrete_model = timed_discrete_model
+    mpc._safe_fallback = counted_fallback
+
+    latency = np.empty(len(states))
+    controls = np.empty(len(states))
+    model_error = 0.0
+    for k, x in enumerate(states):
+        start = time.perf_counter()
+        controls[k] = mpc.compute_control(k * args.dt, x)
+        latency[k] = time.perf_counter() - start
+        Ad, Bd = mpc._linearization[1], mpc._linearization[2]
+        Ad_fresh, Bd_fresh = _discretize_exact(*_linearize_continuous(plant, x, 0.0), args.dt)
+        model_error = max(model_error, np.abs(Ad - Ad_fresh).max(), np.abs(Bd - Bd_fresh).max())
+    return dict(latency=latency * 1e3, linearization=np.array(lin_time) * 1e3, controls=controls,
+                model_error=model_error, fallbacks=len(fallbacks), mpc=mpc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MPC linearization cache")
+    parser.add_argument("--horizon", type=int, default=10)
+    parser.add_argument("--dt", type=float, default=0.02)
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--formulation", choices=["sparse", "condensed"], default="condensed")
+    parser.add_argument("--state-limit", type=float, default=100.0,
+                        help="max_cart_pos and max_theta_dev of every controller")
+    parser.add_argument("--tols", type=float, nargs="+", default=[0.01, 0.05, 0.2])
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    logging.disable(logging.WARNING)
+    plant = NonlinearUprightPlant()
+    states = state_sequence(args.steps, args.dt)
+
+    modes = {"every step": {}}
+    modes.update({f"tol={tol:g}": dict(relinearize_tol=tol) for tol in args.tols})
+    modes["upright"] = dict(linearize_about_upright=True)
+    results = {label: replay(plant, states, kwargs, args) for label, kwargs in modes.items()}
+    base = results["every step"]["controls"]
+
+    print(f"{args.formulation} formulation, horizon={args.horizon}  dt={args.dt}  steps={args.steps}  "
+          f"(latency in ms, first call excluded)")
+    print(f"{'mode':>11} {'p50 step':>9} {'p50 lin':>8} {'hit rate':>9} {'max |dAd|':>10} "
+          f"{'max |du|':>9} {'fallbacks':>10}")
+    for label, r in results.items():
+        mpc = r["mpc"]
+        hit_rate = mpc.linearization_hits / (mpc.linearization_hits + mpc.linearization_misses)
+        print(f"{label:>11} {np.percentile(r['latency'][1:], 50):>9.3f} "
+              f"{np.percentile(r['linearization'][1:], 50):>8.3f} {hit_rate:>9.1%} "
+              f"{r['model_error']:>10.1e} {np.max(np.abs(r['controls'] - base)):>9.1e} {r['fallbacks']:>10d}")
+
+
+if __name__ == "__main__":
+    main()
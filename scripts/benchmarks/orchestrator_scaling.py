@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+#======================================================================================\\\
+#===================== scripts/benchmarks/orchestrator_scaling.py =====================\\\
+#======================================================================================\\\
+"""
+Orchestrator Scaling: thread-per-trajectory vs process chunks over 1..N cores
+
+Strong scaling of ``ParallelOrchestrator`` on a fixed batch of open-loop
+trajectories of the configured plant.  ``mode="thread"`` submits one
+sequential simulation per trajectory to a thread pool; ``mode="process"``
+gives each worker process one contiguous chunk that it steps in lock step
+through ``BaseOrchestrator.step_batch`` and writes into shared memory.  Each
+process pool is warmed up with one run before timing, so worker start-up
+and JIT compilation are excluded; the thread mode is timed once.  A single-threaded ``SequentialOrchestrator``
+loop is the baseline.
+
+Usage:
+    python scripts/benchmarks/orchestrator_scaling.py
+    python scripts/benchmarks/orchestrator_scaling.py --batch 512 --horizon 2000 --max-workers 8
+
+Output:
+    Console table with wall time, trajectory-steps/s, speedup over the
+    sequential loop and parallel efficiency for each mode and worker count.
+"""
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.simulation.core.simulation_context import SimulationContext
+from src.simulation.orchestrators import ParallelOrchestrator, SequentialOrchestrator
+
+
+def best_time(fn, repeats):
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ParallelOrchestrator strong scaling")
+    parser.add_argument("--batch", type=int, default=128)
+    parser.add_argument("--horizon", type=int, default=200)
+    parser.add_argument("--dt", type=float, default=0.001)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    context = SimulationContext()
+    rng = np.random.default_rng(args.seed)
+    initial_states = np.zeros((args.batch, 6))
+    initial_states[:, 1:3] = rng.uniform(-0.1, 0.1, size=(args.batch, 2))
+    controls = rng.uniform(-1.0, 1.0, size=(args.batch, args.horizon))
+    work = args.batch * args.horizon
+
+    def sequential():
+        orchestrator = SequentialOrchestrator(context)
+        for b in range(args.batch):
+            orchestrator.execute(initial_states[b], controls[b], args.dt, args.horizon)
+
+    t_seq = best_time(sequential, 1)
+    print(f"B={args.batch}  horizon={args.horizon}  dt={args.dt}  "
+          f"integrator={context.get_simulation_parameters()['integration_method']}")
+    print(f"{'mode':>10} {'workers':>8} {'time [s]':>10} {'traj-steps/s':>14} {'speedup':>8} {'eff.':>6}")
+    print(f"{'sequential':>10} {1:>8} {t_seq:>10.4f} {work / t_seq:>14.3e} {1.0:>7.2f}x {'':>6}")
+
+    workers = sorted({1, *[2 ** k for k in range(1, 16) if 2 ** k <= args.max_workers], args.max_workers})
+    for mode in ("thread", "process"):
+        for n in workers:
+            with ParallelOrchestrator(context, max_workers=n, mode=mode) as orchestrator:
+                def run():
+                    orchestrator.execute(initial_states, controls, args.dt, args.horizon)
+
+                if mode == "process":
+                    run()  # warm up every worker
+                elapsed = best_time(run, 1 if mode == "thread" else args.repeats)
+            speedup = t_seq / elapsed
+            print(f"{mode:>10} {n:>8} {elapsed:>10.4f} {work / elapsed:>14.3e} "
+                  f"{speedup:>7.2f}x {speedup / n:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+#======================================================================================\
+#=================== scripts/benchmarks/plant_step_benchmark.py ===================\
+#======================================================================================\
+"""
+Plant Step Latency: validated step() vs compiled trusted step
+
+Times ``step()`` of the simplified and low-rank plants against
+``trusted_step`` (Euler and RK4), which skips validation, sanitization,
+monitoring and ``DynamicsResult`` construction.  The trusted step is warmed
+up once before timing so JIT compilation is excluded.
+
+Usage:
+    python scripts/benchmarks/plant_step_benchmark.py
+    python scripts/benchmarks/plant_step_benchmark.py --steps 50000
+
+Output:
+    Console table with microseconds per step and the speedup of each
+    trusted method over ``step()``.
+"""
+
+import argparse
+import time
+import warnings
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+from src.plant.models.lowrank import LowRankDIPConfig, LowRankDIPDynamics
+
+
+PLANTS = {
+    "simplified": lambda: SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default()),
+    "simplified_fast": lambda: SimplifiedDIPDynamics(
+        SimplifiedDIPConfig.create_default(), enable_fast_mode=True),
+    "lowrank": lambda: LowRankDIPDynamics(LowRankDIPConfig()),
+}
+
+
+def time_steps(step, state, control, dt, n_steps):
+    """Return microseconds per call of ``step``."""
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        step(state, control, dt)
+    return (time.perf_counter() - start) / n_steps * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark plant step() against trusted_step")
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--dt", type=float, default=0.001)
+    args = parser.parse_args()
+
+    state = np.array([0.0, 0.1, -0.05, 0.0, 0.2, 0.1])
+    control = np.array([1.0])
+
+    print(f"{'plant':<18}{'step() us':>12}{'euler us':>12}{'rk4 us':>12}{'euler x':>10}{'rk4 x':>10}")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name, make in PLANTS.items():
+            plant = make()
+            base = time_steps(plant.step, state, control, args.dt, args.steps)
+            trusted = {}
+            for method in ("euler", "rk4"):
+                plant.enable_trusted_step(method)
+                plant.trusted_step(state, control, args.dt)  # JIT warm-up
+                trusted[method] = time_steps(plant.trusted_step, state, control, args.dt, args.steps)
+                plant.disable_trusted_step()
+            print(f"{name:<18}{base:>12.2f}{trusted['euler']:>12.2f}{trusted['rk4']:>12.2f}"
+                  f"{base / trusted['euler']:>10.1f}{base / trusted['rk4']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
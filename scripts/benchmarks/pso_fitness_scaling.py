@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+#======================================================================================\
+#================= scripts/benchmarks/pso_fitness_scaling.py ==================\
+#======================================================================================\
+"""
+PSO Fitness Scaling: serial batch vs process-pool backend over 1..N cores
+
+Times one swarm evaluation (the work done per PSO iteration) with the serial
+``simulate_system_batch`` call and with ``ProcessFitnessPool`` for an
+increasing number of workers.  Each pool is warmed up with one evaluation
+before timing, so worker start-up and JIT compilation are excluded, matching
+the steady state of a long optimisation run.
+
+Usage:
+    python scripts/benchmarks/pso_fitness_scaling.py
+    python scripts/benchmarks/pso_fitness_scaling.py --particles 256 --engine loop --max-workers 8
+
+Output:
+    Console table with wall time per swarm evaluation, speedup over the
+    serial backend and parallel efficiency for each worker count.
+"""
+
+import argparse
+import os
+import time
+import warnings
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.optimization.core.parallel_fitness import ProcessFitnessPool
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+from src.simulation.engines.vector_sim import simulate_system_batch
+
+_DYNAMICS = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+
+
+def classical_factory(gains):
+    """Classical SMC on a shared simplified plant (module level: picklable)."""
+    ctrl = ClassicalSMC(gains, max_force=150.0, boundary_layer=0.02)
+    ctrl.dynamics_model = _DYNAMICS
+    return ctrl
+
+
+def best_time(fn, repeats):
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PSO fitness backends")
+    parser.add_argument("--particles", type=int, default=128)
+    parser.add_argument("--sim-time", type=float, default=2.0)
+    parser.add_argument("--dt", type=float, default=0.001)
+    parser.add_argument("--engine", choices=["loop", "vectorized", "auto"], default="auto")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    particles = np.abs(rng.normal([10, 8, 15, 12, 50, 5], [2, 2, 3, 3, 10, 1], size=(args.particles, 6)))
+    sim_kwargs = dict(sim_time=args.sim_time, dt=args.dt, u_max=150.0)
+
+    def serial():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            simulate_system_batch(controller_factory=classical_factory, particles=particles,
+                                  engine=args.engine, **sim_kwargs)
+
+    serial()  # warm-up
+    t_serial = best_time(serial, args.repeats)
+    work = args.particles * int(round(args.sim_time / args.dt))
+
+    print(f"B={args.particles}  steps={int(round(args.sim_time / args.dt))}  engine={args.engine}")
+    print(f"{'backend':>10} {'workers':>8} {'time [s]':>10} {'particle-steps/s':>18} {'speedup':>8} {'eff.':>6}")
+    print(f"{'serial':>10} {1:>8} {t_serial:>10.4f} {work / t_serial:>18.3e} {1.0:>7.2f}x {'':>6}")
+
+    workers = sorted({1, *[2 ** k for k in range(1, 16) if 2 ** k <= args.max_workers], args.max_workers})
+    for n in workers:
+        with ProcessFitnessPool(classical_factory, n_workers=n, engine=args.engine) as pool:
+            pool.simulate(particles, **sim_kwargs)  # warm up every worker
+            t_pool = best_time(lambda: pool.simulate(particles, **sim_kwargs), args.repeats)
+        speedup = t_serial / t_pool
+        print(f"{'process':>10} {n:>8} {t_pool:>10.4f} {work / t_pool:>18.3e} {speedup:>7.2f}x {speedup / n:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -287,6 +287,8 @@ class Args:
     run_cmaes: bool
     robust_pso: bool
     seed: Optional[int]
+    pso_backend: Optional[str] = None
+    pso_workers: Optional[int] = None
 
 # simulate.py - Update the _run_pso function (around line 288)
 def _run_pso(args: Args) -> int:
@@ -381,7 +383,7 @@ def _run_pso(args: Args) -> int:
     try:
         from src.optimization.algorithms.pso_optimizer import PSOTuner
         from src.optimization.algorithms.robust_pso_optimizer import RobustPSOTuner
-        from src.controllers.factory import create_controller
+        from src.controllers.factory import PreparedControllerFactory
     except ModuleNotFoundError as e:
         # In TEST_MODE, provide a deterministic fallback so CLI tests can run
         if os.getenv("TEST_MODE"):
@@ -419,19 +421,23 @@ def _run_pso(args: Args) -> int:
 
     ctrl_name = args.controller or "classical_smc"
 
-    def controller_factory(gains):
-        return create_controller(ctrl_name, config=cfg, gains=gains)
-
-    # Set n_gains attribute on factory function for PSO integration
-    # These values match the CONTROLLER_REGISTRY in factory.py
-    n_gains_map = {
-        'classical_smc': 6,
-        'sta_smc': 6,
-        'adaptive_smc': 5,
-        'hybrid_adaptive_sta_smc': 4,
-    }
-    controller_factory.n_gains = n_gains_map.get(ctrl_name, 6)
-    controller_factory.controller_type = ctrl_name
+    # CLI fitness-backend flags override ``pso.fitness_backend`` and
+    # ``pso.fitness_workers`` from the configuration.
+    if args.pso_backend is not None or args.pso_workers is not None:
+        pso_updates = {}
+        if args.pso_backend is not None:
+            pso_updates["fitness_backend"] = args.pso_backend
+        if args.pso_workers is not None:
+            pso_updates["fitness_workers"] = args.pso_workers
+            if args.pso_backend is None:
+                pso_updates["fitness_backend"] = "process"
+        cfg = cfg.model_copy(update={"pso": cfg.pso.model_copy(update=pso_updates)})
+
+    # The prepared factory resolves the controller config and dynamics model
+    # once instead of per particle, and stays picklable so the process
+    # fitness backend can ship it to its workers.  It also carries the
+    # n_gains/controller_type attributes PSO integration expects.
+    controller_factory = PreparedControllerFactory(ctrl_name, cfg)
 
     #
     # The previous implementation adjusted the PSO workload based on the presence of
@@ -687,6 +693,8 @@ def _parse_cli_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p.add_argument("--run-de", action="store_true", help="Run Differential Evolution to optimize controller gains.")
     p.add_argument("--run-cmaes", action="store_true", help="Run CMA-ES to optimize controller gains.")
     p.add_argument("--robust-pso", action="store_true", help="Enable robust multi-scenario PSO (addresses MT-7 overfitting; requires --run-pso).")
+    p.add_argument("--pso-backend", choices=["serial", "process"], default=None, help="PSO fitness backend (overrides pso.fitness_backend; requires --run-pso).")
+    p.add_argument("--pso-workers", type=int, default=None, metavar="N", help="Worker processes for the process PSO backend (implies --pso-backend process).")
     p.add_argument("--seed",type=int,default=None,help="Random seed for PSO/GA/DE/CMA-ES/simulation determinism (CLI overrides config/global).")
     return p.parse_args(argv)
 
@@ -972,6 +980,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             run_cmaes=args.run_cmaes,
             robust_pso=args.robust_pso,
             seed=args.seed,
+            pso_backend=args.pso_backend,
+            pso_workers=args.pso_workers,
         )
 
         if args.run_pso:
@@ -21,7 +21,7 @@ from __future__ import annotations
 from typing import Tuple
 import numpy as np
 
-from src.controllers.mpc.mpc_controller import _numeric_linearize_continuous
+from src.controllers.mpc.mpc_controller import _linearize_continuous
 
 
 def _controllability_matrix(A: np.ndarray, B: np.ndarray) -> np.ndarray:
@@ -48,7 +48,8 @@ def linearize_dip(dyn: callable, x_eq: np.ndarray, u_eq: float) -> Tuple[np.ndar
     Parameters
     ----------
     dyn : callable
-        A function implementing the continuous‑time dynamics ``f(x, u)``.
+        A function implementing the continuous‑time dynamics ``f(x, u)``,
+        or a plant model providing ``compute_jacobian``.
     x_eq : np.ndarray
         Equilibrium state vector at which to linearise.
     u_eq : float
@@ -57,10 +58,11 @@ def linearize_dip(dyn: callable, x_eq: np.ndarray, u_eq: float) -> Tuple[np.ndar
     Returns
     -------
     (A, B) : tuple of np.ndarray
-        Continuous‑time state matrix ``A`` and input matrix ``B`` obtained
-        via numerical differentiation of the dynamics.
+        Continuous‑time state matrix ``A`` and input matrix ``B`` from the
+        model's analytic Jacobian when available, otherwise via numerical
+        differentiation of the dynamics.
     """
-    A, B = _numeric_linearize_continuous(dyn, x_eq, u_eq)
+    A, B = _linearize_continuous(dyn, x_eq, u_eq)
     return A, B
 
 
@@ -64,7 +64,10 @@ class StabilityAnalyzer(PerformanceAnalyzer):
         **kwargs
             Additional parameters including:
             - system_matrices: (A, B, C, D) for linear analysis
+            - dynamics_model: plant model with ``compute_jacobian``, used to
+              build full-state-output matrices when system_matrices is absent
             - linearization_point: equilibrium point for linearization
+              (default: the upright equilibrium, all zeros)
             - parameter_uncertainties: uncertainty ranges for robustness
 
         Returns
@@ -81,6 +84,11 @@ class StabilityAnalyzer(PerformanceAnalyzer):
 
             # 2. Linear stability analysis (if system matrices provided)
             system_matrices = kwargs.get('system_matrices')
+            dynamics_model = kwargs.get('dynamics_model')
+            if system_matrices is None and dynamics_model is not None:
+                system_matrices = self.linearize_model(
+                    dynamics_model, kwargs.get('linearization_point')
+                )
             if system_matrices is not None:
                 linear_analysis = self._analyze_linear_stability(system_matrices)
                 results['linear_stability'] = linear_analysis
@@ -146,6 +154,34 @@ class StabilityAnalyzer(PerformanceAnalyzer):
 
         return results
 
+    @staticmethod
+    def linearize_model(dynamics_model: Any,
+                        linearization_point: Optional[np.ndarray] = None,
+                        equilibrium_input: float = 0.0) -> Tuple[np.ndarray, ...]:
+        """Linearize a plant model into full-state-output (A, B, C, D) matrices.
+
+        Parameters
+        ----------
+        dynamics_model : Any
+            Plant model providing ``compute_jacobian(state, control_input)``
+        linearization_point : np.ndarray, optional
+            State to linearize about; defaults to the upright equilibrium,
+            which the plant models serve from their cached Jacobian
+        equilibrium_input : float
+            Control input at the linearization point
+
+        Returns
+        -------
+        Tuple[np.ndarray, ...]
+            System matrices (A, B, I, 0)
+        """
+        if linearization_point is None:
+            linearization_point = np.zeros(dynamics_model.get_state_dimension())
+        A, B = dynamics_model.compute_jacobian(np.asarray(linearization_point, dtype=float),
+                                               equilibrium_input)
+        n, m = B.shape
+        return A, B, np.eye(n), np.zeros((n, m))
+
     def _analyze_linear_stability(self, system_matrices: Tuple[np.ndarray, ...]) -> Dict[str, Any]:
         """Analyze stability of linear system."""
         A, B, C, D = system_matrices
@@ -409,6 +409,22 @@ class PSOConfig(StrictModel):
     w_schedule: Optional[Tuple[float, float]] = None
     velocity_clamp: Optional[Tuple[float, float]] = None
     n_processes: Optional[int] = Field(None, ge=1)
+    fitness_backend: str = Field(
+        "serial",
+        description="Fitness evaluation backend: 'serial' (in-process) or 'process' (worker pool)"
+    )
+    fitness_workers: Optional[int] = Field(
+        None, ge=1,
+        description="Worker processes for the 'process' fitness backend (default: CPU count)"
+    )
+    streaming_cost: bool = Field(
+        False,
+        description="Accumulate cost integrals during simulation instead of storing trajectories"
+    )
+    step_mode: str = Field(
+        "default",
+        description="Plant stepping in fitness simulations: 'default' (validated step) or 'trusted' (compiled step)"
+    )
     hyper_trials: Optional[int] = None
     hyper_search: Optional[Dict[str, List[float]]] = None
     study_timeout: Optional[int] = None
@@ -419,6 +435,22 @@ class PSOConfig(StrictModel):
         description="Multi-scenario robust optimization settings (addresses MT-7 overfitting)"
     )
 
+    @field_validator("fitness_backend")
+    @classmethod
+    def _validate_fitness_backend(cls, v: str) -> str:
+        v = str(v).lower()
+        if v not in ("serial", "process"):
+            raise ValueError(f"fitness_backend must be 'serial' or 'process', got '{v}'")
+        return v
+
+    @field_validator("step_mode")
+    @classmethod
+    def _validate_step_mode(cls, v: str) -> str:
+        v = str(v).lower()
+        if v not in ("default", "trusted"):
+            raise ValueError(f"step_mode must be 'default' or 'trusted', got '{v}'")
+        return v
+
 # ------------------------------------------------------------------------------
 # Cost Function
 # ------------------------------------------------------------------------------
@@ -24,9 +24,11 @@ Created: November 8, 2025
 
 import numpy as np
 import logging
-from typing import List, Optional, Union, Sequence, Any
+from typing import List, Optional, Union, Sequence, Any, Tuple
 from dataclasses import dataclass
 
+from .gain_schedule import CompiledGainSchedule, LOW_SIDE
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,8 +75,14 @@ class AdaptiveGainScheduler:
     Note:
         The scheduler updates the base controller's gains before each control computation,
         so the base controller always sees the appropriately scheduled gains.
+
+        Thresholds and gain sets are compiled into a CompiledGainSchedule at
+        construction; call compile_schedule() after changing them.
     """
 
+    # Gain modes, indexed by CompiledGainSchedule side (aggressive below the thresholds)
+    MODES = ('aggressive', 'conservative')
+
     def __init__(
         self,
         base_controller: Any,
@@ -114,8 +122,11 @@ class AdaptiveGainScheduler:
             # Default: scale down aggressive gains
             self.conservative_gains = self.aggressive_gains * self.config.conservative_scale
 
+        self._explicit_conservative = conservative_gains is not None
+
         # State tracking for hysteresis
-        self._last_mode = 'aggressive'  # Track previous gain mode
+        self._mode = LOW_SIDE  # Start aggressive
+        self.compile_schedule()
 
         logger.info(
             f"AdaptiveGainScheduler initialized: "
@@ -124,6 +135,31 @@ class AdaptiveGainScheduler:
             f"{self.config.large_error_threshold:.3f}] rad"
         )
 
+    @property
+    def _last_mode(self) -> str:
+        """Previous gain mode ('aggressive' or 'conservative')."""
+        return self.MODES[self._mode]
+
+    @_last_mode.setter
+    def _last_mode(self, value: str) -> None:
+        self._mode = self.MODES.index(value)
+
+    def compile_schedule(self) -> CompiledGainSchedule:
+        """
+        Compile thresholds, hysteresis and gain sets into a lookup schedule.
+
+        Returns:
+            The compiled schedule (also stored as ``self.schedule``)
+        """
+        self.schedule = CompiledGainSchedule(
+            self.aggressive_gains,
+            self.conservative_gains,
+            self.config.small_error_threshold,
+            self.config.large_error_threshold,
+            self.config.hysteresis_width
+        )
+        return self.schedule
+
     def compute_error_magnitude(self, state: np.ndarray) -> float:
         """
         Compute error magnitude from system state.
@@ -143,6 +179,20 @@ class AdaptiveGainScheduler:
 
         return np.linalg.norm(error)
 
+    def compute_error_magnitude_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Compute error magnitudes for a batch of states.
+
+        Args:
+            states: System states, shape (B, 6)
+
+        Returns:
+            Error magnitudes, shape (B,)
+        """
+        states = np.asarray(states, dtype=float)
+        error = states[:, 1:3] if self.config.use_angles_only else states
+        return np.linalg.norm(error, axis=1)
+
     def schedule_gains(self, state: np.ndarray) -> np.ndarray:
         """
         Determine scheduled gains based on current state magnitude.
@@ -156,37 +206,40 @@ class AdaptiveGainScheduler:
             Scheduled gains (either aggressive, conservative, or interpolated)
         """
         error_mag = self.compute_error_magnitude(state)
+        scheduled_gains, self._mode = self.schedule.lookup(error_mag, self._mode)
+        return scheduled_gains
 
-        # Apply hysteresis based on last mode
-        if self._last_mode == 'aggressive':
-            # Use higher threshold to switch to conservative (add hysteresis)
-            small_thresh = self.config.small_error_threshold + self.config.hysteresis_width
-        else:
-            # Use lower threshold to switch to aggressive (subtract hysteresis)
-            small_thresh = self.config.small_error_threshold - self.config.hysteresis_width
+    def schedule_gains_batch(
+        self,
+        states: np.ndarray,
+        modes: Optional[np.ndarray] = None,
+        gains: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Determine scheduled gains for a batch of states.
 
-        if self._last_mode == 'conservative':
-            large_thresh = self.config.large_error_threshold - self.config.hysteresis_width
-        else:
-            large_thresh = self.config.large_error_threshold + self.config.hysteresis_width
-
-        # Determine gain mode
-        if error_mag < small_thresh:
-            # Small error: aggressive gains for fast convergence
-            scheduled_gains = self.aggressive_gains
-            self._last_mode = 'aggressive'
-        elif error_mag > large_thresh:
-            # Large error: conservative gains to reduce chattering
-            scheduled_gains = self.conservative_gains
-            self._last_mode = 'conservative'
-        else:
-            # Transition zone: linear interpolation
-            alpha = (error_mag - small_thresh) / (large_thresh - small_thresh)
-            alpha = np.clip(alpha, 0.0, 1.0)  # Safety clamp
-            scheduled_gains = (1 - alpha) * self.aggressive_gains + alpha * self.conservative_gains
-            # Keep last mode for hysteresis continuity
+        Args:
+            states: System states, shape (B, 6)
+            modes: Per-row gain modes (0 aggressive, 1 conservative); default aggressive
+            gains: Optional per-row aggressive gains, shape (B, n_gains). Conservative
+                   gains are scaled by config.conservative_scale unless explicit
+                   conservative gains were given, which are then shared by all rows.
 
-        return scheduled_gains
+        Returns:
+            (scheduled_gains, new_modes) with shapes (B, n_gains) and (B,)
+        """
+        states = np.atleast_2d(np.asarray(states, dtype=float))
+        if modes is None:
+            modes = np.full(states.shape[0], LOW_SIDE)
+        endpoints = None
+        if gains is not None:
+            aggressive = np.asarray(gains, dtype=float)
+            if self._explicit_conservative:
+                conservative = np.broadcast_to(self.conservative_gains, aggressive.shape)
+            else:
+                conservative = aggressive * self.config.conservative_scale
+            endpoints = (aggressive, conservative)
+        return self.schedule.lookup_batch(self.compute_error_magnitude_batch(states), modes, endpoints)
 
     def update_controller_gains(self, new_gains: np.ndarray) -> None:
         """
@@ -258,6 +311,37 @@ class AdaptiveGainScheduler:
         # Delegate to base controller
         return self.base_controller.compute_control(state, state_vars, history)
 
+    def compute_control_batch(
+        self,
+        states: np.ndarray,
+        gains: Optional[np.ndarray] = None,
+        ctrl_state: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute scheduled control for a batch of states.
+
+        Requires a base controller with ``compute_control_batch``; each row is
+        evaluated as if the base controller were built with that row's
+        scheduled gains.
+
+        Args:
+            states: System states, shape (B, 6)
+            gains: Optional per-row aggressive gains (see schedule_gains_batch)
+            ctrl_state: Column 0 holds the gain mode, the remaining columns the
+                        base controller state; None starts every row aggressive
+
+        Returns:
+            (u, new_ctrl_state, sigma) with new_ctrl_state laid out like ctrl_state
+        """
+        states = np.atleast_2d(np.asarray(states, dtype=float))
+        modes, base_state = None, None
+        if ctrl_state is not None:
+            ctrl_state = np.asarray(ctrl_state, dtype=float)
+            modes, base_state = ctrl_state[:, 0], ctrl_state[:, 1:]
+        scheduled, modes = self.schedule_gains_batch(states, modes, gains)
+        u, new_state, sigma = self.base_controller.compute_control_batch(states, scheduled, base_state)
+        return u, np.column_stack([modes.astype(float), new_state]), sigma
+
     def initialize_state(self) -> Any:
         """Initialize controller state (delegates to base controller)."""
         return self.base_controller.initialize_state()
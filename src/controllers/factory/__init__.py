@@ -31,6 +31,7 @@ from .base import (
     create_smc_for_pso,
     create_pso_controller_factory,
     get_gain_bounds_for_pso,
+    PreparedControllerFactory,
     
     # Thread-safety
     with_factory_lock,
@@ -142,6 +143,7 @@ __all__ = [
     'create_smc_for_pso',
     'get_gain_bounds_for_pso',
     'PSOControllerWrapper',
+    'PreparedControllerFactory',
     
     # Legacy
     'create_controller_legacy',
@@ -32,6 +32,7 @@ Week 1 aggressive factory refactoring (18 files -> 6 files).
 """
 
 # Standard library imports
+import copy
 import logging
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
@@ -249,126 +250,11 @@ from src.controllers.smc.algorithms.hybrid.config import HybridMode
 logger = logging.getLogger(__name__)
 
 # =============================================================================
-# MAIN FACTORY FUNCTIONS
+# FACTORY BUILDING BLOCKS
 # =============================================================================
 
-def create_controller(controller_type: str,
-                     config: Optional[Any] = None,
-                     gains: Optional[Union[list, np.ndarray]] = None) -> Any:
-    """Create controller instance using the factory pattern with robust configuration.
-
-    This is the primary factory function for creating sliding mode control (SMC) and model
-    predictive control (MPC) instances. It provides a unified interface for controller
-    instantiation with automatic gain validation, configuration resolution, and error handling.
-
-    The factory supports multiple controller types with automatic parameter resolution from
-    multiple sources (explicit gains, config file, or registry defaults) and comprehensive
-    validation of controller-specific requirements.
-
-    Thread Safety:
-        This function is thread-safe and can be called concurrently from multiple threads
-        using a module-level reentrant lock (_factory_lock).
-
-    Supported Controller Types:
-        - 'classical_smc': Classical sliding mode control with boundary layer
-        - 'sta_smc': Super-twisting algorithm (second-order SMC)
-        - 'adaptive_smc': Adaptive SMC with online parameter estimation
-        - 'hybrid_adaptive_sta_smc': Hybrid adaptive super-twisting control
-        - 'mpc_controller': Model predictive control (requires optional dependencies)
-
-    Type Aliases:
-        The factory normalizes common controller type variations:
-        - 'classic_smc', 'smc_classical', 'smc_v1' → 'classical_smc'
-        - 'super_twisting', 'sta' → 'sta_smc'
-        - 'adaptive' → 'adaptive_smc'
-        - 'hybrid', 'hybrid_sta' → 'hybrid_adaptive_sta_smc'
-
-    Gain Resolution Priority:
-        1. Explicit gains parameter (if provided)
-        2. Configuration object gains (config.controllers[type].gains)
-        3. Registry default gains (CONTROLLER_REGISTRY[type]['default_gains'])
-
-    Args:
-        controller_type: Controller type identifier string. Case-insensitive with automatic
-            normalization of aliases (e.g., 'classic_smc' → 'classical_smc'). Must be a
-            non-empty string matching a registered controller type or alias.
-        config: Optional configuration object or dictionary containing controller parameters.
-            The factory attempts to extract parameters from multiple configuration structures:
-            - config.controllers[controller_type]: Controller-specific configuration
-            - config.physics: Physics parameters for dynamics model creation
-            - config.dynamics_model: Pre-existing dynamics model instance
-            If None, uses registry defaults with fallback configurations.
-        gains: Optional gain vector for controller tuning. If provided as numpy array, it is
-            converted to a list. Must match the expected gain count for the controller type:
-            - Classical SMC: 6 gains [k1, k2, λ1, λ2, K, kd]
-            - STA SMC: 6 gains [K1, K2, k1, k2, λ1, λ2] (must satisfy K1 > K2)
-            - Adaptive SMC: 5 gains [k1, k2, λ1, λ2, γ]
-            - Hybrid SMC: 4 gains [c1, λ1, c2, λ2]
-            - MPC: No gains (uses cost matrices instead)
-
-    Returns:
-        Controller instance implementing the BaseController interface with methods:
-        - compute_control(state, last_control, history): Compute control output
-        - reset(): Reset internal controller state
-        - gains property: Access to controller gain vector
-
-    Raises:
-        ValueError: If controller_type is not recognized, is empty, is not a string, or if
-            gains have invalid length, non-finite values, or violate controller-specific
-            constraints (e.g., K1 <= K2 for STA SMC).
-        ImportError: If controller type requires missing optional dependencies (e.g., MPC
-            controller without cvxpy installation). Error message includes list of available
-            controllers.
-        FactoryConfigurationError: If configuration building fails due to invalid parameter
-            values, missing required parameters, or incompatible configuration structure.
-
-    Examples:
-        >>> from src.controllers.factory import create_controller
-        >>> from src.config import load_config
-        >>>
-        >>> # Example 1: Create with default gains from config file
-        >>> config = load_config("config.yaml")
-        >>> controller = create_controller('classical_smc', config)
-        >>> print(controller.gains)
-        [20.0, 15.0, 12.0, 8.0, 35.0, 5.0]
-        >>>
-        >>> # Example 2: Create with PSO-optimized gains
-        >>> optimized_gains = [25.3, 18.7, 14.2, 10.8, 42.6, 6.1]
-        >>> controller = create_controller('classical_smc', config, gains=optimized_gains)
-        >>>
-        >>> # Example 3: Create without config (uses registry defaults)
-        >>> controller = create_controller('sta_smc')
-        >>> print(controller.gains)
-        [25.0, 15.0, 20.0, 12.0, 8.0, 6.0]
-        >>>
-        >>> # Example 4: Type alias usage
-        >>> controller = create_controller('super_twisting', config)  # Normalized to 'sta_smc'
-        >>>
-        >>> # Example 5: Batch creation for comparison studies
-        >>> controller_types = ['classical_smc', 'sta_smc', 'adaptive_smc']
-        >>> controllers = [create_controller(ct, config) for ct in controller_types]
-
-    See Also:
-        - list_available_controllers(): Query available controller types
-        - get_default_gains(controller_type): Get default gains for a type
-        - CONTROLLER_REGISTRY: Registry of all supported controllers with metadata
-        - src.optimization.integration.pso_factory_bridge: PSO integration for gain optimization
-        - config.yaml: Configuration schema for controller parameters
-
-    Notes:
-        - The factory automatically validates gain constraints (e.g., K1 > K2 for STA SMC)
-        - Dynamics models are created automatically if physics parameters are in config
-        - Deprecated parameters are migrated automatically with warnings logged
-        - For invalid default gains, the factory attempts automatic correction before failing
-        - Controller-specific parameters (boundary_layer, dt, etc.) are extracted from config
-          or set to safe defaults
-        - MPC controller creation follows different patterns (no gains, requires horizon/costs)
-
-    References:
-        [1] Utkin, V. "Sliding Modes in Control and Optimization", Springer, 1992
-        [2] Levant, A. "Higher-order sliding modes", IEEE TAC, 1993
-        [3] Shtessel, Y. et al. "Sliding Mode Control and Observation", Birkhauser, 2014
-    """
+def _resolve_controller_type(controller_type: str) -> Tuple[str, Dict[str, Any]]:
+    """Canonicalize ``controller_type`` and look up its registry entry."""
     with _factory_lock:
         # Normalize/alias controller type
         controller_type = canonicalize_controller_type(controller_type)
@@ -381,10 +267,56 @@ def create_controller(controller_type: str,
             available = list_available_controllers()
             raise ImportError(f"{e}. Available controllers: {available}") from e
 
-        controller_class = controller_info['class']
-        config_class = controller_info['config_class']
+    return controller_type, controller_info
+
 
-    # Determine gains to use
+def _resolve_dynamics_model(config: Optional[Any]) -> Optional[Any]:
+    """Return the dynamics model carried by ``config`` or built from its physics."""
+    dynamics_model = None
+    if config is not None:
+        try:
+            # Try to get existing dynamics model
+            if hasattr(config, 'dynamics_model'):
+                dynamics_model = config.dynamics_model
+            elif hasattr(config, 'physics'):
+                dynamics_model = DIPDynamics(config.physics)
+            elif hasattr(config, 'dip_params'):
+                dynamics_model = DIPDynamics(config.dip_params)
+        except Exception as e:
+            logger.warning(f"Could not create dynamics model: {e}")
+
+    return dynamics_model
+
+
+def _private_dynamics_model(dynamics_model: Optional[Any]) -> Optional[Any]:
+    """Return a shallow copy of ``dynamics_model`` with its own mutable state.
+
+    Parameters and physics are shared; the stability monitor and the
+    trusted-step scratch buffer, which ``step()`` writes to, are replaced so
+    that controllers stepped from different threads do not interfere.
+    """
+    if dynamics_model is None:
+        return None
+    private = copy.copy(dynamics_model)
+    if hasattr(private, '_stability_monitor') and hasattr(private, '_setup_monitoring'):
+        private._setup_monitoring()
+    plan = getattr(private, '_trusted_plan', None)
+    if plan is not None:
+        kernel, model, method, params, scratch = plan
+        private._trusted_plan = (kernel, model, method, params, np.empty_like(scratch))
+    return private
+
+
+def _resolve_validated_gains(gains: Optional[Union[list, np.ndarray]],
+                             config: Optional[Any],
+                             controller_type: str,
+                             controller_info: Dict[str, Any]) -> List[float]:
+    """Resolve the gains for a controller and validate them.
+
+    Explicit ``gains`` must pass validation.  Invalid config or registry
+    default gains (``gains is None``) of ``sta_smc`` and ``adaptive_smc`` are
+    replaced by known-good defaults and validated again.
+    """
     controller_gains = _resolve_controller_gains(gains, config, controller_type, controller_info)
 
     # Validate gains with controller-specific rules
@@ -407,21 +339,12 @@ def create_controller(controller_type: str,
         else:
             raise e
 
-    # Create dynamics model if needed
-    dynamics_model = None
-    if config is not None:
-        try:
-            # Try to get existing dynamics model
-            if hasattr(config, 'dynamics_model'):
-                dynamics_model = config.dynamics_model
-            elif hasattr(config, 'physics'):
-                dynamics_model = DIPDynamics(config.physics)
-            elif hasattr(config, 'dip_params'):
-                dynamics_model = DIPDynamics(config.dip_params)
-        except Exception as e:
-            logger.warning(f"Could not create dynamics model: {e}")
+    return controller_gains
 
-    # Extract controller-specific parameters from config
+
+def _resolve_controller_params(config: Optional[Any], controller_type: str,
+                               controller_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract controller parameters from ``config`` and migrate deprecated names."""
     controller_params = _extract_controller_parameters(config, controller_type, controller_info)
 
     # Check for deprecated parameters and apply migrations
@@ -432,6 +355,17 @@ def create_controller(controller_type: str,
         # Graceful fallback if deprecation module is not available
         logger.debug("Deprecation checking not available")
 
+    return controller_params
+
+
+def _build_controller_config(controller_type: str,
+                             controller_info: Dict[str, Any],
+                             controller_gains: List[float],
+                             controller_params: Dict[str, Any],
+                             dynamics_model: Optional[Any]) -> Any:
+    """Build the controller configuration object for validated gains."""
+    config_class = controller_info['config_class']
+
     # Create configuration object
     try:
         # Build config parameters based on controller type
@@ -660,6 +594,147 @@ def create_controller(controller_type: str,
 
         controller_config = config_class(**fallback_params)
 
+    return controller_config
+
+
+# =============================================================================
+# MAIN FACTORY FUNCTIONS
+# =============================================================================
+
+def create_controller(controller_type: str,
+                     config: Optional[Any] = None,
+                     gains: Optional[Union[list, np.ndarray]] = None) -> Any:
+    """Create controller instance using the factory pattern with robust configuration.
+
+    This is the primary factory function for creating sliding mode control (SMC) and model
+    predictive control (MPC) instances. It provides a unified interface for controller
+    instantiation with automatic gain validation, configuration resolution, and error handling.
+
+    The factory supports multiple controller types with automatic parameter resolution from
+    multiple sources (explicit gains, config file, or registry defaults) and comprehensive
+    validation of controller-specific requirements.
+
+    Thread Safety:
+        This function is thread-safe and can be called concurrently from multiple threads
+        using a module-level reentrant lock (_factory_lock).
+
+    Supported Controller Types:
+        - 'classical_smc': Classical sliding mode control with boundary layer
+        - 'sta_smc': Super-twisting algorithm (second-order SMC)
+        - 'adaptive_smc': Adaptive SMC with online parameter estimation
+        - 'hybrid_adaptive_sta_smc': Hybrid adaptive super-twisting control
+        - 'mpc_controller': Model predictive control (requires optional dependencies)
+
+    Type Aliases:
+        The factory normalizes common controller type variations:
+        - 'classic_smc', 'smc_classical', 'smc_v1' → 'classical_smc'
+        - 'super_twisting', 'sta' → 'sta_smc'
+        - 'adaptive' → 'adaptive_smc'
+        - 'hybrid', 'hybrid_sta' → 'hybrid_adaptive_sta_smc'
+
+    Gain Resolution Priority:
+        1. Explicit gains parameter (if provided)
+        2. Configuration object gains (config.controllers[type].gains)
+        3. Registry default gains (CONTROLLER_REGISTRY[type]['default_gains'])
+
+    Args:
+        controller_type: Controller type identifier string. Case-insensitive with automatic
+            normalization of aliases (e.g., 'classic_smc' → 'classical_smc'). Must be a
+            non-empty string matching a registered controller type or alias.
+        config: Optional configuration object or dictionary containing controller parameters.
+            The factory attempts to extract parameters from multiple configuration structures:
+            - config.controllers[controller_type]: Controller-specific configuration
+            - config.physics: Physics parameters for dynamics model creation
+            - config.dynamics_model: Pre-existing dynamics model instance
+            If None, uses registry defaults with fallback configurations.
+        gains: Optional gain vector for controller tuning. If provided as numpy array, it is
+            converted to a list. Must match the expected gain count for the controller type:
+            - Classical SMC: 6 gains [k1, k2, λ1, λ2, K, kd]
+            - STA SMC: 6 gains [K1, K2, k1, k2, λ1, λ2] (must satisfy K1 > K2)
+            - Adaptive SMC: 5 gains [k1, k2, λ1, λ2, γ]
+            - Hybrid SMC: 4 gains [c1, λ1, c2, λ2]
+            - MPC: No gains (uses cost matrices instead)
+
+    Returns:
+        Controller instance implementing the BaseController interface with methods:
+        - compute_control(state, last_control, history): Compute control output
+        - reset(): Reset internal controller state
+        - gains property: Access to controller gain vector
+
+    Raises:
+        ValueError: If controller_type is not recognized, is empty, is not a string, or if
+            gains have invalid length, non-finite values, or violate controller-specific
+            constraints (e.g., K1 <= K2 for STA SMC).
+        ImportError: If controller type requires missing optional dependencies (e.g., MPC
+            controller without cvxpy installation). Error message includes list of available
+            controllers.
+        FactoryConfigurationError: If configuration building fails due to invalid parameter
+            values, missing required parameters, or incompatible configuration structure.
+
+    Examples:
+        >>> from src.controllers.factory import create_controller
+        >>> from src.config import load_config
+        >>>
+        >>> # Example 1: Create with default gains from config file
+        >>> config = load_config("config.yaml")
+        >>> controller = create_controller('classical_smc', config)
+        >>> print(controller.gains)
+        [20.0, 15.0, 12.0, 8.0, 35.0, 5.0]
+        >>>
+        >>> # Example 2: Create with PSO-optimized gains
+        >>> optimized_gains = [25.3, 18.7, 14.2, 10.8, 42.6, 6.1]
+        >>> controller = create_controller('classical_smc', config, gains=optimized_gains)
+        >>>
+        >>> # Example 3: Create without config (uses registry defaults)
+        >>> controller = create_controller('sta_smc')
+        >>> print(controller.gains)
+        [25.0, 15.0, 20.0, 12.0, 8.0, 6.0]
+        >>>
+        >>> # Example 4: Type alias usage
+        >>> controller = create_controller('super_twisting', config)  # Normalized to 'sta_smc'
+        >>>
+        >>> # Example 5: Batch creation for comparison studies
+        >>> controller_types = ['classical_smc', 'sta_smc', 'adaptive_smc']
+        >>> controllers = [create_controller(ct, config) for ct in controller_types]
+
+    See Also:
+        - list_available_controllers(): Query available controller types
+        - get_default_gains(controller_type): Get default gains for a type
+        - CONTROLLER_REGISTRY: Registry of all supported controllers with metadata
+        - src.optimization.integration.pso_factory_bridge: PSO integration for gain optimization
+        - config.yaml: Configuration schema for controller parameters
+
+    Notes:
+        - The factory automatically validates gain constraints (e.g., K1 > K2 for STA SMC)
+        - Dynamics models are created automatically if physics parameters are in config
+        - Deprecated parameters are migrated automatically with warnings logged
+        - For invalid default gains, the factory attempts automatic correction before failing
+        - Controller-specific parameters (boundary_layer, dt, etc.) are extracted from config
+          or set to safe defaults
+        - MPC controller creation follows different patterns (no gains, requires horizon/costs)
+
+    References:
+        [1] Utkin, V. "Sliding Modes in Control and Optimization", Springer, 1992
+        [2] Levant, A. "Higher-order sliding modes", IEEE TAC, 1993
+        [3] Shtessel, Y. et al. "Sliding Mode Control and Observation", Birkhauser, 2014
+    """
+    controller_type, controller_info = _resolve_controller_type(controller_type)
+    controller_class = controller_info['class']
+
+    # Determine and validate the gains to use
+    controller_gains = _resolve_validated_gains(gains, config, controller_type, controller_info)
+
+    # Create dynamics model if needed
+    dynamics_model = _resolve_dynamics_model(config)
+
+    # Extract controller-specific parameters from config
+    controller_params = _resolve_controller_params(config, controller_type, controller_info)
+
+    # Create configuration object
+    controller_config = _build_controller_config(
+        controller_type, controller_info, controller_gains, controller_params, dynamics_model
+    )
+
     # Create and return controller instance
     try:
         if controller_class is None:
@@ -907,6 +982,58 @@ def create_pso_controller_factory(smc_type: SMCType, plant_config: Optional[Any]
     return controller_factory
 
 
+class PreparedControllerFactory:
+    """Controller factory that resolves everything except the gains once.
+
+    ``create_controller`` canonicalizes the type under ``_factory_lock``,
+    rebuilds the dynamics model and re-extracts the controller parameters on
+    every call.  For PSO, where thousands of gain vectors share one
+    configuration, this class performs that work at construction time; each
+    call then only resolves and validates the gains (with the same fallback
+    for invalid default gains) and builds the config and controller,
+    without touching the global lock.  The returned controllers behave like
+    ``create_controller(controller_type, config, gains)``.
+
+    Simulation steps the controller's dynamics model, which updates its
+    stability monitor and trusted-step scratch buffer.  Each controller
+    therefore gets its own shallow copy of the prepared model with fresh
+    copies of that state, so controllers can be run from thread pools.
+    Instances are picklable, so they can be sent to process-based fitness
+    workers.
+
+    Example:
+        >>> factory = PreparedControllerFactory('classical_smc', config)
+        >>> controllers = [factory(g) for g in particles]
+    """
+
+    def __init__(self, controller_type: str, config: Optional[Any] = None):
+        self.controller_type, self.controller_info = _resolve_controller_type(controller_type)
+        if self.controller_info['class'] is None:
+            raise ImportError(f"Controller class for {self.controller_type} is not available")
+
+        self.config = config
+        self.dynamics_model = _resolve_dynamics_model(config)
+        self.controller_params = _resolve_controller_params(
+            config, self.controller_type, self.controller_info
+        )
+        self.n_gains = self.controller_info['gain_count']
+        self.max_force = self.controller_params.get('max_force') or 150.0
+
+    def __call__(self, gains: Optional[Union[list, np.ndarray]] = None) -> Any:
+        """Create a controller for ``gains`` (the config's gains if None)."""
+        controller_gains = _resolve_validated_gains(
+            gains, self.config, self.controller_type, self.controller_info
+        )
+        controller_config = _build_controller_config(
+            self.controller_type, self.controller_info, controller_gains,
+            self.controller_params, _private_dynamics_model(self.dynamics_model)
+        )
+        return self.controller_info['class'](controller_config)
+
+    def __repr__(self) -> str:
+        return f"PreparedControllerFactory({self.controller_type!r}, n_gains={self.n_gains})"
+
+
 # =============================================================================
 # PSO OPTIMIZATION UTILITIES (from smc_factory.py)
 # =============================================================================
@@ -5,8 +5,10 @@
 """Model Predictive Controllers for the double inverted pendulum system."""
 
 from .mpc_controller import MPCController, MPCWeights
+from .explicit_mpc import ExplicitMPCTable
 
 __all__ = [
     "MPCController",
     "MPCWeights",
+    "ExplicitMPCTable",
 ]
\ No newline at end of file
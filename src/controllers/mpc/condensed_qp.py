@@ -0,0 +1,242 @@
+#======================================================================================\\\
+#======================== src/controllers/mpc/condensed_qp.py =========================\\\
+#======================================================================================\\\
+
+"""
+Condensed (state-eliminated) MPC quadratic programs and a dense QP solver.
+
+For a linear model in deviation coordinates ``δ_{k+1} = Ad δ_k + Bd u_k``
+the predicted states are an affine function of the initial state ``θ = δ_0``
+and the input sequence ``z = (u_0, …, u_{N-1})``::
+
+    (δ_1, …, δ_N) = Φ θ + Γ z
+
+Substituting this into the MPC cost and constraints gives a dense QP in the
+``N`` inputs only::
+
+    minimize    ½ zᵀ H z + (F θ + F_ref r)ᵀ z
+    subject to  G z ≤ w + S θ
+
+where ``r`` stacks the reference states ``r_1 … r_N`` (zero when regulating
+to the linearization point).
+
+``H``, ``F``, ``G``, ``w`` and ``S`` depend only on ``(Ad, Bd, Q, R)``, the
+horizon and the bounds, so they are built once per linearization and reused
+for every initial state.  :func:`solve_qp_active_set` solves such a QP
+without cvxpy and reports the optimal active set, which is what the explicit
+MPC table is built from.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import linprog
+
+
+@dataclass
+class CondensedQP:
+    """Dense MPC QP ``min ½zᵀHz + (Fθ + F_ref·r)ᵀz  s.t.  Gz ≤ w + Sθ``."""
+
+    H: np.ndarray  # (N, N) Hessian
+    F: np.ndarray  # (N, nx) parameter-to-gradient map
+    F_ref: np.ndarray  # (N, N*nx) reference-to-gradient map
+    G: np.ndarray  # (m, N) constraint matrix
+    w: np.ndarray  # (m,) constraint offset
+    S: np.ndarray  # (m, nx) parameter-to-bound map
+    Phi: np.ndarray  # (N*nx, nx) free response
+    Gamma: np.ndarray  # (N*nx, N) forced response
+
+    @property
+    def n_inputs(self) -> int:
+        return self.H.shape[0]
+
+    def gradient(self, theta: np.ndarray, reference: Optional[np.ndarray] = None) -> np.ndarray:
+        g = self.F @ theta
+        if reference is not None:
+            g = g + self.F_ref @ np.ravel(reference)
+        return g
+
+    def bounds(self, theta: np.ndarray) -> np.ndarray:
+        return self.w + self.S @ theta
+
+    def predict(self, theta: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """Predicted deviations ``δ_1 … δ_N`` as an ``(N, nx)`` array."""
+        return (self.Phi @ theta + self.Gamma @ z).reshape(self.n_inputs, -1)
+
+
+@dataclass
+class QPSolution:
+    """Result of :func:`solve_qp_active_set`."""
+
+    z: np.ndarray
+    active_set: Tuple[int, ...]
+    status: str  # "optimal", "infeasible" or "max_iter"
+    iterations: int
+
+    @property
+    def success(self) -> bool:
+        return self.status == "optimal"
+
+
+def condense_mpc_qp(
+    Ad: np.ndarray,
+    Bd: np.ndarray,
+    Q: np.ndarray,
+    R: np.ndarray,
+    horizon: int,
+    u_max: float,
+    state_bounds: Sequence[Tuple[int, float]] = (),
+    state_center: Optional[np.ndarray] = None,
+) -> CondensedQP:
+    """
+    Eliminate the states from the MPC problem.
+
+    The cost matches :class:`MPCController`: ``Q`` on ``δ_0 … δ_N`` (the
+    ``δ_0`` term is constant and dropped), ``R`` on ``u_0 … u_{N-1}``.
+
+    Args:
+        Ad, Bd: Discrete model of shapes (nx, nx) and (nx, 1)
+        Q, R: State and input weights
+        horizon: Prediction horizon ``N``
+        u_max: Input bound ``|u_k| ≤ u_max``
+        state_bounds: ``(index, bound)`` pairs constraining
+            ``|δ_k[index] - state_center[index]| ≤ bound`` for ``k = 1 … N-1``
+            (``δ_0`` is the measured state)
+        state_center: Centre of the state bounds; defaults to zero
+
+    Returns:
+        CondensedQP
+    """
+    nx = Ad.shape[0]
+    N = int(horizon)
+    B = np.asarray(Bd, dtype=float).reshape(nx, 1)
+
+    Phi = np.empty((N * nx, nx))
+    Gamma = np.zeros((N * nx, N))
+    A_pow = np.eye(nx)
+    for k in range(N):
+        # Column j of block row k holds A^(k-j) B
+        if k > 0:
+            Gamma[k * nx:(k + 1) * nx, :k] = Ad @ Gamma[(k - 1) * nx:k * nx, :k]
+        Gamma[k * nx:(k + 1) * nx, k] = B[:, 0]
+        A_pow = Ad @ A_pow
+        Phi[k * nx:(k + 1) * nx] = A_pow
+
+    Q_bar = np.kron(np.eye(N), Q)
+    GtQ = Gamma.T @ Q_bar
+    H = 2.0 * (GtQ @ Gamma + float(R[0, 0]) * np.eye(N))
+    H = 0.5 * (H + H.T)
+    F = 2.0 * GtQ @ Phi
+
+    center = np.zeros(nx) if state_center is None else np.asarray(state_center, dtype=float)
+    G_rows = [np.eye(N), -np.eye(N)]
+    w_rows = [np.full(2 * N, float(u_max))]
+    S_rows = [np.zeros((2 * N, nx))]
+    for index, bound in state_bounds:
+        rows = [k * nx + int(index) for k in range(N - 1)]
+        c = float(center[int(index)])
+        G_rows += [Gamma[rows], -Gamma[rows]]
+        S_rows += [-Phi[rows], Phi[rows]]
+        w_rows += [np.full(len(rows), float(bound) + c), np.full(len(rows), float(bound) - c)]
+
+    return CondensedQP(
+        H=H, F=F, F_ref=-2.0 * GtQ,
+        G=np.vstack(G_rows), w=np.concatenate(w_rows), S=np.vstack(S_rows),
+        Phi=Phi, Gamma=Gamma,
+    )
+
+
+def _phase_one(G: np.ndarray, b: np.ndarray) -> Optional[np.ndarray]:
+    """Point maximizing the smallest slack of ``Gz ≤ b`` (None if infeasible)."""
+    n = G.shape[1]
+    # Variables (z, t): maximize t s.t. Gz + t ≤ b, t ≤ 1
+    c = np.zeros(n + 1)
+    c[-1] = -1.0
+    A_ub = np.hstack([G, np.ones((G.shape[0], 1))])
+    bounds = [(None, None)] * n + [(None, 1.0)]
+    res = linprog(c, A_ub=A_ub, b_ub=b, bounds=bounds, method="highs")
+    if res.status != 0 or res.x[-1] < -1e-9:
+        return None
+    return res.x[:n]
+
+
+def solve_qp_active_set(
+    H: np.ndarray,
+    f: np.ndarray,
+    G: np.ndarray,
+    b: np.ndarray,
+    z0: Optional[np.ndarray] = None,
+    H_factor: Optional[Tuple[np.ndarray, bool]] = None,
+    working_set: Optional[Sequence[int]] = None,
+    max_iter: int = 200,
+    tol: float = 1e-9,
+) -> QPSolution:
+    """
+    Primal active-set method for a strictly convex dense QP.
+
+    Solves ``min ½zᵀHz + fᵀz  s.t.  Gz ≤ b`` starting from ``z0`` (or the
+    origin) when feasible, otherwise from a phase-one LP point.  Each
+    iteration solves the equality-constrained subproblem on the working set
+    through the Schur complement of ``H``, so a Cholesky factor passed in
+    ``H_factor`` (from ``scipy.linalg.cho_factor``) is reused across calls.
+    ``working_set`` seeds the initial working set with constraints that are
+    active at ``z0`` (e.g. the saturated inputs of a shifted previous
+    solution); it is ignored when ``z0`` is infeasible.
+
+    Returns:
+        QPSolution with the minimizer and the indices of the constraints in
+        the final working set (active at the optimum, non-negative multipliers)
+    """
+    factor = H_factor if H_factor is not None else cho_factor(H)
+    tol_feas = 1e-9 * (1.0 + np.abs(b))
+
+    z = np.zeros(H.shape[0]) if z0 is None else np.array(z0, dtype=float)
+    working: list = [] if working_set is None else [int(i) for i in working_set]
+    if np.any(G @ z > b + tol_feas):
+        z = _phase_one(G, b)
+        if z is None:
+            return QPSolution(np.zeros(H.shape[0]), (), "infeasible", 0)
+        working = []
+
+    for it in range(1, max_iter + 1):
+        g = H @ z + f
+        Hi_g = cho_solve(factor, g)
+        if working:
+            GW = G[working]
+            Hi_GWt = cho_solve(factor, GW.T)
+            try:
+                lam = np.linalg.solve(GW @ Hi_GWt, -(GW @ Hi_g))
+            except np.linalg.LinAlgError:
+                working.pop()
+                continue
+            p = -(Hi_g + Hi_GWt @ lam)
+        else:
+            lam = np.empty(0)
+            p = -Hi_g
+
+        if np.linalg.norm(p) <= tol * (1.0 + np.linalg.norm(z)):
+            if lam.size == 0 or lam.min() >= -tol:
+                return QPSolution(z, tuple(sorted(working)), "optimal", it)
+            working.pop(int(np.argmin(lam)))
+            continue
+
+        Gp = G @ p
+        slack = np.maximum(b - G @ z, 0.0)
+        blocking = Gp > tol * (1.0 + np.abs(Gp).max())
+        blocking[working] = False
+        alpha, block = 1.0, -1
+        if blocking.any():
+            candidates = np.flatnonzero(blocking)
+            ratios = slack[candidates] / Gp[candidates]
+            j = int(np.argmin(ratios))
+            if ratios[j] < 1.0:
+                alpha, block = float(ratios[j]), int(candidates[j])
+        z = z + alpha * p
+        if block >= 0:
+            working.append(block)
+
+    return QPSolution(z, tuple(sorted(working)), "max_iter", max_iter)
@@ -0,0 +1,348 @@
+#======================================================================================\\\
+#======================== src/controllers/mpc/explicit_mpc.py =========================\\\
+#======================================================================================\\\
+
+"""
+Explicit MPC: offline multiparametric solution with online region lookup.
+
+With the model fixed (linearized once about upright) the condensed MPC QP
+
+    minimize ½ zᵀHz + (Fθ)ᵀz   subject to   Gz ≤ w + Sθ
+
+depends on the measured deviation ``θ = x - x_eq`` only through its linear
+terms.  For every set ``A`` of active constraints the KKT conditions give
+an affine optimal input ``z*(θ) = K_A θ + k_A``, valid on the polyhedral
+*critical region* where the multipliers stay non-negative and the inactive
+constraints stay satisfied.  The explicit controller stores, for each
+region, its half-spaces ``Pθ ≤ q`` and the first-move law ``u = K θ + k``.
+
+Regions are discovered by exploring the bounded state region offline:
+sample points that no known region contains are solved with
+:func:`solve_qp_active_set`, and the optimal active set yields a new region.
+States left uncovered (or outside the box) are reported as misses so the
+caller can fall back to an online solve.
+
+Point location uses a binary search tree over axis-aligned hyperplanes
+``θ[d] ≤ c`` built from each region's bounding box; a leaf lists the few
+regions that intersect its cell.  The lookup is a compiled tree descent plus
+a half-space test of those regions, a few microseconds per step.
+
+Tables are saved as ``.npz`` together with a signature of the MPC problem
+(model, weights, bounds, horizon) so a stale table is detected on load.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.optimize import linprog
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+from .condensed_qp import CondensedQP, solve_qp_active_set
+
+logger = logging.getLogger(__name__)
+
+_TABLE_ARRAYS = (
+    "P", "q", "row_offsets", "K", "k", "box", "x_eq", "signature",
+    "node_dim", "node_split", "node_left", "node_right",
+    "leaf_start", "leaf_count", "leaf_regions", "coverage",
+)
+
+
+@njit(cache=True)
+def _locate_region(theta, node_dim, node_split, node_left, node_right,
+                   leaf_start, leaf_count, leaf_regions, row_offsets, P, q, tol):
+    """Descend the search tree and return the region containing ``theta`` (-1 if none)."""
+    node = 0
+    while node_left[node] >= 0:
+        if theta[node_dim[node]] <= node_split[node]:
+            node = node_left[node]
+        else:
+            node = node_right[node]
+    for j in range(leaf_start[node], leaf_start[node] + leaf_count[node]):
+        r = leaf_regions[j]
+        inside = True
+        for i in range(row_offsets[r], row_offsets[r + 1]):
+            s = 0.0
+            for d in range(theta.shape[0]):
+                s += P[i, d] * theta[d]
+            if s > q[i] + tol:
+                inside = False
+                break
+        if inside:
+            return r
+    return -1
+
+
+def _critical_region(
+    qp: CondensedQP,
+    Hi: np.ndarray,
+    active: Tuple[int, ...],
+    box: np.ndarray,
+    tol: float = 1e-10,
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, float]]:
+    """
+    Affine law and half-spaces of the critical region of ``active``.
+
+    Returns ``(P, q, K0, k0)`` with the region ``Pθ ≤ q`` (rows normalized,
+    rows implied by the box dropped) and the first input ``u_0 = K0·θ + k0``,
+    or None when the active constraints are linearly dependent.
+    """
+    idx = np.asarray(active, dtype=int)
+    Hi_F = Hi @ qp.F
+    if idx.size:
+        GA, SA, wA = qp.G[idx], qp.S[idx], qp.w[idx]
+        Hi_GAt = Hi @ GA.T
+        M = GA @ Hi_GAt
+        if np.linalg.cond(M) > 1e12:
+            return None
+        Minv = np.linalg.inv(M)
+        T = SA + GA @ Hi_F
+        # λ(θ) = -M⁻¹(w_A + Tθ),  z(θ) = Kθ + k
+        K = -Hi_F + Hi_GAt @ Minv @ T
+        k = Hi_GAt @ Minv @ wA
+        P_dual, q_dual = Minv @ T, -Minv @ wA
+    else:
+        K, k = -Hi_F, np.zeros(qp.n_inputs)
+        P_dual, q_dual = np.empty((0, qp.F.shape[1])), np.empty(0)
+
+    inactive = np.setdiff1d(np.arange(qp.G.shape[0]), idx)
+    P_primal = qp.G[inactive] @ K - qp.S[inactive]
+    q_primal = qp.w[inactive] - qp.G[inactive] @ k
+
+    P = np.vstack([P_dual, P_primal])
+    q = np.concatenate([q_dual, q_primal])
+    norms = np.linalg.norm(P, axis=1)
+    keep = norms > tol
+    if np.any(q[~keep] < -tol):
+        return None  # 0·θ ≤ q < 0: empty region
+    P, q = P[keep] / norms[keep, None], q[keep] / norms[keep]
+    # Half-spaces already implied by the box are redundant
+    keep = np.abs(P) @ box > q
+    return P[keep], q[keep], K[0], float(k[0])
+
+
+def _bounding_box(P: np.ndarray, q: np.ndarray, box: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Axis-aligned bounding box of ``{θ : Pθ ≤ q, |θ| ≤ box}``."""
+    n = box.size
+    lo, hi = -box.copy(), box.copy()
+    bounds = list(zip(-box, box))
+    for d in range(n):
+        for sign in (1.0, -1.0):
+            c = np.zeros(n)
+            c[d] = sign
+            res = linprog(c, A_ub=P if P.size else None, b_ub=q if q.size else None,
+                          bounds=bounds, method="highs")
+            if res.status == 0:
+                if sign > 0:
+                    lo[d] = res.x[d]
+                else:
+                    hi[d] = res.x[d]
+    return lo, hi
+
+
+def _build_tree(
+    lo: np.ndarray, hi: np.ndarray, leaf_size: int, max_depth: int
+) -> Dict[str, np.ndarray]:
+    """Binary search tree over axis-aligned split planes of the region boxes."""
+    nodes: List[List[Any]] = []  # [dim, split, left, right, regions]
+    centers = 0.5 * (lo + hi)
+
+    def build(regions: np.ndarray, depth: int) -> int:
+        node = len(nodes)
+        nodes.append([0, 0.0, -1, -1, regions])
+        if regions.size <= leaf_size or depth >= max_depth:
+            return node
+        spread = np.ptp(centers[regions], axis=0)
+        d = int(np.argmax(spread))
+        split = float(np.median(centers[regions, d]))
+        left = regions[lo[regions, d] <= split]
+        right = regions[hi[regions, d] >= split]
+        if max(left.size, right.size) == regions.size:
+            return node  # split separates nothing
+        nodes[node][:2] = [d, split]
+        nodes[node][2] = build(left, depth + 1)
+        nodes[node][3] = build(right, depth + 1)
+        return node
+
+    build(np.arange(lo.shape[0]), 0)
+    leaf_start, leaf_count, leaf_regions = [], [], []
+    for node in nodes:
+        is_leaf = node[2] < 0
+        leaf_start.append(len(leaf_regions))
+        leaf_count.append(len(node[4]) if is_leaf else 0)
+        if is_leaf:
+            leaf_regions.extend(int(r) for r in node[4])
+    return {
+        "node_dim": np.array([n[0] for n in nodes], dtype=np.int64),
+        "node_split": np.array([n[1] for n in nodes], dtype=float),
+        "node_left": np.array([n[2] for n in nodes], dtype=np.int64),
+        "node_right": np.array([n[3] for n in nodes], dtype=np.int64),
+        "leaf_start": np.array(leaf_start, dtype=np.int64),
+        "leaf_count": np.array(leaf_count, dtype=np.int64),
+        "leaf_regions": np.array(leaf_regions, dtype=np.int64),
+    }
+
+
+class ExplicitMPCTable:
+    """
+    Piecewise-affine explicit MPC law over a box of state deviations.
+
+    Example Usage:
+        table = ExplicitMPCTable.build(qp, box, x_eq, signature)
+        table.save("mpc_table.npz")
+        table = ExplicitMPCTable.load("mpc_table.npz")
+        u = table.evaluate(x)          # NaN when x is not covered
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], tol: float = 1e-8) -> None:
+        missing = [name for name in _TABLE_ARRAYS if name not in arrays]
+        if missing:
+            raise ValueError(f"Explicit MPC table is missing arrays: {', '.join(missing)}")
+        for name in _TABLE_ARRAYS:
+            setattr(self, name, np.ascontiguousarray(arrays[name]))
+        self.tol = float(tol)
+
+    @property
+    def n_regions(self) -> int:
+        return self.K.shape[0]
+
+    @classmethod
+    def build(
+        cls,
+        qp: CondensedQP,
+        box: Sequence[float],
+        x_eq: np.ndarray,
+        signature: np.ndarray,
+        n_samples: int = 20000,
+        n_validation: int = 2000,
+        leaf_size: int = 8,
+        max_depth: int = 24,
+        seed: int = 0,
+    ) -> "ExplicitMPCTable":
+        """
+        Solve the multiparametric QP offline by exploring the state box.
+
+        Args:
+            qp: Condensed QP in the deviation ``θ = x - x_eq``
+            box: Half-widths of the explored region, ``|θ_i| ≤ box_i``
+            x_eq: Linearization point
+            signature: Problem signature stored with the table
+            n_samples: Exploration samples drawn uniformly from the box
+            n_validation: Fresh samples used to measure the covered fraction
+            leaf_size: Regions per leaf below which the tree stops splitting
+            max_depth: Maximum search tree depth
+            seed: Sampling seed
+        """
+        box = np.asarray(box, dtype=float)
+        rng = np.random.default_rng(seed)
+        factor = cho_factor(qp.H)
+        Hi = cho_solve(factor, np.eye(qp.n_inputs))
+
+        regions: List[Tuple[np.ndarray, np.ndarray, np.ndarray, float]] = []
+        seen = set()
+        P_all = np.empty((0, box.size))
+        q_all = np.empty(0)
+        owner = np.empty(0, dtype=np.int64)
+        for theta in rng.uniform(-box, box, size=(int(n_samples), box.size)):
+            if regions:
+                outside = P_all @ theta > q_all + 1e-9
+                if np.bincount(owner[outside], minlength=len(regions)).min() == 0:
+                    continue
+            sol = solve_qp_active_set(qp.H, qp.gradient(theta), qp.G, qp.bounds(theta),
+                                      H_factor=factor)
+            if not sol.success or sol.active_set in seen:
+                continue
+            seen.add(sol.active_set)
+            region = _critical_region(qp, Hi, sol.active_set, box)
+            if region is None or np.any(region[0] @ theta > region[1] + 1e-7):
+                continue
+            regions.append(region)
+            P_all = np.vstack([P_all, region[0]])
+            q_all = np.concatenate([q_all, region[1]])
+            owner = np.concatenate([owner, np.full(region[1].size, len(regions) - 1)])
+
+        if not regions:
+            raise RuntimeError("Explicit MPC exploration found no feasible region")
+
+        lo = np.empty((len(regions), box.size))
+        hi = np.empty((len(regions), box.size))
+        for r, (P, q, _, _) in enumerate(regions):
+            lo[r], hi[r] = _bounding_box(P, q, box)
+
+        counts = [region[1].size for region in regions]
+        arrays = {
+            "P": np.vstack([region[0] for region in regions]).reshape(-1, box.size),
+            "q": np.concatenate([region[1] for region in regions]),
+            "row_offsets": np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            "K": np.vstack([region[2] for region in regions]),
+            "k": np.array([region[3] for region in regions]),
+            "box": box,
+            "x_eq": np.asarray(x_eq, dtype=float),
+            "signature": np.asarray(signature, dtype=float),
+            "coverage": np.array(np.nan),
+            **_build_tree(lo, hi, leaf_size, max_depth),
+        }
+        table = cls(arrays)
+        # Fraction of feasible validation states answered by the table
+        covered = feasible = 0
+        for theta in rng.uniform(-box, box, size=(int(n_validation), box.size)):
+            if table.locate(x_eq + theta) >= 0:
+                covered += 1
+                feasible += 1
+            elif solve_qp_active_set(qp.H, qp.gradient(theta), qp.G, qp.bounds(theta),
+                                     H_factor=factor).success:
+                feasible += 1
+        table.coverage = np.array(covered / feasible if feasible else 0.0)
+        logger.info(
+            "Explicit MPC table: %d regions, %d tree nodes, coverage %.1f%%",
+            table.n_regions, table.node_dim.size, 100.0 * float(table.coverage),
+        )
+        return table
+
+    def locate(self, x: np.ndarray) -> int:
+        """Index of the region containing state ``x`` (-1 if not covered)."""
+        theta = np.asarray(x, dtype=float) - self.x_eq
+        if np.any(np.abs(theta) > self.box):
+            return -1
+        return int(_locate_region(
+            theta, self.node_dim, self.node_split, self.node_left, self.node_right,
+            self.leaf_start, self.leaf_count, self.leaf_regions, self.row_offsets,
+            self.P, self.q, self.tol,
+        ))
+
+    def evaluate(self, x: np.ndarray) -> float:
+        """Explicit MPC control for state ``x``, or NaN if ``x`` is not covered."""
+        region = self.locate(x)
+        if region < 0:
+            return np.nan
+        theta = np.asarray(x, dtype=float) - self.x_eq
+        return float(self.K[region] @ theta + self.k[region])
+
+    def matches(self, signature: np.ndarray) -> bool:
+        """True if the table was built for the problem described by ``signature``."""
+        signature = np.asarray(signature, dtype=float)
+        return (signature.shape == self.signature.shape
+                and bool(np.allclose(signature, self.signature, rtol=1e-9, atol=1e-12)))
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as fh:  # keep the exact file name (savez appends .npz to str paths)
+            np.savez_compressed(fh, **{name: getattr(self, name) for name in _TABLE_ARRAYS})
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ExplicitMPCTable":
+        with np.load(Path(path), allow_pickle=False) as data:
+            return cls({name: data[name] for name in data.files})
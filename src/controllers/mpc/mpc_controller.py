@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 # cvxpy is an optional dependency.  Attempt to import it, but allow
@@ -17,7 +18,7 @@ try:
     import cvxpy as cp  # type: ignore
 except Exception:
     cp = None  # type: ignore
-from scipy.linalg import expm
+from scipy.linalg import cho_factor, expm
 
 try:
     from src.core.dynamics import DoubleInvertedPendulum  # type: ignore
@@ -35,8 +36,17 @@ except Exception:
     except Exception:
         ClassicalSMC = None  # type: ignore
 
+from .condensed_qp import CondensedQP, condense_mpc_qp, solve_qp_active_set
+from .explicit_mpc import ExplicitMPCTable
+
 logger = logging.getLogger(__name__)
 
+# Upright equilibrium in this controller's convention (angles from hanging)
+_UPRIGHT = np.array([0.0, np.pi, np.pi, 0.0, 0.0, 0.0])
+
+# Default half-widths of the state box covered by the explicit MPC table
+_EXPLICIT_BOX = (0.5, 0.3, 0.3, 1.0, 2.0, 2.0)
+
 
 def _call_f(dyn: DoubleInvertedPendulum, x: np.ndarray, u: float | np.ndarray) -> np.ndarray:
     """
@@ -133,6 +143,35 @@ def _numeric_linearize_continuous(
     return A, B
 
 
+def _linearize_continuous(
+    dyn: DoubleInvertedPendulum,
+    x_eq: np.ndarray,
+    u_eq: float,
+    eps: float = 1e-6,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linearise ``f(x,u)`` around (x_eq, u_eq), preferring an analytic Jacobian.
+
+    Plant models exposing ``compute_jacobian(x, u) -> (A, B)`` are
+    linearised in a single compiled call; any other model, or a Jacobian
+    that fails or returns malformed matrices, falls back to
+    :func:`_numeric_linearize_continuous`.
+    """
+    x_eq = np.asarray(x_eq, dtype=float)
+    jac = getattr(dyn, "compute_jacobian", None)
+    if callable(jac):
+        n = x_eq.size
+        try:
+            A, B = jac(x_eq, float(u_eq))
+            A = np.asarray(A, dtype=float)
+            B = np.asarray(B, dtype=float).reshape(n, -1)
+            if A.shape == (n, n) and B.shape == (n, 1) and np.all(np.isfinite(A)) and np.all(np.isfinite(B)):
+                return A, B
+        except Exception as e:
+            logger.debug(f"Analytic Jacobian unavailable, using finite differences: {e}")
+    return _numeric_linearize_continuous(dyn, x_eq, u_eq, eps=eps)
+
+
 def _discretize_forward_euler(Ac: np.ndarray, Bc: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
     """Simple forward‑Euler discretization (stable for small dt)."""
     n = Ac.shape[0]
@@ -164,12 +203,58 @@ class MPCWeights:
     r_u: float = 1e-2           # input effort
 
 
+@dataclass
+class _ParametricQP:
+    """MPC quadratic program built once with the per-step data as parameters."""
+
+    problem: Any
+    X: Any
+    U: Any
+    Ad: Any
+    Bd: Any
+    x0: Any
+    Xref: Any
+
+
 class MPCController:
     """
     Linear MPC for the double inverted pendulum on a cart.
 
     State (nx=6): [x, th1, th2, xdot, th1dot, th2dot]
     Input (nu=1): u = cart force
+
+    The QP is built once with the discrete model ``(Ad, Bd)``, the initial
+    state and the reference trajectory as ``cp.Parameter`` objects, so each
+    control step only updates parameter values and re-solves warm.  CVXPY
+    canonicalizes the problem on the first solve and afterwards only maps
+    the new parameter values into the cached OSQP instance.  Pass
+    ``reuse_problem=False`` to rebuild the problem on every step instead.
+
+    ``formulation="condensed"`` eliminates the states instead and solves the
+    dense ``N``-variable QP with the built-in active-set solver (no cvxpy).
+    Its Hessian depends only on ``(Ad, Bd, Q, R)``, so the condensed matrices
+    and the Cholesky factor of the Hessian are cached and reused for as long
+    as the discrete model is unchanged; ``qp_factorizations`` counts rebuilds.
+
+    The model is linearized about the measured state and discretized on
+    every step by default.  ``relinearize_tol`` enables a linearization
+    cache: ``(Ad, Bd)`` are reused while ``max|x0 - x_lin|`` stays within the
+    tolerance of the last linearization point ``x_lin``, so the prediction
+    model differs from a fresh linearization by at most the variation of the
+    Jacobian over that distance (none for linear plants).  With
+    ``linearize_about_upright=True`` the model is linearized once about
+    upright and reused for every state.  ``linearization_hits`` /
+    ``linearization_misses`` count reused and recomputed models.
+
+    With ``explicit_mpc=True`` the model is linearized once about upright
+    and the resulting QP is solved offline into a piecewise-affine region
+    table (:class:`ExplicitMPCTable`).  Each step then locates the region of
+    the current state and evaluates its affine law, with no QP solve and no
+    cvxpy.  The table is loaded lazily on the first control step from
+    ``explicit_table_path`` (and rebuilt and saved there if missing or
+    built for a different problem).  States outside the table, and any
+    step with a user reference set, use the online path instead;
+    ``explicit_hits`` / ``explicit_misses`` count both cases.
     """
 
     def __init__(
@@ -197,6 +282,23 @@ class MPCController:
         # When provided, the returned control is rate-limited relative to the
         # previous output. Units: N per control step.
         max_du: Optional[float] = None,
+        # Build the QP once and update its parameters each step (default).
+        # When False, a new problem is constructed on every call.
+        reuse_problem: bool = True,
+        # "sparse": (X, U) QP solved through cvxpy/OSQP.  "condensed": dense
+        # input-only QP solved by the built-in active-set solver.
+        formulation: str = "sparse",
+        # Reuse (Ad, Bd) while the state stays within this max-abs distance
+        # of the last linearization point (None: re-linearize every step).
+        relinearize_tol: Optional[float] = None,
+        # Linearize once about upright and reuse that model for every state.
+        linearize_about_upright: bool = False,
+        # Explicit MPC about upright: offline region table, online lookup.
+        # ``explicit_options`` may set ``state_box`` (half-widths of the
+        # explored deviation box), ``n_samples``, ``n_validation`` and ``seed``.
+        explicit_mpc: bool = False,
+        explicit_table_path: Optional[Union[str, Path]] = None,
+        explicit_options: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.model = dynamics_model
         self.N = int(horizon)
@@ -217,6 +319,34 @@ class MPCController:
         self._last_u_out: float = 0.0
         self._max_du: Optional[float] = max_du
 
+        # Parametric QP, built lazily on the first solve
+        self._reuse_problem = bool(reuse_problem)
+        self._qp: Optional[_ParametricQP] = None
+
+        # Condensed QP and Hessian factor, cached per discrete model
+        if formulation not in ("sparse", "condensed"):
+            raise ValueError(f"formulation must be 'sparse' or 'condensed', got {formulation!r}")
+        self._formulation = formulation
+        self._condensed: Optional[Tuple[bytes, CondensedQP, Any]] = None
+        self.qp_factorizations = 0
+
+        # Linearization cache: (x_lin, Ad, Bd) of the last linearization
+        if relinearize_tol is not None and float(relinearize_tol) < 0.0:
+            raise ValueError(f"relinearize_tol must be non-negative, got {relinearize_tol}")
+        self._relinearize_tol = None if relinearize_tol is None else float(relinearize_tol)
+        self._linearize_upright = bool(linearize_about_upright)
+        self._linearization: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self.linearization_hits = 0
+        self.linearization_misses = 0
+
+        # Explicit MPC table, loaded or built lazily on the first step
+        self._explicit = bool(explicit_mpc)
+        self._explicit_path = Path(explicit_table_path) if explicit_table_path is not None else None
+        self._explicit_options = dict(explicit_options or {})
+        self._explicit_table: Optional[ExplicitMPCTable] = None
+        self.explicit_hits = 0
+        self.explicit_misses = 0
+
         # Create a safe fallback controller used if the QP fails.  Users may
         # provide custom SMC or PD gains via the ``fallback_smc_gains``
         # and ``fallback_pd_gains`` constructor arguments.  When custom
@@ -300,12 +430,25 @@ class MPCController:
 
     def compute_control(self, t: float, x0: np.ndarray) -> float:
         """
-        Build and solve a linear MPC QP around the current state x0 at time t.
+        Solve the linear MPC QP around the current state x0 at time t.
         On solver failure/infeasibility, return a safe, angle-aware fallback control.
         """
         x0 = np.asarray(x0, dtype=float).reshape(-1)
         assert x0.shape[0] == 6, "Expected state dimension 6: [x, th1, th2, xdot, th1dot, th2dot]"
 
+        # Explicit MPC: region lookup, online path only for uncovered states
+        if self._explicit and self._ref_fn is None:
+            u_exp = self.explicit_table.evaluate(x0)
+            if np.isfinite(u_exp):
+                self.explicit_hits += 1
+                u_cmd = float(np.clip(u_exp, -self.max_force, self.max_force))
+                if self._max_du is not None:
+                    du = np.clip(u_cmd - self._last_u_out, -self._max_du, self._max_du)
+                    u_cmd = float(self._last_u_out + du)
+                self._last_u_out = u_cmd
+                return u_cmd
+            self.explicit_misses += 1
+
         # If cvxpy is unavailable, skip the optimization and compute a
         # simple linear feedback control.  Use proportional gains derived
         # from the weight object to regulate position, angles and rates
@@ -313,7 +456,8 @@ class MPCController:
         # theta1=pi, theta2=pi, and zero velocities.  Clip the result
         # to respect the actuator limits.  This fallback provides a
         # deterministic control signal without depending on cvxpy.
-        if cp is None:
+        # The condensed formulation does not need cvxpy.
+        if cp is None and self._formulation == "sparse":
             # Compute errors relative to the desired upright state
             x_err = float(x0[0])
             th1_err = float(x0[1] - np.pi)
@@ -352,12 +496,222 @@ class MPCController:
 
         # Linearize continuous dynamics around (x0, u=0), then discretize
         try:
-            Ac, Bc = _numeric_linearize_continuous(self.model, x0, 0.0, eps=1e-6)
-            Ad, Bd = self._discretize(Ac, Bc, self.dt)
+            Ad, Bd = self._discrete_model(x0)
         except Exception as e:
             logger.warning("Linearization/discretization failed (%s). Falling back.", e)
             return self._safe_fallback(x0)
 
+        N = self.N
+        if self._formulation == "condensed":
+            U_opt = self._solve_condensed(x0, Xref, Ad, Bd)
+            if U_opt is None:
+                return self._safe_fallback(x0)
+            self._U_prev = U_opt
+            u_cmd = float(np.clip(U_opt[0], -self.max_force, self.max_force))
+            if self._max_du is not None:
+                du = np.clip(u_cmd - self._last_u_out, -self._max_du, self._max_du)
+                u_cmd = float(self._last_u_out + du)
+            self._last_u_out = u_cmd
+            return u_cmd
+
+        if self._reuse_problem:
+            qp = self._qp if self._qp is not None else self._build_parametric_qp()
+            qp.Ad.value = Ad
+            qp.Bd.value = Bd
+            qp.x0.value = x0
+            qp.Xref.value = Xref
+            prob, U = qp.problem, qp.U
+        else:
+            prob, U = self._build_step_problem(x0, Xref, Ad, Bd)
+
+        # Warm start
+        try:
+            if self._U_prev.size == N:
+                U.value = self._U_prev.reshape(1, -1)
+        except Exception as e:
+            logger.debug(f"Could not apply warm start to MPC solver: {e}")
+            pass  # OK: Solver will run cold start
+
+        # Solve (prefer OSQP; fall back to default if unavailable)
+        try:
+            prob.solve(solver=cp.OSQP, warm_start=True, verbose=False)
+        except Exception as e:
+            logger.debug(f"OSQP solver unavailable, using default solver: {e}")
+            prob.solve(warm_start=True, verbose=False)  # OK: Fallback to default CVXPY solver
+
+        if prob.status not in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE):
+            logger.warning("MPC solve failed with status %s; using safe fallback.", prob.status)
+            return self._safe_fallback(x0)
+
+        # Extract first control and cache warm start
+        u0 = float(U.value[0, 0])
+        self._U_prev = U.value.reshape(-1)
+        u_cmd = float(np.clip(u0, -self.max_force, self.max_force))
+        # Optional slew rate limit
+        if self._max_du is not None:
+            du = np.clip(u_cmd - self._last_u_out, -self._max_du, self._max_du)
+            u_cmd = float(self._last_u_out + du)
+        self._last_u_out = u_cmd
+        return u_cmd
+
+    def _discrete_model(self, x0: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Discrete ``(Ad, Bd)`` for the step at ``x0``, reused from the cache when allowed."""
+        cached = self._linearization
+        if cached is not None and (
+            self._linearize_upright
+            or (self._relinearize_tol is not None
+                and np.max(np.abs(x0 - cached[0])) <= self._relinearize_tol)
+        ):
+            self.linearization_hits += 1
+            return cached[1], cached[2]
+
+        x_lin = _UPRIGHT.copy() if self._linearize_upright else x0.copy()
+        Ac, Bc = _linearize_continuous(self.model, x_lin, 0.0, eps=1e-6)
+        Ad, Bd = self._discretize(Ac, Bc, self.dt)
+        self.linearization_misses += 1
+        self._linearization = (x_lin, Ad, Bd)
+        return Ad, Bd
+
+    # -- Condensed formulation ---------------------------------------------------------------
+
+    def _condensed_qp(self, Ad: np.ndarray, Bd: np.ndarray) -> Tuple[CondensedQP, Any]:
+        """Condensed QP and Hessian Cholesky factor for ``(Ad, Bd)``, cached."""
+        key = Ad.tobytes() + Bd.tobytes()
+        if self._condensed is None or self._condensed[0] != key:
+            Q, R = self._cost_weights()
+            qp = condense_mpc_qp(
+                Ad, Bd, Q, R, self.N, self.max_force,
+                state_bounds=[(0, self.max_cart_pos), (1, self.max_theta_dev), (2, self.max_theta_dev)],
+                state_center=_UPRIGHT,
+            )
+            self._condensed = (key, qp, cho_factor(qp.H))
+            self.qp_factorizations += 1
+        return self._condensed[1], self._condensed[2]
+
+    def _solve_condensed(
+        self, x0: np.ndarray, Xref: np.ndarray, Ad: np.ndarray, Bd: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Solve the condensed MPC QP; returns the input sequence or None.
+
+        Same problem as the sparse formulation: the bounds on ``X[:, 0]``
+        only involve the measured state, so they are checked directly.
+        """
+        if (abs(x0[0]) > self.max_cart_pos
+                or abs(x0[1] - np.pi) > self.max_theta_dev
+                or abs(x0[2] - np.pi) > self.max_theta_dev):
+            logger.warning("MPC state outside constraints; using safe fallback.")
+            return None
+
+        qp, factor = self._condensed_qp(Ad, Bd)
+        b = qp.bounds(x0)
+        # Warm start from the previous sequence shifted by one step, with the
+        # constraints it already touches as the initial working set
+        z0, working = None, None
+        if self._U_prev.size == self.N:
+            z0 = np.append(self._U_prev[1:], self._U_prev[-1])
+            working = np.flatnonzero(np.abs(qp.G @ z0 - b) <= 1e-9 * (1.0 + np.abs(b)))[:self.N]
+        sol = solve_qp_active_set(
+            qp.H, qp.gradient(x0, Xref[:, 1:].T), qp.G, b, z0=z0, H_factor=factor,
+            working_set=working,
+        )
+        if not sol.success:
+            logger.warning("MPC solve failed with status %s; using safe fallback.", sol.status)
+            return None
+        return sol.z
+
+    # -- Explicit MPC ------------------------------------------------------------------------
+
+    @property
+    def explicit_table(self) -> ExplicitMPCTable:
+        """Explicit MPC table, loaded from disk or built on first access."""
+        if self._explicit_table is None:
+            self._explicit_table = self._load_explicit_table()
+        return self._explicit_table
+
+    def _load_explicit_table(self) -> ExplicitMPCTable:
+        Ac, Bc = _linearize_continuous(self.model, _UPRIGHT, 0.0, eps=1e-6)
+        Ad, Bd = self._discretize(Ac, Bc, self.dt)
+        opts = dict(self._explicit_options)
+        box = np.asarray(opts.pop("state_box", _EXPLICIT_BOX), dtype=float)
+        w = self.weights
+        signature = np.concatenate([
+            [self.N, self.dt, self.max_force, self.max_cart_pos, self.max_theta_dev,
+             w.q_x, w.q_theta, w.q_xdot, w.q_thetadot, w.r_u],
+            box, Ad.ravel(), Bd.ravel(),
+        ])
+
+        path = self._explicit_path
+        if path is not None and path.exists():
+            try:
+                table = ExplicitMPCTable.load(path)
+                if table.matches(signature):
+                    logger.info("Loaded explicit MPC table from %s (%d regions)", path, table.n_regions)
+                    return table
+                logger.info("Explicit MPC table %s was built for a different problem; rebuilding", path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Could not load explicit MPC table %s (%s); rebuilding", path, e)
+
+        Q, R = self._cost_weights()
+        qp = condense_mpc_qp(
+            Ad, Bd, Q, R, self.N, self.max_force,
+            state_bounds=[(0, self.max_cart_pos), (1, self.max_theta_dev), (2, self.max_theta_dev)],
+        )
+        table = ExplicitMPCTable.build(qp, box, _UPRIGHT, signature, **opts)
+        if path is not None:
+            table.save(path)
+        return table
+
+    # -- QP construction ---------------------------------------------------------------------
+
+    def _cost_weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        w = self.weights
+        Q = np.diag([w.q_x, w.q_theta, w.q_theta, w.q_xdot, w.q_thetadot, w.q_thetadot])
+        R = np.array([[w.r_u]], dtype=float)
+        return Q, R
+
+    def _build_parametric_qp(self) -> _ParametricQP:
+        """
+        Build the MPC QP once with ``Ad``, ``Bd``, ``x0`` and ``Xref`` as parameters.
+
+        The problem is DPP-compliant (parameters enter the dynamics
+        constraint linearly in the decision variables), so CVXPY caches the
+        canonicalization and later solves only rewrite the numeric data.
+        """
+        nx, nu = 6, 1
+        N = self.N
+
+        X = cp.Variable((nx, N + 1))
+        U = cp.Variable((nu, N))
+        Ad = cp.Parameter((nx, nx), name="Ad")
+        Bd = cp.Parameter((nx, nu), name="Bd")
+        x0 = cp.Parameter(nx, name="x0")
+        Xref = cp.Parameter((nx, N + 1), name="Xref")
+
+        Q, R = self._cost_weights()
+        Q_half = np.sqrt(np.diag(Q))[:, None]
+        R_half = float(np.sqrt(R[0, 0]))
+
+        # Stage and terminal tracking costs plus input effort
+        obj = cp.sum_squares(cp.multiply(Q_half, X - Xref)) + cp.sum_squares(R_half * U)
+        cons = [
+            X[:, 0] == x0,
+            X[:, 1:] == Ad @ X[:, :N] + Bd @ U,
+            cp.abs(U[0, :]) <= self.max_force,
+            cp.abs(X[0, :N]) <= self.max_cart_pos,
+            cp.abs(X[1, :N] - np.pi) <= self.max_theta_dev,
+            cp.abs(X[2, :N] - np.pi) <= self.max_theta_dev,
+        ]
+        self._qp = _ParametricQP(
+            problem=cp.Problem(cp.Minimize(obj), cons),
+            X=X, U=U, Ad=Ad, Bd=Bd, x0=x0, Xref=Xref,
+        )
+        return self._qp
+
+    def _build_step_problem(
+        self, x0: np.ndarray, Xref: np.ndarray, Ad: np.ndarray, Bd: np.ndarray
+    ) -> Tuple[Any, Any]:
+        """Build a fresh QP for one control step (``reuse_problem=False``)."""
         nx, nu = 6, 1
         N = self.N
 
@@ -366,9 +720,7 @@ class MPCController:
         U = cp.Variable((nu, N))
 
         # Cost weights
-        w = self.weights
-        Q = np.diag([w.q_x, w.q_theta, w.q_theta, w.q_xdot, w.q_thetadot, w.q_thetadot])
-        R = np.array([[w.r_u]], dtype=float)
+        Q, R = self._cost_weights()
 
         # Objective and constraints
         obj = 0
@@ -396,37 +748,7 @@ class MPCController:
         eN = X[:, N] - Xref[:, N]
         obj += cp.quad_form(eN, Q)
 
-        prob = cp.Problem(cp.Minimize(obj), cons)
-
-        # Warm start
-        try:
-            if self._U_prev.size == N:
-                U.value = self._U_prev.reshape(1, -1)
-        except Exception as e:
-            logger.debug(f"Could not apply warm start to MPC solver: {e}")
-            pass  # OK: Solver will run cold start
-
-        # Solve (prefer OSQP; fall back to default if unavailable)
-        try:
-            prob.solve(solver=cp.OSQP, warm_start=True, verbose=False)
-        except Exception as e:
-            logger.debug(f"OSQP solver unavailable, using default solver: {e}")
-            prob.solve(warm_start=True, verbose=False)  # OK: Fallback to default CVXPY solver
-
-        if prob.status not in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE):
-            logger.warning("MPC solve failed with status %s; using safe fallback.", prob.status)
-            return self._safe_fallback(x0)
-
-        # Extract first control and cache warm start
-        u0 = float(U.value[0, 0])
-        self._U_prev = U.value.reshape(-1)
-        u_cmd = float(np.clip(u0, -self.max_force, self.max_force))
-        # Optional slew rate limit
-        if self._max_du is not None:
-            du = np.clip(u_cmd - self._last_u_out, -self._max_du, self._max_du)
-            u_cmd = float(self._last_u_out + du)
-        self._last_u_out = u_cmd
-        return u_cmd
+        return cp.Problem(cp.Minimize(obj), cons), U
 
     # -- Fallbacks ---------------------------------------------------------------------------
 
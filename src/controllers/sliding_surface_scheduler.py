@@ -36,9 +36,11 @@ Created: November 9, 2025
 
 import numpy as np
 import logging
-from typing import List, Optional, Union, Sequence, Any
+from typing import List, Optional, Union, Sequence, Any, Tuple
 from dataclasses import dataclass
 
+from .gain_schedule import CompiledGainSchedule, LOW_SIDE
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,8 +97,14 @@ class SlidingSurfaceScheduler:
     Note:
         This scheduler is designed to replace AdaptiveGainScheduler for the Hybrid
         controller to fix the deployment blockage (666.9° overshoot issue).
+
+        Thresholds and gain sets are compiled into a CompiledGainSchedule at
+        construction; call compile_schedule() after changing them.
     """
 
+    # Gain modes, indexed by CompiledGainSchedule side (conservative below the thresholds)
+    MODES = ('conservative', 'aggressive')
+
     def __init__(
         self,
         base_controller: Any,
@@ -131,7 +139,8 @@ class SlidingSurfaceScheduler:
         self.conservative_gains = self.robust_gains * self.config.conservative_scale
 
         # State tracking for hysteresis
-        self._last_mode = 'conservative'  # Start conservative (assume good initial performance)
+        self._mode = LOW_SIDE  # Start conservative (assume good initial performance)
+        self.compile_schedule()
 
         logger.info(
             f"SlidingSurfaceScheduler initialized: "
@@ -141,6 +150,31 @@ class SlidingSurfaceScheduler:
             f"INVERTED LOGIC (high |s| -> aggressive)"
         )
 
+    @property
+    def _last_mode(self) -> str:
+        """Previous gain mode ('conservative' or 'aggressive')."""
+        return self.MODES[self._mode]
+
+    @_last_mode.setter
+    def _last_mode(self, value: str) -> None:
+        self._mode = self.MODES.index(value)
+
+    def compile_schedule(self) -> CompiledGainSchedule:
+        """
+        Compile |s| thresholds, hysteresis and gain sets into a lookup schedule.
+
+        Returns:
+            The compiled schedule (also stored as ``self.schedule``)
+        """
+        self.schedule = CompiledGainSchedule(
+            self.conservative_gains,
+            self.aggressive_gains,
+            self.config.small_s_threshold,
+            self.config.large_s_threshold,
+            self.config.hysteresis_width
+        )
+        return self.schedule
+
     def compute_sliding_surface(self, state: np.ndarray) -> float:
         """
         Compute sliding surface magnitude |s| from system state.
@@ -163,6 +197,19 @@ class SlidingSurfaceScheduler:
 
         return abs(s)
 
+    def compute_sliding_surface_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Compute sliding surface magnitudes |s| for a batch of states.
+
+        Args:
+            states: System states, shape (B, 6)
+
+        Returns:
+            Sliding surface magnitudes, shape (B,)
+        """
+        states = np.asarray(states, dtype=float)
+        return np.abs(self.config.c1 * states[:, 1] + self.config.c2 * states[:, 4])
+
     def schedule_gains(self, state: np.ndarray) -> np.ndarray:
         """
         Determine scheduled gains based on sliding surface magnitude.
@@ -181,40 +228,35 @@ class SlidingSurfaceScheduler:
             Scheduled gains (aggressive, conservative, or interpolated)
         """
         s_mag = self.compute_sliding_surface(state)
+        scheduled_gains, self._mode = self.schedule.lookup(s_mag, self._mode)
+        return scheduled_gains
 
-        # Apply hysteresis based on last mode
-        if self._last_mode == 'aggressive':
-            # Currently aggressive, need lower |s| to switch to conservative
-            small_thresh = self.config.small_s_threshold - self.config.hysteresis_width
-        else:
-            # Currently conservative, need higher |s| to stay conservative
-            small_thresh = self.config.small_s_threshold + self.config.hysteresis_width
+    def schedule_gains_batch(
+        self,
+        states: np.ndarray,
+        modes: Optional[np.ndarray] = None,
+        gains: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Determine scheduled gains for a batch of states.
 
-        if self._last_mode == 'conservative':
-            # Currently conservative, need higher |s| to switch to aggressive
-            large_thresh = self.config.large_s_threshold + self.config.hysteresis_width
-        else:
-            # Currently aggressive, need lower |s| to stay aggressive
-            large_thresh = self.config.large_s_threshold - self.config.hysteresis_width
-
-        # Determine gain mode (INVERTED LOGIC)
-        if s_mag < small_thresh:
-            # Small |s|: Control performing well → use conservative gains
-            scheduled_gains = self.conservative_gains
-            self._last_mode = 'conservative'
-        elif s_mag > large_thresh:
-            # Large |s|: Control struggling → use AGGRESSIVE gains (inverted!)
-            scheduled_gains = self.aggressive_gains
-            self._last_mode = 'aggressive'
-        else:
-            # Transition zone: linear interpolation
-            # alpha=0 at small_thresh (conservative), alpha=1 at large_thresh (aggressive)
-            alpha = (s_mag - small_thresh) / (large_thresh - small_thresh)
-            alpha = np.clip(alpha, 0.0, 1.0)  # Safety clamp
-            scheduled_gains = (1 - alpha) * self.conservative_gains + alpha * self.aggressive_gains
-            # Keep last mode for hysteresis continuity
+        Args:
+            states: System states, shape (B, 6)
+            modes: Per-row gain modes (0 conservative, 1 aggressive); default conservative
+            gains: Optional per-row robust gains, shape (B, n_gains), scaled by the
+                   configured conservative/aggressive factors
 
-        return scheduled_gains
+        Returns:
+            (scheduled_gains, new_modes) with shapes (B, n_gains) and (B,)
+        """
+        states = np.atleast_2d(np.asarray(states, dtype=float))
+        if modes is None:
+            modes = np.full(states.shape[0], LOW_SIDE)
+        endpoints = None
+        if gains is not None:
+            robust = np.asarray(gains, dtype=float)
+            endpoints = (robust * self.config.conservative_scale, robust * self.config.aggressive_scale)
+        return self.schedule.lookup_batch(self.compute_sliding_surface_batch(states), modes, endpoints)
 
     def update_controller_gains(self, new_gains: np.ndarray) -> None:
         """
@@ -286,6 +328,37 @@ class SlidingSurfaceScheduler:
         # Delegate to base controller
         return self.base_controller.compute_control(state, state_vars, history)
 
+    def compute_control_batch(
+        self,
+        states: np.ndarray,
+        gains: Optional[np.ndarray] = None,
+        ctrl_state: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute |s|-scheduled control for a batch of states.
+
+        Requires a base controller with ``compute_control_batch``; each row is
+        evaluated as if the base controller were built with that row's
+        scheduled gains.
+
+        Args:
+            states: System states, shape (B, 6)
+            gains: Optional per-row robust gains (see schedule_gains_batch)
+            ctrl_state: Column 0 holds the gain mode, the remaining columns the
+                        base controller state; None starts every row conservative
+
+        Returns:
+            (u, new_ctrl_state, sigma) with new_ctrl_state laid out like ctrl_state
+        """
+        states = np.atleast_2d(np.asarray(states, dtype=float))
+        modes, base_state = None, None
+        if ctrl_state is not None:
+            ctrl_state = np.asarray(ctrl_state, dtype=float)
+            modes, base_state = ctrl_state[:, 0], ctrl_state[:, 1:]
+        scheduled, modes = self.schedule_gains_batch(states, modes, gains)
+        u, new_state, sigma = self.base_controller.compute_control_batch(states, scheduled, base_state)
+        return u, np.column_stack([modes.astype(float), new_state]), sigma
+
     def initialize_state(self) -> Any:
         """Initialize controller state (delegates to base controller)."""
         return self.base_controller.initialize_state()
@@ -61,7 +61,10 @@ alpha : float, optional
 
 import logging
 import numpy as np
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional, Union
+
+from .batch_control import adaptive_smc_batch
+from .core.telemetry import TelemetryBuffer, TelemetryMixin
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +85,7 @@ except Exception:
         from utils import AdaptiveSMCOutput    # when src itself on sys.path
 
 
-class AdaptiveSMC:
+class AdaptiveSMC(TelemetryMixin):
     """
     Adaptive Sliding Mode Controller that adjusts gain K online.
 
@@ -95,6 +98,8 @@ class AdaptiveSMC:
     boundedness without a priori bounded uncertainty【smc_roy_2020_adaptive
     _unbounded†L108650】.
     """
+    # History channels, in the order they are recorded each step
+    TELEMETRY_CHANNELS = ("K", "sigma", "u_sw", "dK", "time_in_sliding")
     n_gains = 5  
     def __init__(
         self,
@@ -257,8 +262,11 @@ class AdaptiveSMC:
         """Initialize internal state: (K, last_u, time_in_sliding)."""
         return (self.K_init, 0.0, 0.0)
         
-    def initialize_history(self) -> Dict:
-        """Initialize history dictionary."""
+    def initialize_history(self) -> Union[Dict, TelemetryBuffer]:
+        """Initialize history dictionary, or a telemetry buffer if configured."""
+        buffer = self._new_telemetry_buffer()
+        if buffer is not None:
+            return buffer
         return {
             'K': [],
             'sigma': [],
@@ -421,16 +429,49 @@ class AdaptiveSMC:
         # partially filled history.  History accumulation can be
         # disabled by passing in an empty dict, though the lists
         # will be created on demand if needed.
+        # A configured TelemetryBuffer is written without allocating.
         hist = history
-        hist.setdefault('K', []).append(new_K)
-        hist.setdefault('sigma', []).append(sigma)
-        hist.setdefault('u_sw', []).append(u_sw)
-        hist.setdefault('dK', []).append(dK)
-        hist.setdefault('time_in_sliding', []).append(new_time_in_sliding)
+        if isinstance(hist, TelemetryBuffer):
+            hist.record(new_K, sigma, u_sw, dK, new_time_in_sliding)
+        else:
+            hist.setdefault('K', []).append(new_K)
+            hist.setdefault('sigma', []).append(sigma)
+            hist.setdefault('u_sw', []).append(u_sw)
+            hist.setdefault('dK', []).append(dK)
+            hist.setdefault('time_in_sliding', []).append(new_time_in_sliding)
         # Construct a structured return value.  Returning a named tuple
         # clarifies the meaning of each element while preserving
         # tuple‑like behaviour.
         return AdaptiveSMCOutput(u, (new_K, u, new_time_in_sliding), hist, sigma)
+
+    def compute_control_batch(
+        self,
+        states: np.ndarray,
+        gains: Optional[np.ndarray] = None,
+        ctrl_state: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the adaptive law for a batch of states and gain vectors.
+
+        Parameters
+        ----------
+        states : np.ndarray
+            State array of shape ``(B, 6)``.
+        gains : np.ndarray, optional
+            Gains ``[k1, k2, lam1, lam2, gamma]`` of shape ``(B, 5)``;
+            defaults to this controller's gains.
+        ctrl_state : np.ndarray, optional
+            ``(K, last_u, time_in_sliding)`` rows of shape ``(B, 3)``;
+            defaults to :meth:`initialize_state`.
+
+        Returns
+        -------
+        tuple
+            ``(u, new_state, sigma)`` with shapes ``(B,)``, ``(B, 3)`` and
+            ``(B,)``, identical to calling :meth:`compute_control` per row.
+            History is not recorded.
+        """
+        return adaptive_smc_batch(self, states, gains, ctrl_state)
         
     def set_dynamics(self, dynamics_model) -> None:
         """Set dynamics model (for compatibility, not used in this implementation)."""
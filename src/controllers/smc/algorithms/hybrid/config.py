@@ -88,6 +88,10 @@ class HybridSMCConfig:
     transition_smoothing: bool = field(default=True)          # Smooth control transitions
     smoothing_time_constant: float = field(default=0.05)     # Smoothing filter time constant
 
+    # Sub-controller evaluation
+    lazy_evaluation: bool = field(default=False)              # Compute only the active controller per step
+    full_evaluation_interval: int = field(default=10)         # Steps between full evaluations when lazy
+
     # Optional dynamics model
     dynamics_model: Optional[object] = field(default=None, compare=False)
 
@@ -213,6 +217,9 @@ class HybridSMCConfig:
         if self.transition_smoothing and self.smoothing_time_constant <= 0:
             raise ValueError("Smoothing time constant must be positive")
 
+        if self.full_evaluation_interval < 1:
+            raise ValueError("Full evaluation interval must be at least 1")
+
     def get_active_controllers(self) -> List[str]:
         """Get list of active controller types based on hybrid mode."""
         mode_mapping = {
@@ -297,7 +304,9 @@ class HybridSMCConfig:
             'enable_learning': self.enable_learning,
             'learning_rate': self.learning_rate,
             'transition_smoothing': self.transition_smoothing,
-            'smoothing_time_constant': self.smoothing_time_constant
+            'smoothing_time_constant': self.smoothing_time_constant,
+            'lazy_evaluation': self.lazy_evaluation,
+            'full_evaluation_interval': self.full_evaluation_interval
         }
 
         # Add individual controller configs
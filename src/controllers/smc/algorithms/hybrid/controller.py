@@ -24,6 +24,7 @@ from ..adaptive.controller import ModularAdaptiveSMC
 from ..super_twisting.controller import ModularSuperTwistingSMC
 from .switching_logic import HybridSwitchingLogic, ControllerState
 from .config import HybridSMCConfig, HybridMode
+from ...core.telemetry import TelemetryBuffer
 
 
 class TransitionFilter:
@@ -103,8 +104,12 @@ class ModularHybridSMC:
 
         # Internal state
         self.simulation_time = 0.0
-        self.control_history = []
         self.switching_history = []
+        self.configure_telemetry()
+
+        # Sub-controller evaluation bookkeeping (see HybridSMCConfig.lazy_evaluation)
+        self._evaluation_step = 0
+        self.evaluation_counts = {name: 0 for name in self.controllers}
 
         # Current mode for compatibility with tests (Control Systems Specialist interface fix)
         self._current_mode = config.hybrid_mode
@@ -127,6 +132,26 @@ class ModularHybridSMC:
 
         self.logger.info(f"Initialized hybrid SMC with controllers: {list(self.controllers.keys())}")
 
+    def configure_telemetry(self, capacity: int = 1000, mode: str = "ring", enabled: bool = True) -> None:
+        """
+        Replace the control history with a new preallocated telemetry buffer.
+
+        The buffer records time, active controller index (into
+        ``controller_names``), final and raw control, a switch flag and the
+        control of every sub-controller (``u_<name>``, NaN when unavailable).
+
+        Args:
+            capacity: Number of steps kept
+            mode: "ring" (keep newest) or "horizon" (keep oldest)
+            enabled: If False, the control history is not recorded
+        """
+        self.controller_names = list(self.controllers)
+        channels = ("time", "active_controller", "u_final", "u_raw", "switched") + tuple(
+            f"u_{name}" for name in self.controller_names
+        )
+        self.control_history = TelemetryBuffer(channels, capacity=capacity, mode=mode, enabled=enabled)
+        self._telemetry_row = [0.0] * len(channels)
+
     @property
     def current_mode(self) -> "HybridMode":
         """Get current hybrid mode for test compatibility."""
@@ -137,6 +162,61 @@ class ModularHybridSMC:
         """Set current hybrid mode for test compatibility."""
         self._current_mode = mode
 
+    def _evaluate_controller(self, controller_name: str, controller: Any, state: np.ndarray,
+                             state_vars: Any, history: Any) -> Dict[str, Any]:
+        """Compute one sub-controller and normalize its result to a dictionary."""
+        self.evaluation_counts[controller_name] += 1
+        try:
+            # Force standard interface by providing non-None state_vars and history
+            safe_state_vars = state_vars if state_vars is not None else {}
+            safe_history = history if history is not None else {}
+            result = controller.compute_control(state, safe_state_vars, safe_history)
+
+            # Handle both return types: numpy array or dictionary
+            if isinstance(result, np.ndarray):
+                # Convert numpy array to dictionary format
+                u_value = float(result[0]) if len(result) > 0 else 0.0
+                normalized_result = {
+                    'u': u_value,
+                    'surface_value': 0.0,  # Default values since not available from array
+                    'surface_derivative': 0.0,
+                    'controller_type': controller_name,
+                    'array_mode': True  # Flag to indicate conversion from array
+                }
+            elif isinstance(result, dict):
+                # Use dictionary directly, but ensure it has required keys
+                normalized_result = {
+                    'u': result.get('u', 0.0),
+                    'surface_value': result.get('surface_value', 0.0),
+                    'surface_derivative': result.get('surface_derivative', 0.0),
+                    'controller_type': result.get('controller_type', controller_name),
+                    **result  # Include all original fields
+                }
+            else:
+                # Fallback for unexpected types (floats, tuples, etc.)
+                try:
+                    if hasattr(result, '__iter__') and not isinstance(result, str):
+                        # Tuple, list or other iterable
+                        u_value = float(result[0]) if len(result) > 0 else 0.0
+                    else:
+                        # Scalar value
+                        u_value = float(result)
+                except (TypeError, ValueError, IndexError):
+                    u_value = 0.0
+
+                normalized_result = {
+                    'u': u_value,
+                    'surface_value': 0.0,
+                    'surface_derivative': 0.0,
+                    'controller_type': controller_name,
+                    'fallback_mode': True
+                }
+
+            return normalized_result
+        except Exception as e:
+            self.logger.warning(f"Controller {controller_name} failed: {e}")
+            return {'u': 0.0, 'error': str(e)}
+
     def compute_control(self, state: np.ndarray, state_vars: Any = None, history: Dict[str, Any] = None, dt: float = None) -> Union[Dict[str, Any], np.ndarray]:
         """
         Compute hybrid SMC control law.
@@ -154,65 +234,35 @@ class ModularHybridSMC:
             # Update simulation time
             self.simulation_time += self.config.dt
 
-            # 1. Compute control for all active controllers
+            # 1. Compute control for the sub-controllers.  In lazy mode only the
+            # active controller is evaluated, except on full evaluation steps;
+            # the switching logic reads nothing but the active controller's
+            # result, so switching decisions are unaffected.
+            active_name = self.switching_logic.get_current_controller()
+            full_evaluation = (not self.config.lazy_evaluation or
+                               self._evaluation_step % self.config.full_evaluation_interval == 0)
+            self._evaluation_step += 1
+
             all_control_results = {}
             for controller_name, controller in self.controllers.items():
-                try:
-                    # Force standard interface by providing non-None state_vars and history
-                    safe_state_vars = state_vars if state_vars is not None else {}
-                    safe_history = history if history is not None else {}
-                    result = controller.compute_control(state, safe_state_vars, safe_history)
-
-                    # Handle both return types: numpy array or dictionary
-                    if isinstance(result, np.ndarray):
-                        # Convert numpy array to dictionary format
-                        u_value = float(result[0]) if len(result) > 0 else 0.0
-                        normalized_result = {
-                            'u': u_value,
-                            'surface_value': 0.0,  # Default values since not available from array
-                            'surface_derivative': 0.0,
-                            'controller_type': controller_name,
-                            'array_mode': True  # Flag to indicate conversion from array
-                        }
-                    elif isinstance(result, dict):
-                        # Use dictionary directly, but ensure it has required keys
-                        normalized_result = {
-                            'u': result.get('u', 0.0),
-                            'surface_value': result.get('surface_value', 0.0),
-                            'surface_derivative': result.get('surface_derivative', 0.0),
-                            'controller_type': result.get('controller_type', controller_name),
-                            **result  # Include all original fields
-                        }
-                    else:
-                        # Fallback for unexpected types (floats, tuples, etc.)
-                        try:
-                            if hasattr(result, '__iter__') and not isinstance(result, str):
-                                # Tuple, list or other iterable
-                                u_value = float(result[0]) if len(result) > 0 else 0.0
-                            else:
-                                # Scalar value
-                                u_value = float(result)
-                        except (TypeError, ValueError, IndexError):
-                            u_value = 0.0
-
-                        normalized_result = {
-                            'u': u_value,
-                            'surface_value': 0.0,
-                            'surface_derivative': 0.0,
-                            'controller_type': controller_name,
-                            'fallback_mode': True
-                        }
-
-                    all_control_results[controller_name] = normalized_result
-                except Exception as e:
-                    self.logger.warning(f"Controller {controller_name} failed: {e}")
-                    all_control_results[controller_name] = {'u': 0.0, 'error': str(e)}
+                if full_evaluation or controller_name == active_name:
+                    all_control_results[controller_name] = self._evaluate_controller(
+                        controller_name, controller, state, state_vars, history
+                    )
 
             # 2. Evaluate switching logic
             switching_decision = self.switching_logic.evaluate_switching(
                 state, all_control_results, self.simulation_time
             )
 
+            # A switch is being considered: make sure the candidate has a result
+            if switching_decision:
+                target_name = switching_decision.target_controller.value
+                if target_name in self.controllers and target_name not in all_control_results:
+                    all_control_results[target_name] = self._evaluate_controller(
+                        target_name, self.controllers[target_name], state, state_vars, history
+                    )
+
             # 3. Execute switching if recommended
             switched = False
             if switching_decision:
@@ -245,19 +295,18 @@ class ModularHybridSMC:
             # 6. Apply final saturation
             u_saturated = np.clip(u_final, -self.config.max_force, self.config.max_force)
 
-            # 7. Store control history
-            self.control_history.append({
-                'time': self.simulation_time,
-                'active_controller': active_controller_name,
-                'u_final': u_saturated,
-                'u_raw': u_active,
-                'switched': switched,
-                'all_results': {name: result['u'] for name, result in all_control_results.items()}
-            })
-
-            # Limit history size
-            if len(self.control_history) > 1000:
-                self.control_history = self.control_history[-500:]
+            # 7. Store control history in the bounded telemetry buffer
+            row = self._telemetry_row
+            row[0] = self.simulation_time
+            row[1] = (self.controller_names.index(active_controller_name)
+                      if active_controller_name in self.controllers else -1)
+            row[2] = u_saturated
+            row[3] = u_active
+            row[4] = 1.0 if switched else 0.0
+            for j, name in enumerate(self.controller_names, start=5):
+                result = all_control_results.get(name)
+                row[j] = result['u'] if result is not None else np.nan
+            self.control_history.record(*row)
 
             # 8. Create comprehensive result
             control_result = self._create_hybrid_result(
@@ -453,6 +502,8 @@ class ModularHybridSMC:
         self.simulation_time = 0.0
         self.control_history.clear()
         self.switching_history.clear()
+        self._evaluation_step = 0
+        self.evaluation_counts = {name: 0 for name in self.controllers}
 
         # Reset switching logic
         if hasattr(self.switching_logic, 'reset'):
@@ -519,37 +570,29 @@ class ModularHybridSMC:
                 'simulation_time': self.simulation_time,
                 'active_controller': self.get_active_controller_name(),
                 'total_control_steps': len(self.control_history),
-                'total_switches': len(self.switching_history)
+                'total_switches': len(self.switching_history),
+                'evaluation_counts': dict(self.evaluation_counts)
             }
         }
 
     def _analyze_controller_performance(self) -> Dict[str, Any]:
         """Analyze relative performance of different controllers."""
-        # Group control history by controller
-        controller_performance = {}
-
-        for entry in self.control_history[-200:]:  # Last 200 steps
-            controller = entry['active_controller']
-            if controller not in controller_performance:
-                controller_performance[controller] = {
-                    'control_efforts': [],
-                    'steps': 0,
-                    'total_time': 0.0
-                }
-
-            controller_performance[controller]['control_efforts'].append(abs(entry['u_final']))
-            controller_performance[controller]['steps'] += 1
+        # Group the last 200 steps of control history by active controller
+        active = self.control_history['active_controller'][-200:]
+        efforts = np.abs(self.control_history['u_final'][-200:])
 
         # Compute statistics
         performance_stats = {}
-        for controller, data in controller_performance.items():
-            if data['steps'] > 0:
+        for index, controller in enumerate(self.controller_names):
+            mask = active == index
+            steps = int(np.count_nonzero(mask))
+            if steps > 0:
                 performance_stats[controller] = {
-                    'avg_control_effort': np.mean(data['control_efforts']),
-                    'std_control_effort': np.std(data['control_efforts']),
-                    'max_control_effort': np.max(data['control_efforts']),
-                    'usage_percentage': (data['steps'] / len(self.control_history[-200:])) * 100,
-                    'total_steps': data['steps']
+                    'avg_control_effort': np.mean(efforts[mask]),
+                    'std_control_effort': np.std(efforts[mask]),
+                    'max_control_effort': np.max(efforts[mask]),
+                    'usage_percentage': (steps / len(active)) * 100,
+                    'total_steps': steps
                 }
 
         return performance_stats
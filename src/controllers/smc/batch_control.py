@@ -0,0 +1,306 @@
+#======================================================================================\\\
+#======================== src/controllers/smc/batch_control.py ========================\\\
+#======================================================================================\\\
+
+"""
+Batched control laws for the legacy SMC controllers.
+
+``compute_control`` of :class:`ClassicalSMC`, :class:`SuperTwistingSMC` and
+:class:`AdaptiveSMC` evaluates one state with one gain vector, so a swarm of
+``B`` particles needs ``B`` controller objects and ``B`` calls per step.  The
+functions here evaluate the same laws for a whole batch as array operations:
+
+- ``states``      ``(B, 6)``  plant states
+- ``gains``       ``(B, G)``  one gain vector per row
+- ``ctrl_state``  ``(B, k)``  controller state (``k`` = 0, 2 and 3)
+
+and return ``(u (B,), new_state (B, k), sigma (B,))``.  Settings other than
+the gains (limits, boundary layers, ``dt`` ...) are taken from the
+controller instance.  Every operation is applied in the same order as the
+per-object path, so results are bitwise identical to calling
+``compute_control`` row by row.  History telemetry is not recorded.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...utils.control.primitives import saturate
+
+logger = logging.getLogger(__name__)
+
+_E1 = np.array([1.0, 0.0, 0.0])
+
+
+def _prepare_batch(
+    states: np.ndarray,
+    gains: Optional[np.ndarray],
+    default_gains: Sequence[float],
+    n_gains: Tuple[int, ...],
+    ctrl_state: Optional[np.ndarray],
+    default_state: Sequence[float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Validate and broadcast batch inputs to row-aligned float arrays."""
+    states = np.asarray(states, dtype=float)
+    if states.ndim != 2 or states.shape[1] != 6:
+        raise ValueError(f"states must have shape (B, 6), got {states.shape}")
+    batch_size = states.shape[0]
+
+    gains = np.asarray(default_gains if gains is None else gains, dtype=float)
+    if gains.ndim == 1:
+        gains = np.broadcast_to(gains, (batch_size, gains.size))
+    if gains.ndim != 2 or gains.shape[0] != batch_size or gains.shape[1] not in n_gains:
+        expected = " or ".join(str(n) for n in n_gains)
+        raise ValueError(f"gains must have shape (B, {expected}), got {gains.shape}")
+
+    k = len(default_state)
+    if ctrl_state is None:
+        ctrl_state = np.broadcast_to(np.asarray(default_state, dtype=float), (batch_size, k))
+    ctrl_state = np.asarray(ctrl_state, dtype=float)
+    if ctrl_state.shape != (batch_size, k):
+        raise ValueError(f"ctrl_state must have shape ({batch_size}, {k}), got {ctrl_state.shape}")
+    return states, gains, ctrl_state
+
+
+def _dot3(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise 3-vector dot product summed in the same order as ``np.dot``."""
+    return a[:, 0] * b[:, 0] + a[:, 1] * b[:, 1] + a[:, 2] * b[:, 2]
+
+
+def equivalent_control_batch(
+    dyn: Any,
+    states: np.ndarray,
+    L: np.ndarray,
+    velocity_term: np.ndarray,
+    regularization: float,
+    threshold: np.ndarray,
+) -> np.ndarray:
+    """
+    Model-based equivalent control for a batch of states.
+
+    Mirrors ``_compute_equivalent_control`` of the classical and
+    super-twisting controllers: ``u_eq = (L·M⁻¹(C·q̇ + G) - v) / (L·M⁻¹·B)``
+    with a regularized inertia matrix, returning zero for rows whose
+    controllability scalar falls below ``threshold`` or whose matrices are
+    unavailable or singular.
+
+    Args:
+        dyn: Dynamics model exposing ``_compute_physics_matrices`` (or None)
+        states: State array of shape (B, 6)
+        L: Surface rows ``[0, k1, k2]`` of shape (B, 3)
+        velocity_term: ``k1·λ1·θ̇1 + k2·λ2·θ̇2`` of shape (B,)
+        regularization: Diagonal regularization of the inertia matrix
+        threshold: Controllability threshold per row, shape (B,)
+
+    Returns:
+        Equivalent control of shape (B,)
+    """
+    batch_size = states.shape[0]
+    u_eq = np.zeros(batch_size)
+    if dyn is None:
+        return u_eq
+
+    M_reg = np.empty((batch_size, 3, 3))
+    rhs = np.empty((batch_size, 3))
+    available = np.zeros(batch_size, dtype=bool)
+    reg_eye = np.eye(3) * max(regularization, 0.0)
+    for b in range(batch_size):
+        try:
+            M, C, G = dyn._compute_physics_matrices(states[b])
+        except Exception as e:
+            logger.warning(f"Physics matrix computation failed, returning safe zero control: {e}")
+            continue
+        q_dot = states[b, 3:]
+        M_reg[b] = M + reg_eye
+        rhs[b] = C @ q_dot + G if getattr(C, "ndim", 1) == 2 else C + G
+        available[b] = True
+
+    rows = np.flatnonzero(available)
+    if rows.size == 0:
+        return u_eq
+    try:
+        Minv_B = np.linalg.solve(M_reg[rows], np.broadcast_to(_E1, (rows.size, 3)))
+    except np.linalg.LinAlgError:
+        # Some matrix is singular; isolate it row by row
+        return _equivalent_control_rows(rows, M_reg, rhs, L, velocity_term, threshold, u_eq)
+    L_Minv_B = _dot3(L[rows], Minv_B)
+    active = np.abs(L_Minv_B) >= threshold[rows]
+    rows, L_Minv_B = rows[active], L_Minv_B[active]
+    if rows.size == 0:
+        return u_eq
+    try:
+        Minv_rhs = np.linalg.solve(M_reg[rows], rhs[rows])
+    except np.linalg.LinAlgError:
+        return _equivalent_control_rows(rows, M_reg, rhs, L, velocity_term, threshold, u_eq)
+    u_eq[rows] = (_dot3(L[rows], Minv_rhs) - velocity_term[rows]) / L_Minv_B
+    return u_eq
+
+
+def _equivalent_control_rows(rows, M_reg, rhs, L, velocity_term, threshold, u_eq):
+    """Per-row fallback of :func:`equivalent_control_batch` for singular batches."""
+    for b in rows:
+        try:
+            Minv_B = np.linalg.solve(M_reg[b], _E1)
+            L_Minv_B = float(L[b] @ Minv_B)
+            if abs(L_Minv_B) < threshold[b]:
+                continue
+            Minv_rhs = np.linalg.solve(M_reg[b], rhs[b])
+            u_eq[b] = (float(L[b] @ Minv_rhs) - velocity_term[b]) / L_Minv_B
+        except np.linalg.LinAlgError:
+            continue
+    return u_eq
+
+
+def classical_smc_batch(
+    controller: Any,
+    states: np.ndarray,
+    gains: Optional[np.ndarray] = None,
+    ctrl_state: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched :meth:`ClassicalSMC.compute_control`.
+
+    Args:
+        controller: ClassicalSMC providing limits and boundary layer settings
+        states: State array of shape (B, 6)
+        gains: Gains ``[k1, k2, lam1, lam2, K, kd]`` of shape (B, 6) or (6,);
+            defaults to the controller's own gains
+        ctrl_state: Ignored stateless placeholder of shape (B, 0)
+
+    Returns:
+        Tuple ``(u, new_state, sigma)`` with shapes (B,), (B, 0) and (B,)
+    """
+    states, gains, ctrl_state = _prepare_batch(
+        states, gains, controller.gains, (6,), ctrl_state, ()
+    )
+    k1, k2, lam1, lam2, K, kd = gains.T
+    theta1, theta2, dtheta1, dtheta2 = states[:, 1], states[:, 2], states[:, 4], states[:, 5]
+
+    sigma = lam1 * theta1 + lam2 * theta2 + k1 * dtheta1 + k2 * dtheta2
+    eps_dyn = controller.epsilon0 + controller.epsilon1 * np.sqrt(sigma * sigma)
+    sat_sigma = saturate(sigma / eps_dyn, 1.0, method=controller.switch_method)
+    sat_sigma = np.where(
+        np.abs(sigma) < controller.hysteresis_ratio * controller.epsilon0, 0.0, sat_sigma
+    )
+
+    if controller._controllability_threshold is None:
+        threshold = 0.05 * (k1 + k2)
+    else:
+        threshold = np.full(states.shape[0], controller._controllability_threshold)
+    L = np.column_stack([np.zeros_like(k1), k1, k2])
+    velocity_term = k1 * lam1 * states[:, 4] + k2 * lam2 * states[:, 5]
+    u_eq = equivalent_control_batch(
+        controller.dyn, states, L, velocity_term, controller.regularization, threshold
+    )
+    max_eq = 5.0 * controller.max_force
+    u_eq = np.clip(u_eq, -max_eq, max_eq)
+
+    u_robust = -K * sat_sigma - kd * sigma
+    u = np.clip(u_eq + u_robust, -controller.max_force, controller.max_force)
+    return u, np.empty((states.shape[0], 0)), sigma
+
+
+def sta_smc_batch(
+    controller: Any,
+    states: np.ndarray,
+    gains: Optional[np.ndarray] = None,
+    ctrl_state: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched :meth:`SuperTwistingSMC.compute_control`.
+
+    Args:
+        controller: SuperTwistingSMC providing limits, ``dt`` and switching settings
+        states: State array of shape (B, 6)
+        gains: Gains ``[K1, K2, k1, k2, lam1, lam2]`` of shape (B, 6), or
+            ``[K1, K2]`` of shape (B, 2) with the default surface gains;
+            defaults to the controller's own gains
+        ctrl_state: ``(z, sigma)`` rows of shape (B, 2); defaults to zeros
+
+    Returns:
+        Tuple ``(u, new_state, sigma)`` with shapes (B,), (B, 2) and (B,)
+    """
+    states, gains, ctrl_state = _prepare_batch(
+        states, gains, controller.gains, (2, 6), ctrl_state, controller.initialize_state()
+    )
+    if gains.shape[1] == 2:
+        defaults = np.broadcast_to([5.0, 3.0, 2.0, 1.0], (gains.shape[0], 4))
+        gains = np.column_stack([gains, defaults])
+    K1, K2, k1, k2, lam1, lam2 = gains.T
+    z = ctrl_state[:, 0]
+    th1, th2, th1dot, th2dot = states[:, 1], states[:, 2], states[:, 4], states[:, 5]
+
+    L = np.column_stack([np.zeros_like(k1), k1, k2])
+    velocity_term = k1 * lam1 * states[:, 4] + k2 * lam2 * states[:, 5]
+    threshold = np.full(states.shape[0], controller.boundary_layer)
+    u_eq = equivalent_control_batch(
+        controller.dyn, states, L, velocity_term, controller.regularization, threshold
+    )
+
+    sigma = k1 * (th1dot + lam1 * th1) + k2 * (th2dot + lam2 * th2)
+    sgn_sigma = saturate(sigma, controller.boundary_layer, method=controller.switch_method)
+
+    # Same operations as _sta_smc_core
+    max_force = controller.max_force
+    dt = controller.dt
+    u_cont = -K1 * np.sqrt(np.abs(sigma)) * sgn_sigma
+    u_raw = u_eq + u_cont + z - controller.damping_gain * sigma
+    u_sat = np.clip(u_raw, -max_force, max_force)
+    new_z = z - K2 * sgn_sigma * dt + controller.anti_windup_gain * (u_sat - u_raw) * dt
+    new_z = np.clip(new_z, -max_force, max_force)
+    return u_sat, np.column_stack([new_z, sigma]), sigma
+
+
+def adaptive_smc_batch(
+    controller: Any,
+    states: np.ndarray,
+    gains: Optional[np.ndarray] = None,
+    ctrl_state: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched :meth:`AdaptiveSMC.compute_control`.
+
+    Args:
+        controller: AdaptiveSMC providing limits, ``dt`` and adaptation settings
+        states: State array of shape (B, 6)
+        gains: Gains ``[k1, k2, lam1, lam2, gamma]`` of shape (B, 5); defaults
+            to the controller's own gains
+        ctrl_state: ``(K, last_u, time_in_sliding)`` rows of shape (B, 3);
+            defaults to ``initialize_state()``
+
+    Returns:
+        Tuple ``(u, new_state, sigma)`` with shapes (B,), (B, 3) and (B,)
+    """
+    default_gains = np.asarray(controller.gains, dtype=float)[:5]
+    if gains is not None:
+        gains = np.asarray(gains, dtype=float)
+        gains = gains[..., :5] if gains.shape[-1] > 5 else gains
+    states, gains, ctrl_state = _prepare_batch(
+        states, gains, default_gains, (5,), ctrl_state, controller.initialize_state()
+    )
+    k1, k2, lam1, lam2, gamma = gains.T
+    prev_K, time_in_sliding = ctrl_state[:, 0], ctrl_state[:, 2]
+    theta1, theta2, theta1_dot, theta2_dot = states[:, 1], states[:, 2], states[:, 4], states[:, 5]
+
+    sigma = k1 * (theta1_dot + lam1 * theta1) + k2 * (theta2_dot + lam2 * theta2)
+    method = "tanh" if controller.smooth_switch else "linear"
+    switching = saturate(sigma, controller.boundary_layer, method=method)
+
+    u_sw = -prev_K * switching
+    u = np.clip(u_sw - controller.alpha * sigma, -controller.max_force, controller.max_force)
+
+    abs_sigma = np.abs(sigma)
+    new_time_in_sliding = np.where(
+        abs_sigma <= controller.boundary_layer, time_in_sliding + controller.dt, 0.0
+    )
+    dK = np.where(
+        abs_sigma <= controller.dead_zone,
+        0.0,
+        gamma * abs_sigma - controller.leak_rate * (prev_K - controller.K_init),
+    )
+    dK = np.clip(dK, -controller.adapt_rate_limit, controller.adapt_rate_limit)
+    new_K = np.clip(prev_K + dK * controller.dt, controller.K_min, controller.K_max)
+    return u, np.column_stack([new_K, u, new_time_in_sliding]), sigma
@@ -11,14 +11,17 @@ import weakref
 # Import from new organized structure
 from ...utils.control.primitives import saturate
 from ...utils import ClassicalSMCOutput
-from typing import TYPE_CHECKING, List, Optional, Union, Sequence, Any
+from .batch_control import classical_smc_batch
+from .core.equivalent_control_table import EquivalentControlTable
+from .core.telemetry import TelemetryBuffer, TelemetryMixin
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union, Sequence, Any
 
 # Avoid circular import at runtime
 if TYPE_CHECKING:
     # Hint only; don't import at runtime to avoid path issues
     from ...plant.models.dynamics import DoubleInvertedPendulum
 
-class ClassicalSMC:
+class ClassicalSMC(TelemetryMixin):
     """
     Classical Sliding‑Mode Controller for a double‑inverted pendulum.
 
@@ -94,6 +97,9 @@ class ClassicalSMC:
     ``ValueError`` when violated.
     """
 
+    # History channels, in the order they are recorded each step
+    TELEMETRY_CHANNELS = ("sigma", "epsilon_eff", "u_eq", "u_robust", "u_total", "u")
+
     def __init__(
         self,
         gains: Union[Sequence[float], np.ndarray],
@@ -183,6 +189,10 @@ class ClassicalSMC:
         # Allow derivative gain to be zero but not negative
         self.kd = require_positive(self.kd, "kd", allow_zero=True)
 
+        # Optional tabulated u_eq (see enable_equivalent_control_table)
+        self._u_eq_table: Optional[EquivalentControlTable] = None
+        self.u_eq_table_fallbacks = 0
+
         # Use weakref for dynamics model to break circular references
         if dynamics_model is not None:
             self._dynamics_ref = weakref.ref(dynamics_model)
@@ -231,6 +241,7 @@ class ClassicalSMC:
         # small of a threshold can lead to numerical instabilities, while a
         # larger threshold needlessly suppresses the equivalent control.  See
         # Golub & Van Loan for background on conditioning of linear systems.
+        self._controllability_threshold: Optional[float] = None
         if controllability_threshold is None:
             # Scale the equivalent‑control threshold with the sum of switching gains.
             # Sliding‑mode theory states that the switching gain must exceed the
@@ -246,6 +257,7 @@ class ClassicalSMC:
             if val <= 0.0:
                 raise ValueError("controllability_threshold must be > 0")
             self.eq_threshold = val
+            self._controllability_threshold = val
 
     # ------------------------------------------------------------------
     # Properties
@@ -275,14 +287,48 @@ class ClassicalSMC:
             self._dynamics_ref = weakref.ref(value)
         else:
             self._dynamics_ref = lambda: None
+        # A table built for the previous model no longer applies
+        self._u_eq_table = None
+
+    def enable_equivalent_control_table(self, **kwargs) -> EquivalentControlTable:
+        """Replace the exact u_eq by a gridded lookup near the upright manifold.
+
+        Builds an :class:`EquivalentControlTable` from the exact computation
+        for this controller's gains and dynamics model.  States whose angles
+        fall outside the table use the exact computation (counted in
+        ``u_eq_table_fallbacks``).  Intended for high-rate runs where the
+        exact solve dominates the step cost.
+
+        Args:
+            **kwargs: Forwarded to :class:`EquivalentControlTable` (``angle_range``,
+                ``resolution``, ``tolerance``, ...).
+
+        Returns:
+            The table; its ``error_bound`` is the worst error measured against
+            the exact computation.
+
+        Raises:
+            ValueError: If no dynamics model is attached or the measured error
+                        exceeds ``tolerance``.
+        """
+        if self.dyn is None:
+            raise ValueError("equivalent control table requires a dynamics model")
+        self._u_eq_table = EquivalentControlTable(self._compute_equivalent_control_exact, **kwargs)
+        self.u_eq_table_fallbacks = 0
+        return self._u_eq_table
+
+    def disable_equivalent_control_table(self) -> None:
+        """Return to the exact equivalent control."""
+        self._u_eq_table = None
 
     def initialize_state(self) -> tuple:
         """No internal state for classical SMC; returns an empty tuple."""
         return ()
 
-    def initialize_history(self) -> dict:
-        """No history tracked for classical SMC; returns an empty dict."""
-        return {}
+    def initialize_history(self) -> Union[dict, TelemetryBuffer]:
+        """Return an empty history dict, or a telemetry buffer if configured."""
+        buffer = self._new_telemetry_buffer()
+        return {} if buffer is None else buffer
 
     @staticmethod
     def validate_gains(gains: Union[Sequence[float], np.ndarray, Any]) -> None:
@@ -335,6 +381,15 @@ class ClassicalSMC:
         return self.lam1 * theta1 + self.lam2 * theta2 + self.k1 * dtheta1 + self.k2 * dtheta2
 
     def _compute_equivalent_control(self, state: np.ndarray) -> float:
+        """Return ``u_eq`` from the lookup table when enabled and in range, else exactly."""
+        if self._u_eq_table is not None:
+            u_eq = self._u_eq_table(state)
+            if u_eq == u_eq:  # NaN outside the table
+                return float(u_eq)
+            self.u_eq_table_fallbacks += 1
+        return self._compute_equivalent_control_exact(state)
+
+    def _compute_equivalent_control_exact(self, state: np.ndarray) -> float:
         """Compute the model-based equivalent control ``u_eq`` with enhanced robustness.
 
         Args:
@@ -480,18 +535,44 @@ class ClassicalSMC:
         u = u_eq + u_robust
         u_saturated = float(np.clip(u, -self.max_force, self.max_force))
 
-        # Telemetry: append key signals to history (in-place)
-        hist = history if isinstance(history, dict) else {}
-        hist.setdefault('sigma', []).append(float(sigma))
-        hist.setdefault('epsilon_eff', []).append(float(eps_dyn))
-        hist.setdefault('u_eq', []).append(float(u_eq))
-        hist.setdefault('u_robust', []).append(float(u_robust))
-        hist.setdefault('u_total', []).append(float(u))
-        hist.setdefault('u', []).append(float(u_saturated))
+        # Telemetry: write key signals to the preallocated buffer, or
+        # append them to the legacy history lists (in-place)
+        if isinstance(history, TelemetryBuffer):
+            history.record(sigma, eps_dyn, u_eq, u_robust, u, u_saturated)
+            hist = history
+        else:
+            hist = history if isinstance(history, dict) else {}
+            hist.setdefault('sigma', []).append(float(sigma))
+            hist.setdefault('epsilon_eff', []).append(float(eps_dyn))
+            hist.setdefault('u_eq', []).append(float(u_eq))
+            hist.setdefault('u_robust', []).append(float(u_robust))
+            hist.setdefault('u_total', []).append(float(u))
+            hist.setdefault('u', []).append(float(u_saturated))
 
         # Return structured output
         return ClassicalSMCOutput(u_saturated, (), hist)
 
+    def compute_control_batch(
+        self,
+        states: np.ndarray,
+        gains: Optional[np.ndarray] = None,
+        ctrl_state: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate the control law for a batch of states and gain vectors.
+
+        Args:
+            states: State array of shape ``(B, 6)``.
+            gains: Gains of shape ``(B, 6)``; defaults to this controller's gains.
+            ctrl_state: Unused (classical SMC is stateless), shape ``(B, 0)``.
+
+        Returns:
+            ``(u, new_state, sigma)`` with shapes ``(B,)``, ``(B, 0)`` and
+            ``(B,)``, identical to calling :meth:`compute_control` per row
+            with a controller built from each gain vector.  History is not
+            recorded.
+        """
+        return classical_smc_batch(self, states, gains, ctrl_state)
+
     def reset(self) -> None:
         """Reset ClassicalSMC controller state.
 
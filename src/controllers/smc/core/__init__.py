@@ -8,14 +8,17 @@ SMC Core Components - Shared logic across all SMC controllers.
 Provides reusable components that implement fundamental SMC concepts:
 - Sliding surface calculations
 - Switching functions for chattering reduction
-- Equivalent control computation
+- Equivalent control computation (exact and tabulated)
 - Parameter validation
+- Preallocated telemetry buffers
 """
 
 from .sliding_surface import SlidingSurface, LinearSlidingSurface
 from .switching_functions import SwitchingFunction, tanh_switching, linear_switching
 from .equivalent_control import EquivalentControl
+from .equivalent_control_table import EquivalentControlTable
 from .gain_validation import validate_smc_gains, SMCGainValidator
+from .telemetry import TelemetryBuffer, TelemetryMixin
 
 __all__ = [
     # Sliding surface components
@@ -29,8 +32,13 @@ __all__ = [
 
     # Equivalent control
     "EquivalentControl",
+    "EquivalentControlTable",
 
     # Validation
     "validate_smc_gains",
-    "SMCGainValidator"
+    "SMCGainValidator",
+
+    # Telemetry
+    "TelemetryBuffer",
+    "TelemetryMixin"
 ]
\ No newline at end of file
@@ -0,0 +1,176 @@
+#======================================================================================\\\
+#================ src/controllers/smc/core/equivalent_control_table.py ================\\\
+#======================================================================================\\\
+
+"""
+Tabulated Equivalent Control for High-Rate SMC Loops.
+
+The exact equivalent control needs the physics matrices and two linear solves
+per step.  For a Lagrangian plant ``M(q)q̈ + C(q, q̇)q̇ + G(q) = Bu`` with
+viscous friction, ``C(q, q̇)q̇`` is quadratic in the velocities and ``M``, ``G``
+depend only on the joint angles, so
+
+    u_eq(θ1, θ2, ẋ, θ̇1, θ̇2) = Σ_k c_k(θ1, θ2) · φ_k(ẋ, θ̇1, θ̇2)
+
+where ``φ_k`` are the ten monomials of degree ≤ 2 in the velocities.
+``EquivalentControlTable`` fits the ten coefficients exactly at every node of
+an angle grid (ten exact evaluations per node) and interpolates them
+bilinearly at run time, so only the angle subspace is gridded and velocities
+are unbounded.
+
+The table is only an approximation across cells (and across the
+controllability cutoff, where the exact u_eq jumps to zero), so the build
+measures the worst error against the exact computation at the cell centres
+and reports it as ``error_bound``.  States outside the angle range return
+NaN so the caller can fall back to the exact computation.
+"""
+
+from typing import Callable, Optional, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Unit velocity samples (ẋ, θ̇1, θ̇2) used to fit the quadratic; the origin,
+# ± each axis and each pair of axes make the monomial matrix invertible.
+_VELOCITY_SAMPLES = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0], [-1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0], [0.0, -1.0, 0.0],
+    [0.0, 0.0, 1.0], [0.0, 0.0, -1.0],
+    [1.0, 1.0, 0.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0],
+])
+
+
+def _monomials(v: np.ndarray) -> np.ndarray:
+    """Return ``[1, ẋ, θ̇1, θ̇2, ẋ², θ̇1², θ̇2², ẋθ̇1, ẋθ̇2, θ̇1θ̇2]`` per row of ``v``."""
+    xd, t1, t2 = v[..., 0], v[..., 1], v[..., 2]
+    one = np.ones_like(xd)
+    return np.stack([one, xd, t1, t2, xd * xd, t1 * t1, t2 * t2, xd * t1, xd * t2, t1 * t2], axis=-1)
+
+
+@njit(cache=True)
+def _interpolate_equivalent_control(coeffs, lo1, lo2, step1, step2, state):
+    """Bilinearly interpolate the coefficient grid and evaluate the quadratic (NaN outside)."""
+    n1 = coeffs.shape[0]
+    n2 = coeffs.shape[1]
+    f1 = (state[1] - lo1) / step1
+    f2 = (state[2] - lo2) / step2
+    if not (0.0 <= f1 <= n1 - 1 and 0.0 <= f2 <= n2 - 1):
+        return np.nan
+    i = min(int(f1), n1 - 2)
+    j = min(int(f2), n2 - 2)
+    a = f1 - i
+    b = f2 - j
+
+    xd = state[3]
+    t1 = state[4]
+    t2 = state[5]
+    phi = (1.0, xd, t1, t2, xd * xd, t1 * t1, t2 * t2, xd * t1, xd * t2, t1 * t2)
+
+    u = 0.0
+    for k in range(10):
+        c = ((1.0 - a) * (1.0 - b) * coeffs[i, j, k] + a * (1.0 - b) * coeffs[i + 1, j, k]
+             + (1.0 - a) * b * coeffs[i, j + 1, k] + a * b * coeffs[i + 1, j + 1, k])
+        u += c * phi[k]
+    return u
+
+
+class EquivalentControlTable:
+    """
+    Angle-gridded lookup of the equivalent control.
+
+    Built from any exact ``u_eq(state)`` callable whose model matrices do not
+    depend on the cart position (true for the DIP plants in this package).
+    """
+
+    def __init__(
+        self,
+        exact: Callable[[np.ndarray], float],
+        angle_range: Tuple[float, float] = (-0.3, 0.3),
+        resolution: int = 41,
+        velocity_scale: float = 1.0,
+        validation_velocity: float = 2.0,
+        validation_samples: int = 4,
+        tolerance: Optional[float] = None,
+        seed: int = 0,
+    ):
+        """
+        Build the table.
+
+        Args:
+            exact: Exact equivalent control for a full state vector
+            angle_range: ``(low, high)`` range of θ1 and θ2 covered by the grid (rad)
+            resolution: Grid nodes per angle axis
+            velocity_scale: Velocity magnitude of the fitting samples (rad/s, m/s)
+            validation_velocity: Velocities of validation states are drawn from ±this range
+            validation_samples: Random velocity draws per cell centre when measuring the error
+            tolerance: If given, raise ValueError when ``error_bound`` exceeds it
+            seed: Seed for the validation velocity draws
+        """
+        low, high = (float(v) for v in angle_range)
+        if not high > low:
+            raise ValueError("angle_range must satisfy low < high")
+        if int(resolution) < 2:
+            raise ValueError("resolution must be >= 2")
+        if velocity_scale <= 0.0:
+            raise ValueError("velocity_scale must be > 0")
+
+        self.angle_range = (low, high)
+        self.resolution = int(resolution)
+        self.step = (high - low) / (self.resolution - 1)
+        grid = np.linspace(low, high, self.resolution)
+
+        velocities = _VELOCITY_SAMPLES * float(velocity_scale)
+        fit = np.linalg.inv(_monomials(velocities))
+        state = np.zeros(6)
+        values = np.empty(len(velocities))
+        self.coeffs = np.empty((self.resolution, self.resolution, 10))
+        for i, theta1 in enumerate(grid):
+            for j, theta2 in enumerate(grid):
+                state[1], state[2] = theta1, theta2
+                for k, v in enumerate(velocities):
+                    state[3:] = v
+                    values[k] = exact(state)
+                self.coeffs[i, j] = fit @ values
+
+        self.error_bound = self._measure_error(exact, grid, validation_velocity,
+                                               int(validation_samples), seed)
+        if tolerance is not None and self.error_bound > tolerance:
+            raise ValueError(
+                f"Equivalent control table error {self.error_bound:.3e} exceeds tolerance {tolerance:.3e}; "
+                f"increase resolution or narrow angle_range"
+            )
+
+    def __call__(self, state: np.ndarray) -> float:
+        """Return the tabulated u_eq, or NaN if the angles are outside the grid."""
+        low = self.angle_range[0]
+        return _interpolate_equivalent_control(self.coeffs, low, low, self.step, self.step,
+                                               np.asarray(state, dtype=float))
+
+    def contains(self, state: np.ndarray) -> bool:
+        """Return True if the angles of ``state`` lie inside the grid."""
+        low, high = self.angle_range
+        return low <= state[1] <= high and low <= state[2] <= high
+
+    def max_error(self, exact: Callable[[np.ndarray], float], states: np.ndarray) -> float:
+        """Largest ``|table - exact|`` over ``states`` inside the grid."""
+        errors = [abs(self(s) - exact(s)) for s in np.atleast_2d(states) if self.contains(s)]
+        return float(max(errors)) if errors else 0.0
+
+    def _measure_error(self, exact, grid, velocity, samples, seed) -> float:
+        # Bilinear interpolation error peaks at cell centres
+        centres = 0.5 * (grid[:-1] + grid[1:])
+        t1, t2 = np.meshgrid(centres, centres, indexing="ij")
+        n = t1.size * samples
+        states = np.zeros((n, 6))
+        states[:, 1] = np.repeat(t1.ravel(), samples)
+        states[:, 2] = np.repeat(t2.ravel(), samples)
+        states[:, 3:] = np.random.default_rng(seed).uniform(-velocity, velocity, size=(n, 3))
+        return self.max_error(exact, states)
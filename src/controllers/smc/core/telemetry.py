@@ -0,0 +1,197 @@
+#======================================================================================\\\
+#======================= src/controllers/smc/core/telemetry.py ========================\\\
+#======================================================================================\\\
+
+"""
+Preallocated Telemetry Buffers for SMC Controllers.
+
+Controllers historically appended every step's signals to Python lists in a
+history dictionary, which grows without bound on long runs and allocates on
+every step.  ``TelemetryBuffer`` stores the same named channels in a fixed
+``(capacity, n_channels)`` NumPy array:
+
+- ``"ring"`` mode keeps the most recent ``capacity`` samples
+- ``"horizon"`` mode keeps the first ``capacity`` samples and counts the rest
+- a disabled buffer ignores writes entirely (for optimization runs)
+
+Reading a channel (``buffer["sigma"]``) returns its samples in chronological
+order, so consumers written against list histories keep working.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+
+TELEMETRY_MODES: Tuple[str, ...] = ("ring", "horizon")
+
+
+class TelemetryBuffer:
+    """
+    Fixed-size, NumPy-backed history of named float channels.
+
+    Writers call :meth:`record` with one value per entry of ``channels`` (in
+    that order).  ``select`` restricts which of those channels are stored;
+    values of unselected channels are discarded.
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[str],
+        capacity: int = 10000,
+        mode: str = "ring",
+        enabled: bool = True,
+        select: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initialize telemetry buffer.
+
+        Args:
+            channels: Names of the values passed to :meth:`record`, in order
+            capacity: Number of samples kept per channel
+            mode: "ring" (keep newest) or "horizon" (keep oldest)
+            enabled: If False, :meth:`record` is a no-op and nothing is allocated
+            select: Subset of ``channels`` to store (default: all)
+        """
+        self.channels: Tuple[str, ...] = tuple(str(c) for c in channels)
+        if len(set(self.channels)) != len(self.channels):
+            raise ValueError(f"Duplicate telemetry channels: {self.channels}")
+        mode = str(mode).lower()
+        if mode not in TELEMETRY_MODES:
+            raise ValueError(f"Unknown telemetry mode '{mode}'; expected one of {TELEMETRY_MODES}")
+        if int(capacity) < 1:
+            raise ValueError("capacity must be >= 1")
+
+        if select is None:
+            stored = self.channels
+        else:
+            stored = tuple(str(c) for c in select)
+            unknown = [c for c in stored if c not in self.channels]
+            if unknown:
+                raise ValueError(f"Unknown telemetry channels {unknown}; available: {self.channels}")
+
+        self.mode = mode
+        self.capacity = int(capacity)
+        self.enabled = bool(enabled)
+        self.stored_channels: Tuple[str, ...] = stored
+        self._column = {name: j for j, name in enumerate(stored)}
+        # (stored column, record argument) pairs; None when record order == storage order
+        self._pairs: Optional[List[Tuple[int, int]]] = (
+            None if stored == self.channels
+            else [(j, self.channels.index(name)) for j, name in enumerate(stored)]
+        )
+        rows = self.capacity if self.enabled else 0
+        self._data = np.zeros((rows, len(stored)), dtype=float)
+        self._writes = 0
+        self.dropped = 0
+
+    def record(self, *values: float) -> None:
+        """Store one sample; ``values`` follow the order of ``channels``."""
+        if not self.enabled:
+            return
+        if self._writes >= self.capacity:
+            if self.mode == "horizon":
+                self.dropped += 1
+                return
+            row = self._writes % self.capacity
+        else:
+            row = self._writes
+        if self._pairs is None:
+            self._data[row] = values
+        else:
+            data = self._data
+            for j, k in self._pairs:
+                data[row, j] = values[k]
+        self._writes += 1
+
+    def clear(self) -> None:
+        """Discard all samples without releasing the storage."""
+        self._writes = 0
+        self.dropped = 0
+
+    @property
+    def total_records(self) -> int:
+        """Number of samples written since the last :meth:`clear` (including overwritten ones)."""
+        return self._writes + self.dropped
+
+    def __len__(self) -> int:
+        return min(self._writes, self._data.shape[0])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._column
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.stored_channels)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return a chronological copy of channel ``name``."""
+        column = self._data[:, self._column[name]]
+        n = len(self)
+        if self._writes <= self.capacity:
+            return column[:n].copy()
+        start = self._writes % self.capacity
+        return np.concatenate((column[start:], column[:start]))
+
+    def get(self, name: str, default=None):
+        """Return channel ``name`` or ``default`` if it is not stored."""
+        return self[name] if name in self._column else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.stored_channels
+
+    def items(self) -> List[Tuple[str, np.ndarray]]:
+        return [(name, self[name]) for name in self.stored_channels]
+
+    def as_dict(self) -> Dict[str, np.ndarray]:
+        """Return all stored channels as a dictionary of arrays."""
+        return dict(self.items())
+
+
+class TelemetryMixin:
+    """
+    Opt-in buffered telemetry for controllers with list-based histories.
+
+    Subclasses declare ``TELEMETRY_CHANNELS`` and call
+    :meth:`_new_telemetry_buffer` from ``initialize_history``.  Until
+    :meth:`configure_telemetry` is called the controller keeps its legacy
+    dictionary history.
+    """
+
+    TELEMETRY_CHANNELS: Tuple[str, ...] = ()
+    _telemetry_spec: Optional[Dict[str, object]] = None
+
+    def configure_telemetry(
+        self,
+        capacity: int = 10000,
+        mode: str = "ring",
+        channels: Optional[Sequence[str]] = None,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Record history into a preallocated :class:`TelemetryBuffer`.
+
+        Takes effect for histories created by subsequent
+        ``initialize_history`` calls.
+
+        Args:
+            capacity: Number of samples kept per channel
+            mode: "ring" (keep newest) or "horizon" (keep oldest)
+            channels: Subset of ``TELEMETRY_CHANNELS`` to store (default: all)
+            enabled: If False, histories ignore all writes
+        """
+        spec = dict(capacity=capacity, mode=mode, select=channels, enabled=enabled)
+        TelemetryBuffer(self.TELEMETRY_CHANNELS, **{**spec, "enabled": False})  # validate eagerly
+        self._telemetry_spec = spec
+
+    def disable_telemetry(self) -> None:
+        """Stop recording history (e.g. inside optimization loops)."""
+        self.configure_telemetry(enabled=False)
+
+    def reset_telemetry(self) -> None:
+        """Return to the legacy dictionary-of-lists history."""
+        self._telemetry_spec = None
+
+    def _new_telemetry_buffer(self) -> Optional[TelemetryBuffer]:
+        """Return a fresh buffer, or None when telemetry is not configured."""
+        if self._telemetry_spec is None:
+            return None
+        return TelemetryBuffer(self.TELEMETRY_CHANNELS, **self._telemetry_spec)
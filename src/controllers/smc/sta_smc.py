@@ -29,6 +29,8 @@ import numpy as np
 # Import from new organized structure
 from ...utils.control.primitives import saturate
 from ...utils import STAOutput
+from .batch_control import sta_smc_batch
+from .core.telemetry import TelemetryBuffer, TelemetryMixin
 from typing import Optional, List, Tuple, Dict, Union
 
 @numba.njit(cache=True)
@@ -132,7 +134,7 @@ def _sta_smc_core(
     return float(u_sat), float(new_z), float(sigma)
  
 
-class SuperTwistingSMC:
+class SuperTwistingSMC(TelemetryMixin):
     """
     Second‑order (super‑twisting) sliding‑mode controller for the double‑inverted pendulum.
 
@@ -198,6 +200,9 @@ class SuperTwistingSMC:
         and a history dictionary (empty for this controller).
     """
 
+    # History channels, in the order they are recorded each step
+    TELEMETRY_CHANNELS = ("sigma", "z", "u", "u_eq")
+
     def __init__(
         self,
         gains: Union[Tuple[float, ...], List[float]],
@@ -341,8 +346,10 @@ class SuperTwistingSMC:
         """Return (z, sigma) initial internal state."""
         return (0.0, 0.0)
 
-    def initialize_history(self) -> Dict:
-        return {}
+    def initialize_history(self) -> Union[Dict, TelemetryBuffer]:
+        """Return an empty history dict, or a telemetry buffer if configured."""
+        buffer = self._new_telemetry_buffer()
+        return {} if buffer is None else buffer
 
     # ---------------- Main control computation -------------------
 
@@ -384,18 +391,50 @@ class SuperTwistingSMC:
             u_eq=u_eq,
             Kaw=self.anti_windup_gain,
         )
-        # Telemetry: append key signals to history (in-place)
-        hist = history if isinstance(history, dict) else {}
-        hist.setdefault('sigma', []).append(float(sigma))
-        hist.setdefault('z', []).append(float(new_z))
-        hist.setdefault('u', []).append(float(u))
-        hist.setdefault('u_eq', []).append(float(u_eq))
+        # Telemetry: write key signals to the preallocated buffer, or
+        # append them to the legacy history lists (in-place)
+        if isinstance(history, TelemetryBuffer):
+            history.record(sigma, new_z, u, u_eq)
+            hist = history
+        else:
+            hist = history if isinstance(history, dict) else {}
+            hist.setdefault('sigma', []).append(float(sigma))
+            hist.setdefault('z', []).append(float(new_z))
+            hist.setdefault('u', []).append(float(u))
+            hist.setdefault('u_eq', []).append(float(u_eq))
 
         # Package results into a named tuple. The internal state carries
         # the updated z and latest sliding surface value. Sigma is also
         # returned separately for batch simulation and Lyapunov validation.
         return STAOutput(u, (new_z, float(sigma)), hist, float(sigma))
 
+    def compute_control_batch(
+        self,
+        states: np.ndarray,
+        gains: Optional[np.ndarray] = None,
+        ctrl_state: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate the super‑twisting law for a batch of states and gains.
+
+        Parameters
+        ----------
+        states : np.ndarray
+            State array of shape ``(B, 6)``.
+        gains : np.ndarray, optional
+            Gains of shape ``(B, 6)`` or ``(B, 2)``; defaults to this
+            controller's gains.
+        ctrl_state : np.ndarray, optional
+            ``(z, sigma)`` rows of shape ``(B, 2)``; defaults to zeros.
+
+        Returns
+        -------
+        tuple
+            ``(u, new_state, sigma)`` with shapes ``(B,)``, ``(B, 2)`` and
+            ``(B,)``, identical to calling :meth:`compute_control` per row.
+            History is not recorded.
+        """
+        return sta_smc_batch(self, states, gains, ctrl_state)
+
     def validate_gains(self, gains_b: "np.ndarray") -> "np.ndarray":
         """
         Vectorized feasibility check for super‑twisting SMC gains.
@@ -5,7 +5,9 @@
 """Specialized controllers for specific tasks."""
 
 from .swing_up_smc import SwingUpSMC
+from .swing_up_batch import BatchedSwingUpSMC
 
 __all__ = [
     "SwingUpSMC",
+    "BatchedSwingUpSMC",
 ]
\ No newline at end of file
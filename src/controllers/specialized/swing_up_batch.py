@@ -0,0 +1,196 @@
+#======================================================================================\\\
+#=================== src/controllers/specialized/swing_up_batch.py ====================\\\
+#======================================================================================\\\
+
+"""
+Batched energy-based swing-up for sweeps over many initial conditions.
+
+``SwingUpSMC`` evaluates the pendulum energy and its swing/stabilize
+hysteresis for one state per call, so a sweep over ``B`` initial angles
+needs ``B`` controller objects and ``B`` Python calls per step.
+``BatchedSwingUpSMC`` applies the same law to ``(B, 6)`` states at once:
+
+- mode flags (``stabilize``) are a boolean array
+- handoff times and clocks are float arrays (NaN = never handed off)
+- energies, transitions and the swing law are array operations
+- stabilize rows are handed to the stabilizer's ``compute_control_batch``
+  (controller state kept as a ``(B, k)`` array); stabilizers without a
+  batched law fall back to one ``compute_control`` call per active row
+
+Thresholds, gains and limits are read from a configured ``SwingUpSMC``, so
+each row reproduces the scalar controller step for step.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .swing_up_smc import STABILIZE_MODE, SWING_MODE, SwingUpSMC, _energy_method
+
+
+class BatchedSwingUpSMC:
+    """
+    Swing-up controller state and control law for ``B`` trajectories.
+
+    Example Usage:
+        batch = BatchedSwingUpSMC(SwingUpSMC(dyn, stabilizer), batch_size=10000)
+        for _ in range(n_steps):
+            u = batch.compute_control(states)
+            ...
+        handed_off = batch.stabilize
+    """
+
+    def __init__(self, controller: SwingUpSMC, batch_size: int) -> None:
+        """
+        Initialize batch state from a configured scalar controller.
+
+        Args:
+            controller: SwingUpSMC providing the dynamics model, stabilizer,
+                        thresholds, gain, ``dt`` and saturation
+            batch_size: Number of trajectories ``B``
+        """
+        self.controller = controller
+        self.dyn = controller.dyn
+        self.stabilizer = controller.stabilizer
+        self.E_bottom = controller.E_bottom
+        self._switch_energy = controller.switch_energy_factor * controller.E_bottom
+        self._exit_energy = controller.exit_energy_factor * controller.E_bottom
+        self._batched_stabilizer = hasattr(self.stabilizer, "compute_control_batch")
+        self._energy_batch_fn = (getattr(self.dyn, "total_energy_batch", None)
+                                 or getattr(self.dyn, "compute_total_energy_batch", None))
+        self._energy_row_fn = _energy_method(self.dyn)
+        if self._energy_batch_fn is None and self._energy_row_fn is None:
+            raise TypeError(
+                f"{type(self.dyn).__name__} provides no energy method "
+                "(total_energy[_batch] or compute_total_energy[_batch])"
+            )
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.reset(batch_size)
+
+    def reset(self, batch_size: Optional[int] = None) -> None:
+        """Return every trajectory to swing mode at ``t = 0``."""
+        if batch_size is not None:
+            if int(batch_size) < 1:
+                raise ValueError("batch_size must be >= 1")
+            self.batch_size = int(batch_size)
+        B = self.batch_size
+        self.stabilize = np.zeros(B, dtype=bool)
+        self.switch_time = np.full(B, np.nan)
+        self.t = np.zeros(B)
+        self.energy_ratio = np.full(B, np.nan)
+
+        if self._batched_stabilizer:
+            init = np.asarray(self.stabilizer.initialize_state(), dtype=float).ravel()
+            self.stabilizer_state: Any = np.tile(init, (B, 1))
+        else:
+            # Per-row (state_vars, history), created on the row's first handoff
+            self.stabilizer_state = [None] * B
+
+    @property
+    def modes(self) -> np.ndarray:
+        """Mode names per trajectory (``'swing'`` / ``'stabilize'``)."""
+        return np.where(self.stabilize, STABILIZE_MODE, SWING_MODE)
+
+    def energy_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Total energy of each state, as seen by the scalar controller.
+
+        Uses the model's vectorized ``total_energy_batch`` or
+        ``compute_total_energy_batch`` (the plants') when available, otherwise
+        the per-state method row by row; a row whose energy cannot be
+        computed gets zero energy, like ``SwingUpSMC.compute_control``.
+        """
+        if self._energy_batch_fn is not None:
+            return np.asarray(self._energy_batch_fn(states), dtype=float).reshape(states.shape[0])
+        energy = np.zeros(states.shape[0])
+        for b, state in enumerate(states):
+            try:
+                energy[b] = float(self._energy_row_fn(state))
+            except Exception as e:
+                self.logger.debug(f"Could not compute current energy, using 0.0: {e}")
+        return energy
+
+    def update_modes(self, states: np.ndarray, E_about_bottom: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply one step of the swing/stabilize hysteresis to every row.
+
+        Returns:
+            Boolean masks ``(to_stabilize, to_swing)`` of the rows that switched
+        """
+        abs_q1 = np.abs(states[:, 1])
+        abs_q2 = np.abs(states[:, 2])
+        controller = self.controller
+        to_stabilize = (
+            ~self.stabilize
+            & (E_about_bottom >= self._switch_energy)
+            & (abs_q1 <= controller.switch_angle_tol)
+            & (abs_q2 <= controller.switch_angle_tol)
+        )
+        to_swing = self.stabilize & (
+            (E_about_bottom < self._exit_energy)
+            | (abs_q1 > controller.reentry_angle_tol)
+            | (abs_q2 > controller.reentry_angle_tol)
+        )
+        self.switch_time[to_stabilize] = self.t[to_stabilize]
+        self.stabilize ^= to_stabilize | to_swing
+        return to_stabilize, to_swing
+
+    def compute_control(self, states: np.ndarray) -> np.ndarray:
+        """
+        Advance every trajectory by one control step.
+
+        Args:
+            states: State array of shape (B, 6)
+
+        Returns:
+            Cart forces of shape (B,)
+        """
+        states = np.asarray(states, dtype=float)
+        if states.shape != (self.batch_size, 6):
+            raise ValueError(f"states must have shape ({self.batch_size}, 6), got {states.shape}")
+        controller = self.controller
+
+        E_about_bottom = self.E_bottom - self.energy_batch(states)
+        self.energy_ratio = E_about_bottom / self.E_bottom
+        self.t += controller.dt
+        self.update_modes(states, E_about_bottom)
+
+        u = controller.k_swing * np.cos(states[:, 1]) * states[:, 4]
+        rows = np.flatnonzero(self.stabilize)
+        if rows.size:
+            u[rows] = self._stabilizer_control(states, rows)
+        if np.isfinite(controller.max_force):
+            u = np.clip(u, -controller.max_force, controller.max_force)
+        return u
+
+    def _stabilizer_control(self, states: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Stabilizer output for the rows in stabilize mode."""
+        if self._batched_stabilizer:
+            u, new_state, _ = self.stabilizer.compute_control_batch(
+                states[rows], None, self.stabilizer_state[rows]
+            )
+            self.stabilizer_state[rows] = new_state
+            return u
+
+        u = np.empty(rows.size)
+        for i, b in enumerate(rows):
+            if self.stabilizer_state[b] is None:
+                self.stabilizer_state[b] = self._initial_stabilizer_state()
+            state_vars, history = self.stabilizer_state[b]
+            u_b, state_vars, history = self.stabilizer.compute_control(states[b], state_vars, history)
+            self.stabilizer_state[b] = (state_vars, history)
+            u[i] = float(u_b)
+        return u
+
+    def _initial_stabilizer_state(self) -> Tuple[Any, Dict]:
+        state_vars = ()
+        history: Dict = {}
+        if hasattr(self.stabilizer, "initialize_state"):
+            state_vars = self.stabilizer.initialize_state()
+        if hasattr(self.stabilizer, "initialize_history"):
+            history = self.stabilizer.initialize_history()
+        return state_vars, history
+
@@ -16,6 +16,13 @@ class _History(TypedDict, total=False):
 SWING_MODE: Mode = "swing"
 STABILIZE_MODE: Mode = "stabilize"
 
+
+def _energy_method(dynamics_model: Any) -> Any:
+    """Per-state energy method of a model: ``total_energy`` or the plants' ``compute_total_energy``."""
+    fn = getattr(dynamics_model, "total_energy", None)
+    return fn if fn is not None else getattr(dynamics_model, "compute_total_energy", None)
+
+
 class SwingUpSMC:
     """
     Energy-based swing-up + handoff to a stabilizing controller with hysteresis.
@@ -49,7 +56,8 @@ class SwingUpSMC:
         """Initialize controller.
 
         Args:
-            dynamics_model: Plant/dynamics with `total_energy(state)`.
+            dynamics_model: Plant/dynamics with `total_energy(state)` or
+                            `compute_total_energy(state)`.
             stabilizing_controller: Inner SMC-like controller after handoff.
             energy_gain: Swing-up gain (k_swing).
             switch_energy_factor: Forward handoff threshold as a fraction of E_bottom.
@@ -91,7 +99,7 @@ class SwingUpSMC:
         # essential for proper hysteresis; tests rely on this fallback when
         # dummy dynamics return 0.0.  See ``test_swing_up_smc.py``.
         try:
-            eb = float(self.dyn.total_energy(self._bottom_ref))  # type: ignore[attr-defined]
+            eb = float(_energy_method(self.dyn)(self._bottom_ref))
             # If the returned energy is not finite or non‑positive, replace it
             # with 1.0 to create a meaningful energy scale.  This avoids
             # degeneracies where both switch and exit thresholds are zero.
@@ -192,7 +200,7 @@ class SwingUpSMC:
         # energy.  This fallback ensures tests using dummy dynamics do not
         # crash when calling compute_control.
         try:
-            E_current = float(self.dyn.total_energy(state))  # type: ignore[attr-defined]
+            E_current = float(_energy_method(self.dyn)(state))
         except Exception as e:
             self.logger.debug(f"Could not compute current energy, using 0.0: {e}")
             E_current = 0.0  # OK: Fallback for dynamics without total_energy method
@@ -33,6 +33,9 @@ from src.config import ConfigSchema, load_config
 from src.utils.seed import create_rng
 from ...plant.models.dynamics import DIPParams
 from ...simulation.engines.vector_sim import simulate_system_batch
+from ...simulation.engines.simulation_runner import STEP_MODES
+from ...simulation.engines.cost_accumulation import CostAccumulators, accumulate_trajectory_costs
+from ..core.parallel_fitness import FITNESS_BACKENDS, ProcessFitnessPool
 
 # ---------------------------------------------------------------------------
 # Module-level configuration
@@ -132,6 +135,10 @@ class PSOTuner:
         rng: Optional[np.random.Generator] = None,
         *,
         instability_penalty_factor: float = 100.0,
+        fitness_backend: Optional[str] = None,
+        fitness_workers: Optional[int] = None,
+        streaming_cost: Optional[bool] = None,
+        step_mode: Optional[str] = None,
     ) -> None:
         """Initialise the PSOTuner.
 
@@ -153,6 +160,23 @@ class PSOTuner:
             The penalty is computed as
             ``instability_penalty_factor * (norm_ise + norm_u + norm_du + norm_sigma)``.
             Larger values penalise instability more heavily.  Default is 100.
+        fitness_backend : {"serial", "process"} or None, optional
+            How the swarm is simulated.  ``"serial"`` runs the batch in the
+            calling process; ``"process"`` shards particles across a
+            persistent worker pool (see
+            :class:`~src.optimization.core.parallel_fitness.ProcessFitnessPool`).
+            ``None`` uses ``pso.fitness_backend`` from the configuration.
+        fitness_workers : int or None, optional
+            Worker count for the process backend.  ``None`` uses
+            ``pso.fitness_workers`` and then the CPU count.
+        streaming_cost : bool or None, optional
+            Accumulate the cost integrals step by step inside the batch
+            simulation instead of materialising ``(B, N+1, 6)``
+            trajectories.  ``None`` uses ``pso.streaming_cost``.
+        step_mode : {"default", "trusted"} or None, optional
+            Plant stepping used by the loop engine.  ``"trusted"`` advances
+            each plant with its compiled ``trusted_step`` instead of the
+            validated ``step()``.  ``None`` uses ``pso.step_mode``.
         """
         # Load configuration if a path is provided
         if isinstance(config, (str, Path)):
@@ -206,6 +230,35 @@ class PSOTuner:
                     "Please remove these fields from the configuration."
                 )
 
+        # Fitness backend: explicit arguments override the configuration.
+        # The worker pool is created lazily on the first fitness call so
+        # that baseline normalisation below always runs in-process.
+        if fitness_backend is None:
+            cfg_backend = getattr(pso_cfg, "fitness_backend", None)
+            fitness_backend = cfg_backend if isinstance(cfg_backend, str) else "serial"
+        if fitness_workers is None:
+            cfg_workers = getattr(pso_cfg, "fitness_workers", None)
+            fitness_workers = cfg_workers if isinstance(cfg_workers, int) else None
+        fitness_backend = str(fitness_backend).lower()
+        if fitness_backend not in FITNESS_BACKENDS:
+            raise ValueError(
+                f"Unknown fitness backend '{fitness_backend}'; expected one of {FITNESS_BACKENDS}"
+            )
+        self.fitness_backend: str = fitness_backend
+        self.fitness_workers: Optional[int] = int(fitness_workers) if fitness_workers is not None else None
+        self._fitness_pool: Optional[ProcessFitnessPool] = None
+        if streaming_cost is None:
+            cfg_streaming = getattr(pso_cfg, "streaming_cost", None)
+            streaming_cost = cfg_streaming if isinstance(cfg_streaming, bool) else False
+        self.streaming_cost: bool = bool(streaming_cost)
+        if step_mode is None:
+            cfg_step_mode = getattr(pso_cfg, "step_mode", None)
+            step_mode = cfg_step_mode if isinstance(cfg_step_mode, str) else "default"
+        step_mode = str(step_mode).lower()
+        if step_mode not in STEP_MODES:
+            raise ValueError(f"Unknown step mode '{step_mode}'; expected one of {STEP_MODES}")
+        self.step_mode: str = step_mode
+
         # Extract cost weights
         self.weights = self.cost_cfg.weights
 
@@ -271,6 +324,7 @@ class PSOTuner:
                     sim_time=self.sim_cfg.duration,
                     dt=self.sim_cfg.dt,
                     u_max=u_max_val,
+                    engine="auto",
                 )
                 if isinstance(res, list):
                     t, x_b, u_b, sigma_b = res[0]
@@ -411,40 +465,31 @@ class PSOTuner:
         sliding-mode stability term.  State error integrates the squared
         deviation of all state components over the horizon.  Control terms
         integrate squared commands and their rates.  A graded instability
-        penalty is applied when trajectories fail early.
+        penalty is applied when trajectories fail early.  The trajectories
+        are first reduced with
+        :func:`~src.simulation.engines.cost_accumulation.accumulate_trajectory_costs`.
+        """
+        return self._compute_cost_from_accumulators(
+            accumulate_trajectory_costs(t, x_b, u_b, sigma_b)
+        )
+
+    def _compute_cost_from_accumulators(self, acc: CostAccumulators) -> np.ndarray:
+        """Compute the cost per particle from accumulated cost integrals.
+
+        This is the cost of :meth:`_compute_cost_from_traj` evaluated on the
+        ``(B,)`` integrals of a streaming simulation
+        (``simulate_system_batch(..., accumulate_cost=True)``).
         """
-        # Flag trajectories with any non-finite state entry
-        nan_traj_mask = ~np.all(np.isfinite(x_b), axis=(1, 2)) if x_b.size else np.zeros(0, dtype=bool)
-        dt = np.diff(t)
-        dt_b = dt[None, :]
-        dt_const = dt[0] if dt.size else self.sim_cfg.dt
-        N = len(dt)
-        B = x_b.shape[0]
-        if N == 0:
+        B = acc.batch_size
+        if acc.n_steps == 0:
             return np.zeros(B, dtype=float)
-        # Instability detection
-        fall_mask = np.abs(x_b[:, :, 1]) > (0.5 * np.pi)
-        explodes_mask = np.any(np.abs(x_b) > 1e6, axis=2)
-        unstable_mask = fall_mask | explodes_mask
-        temp = np.full((B, N + 1), N + 1)
-        temp[unstable_mask] = np.tile(np.arange(N + 1), (B, 1))[unstable_mask]
-        failure_steps = np.min(temp, axis=1)
-        time_mask = (np.arange(N)[None, :] < (failure_steps - 1)[:, None])
-        # State error: integrate squared error across all state variables  # [CIT-068]
-        ise = np.sum((x_b[:, :-1, :] ** 2 * dt_b[:, :, None]) * time_mask[:, :, None], axis=(1, 2))  # [CIT-068]
+        dt_const = acc.dt
+        failure_steps = acc.failure_steps
+        # State error, control effort, control slew and sliding energy  # [CIT-068]
+        ise, u_sq, du_sq, sigma_sq = acc.ise, acc.u_sq, acc.du_sq, acc.sigma_sq
         ise_n = self._normalise(ise, self.norm_ise)
-        # Control effort  # [CIT-068]
-        u_b_trunc = u_b[:, :N] if u_b.shape[1] > N else u_b  # Ensure shape compatibility
-        u_sq = np.sum((u_b_trunc ** 2 * dt_b) * time_mask, axis=1)  # [CIT-068]
         u_n = self._normalise(u_sq, self.norm_u)
-        # Control slew  # [CIT-068]
-        du = np.diff(u_b, axis=1, prepend=u_b[:, 0:1])  # [CIT-068]
-        du_trunc = du[:, :N] if du.shape[1] > N else du  # Ensure shape compatibility
-        du_sq = np.sum((du_trunc ** 2 * dt_b) * time_mask, axis=1)  # [CIT-068]
         du_n = self._normalise(du_sq, self.norm_du)
-        # Sliding variable energy  # [CIT-068]
-        sigma_b_trunc = sigma_b[:, :N] if sigma_b.shape[1] > N else sigma_b  # Ensure shape compatibility
-        sigma_sq = np.sum((sigma_b_trunc ** 2 * dt_b) * time_mask, axis=1)  # [CIT-068]
         sigma_n = self._normalise(sigma_sq, self.norm_sigma)
 
         # Diagnostic logging for PSO cost components
@@ -480,10 +525,10 @@ class PSOTuner:
             + self.weights.control_rate * du_n
             + self.weights.stability * sigma_n
         ) + penalty  # [CIT-068]
-        # Explicitly penalise NaN trajectories
-        if nan_traj_mask.any():
+        # Explicitly penalise non-finite trajectories
+        if acc.nonfinite.any():
             J = J.astype(float, copy=True)
-            J[nan_traj_mask] = float(self.instability_penalty)
+            J[acc.nonfinite] = float(self.instability_penalty)
         J = J.astype(float, copy=True)
         nan_mask = ~np.isfinite(J)
         if nan_mask.any():
@@ -546,6 +591,68 @@ class PSOTuner:
         raise ValueError("costs must be 1D or 2D")
 
     # ---------- Fitness evaluation ----------
+    def _simulate_batch(
+        self, particles: np.ndarray, params_list: Optional[list] = None
+    ) -> Any:
+        """Simulate ``particles`` with the configured fitness backend.
+
+        Returns whatever ``simulate_system_batch`` returns for the same
+        arguments: a ``(t, x_b, u_b, sigma_b)`` tuple, or a list of them when
+        ``params_list`` is given.  In streaming mode each tuple is replaced
+        by a :class:`CostAccumulators` instance.
+        """
+        if self.fitness_backend == "process":
+            if self._fitness_pool is None:
+                self._fitness_pool = ProcessFitnessPool(
+                    self.controller_factory, n_workers=self.fitness_workers,
+                    step_mode=self.step_mode,
+                )
+            simulate = (
+                self._fitness_pool.simulate_costs if self.streaming_cost
+                else self._fitness_pool.simulate
+            )
+            return simulate(
+                particles,
+                sim_time=self._T,
+                dt=self.sim_cfg.dt,
+                u_max=self._u_max,
+                params_list=params_list,
+            )
+        extra: Dict[str, Any] = {} if params_list is None else {"params_list": params_list}
+        try:
+            return simulate_system_batch(
+                controller_factory=self.controller_factory,
+                particles=particles,
+                sim_time=self._T,
+                dt=self.sim_cfg.dt,
+                u_max=self._u_max,
+                engine="auto",
+                accumulate_cost=self.streaming_cost,
+                step_mode=self.step_mode,
+                telemetry=False,
+                **extra,
+            )
+        except TypeError:
+            return simulate_system_batch(
+                controller_factory=self.controller_factory,
+                particles=particles,
+                sim_time=self._T,
+                u_max=self._u_max,
+                **extra,
+            )
+
+    def close(self) -> None:
+        """Release the fitness worker pool, if one was started."""
+        if self._fitness_pool is not None:
+            self._fitness_pool.close()
+            self._fitness_pool = None
+
+    def __enter__(self) -> "PSOTuner":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def _fitness(self, particles: np.ndarray) -> np.ndarray:
         """Vectorised fitness function for a swarm of particles."""
         ref_ctrl = self.controller_factory(particles[0])
@@ -574,26 +681,13 @@ class PSOTuner:
         # Evaluate under uncertainty draws if configured
         if self.uncertainty_cfg and self.uncertainty_cfg.n_evals > 1:
             physics_models = list(self._iter_perturbed_physics())
-            try:
-                results_list = simulate_system_batch(
-                    controller_factory=self.controller_factory,
-                    particles=valid_particles,
-                    sim_time=self._T,
-                    dt=self.sim_cfg.dt,
-                    u_max=self._u_max,
-                    params_list=physics_models,
-                )
-            except TypeError:
-                results_list = simulate_system_batch(
-                    controller_factory=self.controller_factory,
-                    particles=valid_particles,
-                    sim_time=self._T,
-                    u_max=self._u_max,
-                    params_list=physics_models,
-                )
+            results_list = self._simulate_batch(valid_particles, params_list=physics_models)
             all_costs: list[np.ndarray] = []
-            for t, x_b, u_b, sigma_b in results_list:
-                cost = self._compute_cost_from_traj(t, x_b, u_b, sigma_b)
+            for res in results_list:
+                if isinstance(res, CostAccumulators):
+                    cost = self._compute_cost_from_accumulators(res)
+                else:
+                    cost = self._compute_cost_from_traj(*res)
                 nan_mask = ~np.isfinite(cost)
                 if nan_mask.any():
                     cost = cost.astype(float, copy=True)
@@ -607,32 +701,25 @@ class PSOTuner:
                 J_valid = J_valid.astype(float, copy=True)
                 J_valid[unstable_mask] = penalty
         else:
-            try:
-                t, x_b, u_b, sigma_b = simulate_system_batch(
-                    controller_factory=self.controller_factory,
-                    particles=valid_particles,
-                    sim_time=self._T,
-                    dt=self.sim_cfg.dt,
-                    u_max=self._u_max,
-                )
-            except TypeError:
-                t, x_b, u_b, sigma_b = simulate_system_batch(
-                    controller_factory=self.controller_factory,
-                    particles=valid_particles,
-                    sim_time=self._T,
-                    u_max=self._u_max,
+            result = self._simulate_batch(valid_particles)
+            if isinstance(result, CostAccumulators):
+                # Streaming mode flags particles whose state, control or
+                # sliding variable became non-finite.
+                nan_mask = result.nonfinite
+                J_valid = self._compute_cost_from_accumulators(result)
+            else:
+                t, x_b, u_b, sigma_b = result
+                # Determine which particles produced non-finite trajectories.
+                # Construct a mask that flags any particle whose state, control or
+                # sliding variable contains NaNs or infinite values.  Parentheses
+                # group the three boolean arrays to avoid inadvertent line
+                # continuation issues in Python syntax.
+                nan_mask = (
+                    (~np.all(np.isfinite(x_b), axis=(1, 2)))
+                    | (~np.all(np.isfinite(u_b), axis=1))
+                    | (~np.all(np.isfinite(sigma_b), axis=1))
                 )
-            # Determine which particles produced non-finite trajectories.
-            # Construct a mask that flags any particle whose state, control or
-            # sliding variable contains NaNs or infinite values.  Parentheses
-            # group the three boolean arrays to avoid inadvertent line
-            # continuation issues in Python syntax.
-            nan_mask = (
-                (~np.all(np.isfinite(x_b), axis=(1, 2)))
-                | (~np.all(np.isfinite(u_b), axis=1))
-                | (~np.all(np.isfinite(sigma_b), axis=1))
-            )
-            J_valid = self._compute_cost_from_traj(t, x_b, u_b, sigma_b)
+                J_valid = self._compute_cost_from_traj(t, x_b, u_b, sigma_b)
             if nan_mask.any():
                 J_valid[nan_mask] = float(self.instability_penalty)
         if violation_mask.any():
@@ -854,52 +941,57 @@ class PSOTuner:
                 bounds=bounds,
                 init_pos=init_pos,
             )
-        # If an inertia weight schedule is provided, perform manual stepping.  A
-        # linearly decreasing inertia weight from 0.9 to 0.4 encourages early
-        # exploration and late exploitation.  The
-        # optimisation loop updates ``optimizer.options['w']`` at each step and
-        # records cost and position history.
-        if getattr(pso_cfg, "w_schedule", None):
-            try:
-                w_start, w_end = pso_cfg.w_schedule
-                # Generate equally spaced inertia weights over the iteration horizon
-                w_values = np.linspace(float(w_start), float(w_end), iters)
-            except Exception:
-                # Fall back to constant inertia if schedule is invalid
-                w_values = np.full(iters, float(pso_cfg.w))
-            cost_hist: list[float] = []
-            pos_hist: list[np.ndarray] = []
-            for w_val in w_values:
-                # Update inertia weight for this iteration
-                optimizer.options['w'] = float(w_val)
-                # Execute a single PSO step; returns current best cost and position
-                step_cost, step_pos = optimizer.step(self._fitness)
-                cost_hist.append(float(step_cost))
-                pos_hist.append(np.asarray(step_pos, dtype=float).copy())
-            # Retrieve final global best values from the swarm
-            try:
-                final_cost = float(optimizer.swarm.best_cost)
-                final_pos = np.asarray(optimizer.swarm.best_pos, dtype=float).copy()
-            except Exception:
-                # Fallback to the last recorded values
-                final_cost = float(cost_hist[-1])
-                final_pos = pos_hist[-1]
+        # The process fitness backend keeps its workers alive across all
+        # iterations of this run and is released when the run ends.
+        try:
+            # If an inertia weight schedule is provided, perform manual stepping.  A
+            # linearly decreasing inertia weight from 0.9 to 0.4 encourages early
+            # exploration and late exploitation.  The
+            # optimisation loop updates ``optimizer.options['w']`` at each step and
+            # records cost and position history.
+            if getattr(pso_cfg, "w_schedule", None):
+                try:
+                    w_start, w_end = pso_cfg.w_schedule
+                    # Generate equally spaced inertia weights over the iteration horizon
+                    w_values = np.linspace(float(w_start), float(w_end), iters)
+                except Exception:
+                    # Fall back to constant inertia if schedule is invalid
+                    w_values = np.full(iters, float(pso_cfg.w))
+                cost_hist: list[float] = []
+                pos_hist: list[np.ndarray] = []
+                for w_val in w_values:
+                    # Update inertia weight for this iteration
+                    optimizer.options['w'] = float(w_val)
+                    # Execute a single PSO step; returns current best cost and position
+                    step_cost, step_pos = optimizer.step(self._fitness)
+                    cost_hist.append(float(step_cost))
+                    pos_hist.append(np.asarray(step_pos, dtype=float).copy())
+                # Retrieve final global best values from the swarm
+                try:
+                    final_cost = float(optimizer.swarm.best_cost)
+                    final_pos = np.asarray(optimizer.swarm.best_pos, dtype=float).copy()
+                except Exception:
+                    # Fallback to the last recorded values
+                    final_cost = float(cost_hist[-1])
+                    final_pos = pos_hist[-1]
+                return {
+                    "best_cost": final_cost,
+                    "best_pos": final_pos,
+                    "history": {
+                        "cost": np.asarray(cost_hist, dtype=float),
+                        "pos": np.asarray(pos_hist, dtype=float),
+                    },
+                }
+            # Otherwise run the built-in optimise method using constant inertia.  The
+            # inertia weight ``w`` should typically lie in [0.4, 0.9].
+            cost, pos = optimizer.optimize(self._fitness, iters=iters)
             return {
-                "best_cost": final_cost,
-                "best_pos": final_pos,
+                "best_cost": float(cost),
+                "best_pos": np.asarray(pos),
                 "history": {
-                    "cost": np.asarray(cost_hist, dtype=float),
-                    "pos": np.asarray(pos_hist, dtype=float),
+                    "cost": optimizer.cost_history,
+                    "pos": optimizer.pos_history,
                 },
             }
-        # Otherwise run the built-in optimise method using constant inertia.  The
-        # inertia weight ``w`` should typically lie in [0.4, 0.9].
-        cost, pos = optimizer.optimize(self._fitness, iters=iters)
-        return {
-            "best_cost": float(cost),
-            "best_pos": np.asarray(pos),
-            "history": {
-                "cost": optimizer.cost_history,
-                "pos": optimizer.pos_history,
-            },
-        }
+        finally:
+            self.close()
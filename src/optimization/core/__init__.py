@@ -23,6 +23,7 @@ from .parameters import (
     ContinuousParameterSpace
 )
 from .context import OptimizationContext, optimize
+from .parallel_fitness import ProcessFitnessPool
 
 __all__ = [
     "Optimizer",
@@ -41,5 +42,6 @@ __all__ = [
     "DiscreteParameter",
     "ContinuousParameterSpace",
     "OptimizationContext",
-    "optimize"
+    "optimize",
+    "ProcessFitnessPool"
 ]
\ No newline at end of file
@@ -0,0 +1,383 @@
+#======================================================================================\\\
+#=================== src/optimization/core/parallel_fitness.py ========================\\\
+#======================================================================================\\\
+
+"""
+Process-pool trajectory evaluation for population-based tuners.
+
+``ProcessFitnessPool`` shards a swarm across a persistent
+:class:`concurrent.futures.ProcessPoolExecutor`.  Each worker receives the
+controller factory once through the pool initializer and keeps it (together
+with any JIT-compiled kernels and plant objects it builds) alive for the
+lifetime of the pool, so successive PSO iterations only pay for simulation.
+
+Trajectories are not pickled back to the parent.  The parent owns three
+``multiprocessing.shared_memory`` blocks laid out as
+
+* states   ``(D, B_cap, N + 1, S)``
+* controls ``(D, B_cap, N)``
+* sigma    ``(D, B_cap, N)``
+
+where ``D`` is the number of physics draws and ``B_cap`` the particle
+capacity.  Each worker writes its rows in place and only returns the number
+of integration steps it completed.  The parent truncates every draw to the
+shortest completed horizon, which reproduces the batch-wide truncation of
+``simulate_system_batch`` exactly.
+
+With :meth:`ProcessFitnessPool.simulate_costs` workers run the streaming
+cost engine instead and return only ``(B,)`` cost accumulators, so no
+trajectory buffers are needed at all.
+
+The factory must be picklable when the pool uses the ``spawn`` or
+``forkserver`` start method (use a module-level function or
+``functools.partial`` rather than a closure).
+
+Example:
+    >>> with ProcessFitnessPool(factory, n_workers=4) as pool:
+    ...     t, x_b, u_b, sigma_b = pool.simulate(particles, sim_time=5.0, dt=0.01)
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.simulation.engines.cost_accumulation import CostAccumulators
+from src.simulation.engines.vector_sim import simulate_system_batch
+
+
+logger = logging.getLogger(__name__)
+
+FITNESS_BACKENDS: Tuple[str, ...] = ("serial", "process")
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+# Per-process state populated by ``_init_worker``.  ``blocks`` caches attached
+# shared-memory segments by name so that workers map each buffer only once.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(controller_factory: Callable[[np.ndarray], Any], engine: str, step_mode: str) -> None:
+    """Pool initializer: keep the factory warm for the life of the worker."""
+    _WORKER_STATE.clear()
+    _WORKER_STATE["factory"] = controller_factory
+    _WORKER_STATE["engine"] = engine
+    _WORKER_STATE["step_mode"] = step_mode
+    _WORKER_STATE["blocks"] = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    blocks = _WORKER_STATE["blocks"]
+    shm = blocks.get(name)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=name)
+        blocks[name] = shm
+    return shm
+
+
+def _release_stale(names: Sequence[str]) -> None:
+    """Detach from buffers the parent has since replaced."""
+    blocks = _WORKER_STATE["blocks"]
+    for stale in [n for n in blocks if n not in names]:
+        try:
+            blocks.pop(stale).close()
+        except Exception:
+            pass
+
+
+def _simulate_shard(task: Dict[str, Any]) -> List[int]:
+    """Simulate one shard of particles into the shared trajectory buffers.
+
+    Returns the number of completed integration steps for each physics draw.
+    """
+    names = task["names"]
+    _release_stale(names)
+    D, B_cap, N, S = task["shape"]
+    lo, hi = task["rows"]
+
+    x_shm, u_shm, s_shm = (_attach(n) for n in names)
+    x_all = np.ndarray((D, B_cap, N + 1, S), dtype=np.float64, buffer=x_shm.buf)
+    u_all = np.ndarray((D, B_cap, N), dtype=np.float64, buffer=u_shm.buf)
+    s_all = np.ndarray((D, B_cap, N), dtype=np.float64, buffer=s_shm.buf)
+
+    params_list = task["params_list"]
+    result = simulate_system_batch(
+        controller_factory=_WORKER_STATE["factory"],
+        particles=task["particles"],
+        sim_time=task["sim_time"],
+        dt=task["dt"],
+        u_max=task["u_max"],
+        params_list=params_list,
+        engine=_WORKER_STATE["engine"],
+        step_mode=_WORKER_STATE["step_mode"],
+        telemetry=False,
+    )
+    draws = result if params_list is not None else [result]
+
+    steps: List[int] = []
+    for d, (_, x_b, u_b, sigma_b) in enumerate(draws):
+        x_b = np.asarray(x_b, dtype=float)
+        if x_b.shape[-1] != S:
+            raise ValueError(f"Worker produced state dimension {x_b.shape[-1]}, expected {S}")
+        n = int(u_b.shape[1])
+        x_all[d, lo:hi, : n + 1] = x_b
+        u_all[d, lo:hi, :n] = u_b
+        s_all[d, lo:hi, :n] = sigma_b
+        steps.append(n)
+    return steps
+
+
+def _accumulate_shard(task: Dict[str, Any]) -> List[CostAccumulators]:
+    """Simulate one shard with streaming cost accumulation."""
+    params_list = task["params_list"]
+    result = simulate_system_batch(
+        controller_factory=_WORKER_STATE["factory"],
+        particles=task["particles"],
+        sim_time=task["sim_time"],
+        dt=task["dt"],
+        u_max=task["u_max"],
+        params_list=params_list,
+        engine=_WORKER_STATE["engine"],
+        step_mode=_WORKER_STATE["step_mode"],
+        telemetry=False,
+        accumulate_cost=True,
+    )
+    return result if params_list is not None else [result]
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+def _release_resources(executor: ProcessPoolExecutor, blocks: List[shared_memory.SharedMemory]) -> None:
+    executor.shutdown(wait=True, cancel_futures=True)
+    for shm in blocks:
+        try:
+            shm.close()
+        except BufferError:
+            # A caller still holds a view; the mapping is freed on exit.
+            pass
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+    blocks.clear()
+
+
+class ProcessFitnessPool:
+    """Persistent worker pool that simulates particle shards in parallel.
+
+    Parameters
+    ----------
+    controller_factory : Callable[[np.ndarray], Any]
+        Factory passed to ``simulate_system_batch`` inside each worker.
+    n_workers : int, optional
+        Number of worker processes.  Defaults to ``os.cpu_count()``.
+    engine : str, optional
+        ``simulate_system_batch`` engine used by the workers.  Default ``"auto"``.
+    step_mode : str, optional
+        ``simulate_system_batch`` plant step mode used by the workers.
+        Default ``"default"``.
+    state_dim : int, optional
+        Plant state dimension used to size the shared buffers.  Default 6.
+    mp_context : str, optional
+        Multiprocessing start method (``"fork"``, ``"spawn"``, ``"forkserver"``).
+        ``None`` uses the platform default.
+    """
+
+    def __init__(
+        self,
+        controller_factory: Callable[[np.ndarray], Any],
+        n_workers: Optional[int] = None,
+        *,
+        engine: str = "auto",
+        step_mode: str = "default",
+        state_dim: int = 6,
+        mp_context: Optional[str] = None,
+    ) -> None:
+        n_workers = int(n_workers) if n_workers is not None else (os.cpu_count() or 1)
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1")
+        self.n_workers = n_workers
+        self.state_dim = int(state_dim)
+        ctx = mp.get_context(mp_context) if mp_context is not None else None
+        self._executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(controller_factory, engine, step_mode),
+        )
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._shape: Optional[Tuple[int, int, int, int]] = None
+        self._finalizer = weakref.finalize(self, _release_resources, self._executor, self._blocks)
+
+    # ---------- Shared buffers ----------
+    def _ensure_buffers(self, n_draws: int, batch: int, n_steps: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (states, controls, sigma) views, reallocating on growth."""
+        shape = self._shape
+        if (
+            shape is None
+            or shape[0] != n_draws
+            or shape[2] != n_steps
+            or shape[1] < batch
+        ):
+            for shm in self._blocks:
+                shm.close()
+                shm.unlink()
+            self._blocks.clear()
+            S = self.state_dim
+            sizes = (
+                n_draws * batch * (n_steps + 1) * S,
+                n_draws * batch * n_steps,
+                n_draws * batch * n_steps,
+            )
+            for size in sizes:
+                self._blocks.append(shared_memory.SharedMemory(create=True, size=max(size, 1) * 8))
+            self._shape = (n_draws, batch, n_steps, S)
+        D, B_cap, N, S = self._shape
+        x_all = np.ndarray((D, B_cap, N + 1, S), dtype=np.float64, buffer=self._blocks[0].buf)
+        u_all = np.ndarray((D, B_cap, N), dtype=np.float64, buffer=self._blocks[1].buf)
+        s_all = np.ndarray((D, B_cap, N), dtype=np.float64, buffer=self._blocks[2].buf)
+        return x_all, u_all, s_all
+
+    # ---------- Evaluation ----------
+    def simulate(
+        self,
+        particles: np.ndarray,
+        *,
+        sim_time: float,
+        dt: float,
+        u_max: Optional[float] = None,
+        params_list: Optional[Sequence[Any]] = None,
+    ) -> Any:
+        """Simulate a swarm across the worker pool.
+
+        Mirrors ``simulate_system_batch``: returns ``(t, x_b, u_b, sigma_b)``
+        or, when ``params_list`` is given, one such tuple per draw.  The
+        returned arrays are copies, so they stay valid after later calls.
+        """
+        if not self._finalizer.alive:
+            raise RuntimeError("ProcessFitnessPool has been closed")
+        part_arr = np.asarray(particles, dtype=float)
+        if part_arr.ndim == 1:
+            part_arr = part_arr[np.newaxis, :]
+        B = part_arr.shape[0]
+        draws = list(params_list) if params_list is not None else None
+        if draws is not None and len(draws) == 0:
+            return []
+        D = len(draws) if draws is not None else 1
+        N = int(round(sim_time / dt))
+
+        x_all, u_all, s_all = self._ensure_buffers(D, B, N)
+        names = [shm.name for shm in self._blocks]
+
+        futures = []
+        for lo, hi in self._shards(B):
+            task = {
+                "names": names,
+                "shape": self._shape,
+                "rows": (lo, hi),
+                "particles": part_arr[lo:hi],
+                "sim_time": sim_time,
+                "dt": dt,
+                "u_max": u_max,
+                "params_list": draws,
+            }
+            futures.append(self._executor.submit(_simulate_shard, task))
+        steps = np.array([f.result() for f in futures], dtype=int)
+
+        # Per draw, truncate to the shortest shard exactly as the batch
+        # simulator truncates the whole swarm on the first failure.
+        results = []
+        for d in range(D):
+            n = int(steps[:, d].min())
+            t = np.arange(n + 1, dtype=float) * dt
+            results.append((
+                t,
+                x_all[d, :B, : n + 1].copy(),
+                u_all[d, :B, :n].copy(),
+                s_all[d, :B, :n].copy(),
+            ))
+        del x_all, u_all, s_all
+        return results if draws is not None else results[0]
+
+    def simulate_costs(
+        self,
+        particles: np.ndarray,
+        *,
+        sim_time: float,
+        dt: float,
+        u_max: Optional[float] = None,
+        params_list: Optional[Sequence[Any]] = None,
+    ) -> Any:
+        """Simulate a swarm returning only per-particle cost accumulators.
+
+        Mirrors ``simulate_system_batch(..., accumulate_cost=True)``.  When a
+        shard stops early, the shards that ran further are re-simulated up
+        to the shared horizon so the accumulators match a single batch run.
+        """
+        if not self._finalizer.alive:
+            raise RuntimeError("ProcessFitnessPool has been closed")
+        part_arr = np.asarray(particles, dtype=float)
+        if part_arr.ndim == 1:
+            part_arr = part_arr[np.newaxis, :]
+        draws = list(params_list) if params_list is not None else None
+        if draws is not None and len(draws) == 0:
+            return []
+        shards = self._shards(part_arr.shape[0])
+
+        def submit(lo: int, hi: int, horizon_time: float):
+            task = {
+                "particles": part_arr[lo:hi],
+                "sim_time": horizon_time,
+                "dt": dt,
+                "u_max": u_max,
+                "params_list": draws,
+            }
+            return self._executor.submit(_accumulate_shard, task)
+
+        parts = [f.result() for f in [submit(lo, hi, sim_time) for lo, hi in shards]]
+        n_min = min(acc.n_steps for shard in parts for acc in shard)
+        rerun = {
+            k: submit(lo, hi, n_min * dt)
+            for k, (lo, hi) in enumerate(shards)
+            if any(acc.n_steps != n_min for acc in parts[k])
+        }
+        for k, future in rerun.items():
+            parts[k] = future.result()
+
+        results = [
+            CostAccumulators.concatenate([shard[d] for shard in parts])
+            for d in range(len(parts[0]))
+        ]
+        return results if draws is not None else results[0]
+
+    def _shards(self, batch: int) -> List[Tuple[int, int]]:
+        bounds = np.linspace(0, batch, min(self.n_workers, batch) + 1).astype(int)
+        return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    # ---------- Lifecycle ----------
+    def close(self) -> None:
+        """Shut down the workers and release the shared buffers."""
+        self._finalizer()
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def __enter__(self) -> "ProcessFitnessPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+__all__ = ["FITNESS_BACKENDS", "ProcessFitnessPool"]
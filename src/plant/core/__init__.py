@@ -9,6 +9,7 @@ Provides fundamental building blocks for plant dynamics computation:
 - Physics matrix computation (M, C, G matrices)
 - Numerical stability and regularization
 - State validation and sanitization
+- Analytic Jacobian assembly for linearization
 - Integration utilities
 
 These components are designed for reuse across different plant models
@@ -25,6 +26,7 @@ from .numerical_stability import (
     MatrixRegularizer,
     AdaptiveRegularizer,
     MatrixInverter,
+    cofactor_inverse_3x3,
     fast_condition_estimate,
     NumericalStabilityMonitor
 )
@@ -34,6 +36,10 @@ from .state_validation import (
     DIPStateValidator,
     MinimalStateValidator
 )
+from .jacobians import (
+    assemble_manipulator_jacobian,
+    finite_difference_jacobian
+)
 
 __all__ = [
     # Physics matrix computation
@@ -46,6 +52,7 @@ __all__ = [
     "MatrixRegularizer",
     "AdaptiveRegularizer",
     "MatrixInverter",
+    "cofactor_inverse_3x3",
     "fast_condition_estimate",
     "NumericalStabilityMonitor",
 
@@ -53,5 +60,9 @@ __all__ = [
     "StateValidationError",
     "StateValidator",
     "DIPStateValidator",
-    "MinimalStateValidator"
+    "MinimalStateValidator",
+
+    # Jacobian linearization
+    "assemble_manipulator_jacobian",
+    "finite_difference_jacobian"
 ]
\ No newline at end of file
@@ -0,0 +1,135 @@
+#======================================================================================\\\
+#============================ src/plant/core/jacobians.py =============================\\\
+#======================================================================================\\\
+
+"""
+Analytic Jacobian Assembly for DIP Plant Models.
+
+The plant models share the manipulator form M(q)·q̈ = F(q, q̇, u) with the
+control force acting on the cart only.  Differentiating q̈ = M⁻¹F gives
+
+    ∂q̈/∂θⱼ = M⁻¹(∂F/∂θⱼ - (∂M/∂θⱼ)·q̈)
+    ∂q̈/∂q̇  = M⁻¹ ∂F/∂q̇
+    ∂q̈/∂u  = M⁻¹ e₁
+
+so each model only has to supply M, its angle derivatives and the partial
+derivatives of the forcing vector.  The assembly below turns those into the
+continuous-time (A, B) pair of ẋ = f(x, u) in a single JIT-compiled call.
+"""
+
+from __future__ import annotations
+from typing import Callable, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def assemble_manipulator_jacobian(
+    M: np.ndarray,
+    dM_dtheta1: np.ndarray,
+    dM_dtheta2: np.ndarray,
+    F: np.ndarray,
+    dF_dq: np.ndarray,
+    dF_dv: np.ndarray,
+    A: np.ndarray,
+    B: np.ndarray
+) -> bool:
+    """
+    Assemble (A, B) of ẋ = f(x, u) from manipulator-form partial derivatives.
+
+    Args:
+        M: Symmetric 3x3 inertia matrix
+        dM_dtheta1, dM_dtheta2: Derivatives of M with respect to θ1 and θ2
+        F: Forcing vector (right-hand side of M·q̈ = F)
+        dF_dq: 3x2 derivatives of F with respect to (θ1, θ2)
+        dF_dv: 3x3 derivatives of F with respect to (ẋ, θ̇1, θ̇2)
+        A: Output buffer of shape (6, 6)
+        B: Output buffer of shape (6, 1)
+
+    Returns:
+        False if M is singular, True otherwise
+    """
+    # Cofactor inverse of the symmetric inertia matrix
+    C11 = M[1, 1] * M[2, 2] - M[1, 2] * M[1, 2]
+    C12 = M[0, 2] * M[1, 2] - M[0, 1] * M[2, 2]
+    C13 = M[0, 1] * M[1, 2] - M[0, 2] * M[1, 1]
+    det = M[0, 0] * C11 + M[0, 1] * C12 + M[0, 2] * C13
+    if det == 0.0 or not np.isfinite(det):
+        return False
+    Minv = np.empty((3, 3))
+    Minv[0, 0] = C11 / det
+    Minv[0, 1] = C12 / det
+    Minv[0, 2] = C13 / det
+    Minv[1, 1] = (M[0, 0] * M[2, 2] - M[0, 2] * M[0, 2]) / det
+    Minv[1, 2] = (M[0, 1] * M[0, 2] - M[0, 0] * M[1, 2]) / det
+    Minv[2, 2] = (M[0, 0] * M[1, 1] - M[0, 1] * M[0, 1]) / det
+    Minv[1, 0] = Minv[0, 1]
+    Minv[2, 0] = Minv[0, 2]
+    Minv[2, 1] = Minv[1, 2]
+
+    # Accelerations at the linearization point
+    acc = np.empty(3)
+    for i in range(3):
+        acc[i] = Minv[i, 0] * F[0] + Minv[i, 1] * F[1] + Minv[i, 2] * F[2]
+
+    A[:, :] = 0.0
+    B[:, :] = 0.0
+    A[0, 3] = 1.0
+    A[1, 4] = 1.0
+    A[2, 5] = 1.0
+
+    # Angle columns: M⁻¹(∂F/∂θⱼ - ∂M/∂θⱼ · q̈)
+    rhs = np.empty(3)
+    for j in range(2):
+        for i in range(3):
+            if j == 0:
+                dM_acc = dM_dtheta1[i, 0] * acc[0] + dM_dtheta1[i, 1] * acc[1] + dM_dtheta1[i, 2] * acc[2]
+            else:
+                dM_acc = dM_dtheta2[i, 0] * acc[0] + dM_dtheta2[i, 1] * acc[1] + dM_dtheta2[i, 2] * acc[2]
+            rhs[i] = dF_dq[i, j] - dM_acc
+        for i in range(3):
+            A[3 + i, 1 + j] = Minv[i, 0] * rhs[0] + Minv[i, 1] * rhs[1] + Minv[i, 2] * rhs[2]
+
+    # Velocity columns and input column
+    for i in range(3):
+        for j in range(3):
+            A[3 + i, 3 + j] = Minv[i, 0] * dF_dv[0, j] + Minv[i, 1] * dF_dv[1, j] + Minv[i, 2] * dF_dv[2, j]
+        B[3 + i, 0] = Minv[i, 0]
+
+    return True
+
+
+def finite_difference_jacobian(
+    rhs: Callable[[np.ndarray, float], np.ndarray],
+    state: np.ndarray,
+    control: float,
+    eps: float = 1e-6
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Central-difference (A, B) for models without an analytic Jacobian.
+
+    Args:
+        rhs: Callable returning ẋ = f(x, u) for a state and scalar force
+        state: Linearization state
+        control: Linearization input
+        eps: Perturbation size
+
+    Returns:
+        Tuple of (A, B) with shapes (n, n) and (n, 1)
+    """
+    state = np.asarray(state, dtype=float)
+    n = state.size
+    A = np.zeros((n, n))
+    for i in range(n):
+        dx = np.zeros(n)
+        dx[i] = eps
+        A[:, i] = (rhs(state + dx, control) - rhs(state - dx, control)) / (2.0 * eps)
+    B = ((rhs(state, control + eps) - rhs(state, control - eps)) / (2.0 * eps)).reshape(n, 1)
+    return A, B
@@ -26,6 +26,20 @@ except ImportError:
         return decorator
 
 
+@njit
+def _inertia_matrix_batch_numba(
+    kernel, theta1: np.ndarray, theta2: np.ndarray,
+    m0: float, m1: float, m2: float,
+    L1: float, L2: float, Lc1: float, Lc2: float,
+    I1: float, I2: float
+) -> np.ndarray:
+    """Apply a JIT-compiled inertia matrix ``kernel`` to every row of a batch."""
+    M = np.empty((theta1.shape[0], 3, 3))
+    for b in range(theta1.shape[0]):
+        M[b] = kernel(theta1[b], theta2[b], m0, m1, m2, L1, L2, Lc1, Lc2, I1, I2)
+    return M
+
+
 class PhysicsMatrixComputer(Protocol):
     """Protocol for physics matrix computation."""
 
@@ -97,6 +111,25 @@ class DIPPhysicsMatrices:
             self.L1, self.L2, self.Lc1, self.Lc2, self.I1, self.I2
         )
 
+    def compute_inertia_matrix_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Compute the inertia matrices M(q) of a batch of states.
+
+        Args:
+            states: System states, shape (B, 6)
+
+        Returns:
+            Inertia matrices, shape (B, 3, 3)
+        """
+        return self._inertia_matrix_batch(self._compute_inertia_matrix_numba, states)
+
+    def _inertia_matrix_batch(self, kernel, states: np.ndarray) -> np.ndarray:
+        states = np.asarray(states, dtype=np.float64)
+        return _inertia_matrix_batch_numba(
+            kernel, np.ascontiguousarray(states[:, 1]), np.ascontiguousarray(states[:, 2]),
+            self.m0, self.m1, self.m2, self.L1, self.L2, self.Lc1, self.Lc2, self.I1, self.I2
+        )
+
     def compute_coriolis_matrix(self, state: np.ndarray) -> np.ndarray:
         """
         Compute the Coriolis matrix C(q, q̇) for the DIP system.
@@ -263,6 +296,10 @@ class SimplifiedDIPPhysicsMatrices(DIPPhysicsMatrices):
             self.L1, self.L2, self.Lc1, self.Lc2, self.I1, self.I2
         )
 
+    def compute_inertia_matrix_batch(self, states: np.ndarray) -> np.ndarray:
+        """Simplified inertia matrices of a (B, 6) batch of states, shape (B, 3, 3)."""
+        return self._inertia_matrix_batch(self._compute_simplified_inertia_matrix_numba, states)
+
     @staticmethod
     @njit(cache=True)
     def _compute_simplified_inertia_matrix_numba(
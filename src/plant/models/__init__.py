@@ -39,6 +39,16 @@ from .lowrank import (
     LowRankDIPDynamics as ModularLowRankDynamics
 )
 
+# Batched right-hand side kernels
+from .batch_dynamics import (
+    MODEL_SIMPLIFIED,
+    MODEL_SIMPLIFIED_FAST,
+    MODEL_FULL,
+    MODEL_LOWRANK,
+    compute_dynamics_batch,
+    pack_batch_params
+)
+
 __all__ = [
     # Base classes
     "DynamicsModel",
@@ -56,5 +66,13 @@ __all__ = [
     "FullDIPDynamics",
     "LowRankDIPConfig",
     "LowRankPhysicsComputer",
-    "ModularLowRankDynamics"
+    "ModularLowRankDynamics",
+
+    # Batched right-hand side kernels
+    "MODEL_SIMPLIFIED",
+    "MODEL_SIMPLIFIED_FAST",
+    "MODEL_FULL",
+    "MODEL_LOWRANK",
+    "compute_dynamics_batch",
+    "pack_batch_params"
 ]
\ No newline at end of file
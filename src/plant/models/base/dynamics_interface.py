@@ -10,7 +10,7 @@ across different dynamics implementations (simplified, full, low-rank).
 """
 
 from __future__ import annotations
-from typing import Protocol, Tuple, Dict, Any, NamedTuple
+from typing import Protocol, Tuple, Dict, Any, NamedTuple, Optional
 from abc import ABC, abstractmethod
 from enum import Enum
 import numpy as np
@@ -135,6 +135,10 @@ class BaseDynamicsModel(ABC):
     for concrete dynamics implementations.
     """
 
+    # Trusted step state (see enable_trusted_step)
+    _trusted_plan = None
+    _trusted_step_enabled = False
+
     def __init__(self, parameters: Any):
         """
         Initialize dynamics model.
@@ -182,6 +186,125 @@ class BaseDynamicsModel(ABC):
             return self._state_validator.sanitize_state(state)
         return state
 
+    def compute_jacobian(
+        self,
+        state: np.ndarray,
+        control_input: Any = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the continuous-time Jacobian (A, B) of ẋ = f(x, u).
+
+        Models provide the Jacobian through ``_evaluate_jacobian``.  The
+        upright equilibrium (zero state, zero input) is evaluated once and
+        served from a cache afterwards.
+
+        Args:
+            state: Linearization state
+            control_input: Linearization input (scalar or length-1 array)
+
+        Returns:
+            Tuple of (A, B) with shapes (6, 6) and (6, 1)
+        """
+        state = np.asarray(state, dtype=float)
+        u = float(np.atleast_1d(control_input)[0])
+        if u == 0.0 and not np.any(state):
+            cached = getattr(self, '_upright_jacobian', None)
+            if cached is None:
+                cached = self._evaluate_jacobian(np.zeros(self.get_state_dimension()), 0.0)
+                self._upright_jacobian = cached
+            return cached[0].copy(), cached[1].copy()
+        return self._evaluate_jacobian(state, u)
+
+    def _evaluate_jacobian(self, state: np.ndarray, u: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate (A, B) at a state (implemented by models with an analytic Jacobian)."""
+        raise NotImplementedError(f"{type(self).__name__} does not provide a Jacobian")
+
+    def enable_trusted_step(self, method: str = "euler") -> None:
+        """
+        Route ``step()`` through the compiled trusted step.
+
+        Intended for inner loops (PSO fitness, Monte Carlo) whose inputs are
+        already known to be well formed.
+
+        Args:
+            method: Integration method, ``"euler"`` or ``"rk4"``
+
+        Raises:
+            ValueError: If the method is unknown or the model has no
+                compiled kernel
+        """
+        self.prepare_trusted_step(method)
+        self._trusted_step_enabled = True
+
+    def disable_trusted_step(self) -> None:
+        """Restore the validated ``step()`` path."""
+        self._trusted_step_enabled = False
+
+    @property
+    def trusted_step_enabled(self) -> bool:
+        """Whether ``step()`` uses the compiled trusted step."""
+        return self._trusted_step_enabled
+
+    def prepare_trusted_step(self, method: Optional[str] = None) -> None:
+        """
+        Capture the physics parameters used by ``trusted_step``.
+
+        Args:
+            method: Integration method; ``None`` keeps the current one
+                (forward Euler if none was chosen yet)
+
+        Raises:
+            ValueError: If the method is unknown or the model has no
+                compiled kernel
+        """
+        if method is None:
+            if self._trusted_plan is not None:
+                return
+            method = "euler"
+        from ..batch_dynamics import STEP_METHODS, pack_batch_params, trusted_step_row
+        if method not in STEP_METHODS:
+            raise ValueError(f"Unknown trusted step method '{method}'")
+        model, params = pack_batch_params(self)
+        self._trusted_plan = (
+            trusted_step_row, model, STEP_METHODS[method], params, np.empty((5, 6))
+        )
+
+    def trusted_step(
+        self,
+        state: np.ndarray,
+        control_input: Any,
+        dt: float,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Advance the state by one step without validation or diagnostics.
+
+        Skips sanitization, monitoring and ``DynamicsResult`` construction;
+        the only check is that the new state is finite.  Like ``step()``,
+        the input state is returned when the check fails.  Uses the method
+        chosen by ``enable_trusted_step``/``prepare_trusted_step`` (forward
+        Euler by default); parameters are captured on first use.
+
+        Args:
+            state: Current state vector (6D)
+            control_input: Control input (scalar or length-1 array)
+            dt: Time step
+            out: Optional preallocated output buffer of length 6
+
+        Returns:
+            Next state (``out`` when provided)
+        """
+        if self._trusted_plan is None:
+            self.prepare_trusted_step()
+        kernel, model, method, params, scratch = self._trusted_plan
+        if not (isinstance(state, np.ndarray) and state.dtype == np.float64):
+            state = np.asarray(state, dtype=float)
+        u = control_input if isinstance(control_input, float) else float(np.ravel(control_input)[0])
+        if out is None:
+            out = np.empty(6)
+        kernel(model, method, state, u, float(dt), params, scratch, out)
+        return out
+
     def get_state_dimension(self) -> int:
         """Get state vector dimension (default: 6 for DIP)."""
         return 6
@@ -0,0 +1,297 @@
+#======================================================================================\\\
+#========================= src/plant/models/batch_dynamics.py =========================\\\
+#======================================================================================\\\
+
+"""
+Batched Right-Hand Side Kernels for the DIP Plant Models.
+
+The dynamics classes evaluate one state at a time behind validation,
+diagnostics and ``DynamicsResult`` allocation.  Batch simulators that
+already hold a whole population as a ``(B, 6)`` array can instead call
+:func:`compute_dynamics_batch`, which evaluates every row in one parallel
+JIT-compiled kernel:
+
+- ``states``    ``(B, 6)``  state vectors
+- ``controls``  ``(B,)``    cart forces
+- ``params``    ``(B, P)``  physics rows packed by :func:`pack_batch_params`
+
+Each row carries its own parameters, so perturbed plants can be evaluated
+side by side.  The column layout depends on the model code; see
+``PHYSICS_PARAM_FIELDS``, ``FULL_PHYSICS_PARAM_FIELDS`` and
+``LOWRANK_PHYSICS_PARAM_FIELDS``.  Rows whose inertia matrix is singular
+are returned as NaN instead of raising.
+
+The same dispatcher backs :func:`trusted_step_row`, the compiled Euler/RK4
+step behind ``BaseDynamicsModel.trusted_step``.
+"""
+
+from __future__ import annotations
+from typing import Any, Optional, Tuple, Union
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+    prange = range
+
+from .simplified.dynamics import SimplifiedDIPDynamics
+from .simplified.physics import (
+    PHYSICS_PARAM_FIELDS,
+    compute_simplified_fast_rhs_numba,
+    compute_simplified_rhs_numba,
+    pack_physics_params,
+)
+from .full.dynamics import FullDIPDynamics
+from .full.physics import (
+    FULL_PHYSICS_PARAM_FIELDS,
+    compute_full_rhs_numba,
+    pack_full_physics_params,
+)
+from .lowrank.dynamics import LowRankDIPDynamics
+from .lowrank.physics import (
+    LOWRANK_PHYSICS_PARAM_FIELDS,
+    compute_lowrank_rhs_numba,
+    pack_lowrank_physics_params,
+)
+
+# Plant model codes
+MODEL_SIMPLIFIED = 0
+MODEL_SIMPLIFIED_FAST = 1
+MODEL_FULL = 2
+MODEL_LOWRANK = 3
+
+_MODEL_NAMES = {
+    "simplified": MODEL_SIMPLIFIED,
+    "simplified_fast": MODEL_SIMPLIFIED_FAST,
+    "full": MODEL_FULL,
+    "lowrank": MODEL_LOWRANK,
+}
+
+# Integration methods of the trusted step
+STEP_EULER = 0
+STEP_RK4 = 1
+
+STEP_METHODS = {
+    "euler": STEP_EULER,
+    "rk4": STEP_RK4,
+}
+
+# Physics row length expected by each kernel
+_PARAM_COUNTS = {
+    MODEL_SIMPLIFIED: len(PHYSICS_PARAM_FIELDS),
+    MODEL_SIMPLIFIED_FAST: len(PHYSICS_PARAM_FIELDS),
+    MODEL_FULL: len(FULL_PHYSICS_PARAM_FIELDS),
+    MODEL_LOWRANK: len(LOWRANK_PHYSICS_PARAM_FIELDS),
+}
+
+
+@njit(cache=True)
+def dynamics_rhs_row(
+    model: int,
+    state: np.ndarray,
+    control_force: float,
+    params: np.ndarray,
+    out: np.ndarray
+) -> bool:
+    """
+    Evaluate the right-hand side of one state for a model code.
+
+    Args:
+        model: One of the ``MODEL_*`` codes
+        state: System state vector
+        control_force: Applied control force
+        params: Physics row for the model (see :func:`pack_batch_params`)
+        out: Output buffer of length 6 for the state derivative
+
+    Returns:
+        False if the model could not be evaluated, True otherwise
+    """
+    if model == MODEL_SIMPLIFIED:
+        return compute_simplified_rhs_numba(state, control_force, params, out)
+    if model == MODEL_SIMPLIFIED_FAST:
+        return compute_simplified_fast_rhs_numba(state, control_force, params, out)
+    if model == MODEL_FULL:
+        return compute_full_rhs_numba(state, control_force, params, out)
+    if model == MODEL_LOWRANK:
+        return compute_lowrank_rhs_numba(state, control_force, params, out)
+    return False
+
+
+@njit(cache=True)
+def trusted_step_row(
+    model: int,
+    method: int,
+    state: np.ndarray,
+    control_force: float,
+    dt: float,
+    params: np.ndarray,
+    scratch: np.ndarray,
+    out: np.ndarray
+) -> bool:
+    """
+    Advance one state by ``dt`` with checks limited to finiteness.
+
+    Args:
+        model: One of the ``MODEL_*`` codes
+        method: ``STEP_EULER`` or ``STEP_RK4``
+        state: System state vector
+        control_force: Applied control force (held over the step)
+        dt: Time step
+        params: Physics row for the model
+        scratch: Work buffer of shape (5, 6)
+        out: Output buffer of length 6 (may alias ``state``)
+
+    Returns:
+        True if the new state is finite; otherwise ``out`` receives the
+        input state and False is returned
+    """
+    k1, k2, k3, k4, work = scratch[0], scratch[1], scratch[2], scratch[3], scratch[4]
+    ok = dynamics_rhs_row(model, state, control_force, params, k1)
+    if ok and method == STEP_RK4:
+        for k in range(6):
+            work[k] = state[k] + 0.5 * dt * k1[k]
+        ok = dynamics_rhs_row(model, work, control_force, params, k2)
+        if ok:
+            for k in range(6):
+                work[k] = state[k] + 0.5 * dt * k2[k]
+            ok = dynamics_rhs_row(model, work, control_force, params, k3)
+        if ok:
+            for k in range(6):
+                work[k] = state[k] + dt * k3[k]
+            ok = dynamics_rhs_row(model, work, control_force, params, k4)
+        if ok:
+            for k in range(6):
+                work[k] = state[k] + dt / 6.0 * (k1[k] + 2.0 * k2[k] + 2.0 * k3[k] + k4[k])
+    elif ok:
+        for k in range(6):
+            work[k] = state[k] + dt * k1[k]
+    if ok:
+        for k in range(6):
+            if not np.isfinite(work[k]):
+                ok = False
+    if ok:
+        for k in range(6):
+            out[k] = work[k]
+    else:
+        for k in range(6):
+            out[k] = state[k]
+    return ok
+
+
+@njit(parallel=True, cache=True)
+def _dynamics_batch_kernel(
+    model: int,
+    states: np.ndarray,
+    controls: np.ndarray,
+    params: np.ndarray,
+    out: np.ndarray
+) -> None:
+    """Evaluate every row of a batch in parallel; failed rows become NaN."""
+    for b in prange(states.shape[0]):
+        if not dynamics_rhs_row(model, states[b], controls[b], params[b], out[b]):
+            out[b, :] = np.nan
+
+
+def pack_batch_params(dynamics_model: Any) -> Tuple[int, np.ndarray]:
+    """
+    Extract the model code and physics row of a dynamics instance.
+
+    Args:
+        dynamics_model: Simplified, full or low-rank DIP dynamics model
+
+    Returns:
+        Tuple of (model code, physics row)
+
+    Raises:
+        ValueError: If the model or its configuration has no batch kernel
+    """
+    if isinstance(dynamics_model, SimplifiedDIPDynamics):
+        params = pack_physics_params(dynamics_model.config)
+        if dynamics_model.enable_fast_mode:
+            return MODEL_SIMPLIFIED_FAST, params
+        if not dynamics_model.physics.use_simplified_inertia:
+            raise ValueError("full inertia matrix mode is not supported")
+        return MODEL_SIMPLIFIED, params
+    if isinstance(dynamics_model, FullDIPDynamics):
+        return MODEL_FULL, pack_full_physics_params(dynamics_model.config)
+    if isinstance(dynamics_model, LowRankDIPDynamics):
+        return MODEL_LOWRANK, pack_lowrank_physics_params(dynamics_model.config)
+    raise ValueError(f"dynamics model {type(dynamics_model).__name__} is not supported")
+
+
+def compute_dynamics_batch(
+    model: Union[int, str, Any],
+    states: np.ndarray,
+    controls: Union[float, np.ndarray],
+    params: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Evaluate ẋ = f(x, u) for a batch of states in one compiled call.
+
+    Args:
+        model: Dynamics instance, ``MODEL_*`` code or model name
+            (``"simplified"``, ``"simplified_fast"``, ``"full"``, ``"lowrank"``)
+        states: State array of shape (B, 6)
+        controls: Scalar or array of shape (B,) with cart forces
+        params: Physics rows of shape (B, P), or a single row of shape (P,)
+            shared by the batch.  Defaults to the instance's own parameters
+            when ``model`` is a dynamics instance.
+        out: Optional output buffer of shape (B, 6)
+
+    Returns:
+        State derivatives of shape (B, 6); rows that could not be evaluated
+        are NaN
+
+    Raises:
+        ValueError: If the model is unknown or the shapes do not line up
+    """
+    if isinstance(model, str):
+        if model not in _MODEL_NAMES:
+            raise ValueError(f"Unknown model '{model}'")
+        code = _MODEL_NAMES[model]
+    elif isinstance(model, (int, np.integer)):
+        code = int(model)
+        if code not in _MODEL_NAMES.values():
+            raise ValueError(f"Unknown model code {code}")
+    else:
+        code, own_params = pack_batch_params(model)
+        if params is None:
+            params = own_params
+    if params is None:
+        raise ValueError("params are required when model is given by code or name")
+
+    states = np.ascontiguousarray(states, dtype=float)
+    if states.ndim != 2 or states.shape[1] != 6:
+        raise ValueError(f"states must have shape (B, 6), got {states.shape}")
+    batch_size = states.shape[0]
+
+    controls = np.asarray(controls, dtype=float)
+    if controls.ndim == 0:
+        controls = np.full(batch_size, float(controls))
+    else:
+        controls = np.ascontiguousarray(controls.reshape(-1))
+        if controls.size != batch_size:
+            raise ValueError(f"controls must have {batch_size} entries, got {controls.size}")
+
+    n_params = _PARAM_COUNTS[code]
+    params = np.asarray(params, dtype=float)
+    if params.ndim == 1:
+        params = np.broadcast_to(params, (batch_size, params.size))
+    if params.ndim != 2 or params.shape != (batch_size, n_params):
+        raise ValueError(
+            f"params must have shape ({n_params},) or ({batch_size}, {n_params}), got {params.shape}"
+        )
+    params = np.ascontiguousarray(params)
+
+    if out is None:
+        out = np.empty((batch_size, 6))
+    elif out.shape != (batch_size, 6):
+        raise ValueError(f"out must have shape ({batch_size}, 6), got {out.shape}")
+
+    _dynamics_batch_kernel(code, states, controls, params, out)
+    return out
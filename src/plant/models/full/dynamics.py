@@ -18,10 +18,11 @@ import warnings
 from ..base import BaseDynamicsModel, DynamicsResult
 from ...core import (
     DIPStateValidator,
-    NumericalInstabilityError
+    NumericalInstabilityError,
+    finite_difference_jacobian
 )
 from .config import FullDIPConfig
-from .physics import FullFidelityPhysicsComputer
+from .physics import FullFidelityPhysicsComputer, compute_full_jacobian_numba
 from src.utils.config_compatibility import AttributeDictionary, ensure_dict_access
 
 
@@ -211,6 +212,37 @@ class FullDIPDynamics(BaseDynamicsModel):
         G = self.physics._compute_full_gravity_vector(state)
         return M, C, G
 
+    def _evaluate_jacobian(self, state: np.ndarray, u: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Analytic Jacobian of the full dynamics.
+
+        Aerodynamic drag has no closed-form derivative here, so models with
+        aerodynamic forces enabled fall back to central differences.
+        """
+        cfg = self.config
+        if cfg.include_aerodynamic_forces:
+            return finite_difference_jacobian(
+                lambda x, f: self.physics.compute_complete_dynamics_rhs(x, np.array([f])),
+                state, u
+            )
+
+        A = np.empty((6, 6))
+        B = np.empty((6, 1))
+        ok = compute_full_jacobian_numba(
+            np.ascontiguousarray(state, dtype=float), u,
+            cfg.cart_mass, cfg.pendulum1_mass, cfg.pendulum2_mass,
+            cfg.pendulum1_length, cfg.pendulum1_com, cfg.pendulum2_com,
+            cfg.pendulum1_inertia, cfg.pendulum2_inertia, cfg.gravity,
+            cfg.cart_viscous_friction, cfg.joint1_viscous_friction, cfg.joint2_viscous_friction,
+            cfg.cart_coulomb_friction, cfg.joint1_coulomb_friction, cfg.joint2_coulomb_friction,
+            cfg.include_coriolis_effects and cfg.include_centrifugal_effects,
+            cfg.include_gyroscopic_effects,
+            A, B
+        )
+        if not ok:
+            raise ValueError("Cannot linearize: inertia matrix is singular")
+        return A, B
+
     def compute_energy_analysis(self, state: np.ndarray) -> Dict[str, float]:
         """
         Compute comprehensive energy analysis.
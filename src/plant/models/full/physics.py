@@ -26,7 +26,8 @@ from ...core import (
     DIPPhysicsMatrices,
     AdaptiveRegularizer,
     MatrixInverter,
-    NumericalInstabilityError
+    NumericalInstabilityError,
+    assemble_manipulator_jacobian
 )
 from .config import FullDIPConfig
 
@@ -287,13 +288,14 @@ class FullFidelityPhysicsComputer:
 
     def _solve_with_refinement(self, A: np.ndarray, b: np.ndarray) -> np.ndarray:
         """Solve linear system with iterative refinement for higher accuracy."""
-        # Initial solution
-        x = self.matrix_inverter.solve_linear_system(A, b)
+        # Invert once and reuse the inverse for the refinement steps
+        A_inv = self.matrix_inverter.invert_matrix(A)
+        x = A_inv @ b
 
         # Iterative refinement
         for _ in range(2):  # Usually 1-2 iterations sufficient
             residual = b - A @ x
-            correction = self.matrix_inverter.solve_linear_system(A, residual)
+            correction = A_inv @ residual
             x += correction
 
             # Check convergence
@@ -377,4 +379,266 @@ class FullFidelityPhysicsComputer:
             C[0, 1] += gyro_coupling * (theta1_dot + theta2_dot)
             C[1, 0] -= gyro_coupling * (theta1_dot + theta2_dot)
 
-        return C
\ No newline at end of file
+        return C
+
+@njit(cache=True)
+def compute_full_jacobian_numba(
+    state: np.ndarray,
+    control_force: float,
+    m0: float, m1: float, m2: float,
+    L1: float, Lc1: float, Lc2: float,
+    I1: float, I2: float, g: float,
+    cv0: float, cv1: float, cv2: float,
+    cc0: float, cc1: float, cc2: float,
+    include_coriolis: bool, include_gyroscopic: bool,
+    A: np.ndarray,
+    B: np.ndarray
+) -> bool:
+    """
+    JIT-compiled analytic Jacobian of the full-fidelity dynamics.
+
+    Differentiates M(q)q̈ = u - C(q,q̇)q̇ - G(q) - F_friction.  Coulomb
+    friction is piecewise constant in the velocities, so it only shifts the
+    operating-point acceleration; aerodynamic forces and base excitation are
+    not covered.
+
+    Args:
+        state: Linearization state
+        control_force: Linearization input
+        m0, m1, m2: Masses
+        L1, Lc1, Lc2: Length and COM distances
+        I1, I2: Inertias
+        g: Gravity
+        cv0, cv1, cv2: Viscous friction coefficients
+        cc0, cc1, cc2: Coulomb friction coefficients
+        include_coriolis: Coriolis and centrifugal terms enabled
+        include_gyroscopic: Gyroscopic coupling terms enabled
+        A: Output buffer of shape (6, 6) for ∂f/∂x
+        B: Output buffer of shape (6, 1) for ∂f/∂u
+
+    Returns:
+        False if the inertia matrix is singular, True otherwise
+    """
+    theta1, theta2 = state[1], state[2]
+    x_dot, w1, w2 = state[3], state[4], state[5]
+
+    cos1 = np.cos(theta1)
+    cos2 = np.cos(theta2)
+    s1 = np.sin(theta1)
+    s2 = np.sin(theta2)
+    c12 = np.cos(theta1 - theta2)
+    s12 = np.sin(theta1 - theta2)
+
+    a1 = m1 * Lc1 + m2 * L1
+    b = m2 * Lc2
+    k = m2 * L1 * Lc2
+
+    M = np.empty((3, 3))
+    M[0, 0] = m0 + m1 + m2
+    M[0, 1] = a1 * cos1 + b * cos2
+    M[0, 2] = b * cos2
+    M[1, 1] = m1 * Lc1**2 + m2 * L1**2 + I1 + m2 * Lc2**2 + I2 + 2.0 * k * c12
+    M[1, 2] = m2 * Lc2**2 + I2 + k * c12
+    M[2, 2] = m2 * Lc2**2 + I2
+    M[1, 0], M[2, 0], M[2, 1] = M[0, 1], M[0, 2], M[1, 2]
+
+    dM1 = np.zeros((3, 3))
+    dM1[0, 1] = dM1[1, 0] = -a1 * s1
+    dM1[1, 1] = -2.0 * k * s12
+    dM1[1, 2] = dM1[2, 1] = -k * s12
+    dM2 = np.zeros((3, 3))
+    dM2[0, 1] = dM2[1, 0] = -b * s2
+    dM2[0, 2] = dM2[2, 0] = -b * s2
+    dM2[1, 1] = 2.0 * k * s12
+    dM2[1, 2] = dM2[2, 1] = k * s12
+
+    # Gravity and viscous friction (F_friction = -c·q̇ enters with a minus sign)
+    F = np.empty(3)
+    F[0] = control_force + cv0 * x_dot
+    F[1] = a1 * g * s1 + b * g * s2 + cv1 * w1
+    F[2] = b * g * s2 + cv2 * w2
+    if abs(x_dot) > 1e-6:
+        F[0] += cc0 * np.sign(x_dot)
+    if abs(w1) > 1e-6:
+        F[1] += cc1 * np.sign(w1)
+    if abs(w2) > 1e-6:
+        F[2] += cc2 * np.sign(w2)
+
+    dF_dq = np.zeros((3, 2))
+    dF_dq[1, 0] = a1 * g * cos1
+    dF_dq[1, 1] = b * g * cos2
+    dF_dq[2, 1] = b * g * cos2
+
+    dF_dv = np.zeros((3, 3))
+    dF_dv[0, 0] = cv0
+    dF_dv[1, 1] = cv1
+    dF_dv[2, 2] = cv2
+
+    if include_coriolis:
+        ww = w1 * w2 + w2**2
+        F[0] += a1 * s1 * w1**2 + b * s2 * ww
+        F[1] += k * s12 * ww
+        F[2] -= k * s12 * w1**2
+
+        dF_dq[0, 0] += a1 * cos1 * w1**2
+        dF_dq[0, 1] += b * cos2 * ww
+        dF_dq[1, 0] += k * c12 * ww
+        dF_dq[1, 1] -= k * c12 * ww
+        dF_dq[2, 0] -= k * c12 * w1**2
+        dF_dq[2, 1] += k * c12 * w1**2
+
+        dF_dv[0, 1] += 2.0 * a1 * s1 * w1 + b * s2 * w2
+        dF_dv[0, 2] += b * s2 * (w1 + 2.0 * w2)
+        dF_dv[1, 1] += k * s12 * w2
+        dF_dv[1, 2] += k * s12 * (w1 + 2.0 * w2)
+        dF_dv[2, 1] -= 2.0 * k * s12 * w1
+
+    if include_gyroscopic:
+        # Same coupling coefficient as _compute_full_coriolis_matrix_numba
+        gyro_coupling = 0.01
+        F[0] -= gyro_coupling * (w1 + w2) * w1
+        F[1] += gyro_coupling * (w1 + w2) * x_dot
+
+        dF_dv[0, 1] -= gyro_coupling * (2.0 * w1 + w2)
+        dF_dv[0, 2] -= gyro_coupling * w1
+        dF_dv[1, 0] += gyro_coupling * (w1 + w2)
+        dF_dv[1, 1] += gyro_coupling * x_dot
+        dF_dv[1, 2] += gyro_coupling * x_dot
+
+    return assemble_manipulator_jacobian(M, dM1, dM2, F, dF_dq, dF_dv, A, B)
+
+
+# Order of the physical parameters packed by ``pack_full_physics_params``.
+# The two effect switches are stored as 0.0/1.0 so that each row of a batch
+# carries everything ``compute_full_rhs_numba`` needs.
+FULL_PHYSICS_PARAM_FIELDS = (
+    "cart_mass", "pendulum1_mass", "pendulum2_mass",
+    "pendulum1_length", "pendulum1_com", "pendulum2_com",
+    "pendulum1_inertia", "pendulum2_inertia",
+    "gravity",
+    "cart_viscous_friction", "joint1_viscous_friction", "joint2_viscous_friction",
+    "cart_coulomb_friction", "joint1_coulomb_friction", "joint2_coulomb_friction",
+    "include_coriolis", "include_gyroscopic_effects",
+)
+
+
+def pack_full_physics_params(config: FullDIPConfig) -> np.ndarray:
+    """
+    Pack full-model parameters into a flat array for JIT kernels.
+
+    ``include_coriolis`` is set only when both Coriolis and centrifugal
+    effects are enabled, matching ``_compute_full_coriolis_matrix_numba``.
+
+    Args:
+        config: Full DIP configuration
+
+    Returns:
+        Array of shape (len(FULL_PHYSICS_PARAM_FIELDS),) in field order
+
+    Raises:
+        ValueError: If aerodynamic forces or base excitation are enabled
+            (both depend on inputs the kernels do not receive)
+    """
+    if config.include_aerodynamic_forces or config.base_excitation_enabled:
+        raise ValueError(
+            "aerodynamic forces and base excitation are not supported by the JIT kernels"
+        )
+    values = []
+    for name in FULL_PHYSICS_PARAM_FIELDS:
+        if name == "include_coriolis":
+            value = config.include_coriolis_effects and config.include_centrifugal_effects
+        else:
+            value = getattr(config, name)
+        values.append(float(value))
+    return np.array(values)
+
+
+@njit(cache=True)
+def compute_full_rhs_numba(
+    state: np.ndarray,
+    control_force: float,
+    params: np.ndarray,
+    out: np.ndarray
+) -> bool:
+    """
+    JIT-compiled right-hand side of the full-fidelity dynamics.
+
+    Mirrors ``FullFidelityPhysicsComputer.compute_complete_dynamics_rhs``
+    without aerodynamic forces or base excitation.  The inertia matrix is
+    solved by cofactors instead of the regularized inverter, which agrees
+    with it for every well-conditioned state.
+
+    Args:
+        state: System state vector
+        control_force: Applied control force
+        params: Physical parameters packed by ``pack_full_physics_params``
+        out: Output buffer of length 6 for the state derivative
+
+    Returns:
+        False if the inertia matrix is singular, True otherwise
+    """
+    m0, m1, m2 = params[0], params[1], params[2]
+    L1, Lc1, Lc2 = params[3], params[4], params[5]
+    I1, I2, g = params[6], params[7], params[8]
+    cv0, cv1, cv2 = params[9], params[10], params[11]
+    cc0, cc1, cc2 = params[12], params[13], params[14]
+
+    theta1, theta2 = state[1], state[2]
+    x_dot, w1, w2 = state[3], state[4], state[5]
+
+    cos1 = np.cos(theta1)
+    cos2 = np.cos(theta2)
+    s1 = np.sin(theta1)
+    s2 = np.sin(theta2)
+    c12 = np.cos(theta1 - theta2)
+    s12 = np.sin(theta1 - theta2)
+
+    a1 = m1 * Lc1 + m2 * L1
+    b = m2 * Lc2
+    k = m2 * L1 * Lc2
+
+    M11 = m0 + m1 + m2
+    M12 = a1 * cos1 + b * cos2
+    M13 = b * cos2
+    M22 = m1 * Lc1**2 + m2 * L1**2 + I1 + m2 * Lc2**2 + I2 + 2.0 * k * c12
+    M23 = m2 * Lc2**2 + I2 + k * c12
+    M33 = m2 * Lc2**2 + I2
+
+    # Forcing u - C·q̇ - G - F_friction (see compute_full_jacobian_numba)
+    F1 = control_force + cv0 * x_dot
+    F2 = a1 * g * s1 + b * g * s2 + cv1 * w1
+    F3 = b * g * s2 + cv2 * w2
+    if abs(x_dot) > 1e-6:
+        F1 += cc0 * np.sign(x_dot)
+    if abs(w1) > 1e-6:
+        F2 += cc1 * np.sign(w1)
+    if abs(w2) > 1e-6:
+        F3 += cc2 * np.sign(w2)
+    if params[15] != 0.0:
+        ww = w1 * w2 + w2**2
+        F1 += a1 * s1 * w1**2 + b * s2 * ww
+        F2 += k * s12 * ww
+        F3 -= k * s12 * w1**2
+    if params[16] != 0.0:
+        gyro_coupling = 0.01
+        F1 -= gyro_coupling * (w1 + w2) * w1
+        F2 += gyro_coupling * (w1 + w2) * x_dot
+
+    # Cofactor solve of the symmetric 3x3 system
+    A11 = M22 * M33 - M23 * M23
+    A12 = M13 * M23 - M12 * M33
+    A13 = M12 * M23 - M13 * M22
+    det = M11 * A11 + M12 * A12 + M13 * A13
+    if det == 0.0 or not np.isfinite(det):
+        return False
+    A22 = M11 * M33 - M13 * M13
+    A23 = M12 * M13 - M11 * M23
+    A33 = M11 * M22 - M12 * M12
+
+    out[0] = x_dot
+    out[1] = w1
+    out[2] = w2
+    out[3] = (A11 * F1 + A12 * F2 + A13 * F3) / det
+    out[4] = (A12 * F1 + A22 * F2 + A23 * F3) / det
+    out[5] = (A13 * F1 + A23 * F2 + A33 * F3) / det
+    return True
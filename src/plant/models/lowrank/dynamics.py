@@ -21,7 +21,7 @@ from ...core import (
     NumericalInstabilityError
 )
 from .config import LowRankDIPConfig
-from .physics import LowRankPhysicsComputer
+from .physics import LowRankPhysicsComputer, compute_lowrank_jacobian_numba
 
 
 class LowRankDIPDynamics(BaseDynamicsModel):
@@ -242,6 +242,21 @@ class LowRankDIPDynamics(BaseDynamicsModel):
 
         return state_derivative
 
+    def _evaluate_jacobian(self, state: np.ndarray, u: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Analytic Jacobian of the variant selected by the configuration."""
+        cfg = self.config
+        A = np.empty((6, 6))
+        B = np.empty((6, 1))
+        compute_lowrank_jacobian_numba(
+            np.ascontiguousarray(state, dtype=float), u,
+            cfg.cart_mass, cfg.pendulum1_mass, cfg.pendulum2_mass,
+            cfg.pendulum1_length, cfg.pendulum2_length, cfg.gravity,
+            cfg.friction_coefficient, cfg.damping_coefficient,
+            self.physics.dynamics_mode,
+            A, B
+        )
+        return A, B
+
     def compute_energy_analysis(self, state: np.ndarray) -> Dict[str, float]:
         """
         Compute simplified energy analysis.
@@ -288,8 +303,12 @@ class LowRankDIPDynamics(BaseDynamicsModel):
             dt: Time step
 
         Returns:
-            Next state using Euler integration
+            Next state using Euler integration (or the compiled trusted
+            step after ``enable_trusted_step()``)
         """
+        if self._trusted_step_enabled:
+            return self.trusted_step(state, control_input, dt)
+
         result = self.compute_dynamics(state, control_input)
 
         if not result.success:
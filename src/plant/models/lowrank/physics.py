@@ -14,8 +14,21 @@ from __future__ import annotations
 from typing import Tuple
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 from .config import LowRankDIPConfig
 
+# Dynamics variants selected by ``LowRankPhysicsComputer.dynamics_mode``
+LINEARIZED_MODE = 0
+SMALL_ANGLE_MODE = 1
+NONLINEAR_MODE = 2
+
 
 class LowRankPhysicsComputer:
     """
@@ -65,6 +78,13 @@ class LowRankPhysicsComputer:
         self.friction_coeff = self.config.friction_coefficient
         self.damping_coeff = self.config.damping_coefficient
 
+    @property
+    def dynamics_mode(self) -> int:
+        """Variant used by ``compute_simplified_dynamics_rhs``."""
+        if self.config.enable_small_angle_approximation:
+            return LINEARIZED_MODE if self.config.enable_linearization else SMALL_ANGLE_MODE
+        return NONLINEAR_MODE
+
     def compute_simplified_dynamics_rhs(
         self,
         state: np.ndarray,
@@ -349,4 +369,178 @@ class LowRankPhysicsComputer:
         if np.any(np.abs(state_derivative[3:]) > max_accel):
             return False
 
-        return True
\ No newline at end of file
+        return True
+
+
+@njit(cache=True)
+def compute_lowrank_jacobian_numba(
+    state: np.ndarray,
+    control_force: float,
+    m0: float, m1: float, m2: float,
+    l1: float, l2: float, g: float,
+    friction: float, damping: float,
+    mode: int,
+    A: np.ndarray,
+    B: np.ndarray
+) -> None:
+    """
+    JIT-compiled analytic Jacobian of the low-rank dynamics.
+
+    The low-rank model computes the cart acceleration first and feeds it
+    into the pendulum equations, so the chain rule is applied row by row.
+
+    Args:
+        state: Linearization state
+        control_force: Linearization input (the model is affine in it)
+        m0, m1, m2: Masses
+        l1, l2: Pendulum lengths
+        g: Gravity
+        friction: Cart friction coefficient
+        damping: Joint damping coefficient
+        mode: LINEARIZED_MODE, SMALL_ANGLE_MODE or NONLINEAR_MODE
+        A: Output buffer of shape (6, 6) for ∂f/∂x
+        B: Output buffer of shape (6, 1) for ∂f/∂u
+    """
+    theta1, theta2 = state[1], state[2]
+    x_dot, w1, w2 = state[3], state[4], state[5]
+
+    total_mass = m0 + m1 + m2
+    m1l1, m2l2 = m1 * l1, m2 * l2
+    m1gl1, m2gl2 = m1 * g * l1, m2 * g * l2
+    m1l1_sq, m2l2_sq = m1 * l1**2, m2 * l2**2
+
+    A[:, :] = 0.0
+    B[:, :] = 0.0
+    A[0, 3] = 1.0
+    A[1, 4] = 1.0
+    A[2, 5] = 1.0
+
+    # Row 3: cart acceleration; columns 1..5 of the state and the input
+    dxdd = np.zeros(6)
+    if mode == LINEARIZED_MODE:
+        dxdd[1] = -m1gl1 / total_mass
+        dxdd[2] = -m2gl2 / total_mass
+        dxdd[3] = -friction / total_mass
+        sign_g = 1.0
+        dS1, dS2 = 1.0, 1.0
+        Co1, Co2, dCo1, dCo2 = 1.0, 1.0, 0.0, 0.0
+        x_ddot = 0.0  # only multiplies dCo, which vanishes here
+    else:
+        if mode == SMALL_ANGLE_MODE:
+            S1, S2, dS1, dS2 = theta1, theta2, 1.0, 1.0
+            Co1, Co2, dCo1, dCo2 = 1.0, 1.0, 0.0, 0.0
+        else:
+            S1, S2 = np.sin(theta1), np.sin(theta2)
+            dS1, dS2 = np.cos(theta1), np.cos(theta2)
+            Co1, Co2, dCo1, dCo2 = dS1, dS2, -S1, -S2
+        sign_g = -1.0
+        x_ddot = (control_force - m1l1 * S1 * w1**2 - m2l2 * S2 * w2**2
+                  - friction * x_dot) / total_mass
+        dxdd[1] = -m1l1 * dS1 * w1**2 / total_mass
+        dxdd[2] = -m2l2 * dS2 * w2**2 / total_mass
+        dxdd[3] = -friction / total_mass
+        dxdd[4] = -2.0 * m1l1 * S1 * w1 / total_mass
+        dxdd[5] = -2.0 * m2l2 * S2 * w2 / total_mass
+    dxdd_du = 1.0 / total_mass
+
+    for j in range(1, 6):
+        A[3, j] = dxdd[j]
+    B[3, 0] = dxdd_du
+
+    # Rows 4-5: pendulum accelerations driven by the cart acceleration
+    for j in range(1, 6):
+        A[4, j] = m1l1 * Co1 * dxdd[j] / m1l1_sq
+        A[5, j] = m2l2 * Co2 * dxdd[j] / m2l2_sq
+    A[4, 1] += (sign_g * m1gl1 * dS1 + m1l1 * dCo1 * x_ddot) / m1l1_sq
+    A[5, 2] += (sign_g * m2gl2 * dS2 + m2l2 * dCo2 * x_ddot) / m2l2_sq
+    A[4, 4] -= damping / m1l1_sq
+    A[5, 5] -= damping / m2l2_sq
+    B[4, 0] = m1l1 * Co1 * dxdd_du / m1l1_sq
+    B[5, 0] = m2l2 * Co2 * dxdd_du / m2l2_sq
+
+
+# Order of the physical parameters packed by ``pack_lowrank_physics_params``;
+# the dynamics variant travels with the row as a float.
+LOWRANK_PHYSICS_PARAM_FIELDS = (
+    "cart_mass", "pendulum1_mass", "pendulum2_mass",
+    "pendulum1_length", "pendulum2_length", "gravity",
+    "friction_coefficient", "damping_coefficient",
+    "dynamics_mode",
+)
+
+
+def pack_lowrank_physics_params(config: LowRankDIPConfig) -> np.ndarray:
+    """
+    Pack low-rank parameters into a flat array for JIT kernels.
+
+    Args:
+        config: Low-rank DIP configuration
+
+    Returns:
+        Array of shape (len(LOWRANK_PHYSICS_PARAM_FIELDS),) in field order
+    """
+    if config.enable_small_angle_approximation:
+        mode = LINEARIZED_MODE if config.enable_linearization else SMALL_ANGLE_MODE
+    else:
+        mode = NONLINEAR_MODE
+    values = [float(getattr(config, name)) for name in LOWRANK_PHYSICS_PARAM_FIELDS[:-1]]
+    values.append(float(mode))
+    return np.array(values)
+
+
+@njit(cache=True)
+def compute_lowrank_rhs_numba(
+    state: np.ndarray,
+    control_force: float,
+    params: np.ndarray,
+    out: np.ndarray
+) -> bool:
+    """
+    JIT-compiled right-hand side of the low-rank dynamics.
+
+    Mirrors ``LowRankPhysicsComputer.compute_simplified_dynamics_rhs`` for
+    the variant stored in the last parameter column.
+
+    Args:
+        state: System state vector
+        control_force: Applied control force
+        params: Physical parameters packed by ``pack_lowrank_physics_params``
+        out: Output buffer of length 6 for the state derivative
+
+    Returns:
+        Always True (the diagonal mass matrix cannot become singular)
+    """
+    m0, m1, m2 = params[0], params[1], params[2]
+    l1, l2, g = params[3], params[4], params[5]
+    friction, damping = params[6], params[7]
+    mode = int(params[8])
+
+    theta1, theta2 = state[1], state[2]
+    x_dot, w1, w2 = state[3], state[4], state[5]
+
+    total_mass = m0 + m1 + m2
+    m1l1, m2l2 = m1 * l1, m2 * l2
+    m1gl1, m2gl2 = m1 * g * l1, m2 * g * l2
+    m1l1_sq, m2l2_sq = m1 * l1**2, m2 * l2**2
+
+    out[0] = x_dot
+    out[1] = w1
+    out[2] = w2
+    if mode == LINEARIZED_MODE:
+        x_ddot = (control_force - friction * x_dot - m1gl1 * theta1 - m2gl2 * theta2) / total_mass
+        out[3] = x_ddot
+        out[4] = (m1gl1 * theta1 + m1l1 * x_ddot - damping * w1) / m1l1_sq
+        out[5] = (m2gl2 * theta2 + m2l2 * x_ddot - damping * w2) / m2l2_sq
+        return True
+
+    if mode == SMALL_ANGLE_MODE:
+        S1, S2, Co1, Co2 = theta1, theta2, 1.0, 1.0
+    else:
+        S1, S2 = np.sin(theta1), np.sin(theta2)
+        Co1, Co2 = np.cos(theta1), np.cos(theta2)
+    x_ddot = (control_force - m1l1 * S1 * w1**2 - m2l2 * S2 * w2**2
+              - friction * x_dot) / total_mass
+    out[3] = x_ddot
+    out[4] = (-m1gl1 * S1 + m1l1 * Co1 * x_ddot - damping * w1) / m1l1_sq
+    out[5] = (-m2gl2 * S2 + m2l2 * Co2 * x_ddot - damping * w2) / m2l2_sq
+    return True
@@ -21,7 +21,12 @@ from ...core import (
     NumericalInstabilityError
 )
 from .config import SimplifiedDIPConfig
-from .physics import SimplifiedPhysicsComputer, compute_simplified_dynamics_numba
+from .physics import (
+    SimplifiedPhysicsComputer,
+    compute_simplified_dynamics_numba,
+    compute_simplified_jacobian_numba,
+    pack_physics_params
+)
 
 
 class SimplifiedDIPDynamics(BaseDynamicsModel):
@@ -249,10 +254,15 @@ class SimplifiedDIPDynamics(BaseDynamicsModel):
         """Compute total system energy."""
         return self.physics.compute_total_energy(state)
 
+    def compute_total_energy_batch(self, states: np.ndarray) -> np.ndarray:
+        """Compute total system energy of a (B, 6) batch of states."""
+        return self.physics.compute_total_energy_batch(states)
+
     def compute_linearization(
         self,
         equilibrium_state: np.ndarray,
-        equilibrium_input: np.ndarray
+        equilibrium_input: np.ndarray,
+        method: str = "analytic"
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Compute linearization around equilibrium point.
@@ -260,10 +270,16 @@ class SimplifiedDIPDynamics(BaseDynamicsModel):
         Args:
             equilibrium_state: Equilibrium state (typically upright position)
             equilibrium_input: Equilibrium control input (typically zero)
+            method: "analytic" for the JIT-compiled Jacobian or
+                "finite_difference" for forward differences of compute_dynamics
 
         Returns:
             Tuple of (A, B) matrices for linear system ẋ = Ax + Bu
         """
+        if method == "analytic":
+            return self.compute_jacobian(equilibrium_state, equilibrium_input)
+        if method != "finite_difference":
+            raise ValueError(f"Unknown linearization method: {method}")
         return self._compute_linearization_matrices(equilibrium_state, equilibrium_input)
 
     def get_equilibrium_states(self) -> Dict[str, np.ndarray]:
@@ -290,8 +306,12 @@ class SimplifiedDIPDynamics(BaseDynamicsModel):
         Note:
             This method provides compatibility with batch simulation frameworks
             that expect a step() interface. For higher accuracy, use compute_dynamics()
-            with your own integrator.
+            with your own integrator.  After ``enable_trusted_step()`` the
+            compiled trusted step is used instead.
         """
+        if self._trusted_step_enabled:
+            return self.trusted_step(state, control_input, dt)
+
         # Normalize control input to array format
         if np.isscalar(control_input):
             control_input = np.array([control_input])
@@ -423,6 +443,18 @@ class SimplifiedDIPDynamics(BaseDynamicsModel):
 
         return A, B
 
+    def _evaluate_jacobian(self, state: np.ndarray, u: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Analytic Jacobian of the dynamics selected by ``enable_fast_mode``."""
+        A = np.empty((6, 6))
+        B = np.empty((6, 1))
+        ok = compute_simplified_jacobian_numba(
+            np.ascontiguousarray(state, dtype=float), u,
+            pack_physics_params(self.config), self.enable_fast_mode, A, B
+        )
+        if not ok:
+            raise ValueError("Cannot linearize: inertia matrix is singular")
+        return A, B
+
     def _record_successful_computation(self, state: np.ndarray) -> None:
         """Record successful computation for monitoring."""
         if hasattr(self, '_stability_monitor'):
@@ -27,7 +27,8 @@ from ...core import (
     SimplifiedDIPPhysicsMatrices,
     AdaptiveRegularizer,
     MatrixInverter,
-    NumericalInstabilityError
+    NumericalInstabilityError,
+    assemble_manipulator_jacobian
 )
 from .config import SimplifiedDIPConfig
 
@@ -175,6 +176,28 @@ class SimplifiedPhysicsComputer:
         """
         return self._compute_kinetic_energy(state) + self._compute_potential_energy(state)
 
+    def compute_total_energy_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Compute total energy of a batch of states.
+
+        Vectorized form of :meth:`compute_total_energy`, using the same
+        inertia matrix (simplified or full) and potential energy.
+
+        Args:
+            states: System states, shape (B, 6)
+
+        Returns:
+            Total energy per state, shape (B,)
+        """
+        states = np.asarray(states, dtype=np.float64)
+        if self.use_simplified_inertia:
+            M = self.simplified_matrices.compute_inertia_matrix_batch(states)
+        else:
+            M = self.full_matrices.compute_inertia_matrix_batch(states)
+        velocity = states[:, 3:6]
+        kinetic = 0.5 * np.einsum('bi,bij,bj->b', velocity, M, velocity)
+        return kinetic + self._potential_energy(states[:, 1], states[:, 2])
+
     def compute_kinetic_energy(self, state: np.ndarray) -> float:
         """Compute kinetic energy T = (1/2) q̇ᵀ M q̇."""
         return self._compute_kinetic_energy(state)
@@ -192,7 +215,10 @@ class SimplifiedPhysicsComputer:
     def _compute_potential_energy(self, state: np.ndarray) -> float:
         """Internal potential energy computation."""
         _, theta1, theta2, _, _, _ = state
+        return self._potential_energy(theta1, theta2)
 
+    def _potential_energy(self, theta1, theta2):
+        """Gravitational potential energy for scalar or array angles."""
         # Gravitational potential energy
         m1, m2 = self.config.pendulum1_mass, self.config.pendulum2_mass
         Lc1, Lc2 = self.config.pendulum1_com, self.config.pendulum2_com
@@ -234,7 +260,7 @@ class SimplifiedPhysicsComputer:
 
 
 @njit(cache=True)
-def compute_simplified_dynamics_numba(
+def _simplified_fast_accelerations(
     state: np.ndarray,
     control_force: float,
     m0: float, m1: float, m2: float,
@@ -242,27 +268,10 @@ def compute_simplified_dynamics_numba(
     I1: float, I2: float, g: float,
     c0: float, c1: float, c2: float,
     reg_alpha: float, min_reg: float
-) -> np.ndarray:
-    """
-    JIT-compiled simplified dynamics computation.
-
-    Ultra-fast dynamics computation for performance-critical applications.
-    Uses simplified physics with minimal overhead.
-
-    Args:
-        state: System state vector
-        control_force: Applied control force
-        m0, m1, m2: Masses
-        L1, L2, Lc1, Lc2: Lengths and COM distances
-        I1, I2: Inertias
-        g: Gravity
-        c0, c1, c2: Friction coefficients
-        reg_alpha, min_reg: Regularization parameters
-
-    Returns:
-        State derivative vector
-    """
-    x, theta1, theta2, x_dot, theta1_dot, theta2_dot = state
+) -> Tuple[float, float, float]:
+    """Accelerations (ẍ, θ̈1, θ̈2) of the fast simplified model."""
+    theta1, theta2 = state[1], state[2]
+    x_dot, theta1_dot, theta2_dot = state[3], state[4], state[5]
 
     # Trigonometric terms
     c1_val = np.cos(theta1)
@@ -323,6 +332,313 @@ def compute_simplified_dynamics_numba(
     x_ddot = inv_M11 * F1 + inv_M12 * F2 + inv_M13 * F3
     theta1_ddot = inv_M12 * F1 + inv_M22 * F2 + inv_M23 * F3
     theta2_ddot = inv_M13 * F1 + inv_M23 * F2 + inv_M33 * F3
+    return x_ddot, theta1_ddot, theta2_ddot
+
+
+@njit(cache=True)
+def compute_simplified_dynamics_numba(
+    state: np.ndarray,
+    control_force: float,
+    m0: float, m1: float, m2: float,
+    L1: float, L2: float, Lc1: float, Lc2: float,
+    I1: float, I2: float, g: float,
+    c0: float, c1: float, c2: float,
+    reg_alpha: float, min_reg: float
+) -> np.ndarray:
+    """
+    JIT-compiled simplified dynamics computation.
+
+    Ultra-fast dynamics computation for performance-critical applications.
+    Uses simplified physics with minimal overhead.
+
+    Args:
+        state: System state vector
+        control_force: Applied control force
+        m0, m1, m2: Masses
+        L1, L2, Lc1, Lc2: Lengths and COM distances
+        I1, I2: Inertias
+        g: Gravity
+        c0, c1, c2: Friction coefficients
+        reg_alpha, min_reg: Regularization parameters
+
+    Returns:
+        State derivative vector
+    """
+    x_ddot, theta1_ddot, theta2_ddot = _simplified_fast_accelerations(
+        state, control_force, m0, m1, m2, L1, L2, Lc1, Lc2,
+        I1, I2, g, c0, c1, c2, reg_alpha, min_reg
+    )
 
     # Return state derivative
-    return np.array([x_dot, theta1_dot, theta2_dot, x_ddot, theta1_ddot, theta2_ddot])
\ No newline at end of file
+    return np.array([state[3], state[4], state[5], x_ddot, theta1_ddot, theta2_ddot])
+
+# Order of the physical parameters packed by ``pack_physics_params``.  Batch
+# kernels receive one such row per trajectory so that perturbed physics can
+# be simulated side by side with the nominal model.
+PHYSICS_PARAM_FIELDS = (
+    "cart_mass", "pendulum1_mass", "pendulum2_mass",
+    "pendulum1_length", "pendulum2_length",
+    "pendulum1_com", "pendulum2_com",
+    "pendulum1_inertia", "pendulum2_inertia",
+    "gravity",
+    "cart_friction", "joint1_friction", "joint2_friction",
+    "regularization_alpha", "min_regularization",
+)
+
+
+def pack_physics_params(config: SimplifiedDIPConfig) -> np.ndarray:
+    """
+    Pack configuration parameters into a flat array for JIT kernels.
+
+    Args:
+        config: Simplified DIP configuration
+
+    Returns:
+        Array of shape (len(PHYSICS_PARAM_FIELDS),) in field order
+    """
+    return np.array([float(getattr(config, name)) for name in PHYSICS_PARAM_FIELDS])
+
+
+@njit(cache=True)
+def compute_simplified_rhs_numba(
+    state: np.ndarray,
+    control_force: float,
+    params: np.ndarray,
+    out: np.ndarray
+) -> bool:
+    """
+    JIT-compiled right-hand side of the standard simplified model.
+
+    Mirrors ``SimplifiedPhysicsComputer.compute_dynamics_rhs`` (simplified
+    inertia matrix with full Coriolis and gravity terms) for a single state,
+    writing the derivative into ``out`` without allocating.
+
+    Args:
+        state: System state vector
+        control_force: Applied control force
+        params: Physical parameters packed by ``pack_physics_params``
+        out: Output buffer of length 6 for the state derivative
+
+    Returns:
+        False if the inertia matrix is singular, True otherwise
+    """
+    m0, m1, m2 = params[0], params[1], params[2]
+    L1, Lc1, Lc2 = params[3], params[5], params[6]
+    I1, I2, g = params[7], params[8], params[9]
+    c0, c1, c2 = params[10], params[11], params[12]
+
+    theta1, theta2 = state[1], state[2]
+    x_dot, theta1_dot, theta2_dot = state[3], state[4], state[5]
+
+    cos1 = np.cos(theta1)
+    cos2 = np.cos(theta2)
+    s1 = np.sin(theta1)
+    s2 = np.sin(theta2)
+    s12 = np.sin(theta1 - theta2)
+
+    # Simplified inertia matrix (see SimplifiedDIPPhysicsMatrices)
+    M11 = m0 + m1 + m2
+    M22 = m1 * Lc1**2 + m2 * L1**2 + I1 + m2 * Lc2**2 + I2
+    M33 = m2 * Lc2**2 + I2
+    M12 = 0.5 * (m1 * Lc1 + m2 * L1) * cos1 + 0.5 * m2 * Lc2 * cos2
+    M13 = 0.5 * m2 * Lc2 * cos2
+    M23 = 0.8 * (m2 * Lc2**2 + I2)
+
+    # Full Coriolis matrix applied to the velocity vector
+    Cv1 = (c0 * x_dot
+           + (-(m1 * Lc1 + m2 * L1) * s1 * theta1_dot - m2 * Lc2 * s2 * theta2_dot) * theta1_dot
+           - m2 * Lc2 * s2 * theta2_dot * theta2_dot)
+    Cv2 = ((c1 - m2 * L1 * Lc2 * s12 * theta2_dot) * theta1_dot
+           - m2 * L1 * Lc2 * s12 * theta2_dot * theta2_dot)
+    Cv3 = m2 * L1 * Lc2 * s12 * theta1_dot * theta1_dot + c2 * theta2_dot
+
+    G2 = -(m1 * Lc1 + m2 * L1) * g * s1 - m2 * Lc2 * g * s2
+    G3 = -m2 * Lc2 * g * s2
+
+    F1 = control_force - Cv1
+    F2 = -Cv2 - G2
+    F3 = -Cv3 - G3
+
+    # Cofactor solve of the symmetric 3x3 system
+    A11 = M22 * M33 - M23 * M23
+    A12 = M13 * M23 - M12 * M33
+    A13 = M12 * M23 - M13 * M22
+    det = M11 * A11 + M12 * A12 + M13 * A13
+    if det == 0.0 or not np.isfinite(det):
+        return False
+    A22 = M11 * M33 - M13 * M13
+    A23 = M12 * M13 - M11 * M23
+    A33 = M11 * M22 - M12 * M12
+
+    out[0] = x_dot
+    out[1] = theta1_dot
+    out[2] = theta2_dot
+    out[3] = (A11 * F1 + A12 * F2 + A13 * F3) / det
+    out[4] = (A12 * F1 + A22 * F2 + A23 * F3) / det
+    out[5] = (A13 * F1 + A23 * F2 + A33 * F3) / det
+    return True
+
+
+@njit(cache=True)
+def compute_simplified_fast_rhs_numba(
+    state: np.ndarray,
+    control_force: float,
+    params: np.ndarray,
+    out: np.ndarray
+) -> bool:
+    """
+    Non-allocating variant of ``compute_simplified_dynamics_numba``.
+
+    Args:
+        state: System state vector
+        control_force: Applied control force
+        params: Physical parameters packed by ``pack_physics_params``
+        out: Output buffer of length 6 for the state derivative
+
+    Returns:
+        Always True (near-singular inertia matrices are clamped, not rejected)
+    """
+    x_ddot, theta1_ddot, theta2_ddot = _simplified_fast_accelerations(
+        state, control_force,
+        params[0], params[1], params[2],
+        params[3], params[4], params[5], params[6],
+        params[7], params[8], params[9],
+        params[10], params[11], params[12],
+        params[13], params[14],
+    )
+    out[0] = state[3]
+    out[1] = state[4]
+    out[2] = state[5]
+    out[3] = x_ddot
+    out[4] = theta1_ddot
+    out[5] = theta2_ddot
+    return True
+
+
+@njit(cache=True)
+def compute_simplified_jacobian_numba(
+    state: np.ndarray,
+    control_force: float,
+    params: np.ndarray,
+    fast_variant: bool,
+    A: np.ndarray,
+    B: np.ndarray
+) -> bool:
+    """
+    JIT-compiled analytic Jacobian of the simplified model.
+
+    Differentiates the same right-hand side the model integrates: the
+    standard path (``compute_simplified_rhs_numba``) or, with
+    ``fast_variant``, the reduced-coupling ``compute_simplified_dynamics_numba``.
+
+    Args:
+        state: Linearization state
+        control_force: Linearization input
+        params: Physical parameters packed by ``pack_physics_params``
+        fast_variant: Differentiate the fast-mode dynamics instead
+        A: Output buffer of shape (6, 6) for ∂f/∂x
+        B: Output buffer of shape (6, 1) for ∂f/∂u
+
+    Returns:
+        False if the inertia matrix is singular, True otherwise
+    """
+    m0, m1, m2 = params[0], params[1], params[2]
+    L1, Lc1, Lc2 = params[3], params[5], params[6]
+    I1, I2, g = params[7], params[8], params[9]
+    c0, c1, c2 = params[10], params[11], params[12]
+    reg_alpha, min_reg = params[13], params[14]
+
+    theta1, theta2 = state[1], state[2]
+    x_dot, w1, w2 = state[3], state[4], state[5]
+
+    cos1 = np.cos(theta1)
+    cos2 = np.cos(theta2)
+    s1 = np.sin(theta1)
+    s2 = np.sin(theta2)
+    c12 = np.cos(theta1 - theta2)
+    s12 = np.sin(theta1 - theta2)
+
+    a1 = m1 * Lc1 + m2 * L1
+    b = m2 * Lc2
+    k = m2 * L1 * Lc2
+
+    M = np.zeros((3, 3))
+    dM1 = np.zeros((3, 3))
+    dM2 = np.zeros((3, 3))
+    F = np.empty(3)
+    dF_dq = np.empty((3, 2))
+    dF_dv = np.zeros((3, 3))
+
+    M[0, 0] = m0 + m1 + m2
+    M[1, 1] = m1 * Lc1**2 + m2 * L1**2 + I1 + m2 * Lc2**2 + I2
+    M[2, 2] = m2 * Lc2**2 + I2
+
+    if fast_variant:
+        # Reduced coupling with diagonal regularization
+        reg = max(reg_alpha * max(M[0, 0], M[1, 1], M[2, 2]), min_reg)
+        M[0, 0] += reg
+        M[1, 1] += reg
+        M[2, 2] += reg
+        M[0, 1] = 0.7 * (a1 * cos1 + b * cos2)
+        M[0, 2] = 0.7 * b * cos2
+        M[1, 2] = 0.8 * (m2 * Lc2**2 + I2 + k * c12)
+        dM1[0, 1] = -0.7 * a1 * s1
+        dM1[1, 2] = -0.8 * k * s12
+        dM2[0, 1] = -0.7 * b * s2
+        dM2[0, 2] = -0.7 * b * s2
+        dM2[1, 2] = 0.8 * k * s12
+
+        dw = w1 - w2
+        F[0] = control_force + c0 * x_dot + 0.5 * a1 * s1 * w1**2 + 0.5 * b * s2 * w2**2
+        F[1] = c1 * w1 + 0.5 * k * s12 * dw**2 + a1 * g * s1 + 0.5 * b * g * s2
+        F[2] = c2 * w2 - 0.5 * k * s12 * dw**2 + b * g * s2
+
+        dF_dq[0, 0] = 0.5 * a1 * cos1 * w1**2
+        dF_dq[0, 1] = 0.5 * b * cos2 * w2**2
+        dF_dq[1, 0] = 0.5 * k * c12 * dw**2 + a1 * g * cos1
+        dF_dq[1, 1] = -0.5 * k * c12 * dw**2 + 0.5 * b * g * cos2
+        dF_dq[2, 0] = -0.5 * k * c12 * dw**2
+        dF_dq[2, 1] = 0.5 * k * c12 * dw**2 + b * g * cos2
+
+        dF_dv[0, 0] = c0
+        dF_dv[0, 1] = a1 * s1 * w1
+        dF_dv[0, 2] = b * s2 * w2
+        dF_dv[1, 1] = c1 + k * s12 * dw
+        dF_dv[1, 2] = -k * s12 * dw
+        dF_dv[2, 1] = -k * s12 * dw
+        dF_dv[2, 2] = c2 + k * s12 * dw
+    else:
+        # Simplified inertia with full Coriolis, friction and gravity
+        M[0, 1] = 0.5 * a1 * cos1 + 0.5 * b * cos2
+        M[0, 2] = 0.5 * b * cos2
+        M[1, 2] = 0.8 * (m2 * Lc2**2 + I2)
+        dM1[0, 1] = -0.5 * a1 * s1
+        dM2[0, 1] = -0.5 * b * s2
+        dM2[0, 2] = -0.5 * b * s2
+
+        F[0] = control_force - c0 * x_dot + a1 * s1 * w1**2 + b * s2 * (w1 * w2 + w2**2)
+        F[1] = -c1 * w1 + k * s12 * (w1 * w2 + w2**2) + a1 * g * s1 + b * g * s2
+        F[2] = -k * s12 * w1**2 - c2 * w2 + b * g * s2
+
+        dF_dq[0, 0] = a1 * cos1 * w1**2
+        dF_dq[0, 1] = b * cos2 * (w1 * w2 + w2**2)
+        dF_dq[1, 0] = k * c12 * (w1 * w2 + w2**2) + a1 * g * cos1
+        dF_dq[1, 1] = -k * c12 * (w1 * w2 + w2**2) + b * g * cos2
+        dF_dq[2, 0] = -k * c12 * w1**2
+        dF_dq[2, 1] = k * c12 * w1**2 + b * g * cos2
+
+        dF_dv[0, 0] = -c0
+        dF_dv[0, 1] = 2.0 * a1 * s1 * w1 + b * s2 * w2
+        dF_dv[0, 2] = b * s2 * (w1 + 2.0 * w2)
+        dF_dv[1, 1] = -c1 + k * s12 * w2
+        dF_dv[1, 2] = k * s12 * (w1 + 2.0 * w2)
+        dF_dv[2, 1] = -2.0 * k * s12 * w1
+        dF_dv[2, 2] = -c2
+
+    M[1, 0] = M[0, 1]
+    M[2, 0] = M[0, 2]
+    M[2, 1] = M[1, 2]
+    dM1[1, 0], dM1[2, 0], dM1[2, 1] = dM1[0, 1], dM1[0, 2], dM1[1, 2]
+    dM2[1, 0], dM2[2, 0], dM2[2, 1] = dM2[0, 1], dM2[0, 2], dM2[1, 2]
+
+    return assemble_manipulator_jacobian(M, dM1, dM2, F, dF_dq, dF_dv, A, B)
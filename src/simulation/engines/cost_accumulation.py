@@ -0,0 +1,174 @@
+#======================================================================================\\\
+#==================== src/simulation/engines/cost_accumulation.py =====================\\\
+#======================================================================================\\\
+
+"""
+Per-particle cost accumulators for batch simulations.
+
+PSO reduces every simulated trajectory to a handful of integrals: the state
+error energy, control effort, control slew, sliding-surface energy and the
+first step at which the pendulum falls or the state explodes.  Holding the
+full ``(B, N+1, 6)`` trajectory just to compute these sums makes memory grow
+as ``B * N``.  :class:`CostAccumulators` carries only the ``(B,)`` sums, so a
+batch simulator can accumulate them step by step instead.
+
+:func:`accumulate_trajectory_costs` computes the same quantities post hoc
+from a materialised trajectory and is the reference for the streaming
+kernels.  Both follow the conventions of
+``PSOTuner._compute_cost_from_traj``:
+
+- step ``i`` contributes ``x_i``, ``u_i``, ``u_i - u_{i-1}`` (zero for
+  ``i = 0``) and ``sigma_i``, each squared and weighted by
+  ``t_{i+1} - t_i``;
+- ``failure_steps`` is the first state index ``k`` with ``|theta1| > pi/2``
+  or ``|x| > 1e6``, or ``N + 1`` if the trajectory never fails;
+- step ``i`` only counts while ``i < failure_steps - 1``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+# Instability thresholds shared by the post-hoc and streaming reductions
+FALL_ANGLE = 0.5 * np.pi
+EXPLOSION_LIMIT = 1e6
+
+
+@dataclass
+class CostAccumulators:
+    """Per-particle cost integrals of a batch simulation.
+
+    Attributes
+    ----------
+    ise, u_sq, du_sq, sigma_sq : np.ndarray
+        ``(B,)`` integrals of squared state, control, control slew and
+        sliding surface over the counted steps.
+    failure_steps : np.ndarray
+        ``(B,)`` integer index of the first unstable state, ``n_steps + 1``
+        when the trajectory never fails.
+    nonfinite : np.ndarray
+        ``(B,)`` flag set when any state, control or sliding-surface value of
+        the particle was non-finite.
+    n_steps : int
+        Number of integration steps simulated (``N``).
+    dt : float
+        Nominal integration step.
+    """
+
+    ise: np.ndarray
+    u_sq: np.ndarray
+    du_sq: np.ndarray
+    sigma_sq: np.ndarray
+    failure_steps: np.ndarray
+    nonfinite: np.ndarray
+    n_steps: int
+    dt: float
+
+    @property
+    def batch_size(self) -> int:
+        return int(self.ise.shape[0])
+
+    def take(self, rows) -> "CostAccumulators":
+        """Return the accumulators of a subset of particles."""
+        return CostAccumulators(
+            ise=self.ise[rows],
+            u_sq=self.u_sq[rows],
+            du_sq=self.du_sq[rows],
+            sigma_sq=self.sigma_sq[rows],
+            failure_steps=self.failure_steps[rows],
+            nonfinite=self.nonfinite[rows],
+            n_steps=self.n_steps,
+            dt=self.dt,
+        )
+
+    @classmethod
+    def concatenate(cls, parts: Sequence["CostAccumulators"]) -> "CostAccumulators":
+        """Stack accumulators of particle shards simulated over the same horizon."""
+        if not parts:
+            raise ValueError("concatenate requires at least one part")
+        n_steps = {p.n_steps for p in parts}
+        if len(n_steps) != 1:
+            raise ValueError(f"Cannot concatenate accumulators with different horizons: {sorted(n_steps)}")
+        return cls(
+            ise=np.concatenate([p.ise for p in parts]),
+            u_sq=np.concatenate([p.u_sq for p in parts]),
+            du_sq=np.concatenate([p.du_sq for p in parts]),
+            sigma_sq=np.concatenate([p.sigma_sq for p in parts]),
+            failure_steps=np.concatenate([p.failure_steps for p in parts]),
+            nonfinite=np.concatenate([p.nonfinite for p in parts]),
+            n_steps=parts[0].n_steps,
+            dt=parts[0].dt,
+        )
+
+
+def accumulate_trajectory_costs(
+    t: np.ndarray, x_b: np.ndarray, u_b: np.ndarray, sigma_b: np.ndarray
+) -> CostAccumulators:
+    """Reduce materialised trajectories to :class:`CostAccumulators`.
+
+    Parameters
+    ----------
+    t : np.ndarray
+        ``(N+1,)`` time points.
+    x_b : np.ndarray
+        ``(B, N+1, S)`` states.
+    u_b, sigma_b : np.ndarray
+        ``(B, N)`` controls and sliding-surface values.
+    """
+    x_b = np.asarray(x_b, dtype=float)
+    u_b = np.asarray(u_b, dtype=float)
+    sigma_b = np.asarray(sigma_b, dtype=float)
+    dt = np.diff(t)
+    dt_b = dt[None, :]
+    dt_const = float(dt[0]) if dt.size else 0.0
+    N = len(dt)
+    B = x_b.shape[0]
+    # Controls and sigma are checked as well as states, matching the streaming
+    # kernel.  PSOTuner's costs are unchanged by this: a non-finite control or
+    # sigma already made the cost non-finite, which is penalised the same way.
+    nonfinite = (
+        (~np.all(np.isfinite(x_b), axis=(1, 2)) if x_b.size else np.zeros(B, dtype=bool))
+        | (~np.all(np.isfinite(u_b), axis=1))
+        | (~np.all(np.isfinite(sigma_b), axis=1))
+    )
+    # Instability detection
+    fall_mask = np.abs(x_b[:, :, 1]) > FALL_ANGLE
+    explodes_mask = np.any(np.abs(x_b) > EXPLOSION_LIMIT, axis=2)
+    unstable_mask = fall_mask | explodes_mask
+    temp = np.full((B, N + 1), N + 1)
+    temp[unstable_mask] = np.tile(np.arange(N + 1), (B, 1))[unstable_mask]
+    failure_steps = np.min(temp, axis=1)
+    time_mask = (np.arange(N)[None, :] < (failure_steps - 1)[:, None])
+    # State error over all state variables
+    ise = np.sum((x_b[:, :-1, :] ** 2 * dt_b[:, :, None]) * time_mask[:, :, None], axis=(1, 2))
+    # Control effort
+    u_b_trunc = u_b[:, :N] if u_b.shape[1] > N else u_b
+    u_sq = np.sum((u_b_trunc ** 2 * dt_b) * time_mask, axis=1)
+    # Control slew
+    du = np.diff(u_b, axis=1, prepend=u_b[:, 0:1])
+    du_trunc = du[:, :N] if du.shape[1] > N else du
+    du_sq = np.sum((du_trunc ** 2 * dt_b) * time_mask, axis=1)
+    # Sliding variable energy
+    sigma_b_trunc = sigma_b[:, :N] if sigma_b.shape[1] > N else sigma_b
+    sigma_sq = np.sum((sigma_b_trunc ** 2 * dt_b) * time_mask, axis=1)
+    return CostAccumulators(
+        ise=ise,
+        u_sq=u_sq,
+        du_sq=du_sq,
+        sigma_sq=sigma_sq,
+        failure_steps=failure_steps,
+        nonfinite=nonfinite,
+        n_steps=N,
+        dt=dt_const,
+    )
+
+
+__all__ = [
+    "CostAccumulators",
+    "EXPLOSION_LIMIT",
+    "FALL_ANGLE",
+    "accumulate_trajectory_costs",
+]
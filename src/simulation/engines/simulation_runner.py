@@ -41,6 +41,9 @@ except Exception:
 # tests to simulate a missing module.  Do not rename without updating tests.
 DYNAMICS_FULL_MODULE = "src.plant.models.dip_full"
 
+# Plant stepping modes accepted by the runners (see ``run_simulation``)
+STEP_MODES = ("default", "trusted")
+
 def _load_full_step():
     """
     Attempt to load the full dynamics ``step`` function.
@@ -123,6 +126,7 @@ def run_simulation(
     latency_margin: Optional[float] = None,
     fallback_controller: Optional[Callable[[float, np.ndarray], float]] = None,
     strict_mode: bool = False,
+    step_mode: str = "default",
     **_kwargs: Any,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Simulate a single controller trajectory using an explicit Euler method.
@@ -186,6 +190,10 @@ def run_simulation(
         results.  Useful for development and debugging to catch errors early.
         When False (default), graceful degradation is used: exceptions are
         logged and partial results are returned.  Added in CA-01 P1 fix.
+    step_mode : {"default", "trusted"}, default="default"
+        ``"trusted"`` advances plants that support it with their compiled
+        ``trusted_step`` (no validation, sanitization or monitoring; only a
+        finiteness check).  Other plants keep using ``step()``.
     **_kwargs : dict
         Additional keyword arguments are ignored.  They are accepted to
         preserve backward compatibility with earlier versions of this API.
@@ -205,6 +213,15 @@ def run_simulation(
     dt = float(dt)
     if dt <= 0.0:
         raise ValueError("dt must be positive")
+    if step_mode not in STEP_MODES:
+        raise ValueError(f"Unknown step mode '{step_mode}'")
+    trusted_step = None
+    if step_mode == "trusted":
+        try:
+            dynamics_model.prepare_trusted_step()
+            trusted_step = dynamics_model.trusted_step
+        except (AttributeError, ValueError):
+            pass
     # Compute number of steps as the nearest integer that does not exceed sim_time
     n_steps = int(round(float(sim_time) / dt)) if sim_time > 0 else 0
     # Flatten the initial state to determine state dimension
@@ -327,7 +344,10 @@ def run_simulation(
         u_arr[i] = u_val
         # Propagate dynamics
         try:
-            x_next = dynamics_model.step(x_curr, u_val, dt)
+            if trusted_step is not None:
+                x_next = trusted_step(x_curr, u_val, dt, out=x_arr[i + 1])
+            else:
+                x_next = dynamics_model.step(x_curr, u_val, dt)
         except Exception as e:
             logger.warning(
                 f"Simulation terminated early at step {i}/{n_steps} (t={t_now:.3f}s): "
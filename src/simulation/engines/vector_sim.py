@@ -14,11 +14,11 @@ simulation returns an array of shape ``(H+1, D)`` while a batch of B
 simulations returns a tensor of shape ``(B, H+1, D)``.  The initial state is
 always included at index ``0`` of the time dimension.
 
-Early stopping is supported via a simple stop callback: if ``stop_fn`` is
-provided and returns True given the current state, all remaining steps are
-skipped and the output is truncated to the elapsed horizon plus one.  To
-preserve uniform batch shapes, the earliest stopping time across batch
-elements truncates the entire batch.
+Early stopping is supported via a stop callback: ``stop_fn(state)`` on a
+single state, or ``stop_mask_fn(states)`` on the ``(B, D)`` batch returning
+a boolean mask.  A trajectory whose predicate fires is deactivated on its
+own: it is no longer stepped and holds its last state while the others
+continue.  The output is truncated once every trajectory has stopped.
 """
 
 from __future__ import annotations
@@ -27,7 +27,10 @@ import numpy as np
 from typing import Any, Callable, Optional, Tuple
 
 from .simulation_runner import step as _step_fn  # dispatches on config flag
+from .simulation_runner import STEP_MODES
 from ..context.safety_guards import _guard_no_nan, _guard_energy, _guard_bounds
+from ..safety.guards import BatchSafetyGuard, rowwise_mask
+from ..results.containers import RaggedBatchResultContainer
 from collections.abc import Iterable
 try:
     from src.config.schemas import config  # type: ignore
@@ -46,6 +49,7 @@ def simulate(
     state_bounds: Optional[Tuple[Any, Any]] = None,
     stop_fn: Optional[Callable[[np.ndarray], bool]] = None,
     t0: float = 0.0,
+    stop_mask_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None,
 ) -> np.ndarray:
     """Simulate a dynamical system forward in time.
 
@@ -68,21 +72,27 @@ def simulate(
         compares ``sum(state**2)`` against this limit after each step.
     state_bounds : tuple, optional
         Pair ``(lower, upper)`` specifying per‑dimension bounds.  Bounds may
-        be scalars or arrays broadcastable to the state shape.  A ``None``
-        value disables that side of the bound.
+        be scalars, ``(D,)`` arrays or per-trajectory ``(B, D)`` arrays.  A
+        ``None`` value disables that side of the bound.
     stop_fn : callable, optional
-        Optional predicate ``stop_fn(state)``.  If provided and returns
-        True, the simulation stops early and the output is truncated.
+        Optional predicate ``stop_fn(state)`` evaluated on each live
+        trajectory after every step.  A trajectory for which it returns
+        True stops early.
     t0 : float, default 0.0
         Initial simulation time used in bound violation messages.
+    stop_mask_fn : callable, optional
+        Vectorized alternative to ``stop_fn``: called with the ``(B_live, D)``
+        states of the live trajectories, returns a boolean mask of those
+        that stop.
 
     Returns
     -------
     numpy.ndarray
         Array of simulated states including the initial state.  Shape is
         ``(H_stop+1, D)`` for scalar runs or ``(B, H_stop+1, D)`` for
-        batched runs, where ``H_stop <= horizon`` if early stopping
-        occurred.
+        batched runs, where ``H_stop <= horizon`` is the step at which the
+        last trajectory stopped.  Trajectories that stopped earlier repeat
+        their final state up to ``H_stop``.
 
     Examples
     --------
@@ -170,8 +180,20 @@ def simulate(
             # If config is not available or lacks expected structure, ignore
             pass
 
+    # Compile the guards once.  The batch mask is one array pass per step;
+    # the raising guards below only run to report a detected violation.
+    energy_max = energy_limits.get("max") if isinstance(energy_limits, dict) else energy_limits
+    guard = BatchSafetyGuard(max_energy=energy_max, state_bounds=state_bounds)
+    stop_masks = [stop_mask_fn] if stop_mask_fn is not None else []
+    if stop_fn is not None:
+        if batch_mode:
+            stop_masks.append(rowwise_mask(stop_fn))
+        else:
+            stop_masks.append(lambda xs: np.array([bool(stop_fn(xs[0]))]))
+
     # Iterate through time steps
     stop_index = H
+    active = np.ones(n_batches, dtype=bool)
     for i in range(H):
         # Extract control input for this time step, broadcasting batch dimension
         if batch_mode:
@@ -208,31 +230,38 @@ def simulate(
             else:
                 control_idx = min(i, u.shape[0] - 1)
                 u_i = u[control_idx]
-        # Advance one step using the router
-        x_next = _step_fn(x_b, u_i, dt)
+        # Advance the live trajectories one step using the router
+        if active.all():
+            x_next = _step_fn(x_b, u_i, dt)
+            live_next = x_next
+            rows = None
+        else:
+            rows = np.flatnonzero(active)
+            live_next = np.asarray(_step_fn(x_b[rows], u_i[rows], dt), dtype=float)
+            x_next = x_b.copy()
+            x_next[rows] = live_next
         # Post‑step guards
-        _guard_no_nan(x_next, step_idx=i)
-        if energy_limits is not None:
-            limits = energy_limits if isinstance(energy_limits, dict) else {"max": float(energy_limits)}
-            _guard_energy(x_next, limits=limits)
-        if state_bounds is not None:
-            _guard_bounds(x_next, bounds=state_bounds, t=t + dt)
+        if guard(np.atleast_2d(live_next), rows).any():
+            _guard_no_nan(x_next, step_idx=i)
+            if energy_limits is not None:
+                limits = energy_limits if isinstance(energy_limits, dict) else {"max": float(energy_limits)}
+                _guard_energy(x_next, limits=limits)
+            if state_bounds is not None:
+                _guard_bounds(x_next, bounds=state_bounds, t=t + dt)
         # Record and update state
         states[:, i + 1, :] = x_next
         x_b = x_next
         t += dt
-        # Early stop check: call predicate on batch or scalar state
-        if stop_fn is not None:
-            # Evaluate stop predicate on each batch element; stop if any returns True
-            if batch_mode:
-                stop_mask = np.array([bool(stop_fn(s)) for s in x_b])
-                if np.any(stop_mask):
-                    stop_index = i + 1
-                    break
-            else:
-                if stop_fn(x_b.squeeze() if hasattr(x_b, "squeeze") else x_b):
-                    stop_index = i + 1
-                    break
+        # Early stop check: deactivate each trajectory whose predicate fires
+        if stop_masks:
+            rows = np.flatnonzero(active)
+            for mask_fn in stop_masks:
+                stopped = np.asarray(mask_fn(np.atleast_2d(x_b)[rows]), dtype=bool)
+                active[rows[stopped]] = False
+                rows = rows[~stopped]
+            if not active.any():
+                stop_index = i + 1
+                break
 
     # Pre‑emit guards on the final state (or truncated state)
     _guard_no_nan(x_b, step_idx=stop_index)
@@ -263,6 +292,12 @@ def simulate_system_batch(
     convergence_tol: Optional[float] = None,
     grace_period: float = 0.0,
     rng: Optional[np.random.Generator] = None,
+    engine: str = "loop",
+    accumulate_cost: bool = False,
+    step_mode: str = "default",
+    telemetry: bool = True,
+    active_set: bool = False,
+    storage: Optional[Any] = None,
     **_kwargs: Any,
 ) -> Any:
     """Vectorised batch simulation of multiple controllers.
@@ -276,9 +311,11 @@ def simulate_system_batch(
 
     When ``params_list`` is provided, the simulation is repeated for each
     element in the list.  The return value is then a list of results, one per
-    parameter set.  For backward compatibility, the dynamics model is
-    determined internally by the controller factory; perturbed physics
-    parameters are ignored and results are replicated across the list.
+    parameter set.  With the vectorized engine every (draw, particle) pair is
+    simulated in one flattened pass using the draw's physics parameters.
+    The loop engine cannot inject physics into the controller-owned dynamics
+    models; it ignores the perturbed parameters and replicates the nominal
+    results across the list.
 
     Parameters
     ----------
@@ -298,9 +335,11 @@ def simulate_system_batch(
     seed : int, optional
         Deprecated.  Ignored; retained for signature compatibility.
     params_list : iterable, optional
-        Optional list of physics parameter objects.  When provided, the
-        simulation is repeated for each element.  The current implementation
-        ignores these parameters and replicates the base results.
+        Optional list of physics parameter objects (e.g. ``DIPParams``).
+        When provided, the simulation is repeated for each element.  Fields
+        missing from an element keep the nominal plant value; ``None``
+        entries simulate the nominal plant.  Only honoured by the vectorized
+        engine (see above).  Early termination is shared by all draws.
     initial_state : array-like, optional
         Initial state(s) for the batch.  If ``None``, a zero state is used.
         If a 1D array of length ``D`` is provided, it is broadcast across all
@@ -314,6 +353,46 @@ def simulate_system_batch(
         Duration (seconds) to wait before checking the convergence criterion.
     rng : numpy.random.Generator, optional
         Unused in this implementation.  Present for API compatibility.
+    engine : {"loop", "vectorized", "auto"}, default "loop"
+        Integration backend.  ``"loop"`` steps each particle's controller
+        and dynamics objects in Python.  ``"vectorized"`` compiles the batch
+        into row-aligned arrays and integrates the whole horizon in one JIT
+        kernel (see :mod:`src.simulation.engines.batch_engine`); it supports
+        classical SMC on the simplified DIP plant, records the true sliding
+        surface and does not populate controller histories.  ``"auto"``
+        uses the vectorized engine when the batch is supported and falls
+        back to the loop otherwise.
+    accumulate_cost : bool, default False
+        Return per-particle
+        :class:`~src.simulation.engines.cost_accumulation.CostAccumulators`
+        instead of trajectories.  The vectorized engine accumulates the cost
+        integrals step by step and never allocates the ``(B, N+1, D)``
+        arrays; the loop engine reduces its trajectories after the run.
+    step_mode : {"default", "trusted"}, default "default"
+        Plant stepping used by the loop engine.  ``"trusted"`` advances
+        plants that support it with their compiled ``trusted_step`` (no
+        validation, sanitization or monitoring; see
+        :meth:`~src.plant.models.base.BaseDynamicsModel.trusted_step`) and
+        uses ``step()`` for the rest.  The vectorized engine ignores it.
+    telemetry : bool, default True
+        When False, controllers that support it
+        (:meth:`~src.controllers.smc.core.telemetry.TelemetryMixin.disable_telemetry`)
+        record no history during the loop engine run, avoiding per-step
+        history growth in optimization loops.
+    active_set : bool, default False
+        Loop engine only (``"auto"`` then always uses the loop).  Retire
+        particles one at a time instead of truncating the whole batch: a
+        particle whose controller raises, whose plant step fails or becomes
+        non-finite, or (with ``convergence_tol``) whose ``|sigma|`` drops
+        below the tolerance after the grace period stops being stepped while
+        the rest run on.  Returns a
+        :class:`~src.simulation.results.RaggedBatchResultContainer` with a
+        ``"sigma"`` extra instead of the tuple.
+    storage : str or Path, optional
+        With ``active_set``, a directory in which the container's arrays are
+        memory-mapped and filled in place (see
+        :class:`~src.simulation.results.RaggedBatchResultContainer`).
+        ``params_list`` copies are held in memory.
 
     Returns
     -------
@@ -325,9 +404,25 @@ def simulate_system_batch(
     - ``sigma_b``: ndarray of shape ``(B, N)`` of sliding-surface values
 
     If ``params_list`` is provided, returns a list of such tuples (one per
-    element in ``params_list``).
+    element in ``params_list``).  With ``accumulate_cost=True`` each tuple
+    is replaced by a ``CostAccumulators`` instance.  With
+    ``active_set=True`` each tuple is replaced by a
+    ``RaggedBatchResultContainer``.
     """
     import numpy as _np  # local import to avoid polluting namespace
+    if engine not in ("loop", "vectorized", "auto"):
+        raise ValueError(f"Unknown batch engine '{engine}'")
+    if step_mode not in STEP_MODES:
+        raise ValueError(f"Unknown step mode '{step_mode}'")
+    if active_set and (engine == "vectorized" or accumulate_cost):
+        raise ValueError("active_set requires the loop engine and trajectory outputs")
+    if accumulate_cost and engine == "loop":
+        return _accumulate_loop_costs(
+            controller_factory=controller_factory, particles=particles,
+            sim_time=sim_time, dt=dt, u_max=u_max, params_list=params_list,
+            initial_state=initial_state, convergence_tol=convergence_tol,
+            grace_period=grace_period, step_mode=step_mode,
+        )
     # Convert particles to array
     # MEMORY OPTIMIZATION: asarray creates view when input is already ndarray with correct dtype
     part_arr = _np.asarray(particles, dtype=float)
@@ -368,12 +463,6 @@ def simulate_system_batch(
         else:
             # MEMORY OPTIMIZATION: Copy only when necessary (will be written to)
             init_b = init.copy()
-    # Preallocate outputs
-    t_arr = _np.zeros(H + 1, dtype=float)
-    x_b = _np.zeros((B, H + 1, init_b.shape[1]), dtype=float)
-    u_b = _np.zeros((B, H), dtype=float)
-    sigma_b = _np.zeros((B, H), dtype=float)
-    x_b[:, 0, :] = init_b
     # Convergence parameters
     check_convergence = (convergence_tol is not None) and (convergence_tol is not False)
     conv_tol = float(convergence_tol) if convergence_tol else 0.0
@@ -392,6 +481,8 @@ def simulate_system_batch(
                 f"Controller {j} ({type(ctrl).__name__}) doesn't support state initialization: {e}"
             )
             state_vars[j] = None
+        if not telemetry and hasattr(ctrl, "disable_telemetry"):
+            ctrl.disable_telemetry()
         try:
             if hasattr(ctrl, "initialize_history"):
                 histories[j] = ctrl.initialize_history()  # type: ignore[assignment]
@@ -413,6 +504,92 @@ def simulate_system_batch(
                     u_limits[j] = float(getattr(ctrl, "max_force"))
                 except Exception:
                     u_limits[j] = _np.inf
+    # Compiled batch engine
+    if engine != "loop" and not active_set:
+        from .batch_engine import (
+            build_batch_plan,
+            expand_plan_for_physics,
+            run_batch_plan,
+            run_batch_plan_cost,
+        )
+        try:
+            if init_b.shape[1] != 6:
+                raise ValueError(f"state dimension {init_b.shape[1]} is not supported")
+            plan = build_batch_plan(controllers)
+        except ValueError as e:
+            if engine == "vectorized":
+                raise
+            import logging
+            logging.getLogger(__name__).debug(f"Vectorized batch engine unavailable, using loop: {e}")
+            plan = None
+        if plan is not None and accumulate_cost:
+            conv = conv_tol if check_convergence else None
+            if params_list is None:
+                return run_batch_plan_cost(plan, init_b, H, dt, u_limits,
+                                           convergence_tol=conv, grace_steps=grace_steps)
+            draws = list(params_list)
+            D = len(draws)
+            if D == 0:
+                return []
+            acc = run_batch_plan_cost(
+                expand_plan_for_physics(plan, draws),
+                _np.tile(init_b, (D, 1)), H, dt, _np.tile(u_limits, D),
+                convergence_tol=conv, grace_steps=grace_steps,
+            )
+            return [acc.take(slice(d * B, (d + 1) * B)) for d in range(D)]
+        if plan is None and accumulate_cost:
+            return _accumulate_loop_costs(
+                controller_factory=controller_factory, particles=part_arr,
+                sim_time=sim_time, dt=dt, u_max=u_max, params_list=params_list,
+                initial_state=initial_state, convergence_tol=convergence_tol,
+                grace_period=grace_period, step_mode=step_mode,
+            )
+        if plan is not None:
+            if params_list is None:
+                return run_batch_plan(
+                    plan, init_b, H, dt, u_limits,
+                    convergence_tol=conv_tol if check_convergence else None,
+                    grace_steps=grace_steps,
+                )
+            # One flattened pass over every (draw, particle) pair
+            draws = list(params_list)
+            D = len(draws)
+            if D == 0:
+                return []
+            t_d, x_d, u_d, s_d = run_batch_plan(
+                expand_plan_for_physics(plan, draws),
+                _np.tile(init_b, (D, 1)), H, dt, _np.tile(u_limits, D),
+                convergence_tol=conv_tol if check_convergence else None,
+                grace_steps=grace_steps,
+            )
+            return [
+                (_np.copy(t_d), x_d[d * B:(d + 1) * B], u_d[d * B:(d + 1) * B], s_d[d * B:(d + 1) * B])
+                for d in range(D)
+            ]
+    # Plants that can take the compiled trusted step
+    trusted = [False] * B
+    if step_mode == "trusted":
+        for j, ctrl in enumerate(controllers):
+            dyn = getattr(ctrl, "dynamics_model", None)
+            try:
+                dyn.prepare_trusted_step()
+                trusted[j] = True
+            except (AttributeError, ValueError):
+                pass
+    if active_set:
+        result = _simulate_active_set(
+            controllers, state_vars, histories, u_limits, trusted, init_b, H, dt,
+            conv_tol if check_convergence else None, grace_steps, storage,
+        )
+        if params_list is not None:
+            return [result.copy() for _ in params_list]
+        return result
+    # Preallocate outputs (the compiled engine allocates its own)
+    t_arr = _np.zeros(H + 1, dtype=float)
+    x_b = _np.zeros((B, H + 1, init_b.shape[1]), dtype=float)
+    u_b = _np.zeros((B, H), dtype=float)
+    sigma_b = _np.zeros((B, H), dtype=float)
+    x_b[:, 0, :] = init_b
     # Simulation loop
     # We will reuse dynamics_model from each controller
     times = t_arr
@@ -421,33 +598,9 @@ def simulate_system_batch(
         times[i] = t_now
         # Compute controls and sigma for each particle
         for j, ctrl in enumerate(controllers):
-            x_curr = x_b[j, i]
-            # Use compute_control if available
             try:
-                if hasattr(ctrl, "compute_control"):
-                    ret = ctrl.compute_control(x_curr, state_vars[j], histories[j])
-                    # ret may be namedtuple or tuple
-                    try:
-                        u_val = float(ret[0])
-                    except Exception:
-                        u_val = float(ret)
-                    # update state and history
-                    try:
-                        if len(ret) >= 2:
-                            state_vars[j] = ret[1]
-                        if len(ret) >= 3:
-                            histories[j] = ret[2]
-                    except Exception:
-                        pass
-                    # extract sigma if available
-                    sigma_val = 0.0
-                    if hasattr(ret, "sigma"):
-                        sigma_val = float(ret.sigma)
-                    elif hasattr(ret, "__len__") and len(ret) >= 4:
-                        sigma_val = float(ret[3])
-                else:
-                    u_val = float(ctrl(t_now, x_curr))
-                    sigma_val = 0.0
+                u_val, sigma_val, state_vars[j], histories[j] = _particle_control(
+                    ctrl, x_b[j, i], state_vars[j], histories[j], t_now)
             except Exception as e:
                 # CRITICAL FIX: Don't catch Warning exceptions (pytest may convert warnings to errors)
                 # Re-raise warnings so they propagate normally and don't terminate simulation
@@ -487,27 +640,11 @@ def simulate_system_batch(
         # Step all particles forward using their dynamics model
         early_stop = False
         for j, ctrl in enumerate(controllers):
-            dyn = getattr(ctrl, "dynamics_model", None)
-            if dyn is None:
-                # If controller lacks dynamics_model, fall back to global step
-                try:
-                    x_next = ctrl.step(x_b[j, i], u_b[j, i], dt)  # type: ignore[attr-defined]
-                except Exception:
-                    x_next = None
-            else:
-                try:
-                    x_next = dyn.step(x_b[j, i], u_b[j, i], dt)
-                except Exception:
-                    x_next = None
+            x_next = _particle_step(ctrl, x_b[j, i], u_b[j, i], dt, trusted[j], x_b[j, i + 1])
             if x_next is None:
                 early_stop = True
                 break
-            # MEMORY OPTIMIZATION: asarray creates view when input is already ndarray with correct dtype
-            x_next_arr = _np.asarray(x_next, dtype=float).reshape(-1)
-            if not _np.all(_np.isfinite(x_next_arr)):
-                early_stop = True
-                break
-            x_b[j, i + 1] = x_next_arr
+            x_b[j, i + 1] = x_next
         if early_stop:
             # truncate and exit
             H = i
@@ -560,3 +697,130 @@ def simulate_system_batch(
         return result
     # replicate results for each params entry
     return [(_np.copy(times), _np.copy(x_b), _np.copy(u_b), _np.copy(sigma_b)) for _ in params_list]
+
+
+def _particle_control(ctrl: Any, x: np.ndarray, state_var: Any, history: Any, t: float):
+    """Control, sliding surface and updated state/history of one particle's controller."""
+    if not hasattr(ctrl, "compute_control"):
+        return float(ctrl(t, x)), 0.0, state_var, history
+    ret = ctrl.compute_control(x, state_var, history)
+    # ret may be namedtuple or tuple
+    try:
+        u_val = float(ret[0])
+    except Exception:
+        u_val = float(ret)
+    # update state and history
+    try:
+        if len(ret) >= 2:
+            state_var = ret[1]
+        if len(ret) >= 3:
+            history = ret[2]
+    except Exception:
+        pass
+    # extract sigma if available
+    sigma_val = 0.0
+    if hasattr(ret, "sigma"):
+        sigma_val = float(ret.sigma)
+    elif hasattr(ret, "__len__") and len(ret) >= 4:
+        sigma_val = float(ret[3])
+    return u_val, sigma_val, state_var, history
+
+
+def _particle_step(ctrl: Any, x: np.ndarray, u: float, dt: float, trusted: bool,
+                   out: np.ndarray) -> Optional[np.ndarray]:
+    """Next state of one particle's plant, or None if the step failed or is not finite."""
+    dyn = getattr(ctrl, "dynamics_model", None)
+    try:
+        if dyn is None:
+            # If controller lacks dynamics_model, fall back to global step
+            x_next = ctrl.step(x, u, dt)  # type: ignore[attr-defined]
+        elif trusted:
+            x_next = dyn.trusted_step(x, u, dt, out=out)
+        else:
+            x_next = dyn.step(x, u, dt)
+    except Exception:
+        return None
+    if x_next is None:
+        return None
+    # MEMORY OPTIMIZATION: asarray creates view when input is already ndarray with correct dtype
+    x_next = np.asarray(x_next, dtype=float).reshape(-1)
+    if not np.all(np.isfinite(x_next)):
+        return None
+    return x_next
+
+
+def _simulate_active_set(
+    controllers: list,
+    state_vars: list,
+    histories: list,
+    u_limits: np.ndarray,
+    trusted: list,
+    init_b: np.ndarray,
+    H: int,
+    dt: float,
+    conv_tol: Optional[float],
+    grace_steps: int,
+    storage: Optional[Any] = None,
+) -> RaggedBatchResultContainer:
+    """Loop engine that retires each particle on its own.
+
+    Only the particles in ``live`` have their controller and plant stepped.
+    A particle leaves the live set when its controller raises (``failed``),
+    its plant step fails or is not finite (``diverged``), or, with
+    ``conv_tol``, its ``|sigma|`` falls below the tolerance after the grace
+    period (``converged``); the others run on to the horizon.
+    """
+    B, D = init_b.shape
+    result = RaggedBatchResultContainer(B, H, D, times=np.arange(H + 1) * dt,
+                                        extras=("sigma",), storage=storage)
+    result.states[:, 0] = init_b
+    sigma_b = result.extras["sigma"]
+    live = list(range(B))
+    for i in range(H):
+        t_now = i * dt
+        still_live = []
+        for j in live:
+            ctrl = controllers[j]
+            try:
+                u_val, sigma_val, state_vars[j], histories[j] = _particle_control(
+                    ctrl, result.states[j, i], state_vars[j], histories[j], t_now)
+            except Exception as e:
+                if isinstance(e, Warning):
+                    raise
+                result.end_trajectory(j, i, result.FAILED)
+                continue
+            limit = u_limits[j]
+            u_val = min(max(u_val, -limit), limit)
+            result.controls[j, i] = u_val
+            sigma_b[j, i] = sigma_val
+            x_next = _particle_step(ctrl, result.states[j, i], u_val, dt, trusted[j],
+                                    result.states[j, i + 1])
+            if x_next is None:
+                result.end_trajectory(j, i, result.DIVERGED)
+                continue
+            result.states[j, i + 1] = x_next
+            if conv_tol is not None and i >= grace_steps and abs(sigma_val) < conv_tol:
+                result.end_trajectory(j, i + 1, result.CONVERGED)
+                continue
+            still_live.append(j)
+        live = still_live
+        if not live:
+            break
+    for ctrl, hist in zip(controllers, histories):
+        if hist is not None:
+            try:
+                setattr(ctrl, "_last_history", hist)
+            except Exception:
+                pass
+    result.flush()
+    return result
+
+
+def _accumulate_loop_costs(**kwargs: Any) -> Any:
+    """Run the loop engine and reduce its trajectories to cost accumulators."""
+    from .cost_accumulation import accumulate_trajectory_costs
+
+    result = simulate_system_batch(engine="loop", **kwargs)
+    if kwargs.get("params_list") is None:
+        return accumulate_trajectory_costs(*result)
+    return [accumulate_trajectory_costs(*r) for r in result]
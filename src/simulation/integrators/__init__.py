@@ -9,6 +9,7 @@ from .adaptive.runge_kutta import AdaptiveRungeKutta, DormandPrince45
 from .fixed_step.euler import ForwardEuler, BackwardEuler
 from .fixed_step.runge_kutta import RungeKutta4, RungeKutta2
 from .discrete.zero_order_hold import ZeroOrderHold
+from .compiled.horizon import CompiledHorizonIntegrator, compiled_rhs
 from .factory import IntegratorFactory, create_integrator, get_available_integrators
 
 __all__ = [
@@ -20,6 +21,8 @@ __all__ = [
     "RungeKutta4",
     "RungeKutta2",
     "ZeroOrderHold",
+    "CompiledHorizonIntegrator",
+    "compiled_rhs",
     "IntegratorFactory",
     "create_integrator",
     "get_available_integrators"
@@ -0,0 +1,19 @@
+#======================================================================================\\\
+#================== src/simulation/integrators/compiled/__init__.py ===================\\\
+#======================================================================================\\\
+
+"""Compiled whole-horizon integration methods."""
+
+from .horizon import (
+    COMPILED_METHODS,
+    CompiledHorizonIntegrator,
+    compiled_rhs,
+    saturated_linear_feedback
+)
+
+__all__ = [
+    "COMPILED_METHODS",
+    "CompiledHorizonIntegrator",
+    "compiled_rhs",
+    "saturated_linear_feedback"
+]
\ No newline at end of file
@@ -0,0 +1,528 @@
+#======================================================================================\\\
+#=================== src/simulation/integrators/compiled/horizon.py ===================\\\
+#======================================================================================\\\
+
+"""Whole-horizon integration inside a single JIT-compiled call.
+
+The step integrators in :mod:`..fixed_step` and :mod:`..adaptive` call a
+Python ``dynamics_fn`` for every stage.  The kernels here take a compiled
+right-hand side and a compiled control law instead and advance the whole
+horizon without returning to the interpreter, writing into preallocated
+trajectory buffers.
+
+Compiled callables use the following signatures::
+
+    rhs(state, u, rhs_params, out) -> bool       # writes dx/dt into out
+    control_law(t, state, law_params) -> float   # cart force
+
+The plant kernels ``compute_*_rhs_numba`` already follow the ``rhs``
+convention; :func:`compiled_rhs` returns the kernel and physics row for a
+plant instance.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+from ....plant.models.batch_dynamics import (
+    MODEL_FULL,
+    MODEL_LOWRANK,
+    MODEL_SIMPLIFIED,
+    MODEL_SIMPLIFIED_FAST,
+    pack_batch_params,
+)
+from ....plant.models.full.physics import compute_full_rhs_numba
+from ....plant.models.lowrank.physics import compute_lowrank_rhs_numba
+from ....plant.models.simplified.physics import (
+    compute_simplified_fast_rhs_numba,
+    compute_simplified_rhs_numba,
+)
+
+
+COMPILED_METHODS = ("rk4", "dp45")
+
+_RHS_KERNELS = {
+    MODEL_SIMPLIFIED: compute_simplified_rhs_numba,
+    MODEL_SIMPLIFIED_FAST: compute_simplified_fast_rhs_numba,
+    MODEL_FULL: compute_full_rhs_numba,
+    MODEL_LOWRANK: compute_lowrank_rhs_numba,
+}
+
+# Dormand-Prince 4(5) tableau (same coefficients as DormandPrince45)
+_DP_C = np.array([0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0])
+_DP_A = np.array([
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [1/5, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [3/40, 9/40, 0.0, 0.0, 0.0, 0.0],
+    [44/45, -56/15, 32/9, 0.0, 0.0, 0.0],
+    [19372/6561, -25360/2187, 64448/6561, -212/729, 0.0, 0.0],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0.0],
+    [35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84],
+])
+_DP_B4 = np.array([5179/57600, 0.0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+_DP_B5 = np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0])
+
+# Continuous extension of Dormand-Prince 5 (Hairer, Nørsett & Wanner)
+_DP_D = np.array([
+    -12715105075.0 / 11282082432.0,
+    0.0,
+    87487479700.0 / 32700410799.0,
+    -10690763975.0 / 1880347072.0,
+    701980252875.0 / 199316789632.0,
+    -1453857185.0 / 822651844.0,
+    69997945.0 / 29380423.0,
+])
+
+
+@njit(cache=True)
+def saturated_linear_feedback(t: float, state: np.ndarray, law_params: np.ndarray) -> float:
+    """Compiled control law u = sat(-K·x).
+
+    Parameters
+    ----------
+    t : float
+        Current time (unused)
+    state : np.ndarray
+        State vector of length n
+    law_params : np.ndarray
+        Gains ``K`` (length n) optionally followed by the saturation limit;
+        a non-positive limit disables saturation
+
+    Returns
+    -------
+    float
+        Control force
+    """
+    n = state.shape[0]
+    u = 0.0
+    for i in range(n):
+        u -= law_params[i] * state[i]
+    if law_params.shape[0] > n and law_params[n] > 0.0:
+        u_max = law_params[n]
+        if u > u_max:
+            u = u_max
+        elif u < -u_max:
+            u = -u_max
+    return u
+
+
+@njit(cache=True)
+def _all_finite(x: np.ndarray) -> bool:
+    """Return True if every entry of ``x`` is finite."""
+    for i in range(x.shape[0]):
+        if not np.isfinite(x[i]):
+            return False
+    return True
+
+
+@njit(cache=True)
+def _rk4_horizon_kernel(rhs, control_law, t0, dt, rhs_params, law_params,
+                        sample_hold, states, controls, work, stats):
+    """Fixed-step RK4 over the whole horizon; returns completed steps."""
+    n_steps = controls.shape[0]
+    n = states.shape[1]
+    k1, k2, k3, k4, tmp = work[0], work[1], work[2], work[3], work[4]
+    for i in range(n_steps):
+        t = t0 + i * dt
+        y = states[i]
+        u = control_law(t, y, law_params)
+        controls[i] = u
+        if not rhs(y, u, rhs_params, k1):
+            return i
+        for j in range(n):
+            tmp[j] = y[j] + dt * k1[j] / 2
+        if not sample_hold:
+            u = control_law(t + dt / 2, tmp, law_params)
+        if not rhs(tmp, u, rhs_params, k2):
+            return i
+        for j in range(n):
+            tmp[j] = y[j] + dt * k2[j] / 2
+        if not sample_hold:
+            u = control_law(t + dt / 2, tmp, law_params)
+        if not rhs(tmp, u, rhs_params, k3):
+            return i
+        for j in range(n):
+            tmp[j] = y[j] + dt * k3[j]
+        if not sample_hold:
+            u = control_law(t + dt, tmp, law_params)
+        if not rhs(tmp, u, rhs_params, k4):
+            return i
+        stats[0] += 4
+        stats[1] += 1
+        for j in range(n):
+            states[i + 1, j] = y[j] + dt * (k1[j] + 2 * k2[j] + 2 * k3[j] + k4[j]) / 6
+        if not _all_finite(states[i + 1]):
+            return i
+    return n_steps
+
+
+@njit(cache=True)
+def _dp45_attempt(rhs, control_law, t, y, h, u, sample_hold, rhs_params, law_params,
+                  rtol, atol, k, tmp, y5):
+    """Evaluate stages 2-7 of a Dormand-Prince step (k[0] holds f(t, y)).
+
+    Writes the 5th-order solution into ``y5`` and returns the RMS error
+    norm scaled like ``BaseIntegrator._compute_error_norm``, or NaN if the
+    right-hand side failed.
+    """
+    n = y.shape[0]
+    for s in range(1, 7):
+        for j in range(n):
+            acc = 0.0
+            for m in range(s):
+                acc += _DP_A[s, m] * k[m, j]
+            tmp[j] = y[j] + h * acc
+        if not sample_hold:
+            u = control_law(t + _DP_C[s] * h, tmp, law_params)
+        if not rhs(tmp, u, rhs_params, k[s]):
+            return np.nan
+    sq = 0.0
+    for j in range(n):
+        s4 = 0.0
+        s5 = 0.0
+        for m in range(7):
+            s4 += _DP_B4[m] * k[m, j]
+            s5 += _DP_B5[m] * k[m, j]
+        y5[j] = y[j] + h * s5
+        e = (y5[j] - (y[j] + h * s4)) / (atol + rtol * abs(y[j]))
+        sq += e * e
+    return np.sqrt(sq / n)
+
+
+@njit(cache=True)
+def _dp45_update_step(err_norm, h, min_step, max_step, safety):
+    """Step size update mirroring ``ErrorController.update_step_size`` (order 5)."""
+    if err_norm <= 1.0:
+        accept = True
+        if err_norm == 0.0:
+            factor = 2.0
+        else:
+            factor = min(safety * (1.0 / err_norm) ** (1.0 / 5), 5.0)
+    else:
+        accept = False
+        factor = max(safety * (1.0 / err_norm) ** (1.0 / 6), 0.1)
+    h_new = min(max(h * factor, min_step), max_step)
+    return h_new, accept
+
+
+@njit(cache=True)
+def _dp45_hold_kernel(rhs, control_law, t0, dt, rhs_params, law_params,
+                      rtol, atol, min_step, max_step, safety, h_init, max_attempts,
+                      states, controls, k, work, stats):
+    """Adaptive DP45 with the control held over each output interval.
+
+    Every interval ends exactly on the output grid, so grid samples need no
+    interpolation.  Returns the number of completed intervals.
+    """
+    n_steps = controls.shape[0]
+    n = states.shape[1]
+    tmp, y, y5 = work[0], work[1], work[2]
+    h = h_init
+    for i in range(n_steps):
+        t = t0 + i * dt
+        t_end = t0 + (i + 1) * dt
+        for j in range(n):
+            y[j] = states[i, j]
+        u = control_law(t, y, law_params)
+        controls[i] = u
+        if not rhs(y, u, rhs_params, k[0]):
+            return i
+        stats[0] += 1
+        attempts = 0
+        done = False
+        while not done:
+            remaining = t_end - t
+            last = h >= remaining
+            h_try = remaining if last else h
+            err_norm = _dp45_attempt(rhs, control_law, t, y, h_try, u, True, rhs_params,
+                                     law_params, rtol, atol, k, tmp, y5)
+            stats[0] += 6
+            if not np.isfinite(err_norm):
+                return i
+            h, accept = _dp45_update_step(err_norm, h_try, min_step, max_step, safety)
+            if accept:
+                stats[1] += 1
+                for j in range(n):
+                    y[j] = y5[j]
+                    k[0, j] = k[6, j]  # first-same-as-last
+                t = t_end if last else t + h_try
+                done = last
+            else:
+                stats[2] += 1
+                if h_try <= min_step:
+                    return i
+            attempts += 1
+            if attempts > max_attempts:
+                return i
+        for j in range(n):
+            states[i + 1, j] = y[j]
+    return n_steps
+
+
+@njit(cache=True)
+def _dp45_dense_kernel(rhs, control_law, t0, dt, rhs_params, law_params,
+                       rtol, atol, min_step, max_step, safety, h_init, max_attempts,
+                       states, controls, k, work, stats):
+    """Adaptive DP45 with continuous feedback and dense output on the grid.
+
+    Steps are chosen by the error controller alone; grid samples are taken
+    from the continuous extension of each accepted step.  Returns the
+    number of completed grid intervals.
+    """
+    n_steps = controls.shape[0]
+    n = states.shape[1]
+    tmp, y, y5, r5 = work[0], work[1], work[2], work[3]
+    t = t0
+    t_final = t0 + n_steps * dt
+    for j in range(n):
+        y[j] = states[0, j]
+    u = control_law(t, y, law_params)
+    if n_steps > 0:
+        controls[0] = u
+    if not rhs(y, u, rhs_params, k[0]):
+        return 0
+    stats[0] += 1
+    h = h_init
+    g = 1
+    attempts = 0
+    while g <= n_steps:
+        remaining = t_final - t
+        last = h >= remaining
+        h_try = remaining if last else h
+        err_norm = _dp45_attempt(rhs, control_law, t, y, h_try, u, False, rhs_params,
+                                 law_params, rtol, atol, k, tmp, y5)
+        stats[0] += 6
+        if not np.isfinite(err_norm):
+            return g - 1
+        h, accept = _dp45_update_step(err_norm, h_try, min_step, max_step, safety)
+        attempts += 1
+        if attempts > max_attempts:
+            return g - 1
+        if not accept:
+            stats[2] += 1
+            if h_try <= min_step:
+                return g - 1
+            continue
+        stats[1] += 1
+        t_new = t_final if last else t + h_try
+
+        # Continuous extension coefficients of the accepted step
+        for j in range(n):
+            acc = 0.0
+            for m in range(7):
+                acc += _DP_D[m] * k[m, j]
+            r5[j] = h_try * acc
+        while g <= n_steps and t0 + g * dt <= t_new:
+            t_g = t0 + g * dt
+            theta = (t_g - t) / h_try
+            theta1 = 1.0 - theta
+            for j in range(n):
+                ydiff = y5[j] - y[j]
+                bspl = h_try * k[0, j] - ydiff
+                r4 = ydiff - h_try * k[6, j] - bspl
+                states[g, j] = y[j] + theta * (ydiff + theta1 * (bspl + theta * (r4 + theta1 * r5[j])))
+            if g < n_steps:
+                controls[g] = control_law(t_g, states[g], law_params)
+            g += 1
+
+        for j in range(n):
+            y[j] = y5[j]
+            k[0, j] = k[6, j]  # first-same-as-last
+        t = t_new
+    return n_steps
+
+
+def compiled_rhs(dynamics_model: Any) -> Tuple[Callable, np.ndarray]:
+    """Return the compiled right-hand side and physics row of a plant.
+
+    Parameters
+    ----------
+    dynamics_model : object
+        Simplified, full or low-rank DIP dynamics model
+
+    Returns
+    -------
+    tuple
+        (rhs kernel, physics parameter row)
+
+    Raises
+    ------
+    ValueError
+        If the model or its configuration has no compiled kernel
+    """
+    code, params = pack_batch_params(dynamics_model)
+    return _RHS_KERNELS[code], params
+
+
+class CompiledHorizonIntegrator:
+    """Integrate a closed loop over a full horizon in one compiled call.
+
+    ``rk4`` takes one classic RK4 step per output interval.  ``dp45`` runs
+    the adaptive Dormand-Prince 4(5) pair with the same step-size control as
+    :class:`~..adaptive.runge_kutta.DormandPrince45` and reports the state
+    on the uniform output grid.
+
+    With ``sample_hold=True`` (the default, matching the simulation runners)
+    the control law is sampled at each grid point and held over the
+    interval.  With ``sample_hold=False`` the law is evaluated at every
+    stage; ``dp45`` then steps across grid points and fills the grid from
+    its dense output.
+    """
+
+    def __init__(self,
+                 method: str = "rk4",
+                 rtol: float = 1e-6,
+                 atol: float = 1e-9,
+                 min_step: float = 1e-12,
+                 max_step: float = 1.0,
+                 safety_factor: float = 0.9,
+                 sample_hold: bool = True,
+                 max_attempts: int = 100000):
+        """Initialize compiled horizon integrator.
+
+        Parameters
+        ----------
+        method : str, optional
+            ``"rk4"`` or ``"dp45"``
+        rtol : float, optional
+            Relative tolerance (``dp45`` only)
+        atol : float, optional
+            Absolute tolerance (``dp45`` only)
+        min_step : float, optional
+            Minimum step size (``dp45`` only)
+        max_step : float, optional
+            Maximum step size (``dp45`` only)
+        safety_factor : float, optional
+            Safety factor for step size control (``dp45`` only)
+        sample_hold : bool, optional
+            Hold the control over each output interval
+        max_attempts : int, optional
+            Step attempts allowed per interval (``sample_hold``) or per
+            horizon before the integration is abandoned (``dp45`` only)
+        """
+        if method not in COMPILED_METHODS:
+            raise ValueError(f"Unknown method '{method}'. Available: {list(COMPILED_METHODS)}")
+        self.method = method
+        self.rtol = rtol
+        self.atol = atol
+        self.min_step = min_step
+        self.max_step = max_step
+        self.safety_factor = safety_factor
+        self.sample_hold = sample_hold
+        self.max_attempts = max_attempts
+        self._stats = np.zeros(3, dtype=np.int64)
+
+    def reset_statistics(self) -> None:
+        """Reset integration statistics."""
+        self._stats[:] = 0
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get integration statistics."""
+        return {
+            "function_evaluations": int(self._stats[0]),
+            "accepted_steps": int(self._stats[1]),
+            "rejected_steps": int(self._stats[2]),
+        }
+
+    def integrate_horizon(self,
+                          rhs: Callable,
+                          control_law: Callable,
+                          initial_state: np.ndarray,
+                          dt: float,
+                          n_steps: int,
+                          rhs_params: np.ndarray,
+                          law_params: Optional[np.ndarray] = None,
+                          t0: float = 0.0,
+                          initial_step: Optional[float] = None,
+                          states: Optional[np.ndarray] = None,
+                          controls: Optional[np.ndarray] = None
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Integrate ``n_steps`` output intervals of length ``dt``.
+
+        Parameters
+        ----------
+        rhs : callable
+            Compiled right-hand side ``rhs(state, u, rhs_params, out) -> bool``
+        control_law : callable
+            Compiled law ``control_law(t, state, law_params) -> float``
+        initial_state : np.ndarray
+            Initial state of length n
+        dt : float
+            Output grid spacing (and control sample period)
+        n_steps : int
+            Number of output intervals
+        rhs_params : np.ndarray
+            Parameter row passed to ``rhs``
+        law_params : np.ndarray, optional
+            Parameter row passed to ``control_law``
+        t0 : float, optional
+            Initial time
+        initial_step : float, optional
+            First trial step for ``dp45`` (defaults to ``dt``)
+        states : np.ndarray, optional
+            Preallocated trajectory buffer of shape (n_steps + 1, n)
+        controls : np.ndarray, optional
+            Preallocated control buffer of shape (n_steps,)
+
+        Returns
+        -------
+        tuple
+            (t, x, u) with shapes (k + 1,), (k + 1, n) and (k,), where k is
+            the number of completed intervals; ``x`` and ``u`` are views of
+            the trajectory buffers.  k < n_steps if the right-hand side
+            failed, the state became non-finite or step control broke down.
+        """
+        if dt <= 0:
+            raise ValueError("dt must be positive")
+        n_steps = int(n_steps)
+        if n_steps < 0:
+            raise ValueError("n_steps must be non-negative")
+        x0 = np.asarray(initial_state, dtype=float).reshape(-1)
+        if not np.all(np.isfinite(x0)):
+            raise ValueError("initial_state contains non-finite values")
+        n = x0.size
+
+        if states is None:
+            states = np.empty((n_steps + 1, n))
+        elif states.shape != (n_steps + 1, n):
+            raise ValueError(f"states must have shape ({n_steps + 1}, {n}), got {states.shape}")
+        if controls is None:
+            controls = np.empty(n_steps)
+        elif controls.shape != (n_steps,):
+            raise ValueError(f"controls must have shape ({n_steps},), got {controls.shape}")
+        states[0] = x0
+
+        rhs_params = np.ascontiguousarray(rhs_params, dtype=float)
+        if law_params is None:
+            law_params = np.empty(0)
+        law_params = np.ascontiguousarray(law_params, dtype=float)
+
+        if self.method == "rk4":
+            work = np.empty((5, n))
+            completed = _rk4_horizon_kernel(
+                rhs, control_law, float(t0), float(dt), rhs_params, law_params,
+                bool(self.sample_hold), states, controls, work, self._stats
+            )
+        else:
+            kernel = _dp45_hold_kernel if self.sample_hold else _dp45_dense_kernel
+            h_init = float(dt if initial_step is None else initial_step)
+            h_init = min(max(h_init, self.min_step), self.max_step)
+            completed = kernel(
+                rhs, control_law, float(t0), float(dt), rhs_params, law_params,
+                float(self.rtol), float(self.atol), float(self.min_step),
+                float(self.max_step), float(self.safety_factor), h_init,
+                int(self.max_attempts), states, controls,
+                np.empty((7, n)), np.empty((4, n)), self._stats
+            )
+
+        t = t0 + dt * np.arange(completed + 1)
+        return t, states[:completed + 1], controls[:completed]
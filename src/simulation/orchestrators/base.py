@@ -38,6 +38,10 @@ class BaseOrchestrator(Orchestrator, SimulationEngine):
         # Initialize integrator
         self._integrator = self._create_integrator()
 
+        # Batch kernel of the plant, resolved on the first step_batch()
+        self._batch_params = None
+        self._batch_params_resolved = False
+
         # Performance tracking
         self._execution_stats = {
             "total_simulations": 0,
@@ -91,13 +95,73 @@ class BaseOrchestrator(Orchestrator, SimulationEngine):
 
         # Create dynamics wrapper function
         def dynamics_fn(time, x, u):
-            return self.dynamics_model.compute_dynamics(x, u)
+            result = self.dynamics_model.compute_dynamics(x, u)
+            # Plant models return a DynamicsResult; plain arrays pass through
+            return getattr(result, "state_derivative", result)
 
         # Integrate using selected method
         next_state = self._integrator.integrate(dynamics_fn, state, control, dt, t)
 
         return next_state
 
+    def step_batch(self, states: np.ndarray, controls: np.ndarray, dt: float, **kwargs) -> np.ndarray:
+        """Execute a single simulation step for a batch of states.
+
+        Fixed-step integrators advance the whole batch at once through the
+        compiled ``compute_dynamics_batch`` kernel when the plant has one.
+        Otherwise (adaptive integrators, plants without a batch kernel) each
+        row is stepped with :meth:`step`.
+
+        Parameters
+        ----------
+        states : np.ndarray
+            Current states, shape (batch_size, state_dim)
+        controls : np.ndarray
+            Scalar control input per row, shape (batch_size,)
+        dt : float
+            Time step
+        **kwargs
+            Additional parameters (``t``)
+
+        Returns
+        -------
+        np.ndarray
+            Next states, shape (batch_size, state_dim); rows whose step failed
+            are NaN
+        """
+        t = kwargs.get("t", 0.0)
+        states = np.asarray(states, dtype=float)
+        controls = np.asarray(controls, dtype=float).reshape(-1)
+
+        batch_params = self._batch_dynamics_params()
+        if batch_params is not None and not getattr(self._integrator, "adaptive", False):
+            from ...plant.models.batch_dynamics import compute_dynamics_batch
+            code, params = batch_params
+
+            def dynamics_fn(time, x, u):
+                return compute_dynamics_batch(code, x, u, params)
+
+            return self._integrator.integrate(dynamics_fn, states, controls, dt, t)
+
+        next_states = np.empty_like(states)
+        for b in range(states.shape[0]):
+            try:
+                next_states[b] = self.step(states[b], controls[b:b+1], dt, t=t)
+            except Exception:
+                next_states[b] = np.nan
+        return next_states
+
+    def _batch_dynamics_params(self):
+        """Model code and physics row of the plant's batch kernel, or None."""
+        if not self._batch_params_resolved:
+            try:
+                from ...plant.models.batch_dynamics import pack_batch_params
+                self._batch_params = pack_batch_params(self.dynamics_model)
+            except Exception:
+                self._batch_params = None
+            self._batch_params_resolved = True
+        return self._batch_params
+
     @abstractmethod
     def execute(self,
                initial_state: np.ndarray,
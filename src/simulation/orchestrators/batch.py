@@ -12,7 +12,8 @@ import numpy as np
 
 from .base import BaseOrchestrator
 from ..core.interfaces import ResultContainer
-from ..results.containers import BatchResultContainer
+from ..results.containers import BatchResultContainer, RaggedBatchResultContainer
+from ..safety.guards import BatchSafetyGuard, rowwise_mask
 
 
 class BatchOrchestrator(BaseOrchestrator):
@@ -42,7 +43,18 @@ class BatchOrchestrator(BaseOrchestrator):
         horizon : int
             Simulation horizon
         **kwargs
-            Additional options
+            Additional options: ``safety_guards`` (default True),
+            ``energy_limits`` and ``state_bounds`` (override the configured
+            guard limits), ``stop_fn`` (predicate on one state),
+            ``stop_mask_fn`` (predicate on the ``(B, D)`` batch returning a
+            boolean mask), ``t0`` and ``active_set`` (default False).  A
+            trajectory that stops or violates a guard is deactivated on its
+            own; the others continue.  With ``active_set=True`` only the live
+            trajectories are stepped, through :meth:`step_batch` on a
+            compacted working array, and the result is a
+            :class:`RaggedBatchResultContainer` recording each trajectory's
+            length and end status; ``storage`` (a directory) makes it write
+            the trajectories into memory-mapped arrays there.
 
         Returns
         -------
@@ -68,10 +80,28 @@ class BatchOrchestrator(BaseOrchestrator):
         # Extract options
         safety_guards = kwargs.get("safety_guards", True)
         stop_fn = kwargs.get("stop_fn", None)
+        stop_mask_fn = kwargs.get("stop_mask_fn", None)
         t0 = kwargs.get("t0", 0.0)
 
+        # Batch predicates, evaluated on the live rows only
+        stop_masks = [stop_mask_fn] if stop_mask_fn is not None else []
+        if stop_fn is not None:
+            stop_masks.append(rowwise_mask(stop_fn))
+        guard = None
+        if safety_guards:
+            guard = BatchSafetyGuard.from_config(
+                self.config, kwargs.get("energy_limits"), kwargs.get("state_bounds"))
+
         # Prepare result arrays
         times = np.linspace(t0, t0 + horizon * dt, horizon + 1)
+
+        if kwargs.get("active_set", False):
+            result, total_steps = self._execute_active_set(
+                initial_state, control_inputs, dt, horizon, times, stop_masks, guard,
+                kwargs.get("storage"))
+            self._update_stats(total_steps, time.perf_counter() - start_time)
+            return result
+
         states = np.zeros((batch_size, horizon + 1, state_dim))
         controls = np.zeros((batch_size, horizon))
 
@@ -95,21 +125,15 @@ class BatchOrchestrator(BaseOrchestrator):
 
             controls[:, i] = step_controls.flat[:batch_size]
 
-            # Apply stop condition
-            if stop_fn is not None:
-                for b in range(batch_size):
-                    if active_mask[b] and stop_fn(current_states[b]):
-                        active_mask[b] = False
-
-            # Apply safety guards if enabled
-            if safety_guards:
-                for b in range(batch_size):
-                    if active_mask[b]:
-                        try:
-                            from ..safety.guards import apply_safety_guards
-                            apply_safety_guards(current_states[b], i, self.config)
-                        except Exception:
-                            active_mask[b] = False
+            # Apply stop conditions and safety guards
+            live = np.flatnonzero(active_mask)
+            for mask_fn in stop_masks:
+                if live.size:
+                    stopped = np.asarray(mask_fn(current_states[live]), dtype=bool)
+                    active_mask[live[stopped]] = False
+                    live = live[~stopped]
+            if guard is not None and live.size:
+                active_mask[live[guard(current_states[live])]] = False
 
             # Vectorized simulation step for active simulations
             next_states = current_states.copy()
@@ -155,6 +179,77 @@ class BatchOrchestrator(BaseOrchestrator):
 
         return result
 
+    def _execute_active_set(self,
+                            initial_state: np.ndarray,
+                            control_inputs: np.ndarray,
+                            dt: float,
+                            horizon: int,
+                            times: np.ndarray,
+                            stop_masks: list,
+                            guard: Optional[BatchSafetyGuard],
+                            storage=None):
+        """Step only the live trajectories, compacting them as they end.
+
+        ``live`` holds the batch indices of the trajectories still running
+        and ``current`` their states, row for row.  Stop predicates and the
+        guard are evaluated on ``current``; rows that trigger them, or whose
+        step is not finite, are dropped from both before the next step, so
+        the cost of each step follows the number of live trajectories.
+
+        Returns
+        -------
+        tuple
+            ``(RaggedBatchResultContainer, number of steps taken)``
+        """
+        batch_size, state_dim = initial_state.shape
+        result = RaggedBatchResultContainer(batch_size, horizon, state_dim, times=times,
+                                            storage=storage)
+        result.states[:, 0] = initial_state
+
+        checks = [(mask_fn, result.STOPPED) for mask_fn in stop_masks]
+        if guard is not None:
+            checks.append((guard, result.GUARD_VIOLATION))
+        scalar_controls = control_inputs.ndim == 2 or control_inputs.shape[2] == 1
+
+        live = np.arange(batch_size)
+        current = np.array(initial_state, dtype=float)
+        total_steps = 0
+        for i in range(horizon):
+            for mask_fn, status in checks:
+                if not live.size:
+                    break
+                ended = np.asarray(mask_fn(current), dtype=bool)
+                if ended.any():
+                    result.end_trajectory(live[ended], i, status)
+                    live, current = live[~ended], current[~ended]
+            if not live.size:
+                break
+
+            step_controls = control_inputs[live, i]
+            if scalar_controls:
+                u = step_controls.reshape(-1)
+                result.controls[live, i] = u
+                next_states = self.step_batch(current, u, dt, t=times[i])
+            else:
+                result.controls[live, i] = step_controls[:, 0]
+                next_states = np.empty_like(current)
+                for row, (x, u) in enumerate(zip(current, step_controls)):
+                    try:
+                        next_states[row] = self.step(x, u, dt, t=times[i])
+                    except Exception:
+                        next_states[row] = np.nan
+            total_steps += live.size
+
+            finite = np.isfinite(next_states).all(axis=1)
+            if not finite.all():
+                result.end_trajectory(live[~finite], i, result.DIVERGED)
+                live, next_states = live[finite], next_states[finite]
+            result.states[live, i + 1] = next_states
+            current = next_states
+
+        result.flush()
+        return result, total_steps
+
     def _normalize_control_inputs(self,
                                 control_inputs: np.ndarray,
                                 batch_size: int,
@@ -2,30 +2,175 @@
 #====================== src/simulation/orchestrators/parallel.py ======================\\\
 #======================================================================================\\\
 
-"""Parallel simulation orchestrator for multi-threaded execution."""
+"""Parallel simulation orchestrator for multi-threaded or multi-process execution."""
 
 from __future__ import annotations
 
+import multiprocessing as mp
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Callable, List, Optional
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import numpy as np
 
 from .base import BaseOrchestrator
+from .batch import BatchOrchestrator
 from .sequential import SequentialOrchestrator
 from ..core.interfaces import ResultContainer
 from ..results.containers import BatchResultContainer
+from ..safety.guards import BatchSafetyGuard, rowwise_mask
+
+EXECUTION_MODES = ("thread", "process")
+
+
+def simulate_chunk(orchestrator: BaseOrchestrator,
+                   initial_states: np.ndarray,
+                   control_sequences: np.ndarray,
+                   dt: float,
+                   horizon: int,
+                   states_out: np.ndarray,
+                   controls_out: np.ndarray,
+                   lengths_out: np.ndarray,
+                   *,
+                   safety_guards: bool = True,
+                   stop_fn: Optional[Callable[[np.ndarray], bool]] = None,
+                   t0: float = 0.0) -> None:
+    """Simulate a contiguous chunk of trajectories in lock step.
+
+    All live rows are advanced together with ``orchestrator.step_batch``.
+    Each row follows the semantics of :class:`SequentialOrchestrator`: it
+    ends when ``stop_fn`` fires, when its next state is non-finite, or when
+    the step fails.  A safety-guard violation (checked for all live rows at
+    once with :class:`BatchSafetyGuard`) fails the trajectory, as it does
+    for a sequential run inside the thread pool.
 
+    Parameters
+    ----------
+    orchestrator : BaseOrchestrator
+        Orchestrator providing the integrator and plant
+    initial_states : np.ndarray
+        Initial states, shape (B, state_dim)
+    control_sequences : np.ndarray
+        Control sequences, shape (B, horizon)
+    dt : float
+        Time step
+    horizon : int
+        Simulation horizon
+    states_out, controls_out, lengths_out : np.ndarray
+        Output buffers of shapes (B, horizon + 1, state_dim), (B, horizon)
+        and (B,).  ``lengths_out`` receives the number of completed steps
+        of each trajectory, or -1 if it failed.
+    safety_guards : bool, optional
+        Apply the configured safety guards before every step
+    stop_fn : callable, optional
+        Early stopping predicate on a single state
+    t0 : float, optional
+        Initial time
+    """
+    batch_size = initial_states.shape[0]
+    times = np.linspace(t0, t0 + horizon * dt, horizon + 1)
+    states_out[:, 0] = initial_states
+    lengths_out[:] = horizon
+    live = np.ones(batch_size, dtype=bool)
+    guard = BatchSafetyGuard.from_config(orchestrator.config) if safety_guards else None
+    stop_mask = rowwise_mask(stop_fn) if stop_fn is not None else None
+
+    for i in range(horizon):
+        rows = np.flatnonzero(live)
+        if rows.size == 0:
+            break
+        controls_out[rows, i] = control_sequences[rows, i]
+
+        if stop_mask is not None:
+            stopped = stop_mask(states_out[rows, i])
+            lengths_out[rows[stopped]] = i
+            live[rows[stopped]] = False
+            rows = rows[~stopped]
+        if guard is not None and rows.size:
+            unsafe = rows[guard(states_out[rows, i])]
+            lengths_out[unsafe] = -1
+            live[unsafe] = False
+
+        rows = np.flatnonzero(live)
+        if rows.size == 0:
+            break
+        try:
+            next_states = orchestrator.step_batch(states_out[rows, i], control_sequences[rows, i], dt, t=times[i])
+        except Exception:
+            next_states = np.full((rows.size, states_out.shape[2]), np.nan)
+
+        finite = np.isfinite(next_states).all(axis=1)
+        states_out[rows[finite], i + 1] = next_states[finite]
+        lengths_out[rows[~finite]] = i
+        live[rows[~finite]] = False
+
+
+# ---------------------------------------------------------------------------
+# Process-pool workers
+# ---------------------------------------------------------------------------
+# Per-process orchestrator created once by ``_init_worker``.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(context) -> None:
+    """Pool initializer: build the worker's orchestrator once."""
+    _WORKER_STATE.clear()
+    _WORKER_STATE["orchestrator"] = BatchOrchestrator(context)
+
+
+def _simulate_chunk_task(task: Dict[str, Any]) -> None:
+    """Simulate rows ``lo:hi`` into the parent's shared buffers."""
+    B, N, S = task["shape"]
+    lo, hi = task["rows"]
+    blocks = [shared_memory.SharedMemory(name=name) for name in task["names"]]
+    try:
+        states = np.ndarray((B, N + 1, S), dtype=np.float64, buffer=blocks[0].buf)
+        controls = np.ndarray((B, N), dtype=np.float64, buffer=blocks[1].buf)
+        lengths = np.ndarray((B,), dtype=np.int64, buffer=blocks[2].buf)
+        simulate_chunk(
+            _WORKER_STATE["orchestrator"], task["initial_states"], task["control_sequences"],
+            task["dt"], N, states[lo:hi], controls[lo:hi], lengths[lo:hi],
+            safety_guards=task["safety_guards"], stop_fn=task["stop_fn"], t0=task["t0"],
+        )
+        del states, controls, lengths
+    finally:
+        for shm in blocks:
+            shm.close()
 
-class ParallelOrchestrator(BaseOrchestrator):
-    """Parallel simulation orchestrator for multi-threaded execution.
 
-    This orchestrator executes multiple simulations in parallel using
-    a thread pool, providing performance improvements for independent
-    simulation runs such as Monte Carlo analysis.
+def _shutdown_executor(holder: Dict[str, Any]) -> None:
+    executor = holder.pop("executor", None)
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ParallelOrchestrator(BaseOrchestrator):
+    """Parallel simulation orchestrator for multi-threaded or multi-process execution.
+
+    In ``"thread"`` mode each trajectory is a separate task on a thread
+    pool, which suits I/O-bound runs such as HIL.  The step loop itself holds
+    the GIL, so CPU-bound batches should use ``"process"`` mode: the batch is
+    split into one contiguous chunk per worker process, each chunk is stepped
+    in lock step through :meth:`BaseOrchestrator.step_batch`, and the
+    workers write states, controls and trajectory lengths straight into
+    shared memory owned by the parent.
+
+    The process pool is created on first use and kept for later calls;
+    release it with :meth:`close` or by using the orchestrator as a context
+    manager.  Workers are started with ``spawn`` by default: the parallel
+    batch-dynamics kernel starts numba's TBB/OpenMP thread pool, which is not
+    fork-safe once running in the parent.  The context and any ``stop_fn``
+    must therefore be picklable.
     """
 
-    def __init__(self, context, max_workers: Optional[int] = None):
+    def __init__(self,
+                 context,
+                 max_workers: Optional[int] = None,
+                 *,
+                 mode: str = "thread",
+                 mp_context: str = "spawn"):
         """Initialize parallel orchestrator.
 
         Parameters
@@ -33,10 +178,21 @@ class ParallelOrchestrator(BaseOrchestrator):
         context : SimulationContext
             Simulation context
         max_workers : int, optional
-            Maximum number of worker threads (default: CPU count)
+            Maximum number of worker threads or processes (default: CPU count)
+        mode : str, optional
+            ``"thread"`` (default) or ``"process"``
+        mp_context : str, optional
+            Multiprocessing start method for ``"process"`` mode
+            (``"spawn"`` (default), ``"forkserver"`` or ``"fork"``)
         """
         super().__init__(context)
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"mode must be one of {EXECUTION_MODES}, got {mode!r}")
         self.max_workers = max_workers
+        self.mode = mode
+        self.mp_context = mp_context
+        self._pool: Dict[str, Any] = {}
+        self._finalizer = weakref.finalize(self, _shutdown_executor, self._pool)
 
     def execute(self,
                initial_state: np.ndarray,
@@ -76,6 +232,9 @@ class ParallelOrchestrator(BaseOrchestrator):
             # Single simulation - use sequential orchestrator
             sequential = SequentialOrchestrator(self.context)
             result = sequential.execute(initial_state[0], control_inputs, dt, horizon, **kwargs)
+        elif self.mode == "process":
+            # Multiple simulations - one contiguous chunk per worker process
+            result = self._execute_process_batch(initial_state, control_inputs, dt, horizon, **kwargs)
         else:
             # Multiple simulations - execute in parallel
             result = self._execute_parallel_batch(initial_state, control_inputs, dt, horizon, **kwargs)
@@ -97,41 +256,21 @@ class ParallelOrchestrator(BaseOrchestrator):
         batch_size = initial_states.shape[0]
 
         # Prepare individual simulation parameters
-        simulation_params = []
-        for i in range(batch_size):
-            initial_state = initial_states[i]
-
-            # Extract control inputs for this simulation
-            if control_inputs.ndim == 1:
-                # Single control sequence for all
-                controls = control_inputs
-            elif control_inputs.ndim == 2:
-                if control_inputs.shape[0] == batch_size:
-                    # Batch of control sequences
-                    controls = control_inputs[i]
-                else:
-                    # Single control sequence with multiple inputs per step
-                    controls = control_inputs
-            elif control_inputs.ndim == 3:
-                # Batch of multi-input control sequences
-                controls = control_inputs[i]
-            else:
-                controls = control_inputs
-
-            simulation_params.append((initial_state, controls, dt, horizon, kwargs.copy()))
+        simulation_params = [
+            (initial_states[i], self._trajectory_controls(control_inputs, batch_size, i),
+             dt, horizon, kwargs.copy())
+            for i in range(batch_size)
+        ]
 
         # Execute simulations in parallel
         results = []
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all simulations
-            future_to_index = {
-                executor.submit(self._run_single_simulation, *params): i
-                for i, params in enumerate(simulation_params)
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
+            futures = [executor.submit(self._run_single_simulation, *params)
+                       for params in simulation_params]
+
+            # Collect results in submission order
+            for index, future in enumerate(futures):
                 try:
                     result = future.result()
                     results.append((index, result))
@@ -140,9 +279,6 @@ class ParallelOrchestrator(BaseOrchestrator):
                     print(f"Simulation {index} failed: {e}")
                     results.append((index, None))
 
-        # Sort results by original index
-        results.sort(key=lambda x: x[0])
-
         # Combine into batch result container
         batch_result = BatchResultContainer()
         for index, result in results:
@@ -167,12 +303,141 @@ class ParallelOrchestrator(BaseOrchestrator):
         This method creates a new sequential orchestrator for each worker
         to avoid thread safety issues.
         """
-        # Create a new context for this thread
-        context = type(self.context)(self.context.config.model_dump_json())
-        sequential = SequentialOrchestrator(context)
+        # Own orchestrator (and integrator) per task; the plant is stateless
+        # and shared through the context.
+        sequential = SequentialOrchestrator(self.context)
 
         return sequential.execute(initial_state, control_inputs, dt, horizon, **kwargs)
 
+    @staticmethod
+    def _trajectory_controls(control_inputs: np.ndarray, batch_size: int, index: int) -> np.ndarray:
+        """Control inputs of trajectory ``index`` as passed to the sequential run."""
+        if control_inputs.ndim == 1:
+            # Single control sequence for all
+            return control_inputs
+        if control_inputs.ndim == 2:
+            if control_inputs.shape[0] == batch_size:
+                # Batch of control sequences
+                return control_inputs[index]
+            # Single control sequence with multiple inputs per step
+            return control_inputs
+        if control_inputs.ndim == 3:
+            # Batch of multi-input control sequences
+            return control_inputs[index]
+        return control_inputs
+
+    def _control_sequences(self, control_inputs: np.ndarray, batch_size: int, horizon: int) -> np.ndarray:
+        """Per-trajectory scalar control sequences, shape (batch_size, horizon).
+
+        Applies the same selection as the thread mode followed by the
+        sequential orchestrator's reduction to one input per step.
+        """
+        sequences = np.empty((batch_size, horizon))
+        for i in range(batch_size):
+            controls = self._trajectory_controls(control_inputs, batch_size, i)
+            if controls.ndim == 1 and len(controls) == horizon:
+                sequences[i] = controls
+            elif controls.ndim == 2 and controls.shape[0] == horizon:
+                sequences[i] = controls[:, 0]
+            else:
+                sequences[i] = controls.flat[0]
+        return sequences
+
+    # ---------- Process mode ----------
+    def _executor(self) -> ProcessPoolExecutor:
+        executor = self._pool.get("executor")
+        if executor is None:
+            if not self._finalizer.alive:
+                raise RuntimeError("ParallelOrchestrator has been closed")
+            executor = ProcessPoolExecutor(
+                max_workers=self._n_workers(),
+                mp_context=mp.get_context(self.mp_context),
+                initializer=_init_worker,
+                initargs=(self.context,),
+            )
+            self._pool["executor"] = executor
+        return executor
+
+    def _n_workers(self) -> int:
+        return int(self.max_workers) if self.max_workers is not None else (os.cpu_count() or 1)
+
+    def _execute_process_batch(self,
+                               initial_states: np.ndarray,
+                               control_inputs: np.ndarray,
+                               dt: float,
+                               horizon: int,
+                               **kwargs) -> ResultContainer:
+        """Execute batch simulations as contiguous chunks on worker processes."""
+        batch_size, state_dim = initial_states.shape
+        sequences = self._control_sequences(control_inputs, batch_size, horizon)
+        t0 = kwargs.get("t0", 0.0)
+        executor = self._executor()
+        chunks = self._chunks(batch_size)
+
+        sizes = (batch_size * (horizon + 1) * state_dim, batch_size * horizon, batch_size)
+        blocks = [shared_memory.SharedMemory(create=True, size=max(size, 1) * 8) for size in sizes]
+        try:
+            states = np.ndarray((batch_size, horizon + 1, state_dim), dtype=np.float64, buffer=blocks[0].buf)
+            controls = np.ndarray((batch_size, horizon), dtype=np.float64, buffer=blocks[1].buf)
+            lengths = np.ndarray((batch_size,), dtype=np.int64, buffer=blocks[2].buf)
+
+            futures = []
+            for lo, hi in chunks:
+                task = {
+                    "names": [shm.name for shm in blocks],
+                    "shape": (batch_size, horizon, state_dim),
+                    "rows": (lo, hi),
+                    "initial_states": initial_states[lo:hi],
+                    "control_sequences": sequences[lo:hi],
+                    "dt": dt,
+                    "safety_guards": kwargs.get("safety_guards", True),
+                    "stop_fn": kwargs.get("stop_fn", None),
+                    "t0": t0,
+                }
+                futures.append(executor.submit(_simulate_chunk_task, task))
+
+            for (lo, hi), future in zip(chunks, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Simulation chunk {lo}:{hi} failed: {e}")
+                    lengths[lo:hi] = -1
+
+            times = np.linspace(t0, t0 + horizon * dt, horizon + 1)
+            batch_result = BatchResultContainer()
+            for index in range(batch_size):
+                n = int(lengths[index])
+                if n < 0:
+                    continue
+                batch_result.add_trajectory(states[index, :n + 1].copy(), times[:n + 1],
+                                            controls=controls[index, :n].copy(), batch_index=index)
+            del states, controls, lengths
+        finally:
+            for shm in blocks:
+                try:
+                    shm.close()
+                except BufferError:
+                    # A view is still referenced (e.g. by a traceback); the mapping is freed on exit.
+                    pass
+                shm.unlink()
+
+        return batch_result
+
+    def _chunks(self, batch_size: int) -> List[Tuple[int, int]]:
+        bounds = np.linspace(0, batch_size, min(self._n_workers(), batch_size) + 1).astype(int)
+        return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    # ---------- Lifecycle ----------
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        self._finalizer()
+
+    def __enter__(self) -> "ParallelOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 
 class WorkerPool:
     """Reusable worker pool for parallel simulations."""
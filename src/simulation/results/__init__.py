@@ -4,7 +4,7 @@
 
 """Result processing and management for simulation framework."""
 
-from .containers import StandardResultContainer, BatchResultContainer
+from .containers import StandardResultContainer, BatchResultContainer, RaggedBatchResultContainer
 from .processors import ResultProcessor
 from .exporters import CSVExporter, HDF5Exporter
 from .validators import ResultValidator
@@ -12,6 +12,7 @@ from .validators import ResultValidator
 __all__ = [
     "StandardResultContainer",
     "BatchResultContainer",
+    "RaggedBatchResultContainer",
     "ResultProcessor",
     "CSVExporter",
     "HDF5Exporter",
@@ -6,7 +6,9 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
 import numpy as np
 
 from ..core.interfaces import ResultContainer
@@ -114,4 +116,239 @@ class BatchResultContainer(ResultContainer):
 
     def get_batch_count(self) -> int:
         """Get number of batches."""
-        return len(self.batch_data)
\ No newline at end of file
+        return len(self.batch_data)
+
+    def to_ragged(self, storage: Optional[Union[str, Path]] = None) -> "RaggedBatchResultContainer":
+        """Pack the trajectories into a columnar :class:`RaggedBatchResultContainer`.
+
+        Trajectories are placed on the time grid of the longest one; shorter
+        ones are marked ``stopped``.  ``storage`` selects a memory-mapped
+        store as for :class:`RaggedBatchResultContainer`.
+        """
+        if not self.batch_data:
+            raise ValueError("No trajectories to pack")
+        indices = sorted(self.batch_data)
+        longest = max((self.batch_data[i] for i in indices), key=lambda d: len(d['states']))
+        packed = RaggedBatchResultContainer(
+            indices[-1] + 1, len(longest['states']) - 1, np.shape(longest['states'])[1],
+            times=longest['times'], storage=storage)
+        for i in indices:
+            data = self.batch_data[i]
+            packed.add_trajectory(data['states'], data['times'], batch_index=i,
+                                  controls=data['controls'])
+        packed.metadata.update(self.metadata)
+        packed.flush()
+        return packed
+
+
+class RaggedBatchResultContainer(ResultContainer):
+    """Batch results whose trajectories end at different steps.
+
+    Trajectories share one time grid and are stored densely: ``states`` of
+    shape ``(B, N+1, D)``, ``controls`` of shape ``(B, N)`` and optional
+    per-step ``extras`` (e.g. the sliding surface) of shape ``(B, N)``.
+    ``lengths[b]`` is the number of steps trajectory ``b`` completed and
+    ``status[b]`` records why it ended; entries past the end are NaN.
+    Per-trajectory accessors return views trimmed to the trajectory's own
+    length, and the container is accepted wherever a
+    :class:`BatchResultContainer` is (``get_states(batch_index)``,
+    ``batch_data``, exporters).
+
+    With ``storage`` the arrays are ``np.memmap``-backed ``.npy`` files in
+    that directory, so a batch writer fills them in place without holding
+    the batch in memory; :meth:`open` maps a stored batch back and its
+    accessors only read the slices they return.
+    """
+
+    COMPLETED, STOPPED, CONVERGED, DIVERGED, GUARD_VIOLATION, FAILED = range(6)
+    STATUS_NAMES = ("completed", "stopped", "converged", "diverged", "guard_violation", "failed")
+    MANIFEST = "manifest.json"
+
+    def __init__(self,
+                 batch_size: int,
+                 horizon: int,
+                 state_dim: int,
+                 times: Optional[np.ndarray] = None,
+                 extras: Sequence[str] = (),
+                 storage: Optional[Union[str, Path]] = None):
+        """Initialize ragged batch container.
+
+        Parameters
+        ----------
+        batch_size, horizon, state_dim : int
+            Dimensions ``B``, ``N`` and ``D`` of the dense storage
+        times : np.ndarray, optional
+            Shared time grid of length ``N+1`` (default: step indices)
+        extras : sequence of str
+            Names of additional per-step ``(B, N)`` arrays
+        storage : str or Path, optional
+            Directory for memory-mapped arrays (created if missing); arrays
+            are held in memory when omitted
+        """
+        self.storage = None if storage is None else Path(storage)
+        if self.storage is not None:
+            self.storage.mkdir(parents=True, exist_ok=True)
+        self.times = self._allocate("times", (horizon + 1,), np.float64, np.nan)
+        self.times[:] = np.arange(horizon + 1) if times is None else times
+        self.states = self._allocate("states", (batch_size, horizon + 1, state_dim), np.float64, np.nan)
+        self.controls = self._allocate("controls", (batch_size, horizon), np.float64, np.nan)
+        self.extras = {name: self._allocate(f"extra_{name}", (batch_size, horizon), np.float64, np.nan)
+                       for name in extras}
+        self.lengths = self._allocate("lengths", (batch_size,), np.int64, horizon)
+        self.status = self._allocate("status", (batch_size,), np.int8, self.COMPLETED)
+        self.metadata = {}
+        self._write_manifest()
+
+    def _allocate(self, name: str, shape: tuple, dtype, fill) -> np.ndarray:
+        """Array filled with ``fill``, memory-mapped under ``storage`` if set."""
+        if self.storage is None:
+            return np.full(shape, fill, dtype=dtype)
+        array = np.lib.format.open_memmap(self.storage / f"{name}.npy", mode="w+",
+                                          dtype=dtype, shape=shape)
+        array[...] = fill
+        return array
+
+    def _write_manifest(self) -> None:
+        if self.storage is None:
+            return
+        manifest = {
+            'extras': list(self.extras),
+            'metadata': {k: v for k, v in self.metadata.items()
+                         if isinstance(v, (bool, int, float, str))},
+        }
+        (self.storage / self.MANIFEST).write_text(json.dumps(manifest))
+
+    @classmethod
+    def open(cls, storage: Union[str, Path], mode: str = "r") -> "RaggedBatchResultContainer":
+        """Map a batch stored by a container created with ``storage``.
+
+        Parameters
+        ----------
+        storage : str or Path
+            Directory the batch was written to
+        mode : {'r', 'r+', 'c'}
+            ``np.load`` memory-map mode (read-only, read-write, copy-on-write)
+        """
+        storage = Path(storage)
+        manifest = json.loads((storage / cls.MANIFEST).read_text())
+
+        def load(name):
+            return np.load(storage / f"{name}.npy", mmap_mode=mode)
+
+        container = object.__new__(cls)
+        container.storage = storage
+        container.times = load("times")
+        container.states = load("states")
+        container.controls = load("controls")
+        container.extras = {name: load(f"extra_{name}") for name in manifest['extras']}
+        container.lengths = load("lengths")
+        container.status = load("status")
+        container.metadata = manifest['metadata']
+        return container
+
+    def flush(self) -> None:
+        """Write memory-mapped arrays and scalar metadata to ``storage``."""
+        if self.storage is None:
+            return
+        for array in (self.times, self.states, self.controls, self.lengths, self.status,
+                      *self.extras.values()):
+            if isinstance(array, np.memmap):
+                array.flush()
+        self._write_manifest()
+
+    @property
+    def batch_size(self) -> int:
+        return self.states.shape[0]
+
+    @property
+    def horizon(self) -> int:
+        return self.controls.shape[1]
+
+    def end_trajectory(self, batch_index, length, status: int) -> None:
+        """Mark trajectories as ended after ``length`` steps and blank the rest."""
+        rows = np.atleast_1d(batch_index)
+        lengths = np.broadcast_to(np.asarray(length, dtype=np.int64), rows.shape)
+        self.lengths[rows] = lengths
+        self.status[rows] = status
+        for b, n in zip(rows, lengths):
+            self.states[b, n + 1:] = np.nan
+            self.controls[b, n:] = np.nan
+            for values in self.extras.values():
+                values[b, n:] = np.nan
+
+    def add_trajectory(self, states: np.ndarray, times: np.ndarray, **metadata) -> None:
+        """Write one trajectory of ``len(states) - 1`` steps into its row."""
+        batch_index = metadata.get('batch_index', 0)
+        length = len(states) - 1
+        self.states[batch_index, :length + 1] = states
+        controls = metadata.get('controls')
+        if controls is not None:
+            self.controls[batch_index, :length] = np.asarray(controls).reshape(-1)[:length]
+        for name, values in self.extras.items():
+            if metadata.get(name) is not None:
+                values[batch_index, :length] = metadata[name]
+        status = metadata.get('status', self.COMPLETED if length == self.horizon else self.STOPPED)
+        self.end_trajectory(batch_index, length, status)
+
+    def get_states(self, batch_index: Optional[int] = None) -> np.ndarray:
+        """States of one trajectory, or the padded ``(B, N+1, D)`` array."""
+        if batch_index is None:
+            return self.states
+        return self.states[batch_index, :self.lengths[batch_index] + 1]
+
+    def get_times(self, batch_index: Optional[int] = None) -> np.ndarray:
+        """Time vector of one trajectory, or the shared grid."""
+        if batch_index is None:
+            return self.times
+        return self.times[:self.lengths[batch_index] + 1]
+
+    def get_controls(self, batch_index: Optional[int] = None) -> np.ndarray:
+        """Controls of one trajectory, or the padded ``(B, N)`` array."""
+        if batch_index is None:
+            return self.controls
+        return self.controls[batch_index, :self.lengths[batch_index]]
+
+    def get_extra(self, name: str, batch_index: Optional[int] = None) -> np.ndarray:
+        """Per-step extra array of one trajectory, or the padded ``(B, N)`` array."""
+        values = self.extras[name]
+        if batch_index is None:
+            return values
+        return values[batch_index, :self.lengths[batch_index]]
+
+    def get_status(self, batch_index: int) -> str:
+        """Why trajectory ``batch_index`` ended."""
+        return self.STATUS_NAMES[self.status[batch_index]]
+
+    def get_batch_count(self) -> int:
+        """Get number of batches."""
+        return self.batch_size
+
+    @property
+    def batch_data(self) -> Dict[int, Dict[str, Any]]:
+        """Per-trajectory views in the :class:`BatchResultContainer` layout."""
+        return {
+            b: {
+                'states': self.get_states(b),
+                'times': self.get_times(b),
+                'controls': self.get_controls(b),
+                'metadata': {'status': self.get_status(b)},
+            }
+            for b in range(self.batch_size)
+        }
+
+    def copy(self) -> "RaggedBatchResultContainer":
+        """In-memory deep copy of the arrays and metadata."""
+        other = object.__new__(type(self))
+        other.storage = None
+        other.times = np.array(self.times)
+        other.states = np.array(self.states)
+        other.controls = np.array(self.controls)
+        other.extras = {name: np.array(values) for name, values in self.extras.items()}
+        other.lengths = np.array(self.lengths)
+        other.status = np.array(self.status)
+        other.metadata = dict(self.metadata)
+        return other
+
+    def export(self, format_type: str, filepath: str) -> None:
+        """Export batch results to specified format."""
+        BatchResultContainer.export(self, format_type, filepath)
@@ -10,6 +10,12 @@ import csv
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+
+# Trajectories copied per block when writing a columnar batch to HDF5
+_HDF5_BLOCK = 256
+
 
 class CSVExporter:
     """Export simulation results to CSV format."""
@@ -22,20 +28,21 @@ class CSVExporter:
         with open(filepath, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
 
+            controls = getattr(result_container, 'controls', None)
+
             # Write header
             state_cols = [f'state_{i}' for i in range(states.shape[1])]
             header = ['time'] + state_cols
-            if hasattr(result_container, 'controls') and result_container.controls is not None:
+            if controls is not None:
                 header.append('control')
             writer.writerow(header)
 
-            # Write data
-            for i, (t, state) in enumerate(zip(times, states)):
-                row = [t] + state.tolist()
-                if hasattr(result_container, 'controls') and result_container.controls is not None:
-                    if i < len(result_container.controls):
-                        row.append(result_container.controls[i])
-                writer.writerow(row)
+            # Write data; the last state has no control
+            rows = np.column_stack((times, states)).tolist()
+            if controls is not None:
+                for row, control in zip(rows, controls):
+                    row.append(control)
+            writer.writerows(rows)
 
     def export_batch(self, batch_container: Any, filepath: str) -> None:
         """Export batch simulation results to CSV."""
@@ -48,7 +55,10 @@ class CSVExporter:
             temp_container = type('TempContainer', (), {})()
             temp_container.get_states = lambda: batch_container.get_states(batch_idx)
             temp_container.get_times = lambda: batch_container.get_times(batch_idx)
-            temp_container.controls = batch_container.batch_data.get(batch_idx, {}).get('controls')
+            if hasattr(batch_container, 'get_controls'):
+                temp_container.controls = batch_container.get_controls(batch_idx)
+            else:
+                temp_container.controls = batch_container.batch_data.get(batch_idx, {}).get('controls')
 
             self.export(temp_container, str(batch_filepath))
 
@@ -78,12 +88,24 @@ class HDF5Exporter:
                         metadata_group.attrs[key] = value
 
     def export_batch(self, batch_container: Any, filepath: str) -> None:
-        """Export batch simulation results to HDF5."""
+        """Export batch simulation results to HDF5.
+
+        Columnar containers (:class:`RaggedBatchResultContainer`) are written
+        as one chunked dataset per field (``states`` ``(B, N+1, D)``,
+        ``controls``, ``lengths``, ``status`` and the extras), copied a block
+        of trajectories at a time so memory-mapped batches are never loaded
+        whole.  Other containers get one ``batch_<i>`` group per trajectory.
+        """
         try:
             import h5py
         except ImportError:
             raise ImportError("h5py required for HDF5 export")
 
+        if hasattr(batch_container, 'lengths'):
+            with h5py.File(filepath, 'w') as f:
+                self._write_columnar(f, batch_container)
+            return
+
         with h5py.File(filepath, 'w') as f:
             for batch_idx in range(batch_container.get_batch_count()):
                 batch_group = f.create_group(f'batch_{batch_idx}')
@@ -92,4 +114,25 @@ class HDF5Exporter:
 
                 batch_data = batch_container.batch_data.get(batch_idx, {})
                 if batch_data.get('controls') is not None:
-                    batch_group.create_dataset('controls', data=batch_data['controls'])
\ No newline at end of file
+                    batch_group.create_dataset('controls', data=batch_data['controls'])
+
+    def _write_columnar(self, f: Any, batch_container: Any) -> None:
+        """Write a ragged batch as per-field datasets chunked by trajectory."""
+        f.attrs['layout'] = 'columnar'
+        f.attrs['status_names'] = list(batch_container.STATUS_NAMES)
+        f.create_dataset('times', data=np.asarray(batch_container.times))
+        f.create_dataset('lengths', data=np.asarray(batch_container.lengths))
+        f.create_dataset('status', data=np.asarray(batch_container.status))
+
+        fields = {'states': batch_container.states, 'controls': batch_container.controls}
+        fields.update({f'extras/{name}': values for name, values in batch_container.extras.items()})
+        for name, values in fields.items():
+            dataset = f.create_dataset(name, shape=values.shape, dtype=values.dtype,
+                                       chunks=(1,) + values.shape[1:] if values.size else None)
+            for start in range(0, values.shape[0], _HDF5_BLOCK):
+                dataset[start:start + _HDF5_BLOCK] = values[start:start + _HDF5_BLOCK]
+
+        metadata_group = f.create_group('metadata')
+        for key, value in batch_container.metadata.items():
+            if isinstance(value, (int, float, str)):
+                metadata_group.attrs[key] = value
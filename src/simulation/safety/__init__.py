@@ -9,7 +9,12 @@ from .guards import (
     guard_no_nan,
     guard_energy,
     guard_bounds,
-    SafetyViolationError
+    SafetyViolationError,
+    BatchSafetyGuard,
+    nan_mask,
+    energy_mask,
+    bounds_mask,
+    rowwise_mask
 )
 from .constraints import (
     StateConstraints,
@@ -34,6 +39,11 @@ __all__ = [
     "guard_energy",
     "guard_bounds",
     "SafetyViolationError",
+    "BatchSafetyGuard",
+    "nan_mask",
+    "energy_mask",
+    "bounds_mask",
+    "rowwise_mask",
     "StateConstraints",
     "ControlConstraints",
     "EnergyConstraints",
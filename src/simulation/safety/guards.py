@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 import numpy as np
-from typing import Any, Tuple, Optional, Dict
+from typing import Any, Callable, Tuple, Optional, Dict
 
 from ..core.interfaces import SafetyGuard
 
@@ -239,6 +239,118 @@ def apply_safety_guards(state: np.ndarray, step_idx: int, config: Any) -> None:
             guard_bounds(state, bounds, step_idx * 0.01)  # Approximate time
 
 
+# Vectorized guards: one mask over a (B, D) batch, True where a row violates
+def nan_mask(states: np.ndarray) -> np.ndarray:
+    """Rows of ``states`` containing NaN or infinite values."""
+    return ~np.isfinite(states).all(axis=-1)
+
+
+def energy_mask(states: np.ndarray, max_energy: float) -> np.ndarray:
+    """Rows whose energy ``sum(x**2)`` exceeds ``max_energy`` (as :func:`guard_energy`)."""
+    return np.einsum("...i,...i->...", states, states) > max_energy
+
+
+def bounds_mask(states: np.ndarray,
+                lower: Optional[np.ndarray],
+                upper: Optional[np.ndarray]) -> np.ndarray:
+    """Rows with any component outside ``[lower, upper]`` (None disables a side)."""
+    mask = np.zeros(states.shape[:-1], dtype=bool)
+    if lower is not None:
+        mask |= (states < lower).any(axis=-1)
+    if upper is not None:
+        mask |= (states > upper).any(axis=-1)
+    return mask
+
+
+class BatchSafetyGuard:
+    """NaN, energy and bounds guards evaluated on a whole batch at once.
+
+    Limits are converted to arrays once; calling the guard on a ``(B, D)``
+    state array returns a ``(B,)`` mask that is True for the rows violating
+    any guard, so callers can deactivate those trajectories individually.
+    The checks match :func:`guard_no_nan`, :func:`guard_energy` and
+    :func:`guard_bounds`.
+    """
+
+    def __init__(self,
+                 max_energy: Optional[float] = None,
+                 state_bounds: Optional[Tuple[Any, Any]] = None,
+                 check_nan: bool = True):
+        """Initialize batch guard.
+
+        Parameters
+        ----------
+        max_energy : float, optional
+            Maximum allowed ``sum(state**2)``; no energy guard if None
+        state_bounds : tuple, optional
+            ``(lower, upper)`` bounds broadcastable to a state; either side
+            may be None
+        check_nan : bool, optional
+            Whether non-finite rows are flagged (default True)
+        """
+        self.check_nan = check_nan
+        self.max_energy = None if max_energy is None else float(max_energy)
+        lower, upper = state_bounds if state_bounds is not None else (None, None)
+        self.lower = None if lower is None else np.asarray(lower, dtype=float)
+        self.upper = None if upper is None else np.asarray(upper, dtype=float)
+
+    @classmethod
+    def from_config(cls,
+                    config: Any,
+                    energy_limits: Optional[Any] = None,
+                    state_bounds: Optional[Tuple[Any, Any]] = None) -> "BatchSafetyGuard":
+        """Build the guards :func:`apply_safety_guards` reads from ``config``.
+
+        Explicit ``energy_limits`` (a float or a dict with ``'max'``) and
+        ``state_bounds`` take precedence over the configuration.
+        """
+        safety_settings = getattr(getattr(config, 'simulation', {}), 'safety', None)
+        if energy_limits is None and safety_settings:
+            energy_limits = getattr(safety_settings, 'energy_limits', None)
+        if state_bounds is None and safety_settings:
+            state_bounds = getattr(safety_settings, 'state_bounds', None)
+
+        if isinstance(energy_limits, dict):
+            energy_limits = energy_limits.get('max')
+        if state_bounds is not None and hasattr(state_bounds, 'lower') and hasattr(state_bounds, 'upper'):
+            state_bounds = (state_bounds.lower, state_bounds.upper)
+        return cls(max_energy=energy_limits, state_bounds=state_bounds or None)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any guard is active."""
+        return (self.check_nan or self.max_energy is not None
+                or self.lower is not None or self.upper is not None)
+
+    def __call__(self, states: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Violation mask of shape ``states.shape[:-1]``.
+
+        ``rows`` gives the batch rows that ``states`` holds when it is a
+        subset of the batch; per-row ``(B, D)`` bounds are indexed with it.
+        """
+        states = np.asarray(states, dtype=float)
+        mask = nan_mask(states) if self.check_nan else np.zeros(states.shape[:-1], dtype=bool)
+        if self.max_energy is not None:
+            mask |= energy_mask(states, self.max_energy)
+        if self.lower is not None or self.upper is not None:
+            mask |= bounds_mask(states, _bound_rows(self.lower, rows), _bound_rows(self.upper, rows))
+        return mask
+
+
+def _bound_rows(bound: Optional[np.ndarray], rows: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """Select ``rows`` of a per-row ``(B, D)`` bound; other bounds pass through."""
+    if bound is None or rows is None or bound.ndim < 2:
+        return bound
+    return bound[rows]
+
+
+def rowwise_mask(predicate: Callable[[np.ndarray], bool]) -> Callable[[np.ndarray], np.ndarray]:
+    """Adapt a per-state predicate ``predicate(state) -> bool`` to the batch mask API."""
+    def mask_fn(states: np.ndarray) -> np.ndarray:
+        return np.fromiter((bool(predicate(state)) for state in states), dtype=bool, count=len(states))
+    return mask_fn
+
+
 # Legacy functions with original names for backward compatibility
 _guard_no_nan = guard_no_nan
 _guard_energy = guard_energy
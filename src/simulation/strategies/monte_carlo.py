@@ -6,16 +6,65 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional
+import math
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import numpy as np
 
 from ..core.interfaces import SimulationStrategy
+from ...utils.testing.reproducibility import SeedManager
 
 
-class MonteCarloStrategy(SimulationStrategy):
-    """Monte Carlo simulation strategy for statistical analysis."""
+EXECUTION_MODES = ("thread", "process")
+
+
+def _evaluate_sample(simulation_fn: Callable, params: Dict[str, Any], kwargs: Dict[str, Any]) -> Any:
+    try:
+        return simulation_fn(params, **kwargs)
+    except Exception:
+        return None  # Failed simulation
+
 
-    def __init__(self, n_samples: int = 1000, parallel: bool = True, max_workers: Optional[int] = None):
+def _run_chunk(simulation_fn: Callable,
+               param_sets: List[Dict[str, Any]],
+               kwargs: Dict[str, Any]) -> Tuple[List[Any], float]:
+    """Evaluate a contiguous chunk of samples; returns results and compute time."""
+    start = time.perf_counter()
+    results = [_evaluate_sample(simulation_fn, params, kwargs) for params in param_sets]
+    return results, time.perf_counter() - start
+
+
+class MonteCarloStrategy(SimulationStrategy):
+    """Monte Carlo simulation strategy for statistical analysis.
+
+    Every sample gets its own seed from a :class:`SeedManager`; its
+    parameters are drawn from a generator seeded with it, and the seed can be
+    handed to the simulation through ``seed_param``.  Samples therefore do
+    not depend on how they are scheduled, and the parallel and sequential
+    paths produce identical results.
+
+    In parallel mode samples are submitted in contiguous chunks, keeping one
+    chunk in flight per worker.  The first chunks hold a single sample;
+    later ones are sized from the measured per-sample cost so that each
+    takes about ``target_chunk_time`` seconds, capped at an even share of
+    the remaining samples.  Results are reassembled in sample order.
+    ``"process"`` mode requires a picklable ``simulation_fn`` (a
+    module-level function).
+    """
+
+    def __init__(self,
+                 n_samples: int = 1000,
+                 parallel: bool = True,
+                 max_workers: Optional[int] = None,
+                 *,
+                 mode: str = "thread",
+                 seed: Optional[int] = None,
+                 seed_param: Optional[str] = None,
+                 target_chunk_time: float = 0.1,
+                 progress_callback: Optional[Callable[[int, int, float], None]] = None):
         """Initialize Monte Carlo strategy.
 
         Parameters
@@ -25,11 +74,33 @@ class MonteCarloStrategy(SimulationStrategy):
         parallel : bool, optional
             Whether to use parallel execution
         max_workers : int, optional
-            Maximum number of parallel workers
+            Maximum number of parallel workers (default: CPU count)
+        mode : str, optional
+            ``"thread"`` (default) or ``"process"`` workers
+        seed : int, optional
+            Master seed for the per-sample seeds; if None it is drawn from
+            NumPy's global generator, so ``set_global_seed`` still applies
+        seed_param : str, optional
+            Parameter name under which each sample's seed is passed to
+            ``simulation_fn`` (not passed if None)
+        target_chunk_time : float, optional
+            Target compute time per parallel chunk in seconds
+        progress_callback : callable, optional
+            Called as ``callback(completed, total, samples_per_second)``
+            after each completed chunk (each sample when sequential)
         """
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"mode must be one of {EXECUTION_MODES}, got {mode!r}")
+        if target_chunk_time <= 0:
+            raise ValueError("target_chunk_time must be positive")
         self.n_samples = n_samples
         self.parallel = parallel
         self.max_workers = max_workers
+        self.mode = mode
+        self.seed = seed
+        self.seed_param = seed_param
+        self.target_chunk_time = target_chunk_time
+        self.progress_callback = progress_callback
 
     def analyze(self,
                simulation_fn: Callable,
@@ -55,33 +126,38 @@ class MonteCarloStrategy(SimulationStrategy):
         param_distributions = parameters.get('distributions', {})
         fixed_params = parameters.get('fixed', {})
 
-        # Generate samples
-        samples = self._generate_samples(param_distributions)
+        # Generate samples, one seed per sample
+        master_seed = self.seed if self.seed is not None else int(np.random.randint(0, 2**31 - 1))
+        seed_manager = SeedManager(master_seed)
+        seeds = [seed_manager.spawn() for _ in range(self.n_samples)]
+        samples = self._generate_samples(param_distributions, seeds)
 
         # Run simulations
         if self.parallel:
-            results = self._run_parallel_simulations(simulation_fn, samples, fixed_params, **kwargs)
+            results = self._run_parallel_simulations(simulation_fn, samples, fixed_params, seeds, **kwargs)
         else:
-            results = self._run_sequential_simulations(simulation_fn, samples, fixed_params, **kwargs)
+            results = self._run_sequential_simulations(simulation_fn, samples, fixed_params, seeds, **kwargs)
 
         # Analyze results
         analysis = self._analyze_results(results, samples)
+        analysis['master_seed'] = master_seed
 
         return analysis
 
-    def _generate_samples(self, distributions: Dict[str, Any]) -> List[Dict[str, float]]:
-        """Generate Monte Carlo parameter samples."""
+    def _generate_samples(self, distributions: Dict[str, Any], seeds: List[int]) -> List[Dict[str, float]]:
+        """Generate Monte Carlo parameter samples, drawing sample ``i`` from ``seeds[i]``."""
         samples = []
 
-        for _ in range(self.n_samples):
+        for seed in seeds:
+            rng = np.random.default_rng(seed)
             sample = {}
             for param_name, distribution in distributions.items():
                 if distribution['type'] == 'normal':
-                    sample[param_name] = np.random.normal(
+                    sample[param_name] = rng.normal(
                         distribution['mean'], distribution['std']
                     )
                 elif distribution['type'] == 'uniform':
-                    sample[param_name] = np.random.uniform(
+                    sample[param_name] = rng.uniform(
                         distribution['low'], distribution['high']
                     )
                 elif distribution['type'] == 'constant':
@@ -93,22 +169,53 @@ class MonteCarloStrategy(SimulationStrategy):
 
         return samples
 
+    def _param_sets(self,
+                    samples: List[Dict[str, float]],
+                    fixed_params: Dict[str, Any],
+                    seeds: List[int]) -> List[Dict[str, Any]]:
+        param_sets = []
+        for sample, seed in zip(samples, seeds):
+            combined_params = {**fixed_params, **sample}
+            if self.seed_param is not None:
+                combined_params[self.seed_param] = seed
+            param_sets.append(combined_params)
+        return param_sets
+
     def _run_parallel_simulations(self,
                                  simulation_fn: Callable,
                                  samples: List[Dict[str, float]],
                                  fixed_params: Dict[str, Any],
+                                 seeds: List[int],
                                  **kwargs) -> List[Any]:
-        """Run simulations in parallel."""
-        # This would integrate with the parallel orchestrator
-        # For now, simplified implementation
-        results = []
-        for sample in samples:
-            combined_params = {**fixed_params, **sample}
-            try:
-                result = simulation_fn(combined_params, **kwargs)
-                results.append(result)
-            except Exception:
-                results.append(None)  # Failed simulation
+        """Run simulations in parallel in adaptively sized chunks."""
+        param_sets = self._param_sets(samples, fixed_params, seeds)
+        total = len(param_sets)
+        n_workers = self._n_workers()
+        results: List[Any] = [None] * total
+        cost = None  # Smoothed compute time per sample
+        completed, next_index = 0, 0
+        start = time.perf_counter()
+
+        with self._executor(n_workers) as executor:
+            pending = {}
+            while next_index < total or pending:
+                while next_index < total and len(pending) < n_workers:
+                    size = self._chunk_size(cost, total - next_index, n_workers)
+                    lo, hi = next_index, next_index + size
+                    future = executor.submit(_run_chunk, simulation_fn, param_sets[lo:hi], kwargs)
+                    pending[future] = (lo, hi)
+                    next_index = hi
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: pending[f][0]):
+                    lo, hi = pending.pop(future)
+                    chunk_results, elapsed = future.result()
+                    results[lo:hi] = chunk_results
+
+                    per_sample = elapsed / (hi - lo)
+                    cost = per_sample if cost is None else 0.5 * (cost + per_sample)
+                    completed += hi - lo
+                    self._report_progress(completed, total, start)
 
         return results
 
@@ -116,19 +223,41 @@ class MonteCarloStrategy(SimulationStrategy):
                                    simulation_fn: Callable,
                                    samples: List[Dict[str, float]],
                                    fixed_params: Dict[str, Any],
+                                   seeds: List[int],
                                    **kwargs) -> List[Any]:
         """Run simulations sequentially."""
+        param_sets = self._param_sets(samples, fixed_params, seeds)
         results = []
-        for sample in samples:
-            combined_params = {**fixed_params, **sample}
-            try:
-                result = simulation_fn(combined_params, **kwargs)
-                results.append(result)
-            except Exception:
-                results.append(None)  # Failed simulation
+        start = time.perf_counter()
+        for params in param_sets:
+            results.append(_evaluate_sample(simulation_fn, params, kwargs))
+            self._report_progress(len(results), len(param_sets), start)
 
         return results
 
+    def _chunk_size(self, cost: Optional[float], remaining: int, n_workers: int) -> int:
+        """Samples in the next chunk given the per-sample cost (None before any measurement)."""
+        if cost is None:
+            return 1
+        fair_share = math.ceil(remaining / n_workers)
+        if cost <= 0:
+            return fair_share
+        return max(1, min(int(self.target_chunk_time / cost), fair_share))
+
+    def _n_workers(self) -> int:
+        return int(self.max_workers) if self.max_workers is not None else (os.cpu_count() or 1)
+
+    def _executor(self, n_workers: int):
+        if self.mode == "process":
+            # spawn: numba's parallel kernels are not fork-safe once started
+            return ProcessPoolExecutor(max_workers=n_workers, mp_context=mp.get_context("spawn"))
+        return ThreadPoolExecutor(max_workers=n_workers)
+
+    def _report_progress(self, completed: int, total: int, start: float) -> None:
+        if self.progress_callback is not None:
+            elapsed = time.perf_counter() - start
+            self.progress_callback(completed, total, completed / elapsed if elapsed > 0 else float('inf'))
+
     def _analyze_results(self, results: List[Any], samples: List[Dict[str, float]]) -> Dict[str, Any]:
         """Analyze Monte Carlo results."""
         # Filter successful results
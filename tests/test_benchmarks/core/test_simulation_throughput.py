@@ -303,4 +303,69 @@ def test_timestep_performance_scaling(dt, config):
         assert time_per_step < 1e-3, f"Too slow: {time_per_step*1000:.3f}ms per step"
 
     except Exception as e:
-        pytest.skip(f"Timestep test failed for dt={dt}: {e}")
\ No newline at end of file
+        pytest.skip(f"Timestep test failed for dt={dt}: {e}")
+
+
+@pytest.mark.parametrize("engine", ["loop", "vectorized"])
+def test_batch_engine_throughput(engine, benchmark):
+    """Benchmark particle-steps per second of the batch engines."""
+    try:
+        from src.controllers.smc.classic_smc import ClassicalSMC
+        from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+    except Exception:
+        pytest.skip("Classical SMC or simplified plant not available")
+
+    dynamics = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+
+    def factory(p):
+        ctrl = ClassicalSMC(p, max_force=150.0, boundary_layer=0.02)
+        ctrl.dynamics_model = dynamics
+        return ctrl
+
+    batch_size = 20
+    dt = 0.01
+    sim_time = 1.0
+    gains = _default_gains_for("classical_smc", None)
+    particles = np.tile(gains, (batch_size, 1)) * np.linspace(0.8, 1.2, batch_size)[:, None]
+    initial_state = np.array([0.0, 0.1, 0.05, 0.0, 0.0, 0.0])
+
+    def run_batch():
+        return simulate_system_batch(
+            controller_factory=factory,
+            particles=particles,
+            sim_time=sim_time,
+            dt=dt,
+            initial_state=initial_state,
+            engine=engine,
+        )
+
+    run_batch()  # exclude JIT compilation from the measurement
+    t, x_b, u_b, sigma_b = benchmark(run_batch)
+    assert x_b.shape == (batch_size, int(round(sim_time / dt)) + 1, 6)
+    benchmark.extra_info["particle_steps"] = int(batch_size * u_b.shape[1])
+
+
+@pytest.mark.parametrize("step_mode", ["default", "trusted"])
+def test_plant_step_throughput(step_mode, benchmark):
+    """Benchmark single plant steps: validated step() vs compiled trusted step."""
+    try:
+        from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+    except Exception:
+        pytest.skip("Simplified plant not available")
+
+    dynamics = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+    if step_mode == "trusted":
+        dynamics.enable_trusted_step()
+    state = np.array([0.0, 0.1, -0.05, 0.0, 0.2, 0.1])
+    n_steps = 1000
+
+    def run_steps():
+        x = state
+        for _ in range(n_steps):
+            x = dynamics.step(x, 1.0, 0.001)
+        return x
+
+    run_steps()  # exclude JIT compilation from the measurement
+    x = benchmark(run_steps)
+    assert np.all(np.isfinite(x))
+    benchmark.extra_info["steps"] = n_steps
@@ -0,0 +1,125 @@
+#======================================================================================\
+#============== tests/test_controllers/factory/test_prepared_factory.py ===============\
+#======================================================================================\
+
+"""
+Tests for PreparedControllerFactory.
+
+The prepared factory must build the same controllers as create_controller()
+while resolving configuration once and never taking the factory lock per call.
+"""
+
+import pickle
+import warnings
+
+import numpy as np
+import pytest
+
+from src.config import load_config
+from src.controllers.factory import PreparedControllerFactory, create_controller
+from src.controllers.factory import base
+
+
+GAINS = {
+    'classical_smc': [20.0, 15.0, 12.0, 8.0, 35.0, 5.0],
+    'sta_smc': [25.0, 15.0, 20.0, 12.0, 8.0, 6.0],
+    'adaptive_smc': [25.0, 18.0, 15.0, 10.0, 4.0],
+    'hybrid_adaptive_sta_smc': [18.0, 12.0, 10.0, 8.0],
+}
+
+
+def _control_sequence(controller, steps=5):
+    u = []
+    for k in range(steps):
+        x = np.array([0.0, 0.1, -0.05, 0.0, 0.2, 0.1]) * (1.0 + 0.1 * k)
+        u.append(controller.compute_control(x, {}, {})['u'])
+    return np.array(u, dtype=float)
+
+
+@pytest.fixture(scope="module")
+def config():
+    return load_config("config.yaml")
+
+
+@pytest.fixture(autouse=True)
+def quiet_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        yield
+
+
+class TestPreparedControllerFactory:
+    """Prepared factories are equivalent to create_controller."""
+
+    @pytest.mark.parametrize("controller_type", list(GAINS))
+    def test_matches_create_controller(self, config, controller_type):
+        factory = PreparedControllerFactory(controller_type, config)
+        gains = np.array(GAINS[controller_type])
+
+        expected = create_controller(controller_type, config, gains)
+        controller = factory(gains)
+
+        assert type(controller) is type(expected)
+        assert factory.n_gains == len(gains)
+        np.testing.assert_array_equal(_control_sequence(controller), _control_sequence(expected))
+
+    def test_calls_do_not_take_factory_lock(self, config, monkeypatch):
+        factory = PreparedControllerFactory('classical_smc', config)
+        monkeypatch.setattr(base, '_factory_lock', None)
+
+        controllers = [factory(np.array(GAINS['classical_smc']) * s) for s in (1.0, 1.5, 2.0)]
+
+        assert len({id(c) for c in controllers}) == 3
+
+    def test_controllers_get_private_dynamics_models(self, config):
+        factory = PreparedControllerFactory('classical_smc', config)
+        factory.dynamics_model.enable_trusted_step()
+        models = [factory(GAINS['classical_smc']).config.dynamics_model for _ in range(2)]
+        a, b = models
+
+        assert a is not b and a is not factory.dynamics_model
+        assert a.physics is factory.dynamics_model.physics
+        assert a._stability_monitor is not b._stability_monitor
+        assert a._trusted_plan[4] is not b._trusted_plan[4]
+        assert a.trusted_step_enabled
+
+        x = np.array([0.0, 0.1, -0.05, 0.0, 0.2, 0.1])
+        np.testing.assert_array_equal(a.step(x, 1.0, 0.01), factory.dynamics_model.step(x, 1.0, 0.01))
+
+    def test_pickle_round_trip(self, config):
+        factory = pickle.loads(pickle.dumps(PreparedControllerFactory('adaptive_smc', config)))
+
+        assert factory.controller_type == 'adaptive_smc'
+        np.testing.assert_array_equal(
+            _control_sequence(factory(GAINS['adaptive_smc'])),
+            _control_sequence(create_controller('adaptive_smc', config, GAINS['adaptive_smc'])),
+        )
+
+    def test_aliases_are_canonicalized(self, config):
+        assert PreparedControllerFactory('classic_smc', config).controller_type == 'classical_smc'
+
+    def test_config_gains_used_when_none_given(self, config):
+        factory = PreparedControllerFactory('classical_smc', config)
+
+        np.testing.assert_array_equal(
+            _control_sequence(factory(None)),
+            _control_sequence(create_controller('classical_smc', config)),
+        )
+
+    def test_invalid_default_gains_fall_back_like_create_controller(self, monkeypatch):
+        invalid = [25.0, 15.0, 20.0]  # too few gains
+
+        def validate(gains, *args):
+            if len(gains) != 6:
+                raise ValueError("wrong gain count")
+
+        monkeypatch.setattr(base, 'validate_controller_gains', validate)
+        monkeypatch.setattr(base, '_resolve_controller_gains',
+                            lambda gains, *args: invalid if gains is None else gains)
+        factory = PreparedControllerFactory('sta_smc')
+
+        expected = create_controller('sta_smc')
+        np.testing.assert_array_equal(factory(None).gains, expected.gains)
+        np.testing.assert_array_equal(factory(None).gains, GAINS['sta_smc'])
+        with pytest.raises(ValueError):
+            factory(invalid)
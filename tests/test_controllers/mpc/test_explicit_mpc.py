@@ -0,0 +1,155 @@
+#======================================================================================\\\
+#================== tests/test_controllers/mpc/test_explicit_mpc.py ===================\\\
+#======================================================================================\\\
+
+"""
+Tests for the condensed MPC QP, its active-set solver and explicit MPC.
+
+SINGLE JOB: Check that the explicit region table reproduces the optimal
+first move of the condensed QP, that it is persisted and reloaded, and that
+MPCController uses it with an online fallback for uncovered states.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.controllers.mpc.condensed_qp import condense_mpc_qp, solve_qp_active_set
+from src.controllers.mpc.explicit_mpc import ExplicitMPCTable
+from src.controllers.mpc.mpc_controller import (
+    MPCController,
+    _UPRIGHT,
+    _discretize_exact,
+    _linearize_continuous,
+)
+
+from .test_mpc_constraints_solver import MockDynamics
+
+
+HORIZON = 6
+BOX = np.array([0.5, 0.2, 0.2, 0.5, 1.0, 1.0])
+BUILD = dict(state_box=BOX, n_samples=600, n_validation=100)
+
+
+@pytest.fixture(scope="module")
+def qp():
+    mpc = MPCController(MockDynamics(), horizon=HORIZON, dt=0.02)
+    Ac, Bc = _linearize_continuous(mpc.model, _UPRIGHT, 0.0)
+    Ad, Bd = _discretize_exact(Ac, Bc, mpc.dt)
+    Q, R = mpc._cost_weights()
+    return condense_mpc_qp(Ad, Bd, Q, R, HORIZON, mpc.max_force,
+                           state_bounds=[(0, mpc.max_cart_pos), (1, mpc.max_theta_dev),
+                                         (2, mpc.max_theta_dev)])
+
+
+@pytest.fixture(scope="module")
+def table(qp):
+    return ExplicitMPCTable.build(qp, BOX, _UPRIGHT, np.array([1.0]), n_samples=600, n_validation=100)
+
+
+def _samples(n, seed=4):
+    return np.random.default_rng(seed).uniform(-BOX, BOX, size=(n, 6))
+
+
+class TestCondensedQP:
+
+    def test_prediction_matches_simulation(self, qp):
+        theta, z = _samples(1)[0], np.linspace(-1.0, 1.0, HORIZON)
+        A = qp.Phi[:6]
+        B = qp.Gamma[:6, :1]
+        delta, expected = theta, []
+        for u in z:
+            delta = A @ delta + B[:, 0] * u
+            expected.append(delta)
+        np.testing.assert_allclose(qp.predict(theta, z), expected, atol=1e-12)
+
+    def test_active_set_solution_matches_cvxpy(self, qp):
+        cp = pytest.importorskip("cvxpy")
+        for theta in _samples(5):
+            sol = solve_qp_active_set(qp.H, qp.gradient(theta), qp.G, qp.bounds(theta))
+            z = cp.Variable(HORIZON)
+            problem = cp.Problem(
+                cp.Minimize(0.5 * cp.quad_form(z, qp.H) + qp.gradient(theta) @ z),
+                [qp.G @ z <= qp.bounds(theta)],
+            )
+            problem.solve(solver=cp.CLARABEL)
+            assert sol.success
+            np.testing.assert_allclose(sol.z, z.value, atol=1e-5)
+
+    def test_infeasible_problem_reported(self, qp):
+        theta = np.array([0.0, 0.0, 0.0, 0.0, 50.0, -50.0])
+        sol = solve_qp_active_set(qp.H, qp.gradient(theta), qp.G, qp.bounds(theta))
+        assert sol.status == "infeasible" and not sol.success
+
+
+class TestExplicitMPCTable:
+
+    def test_law_matches_online_solution(self, qp, table):
+        assert table.coverage > 0.9
+        hits = 0
+        for theta in _samples(200):
+            u = table.evaluate(_UPRIGHT + theta)
+            if np.isnan(u):
+                continue
+            hits += 1
+            sol = solve_qp_active_set(qp.H, qp.gradient(theta), qp.G, qp.bounds(theta))
+            assert u == pytest.approx(sol.z[0], abs=1e-6)
+        assert hits > 150
+
+    def test_outside_box_not_covered(self, table):
+        x = _UPRIGHT + np.array([0.0, 0.25, 0.0, 0.0, 0.0, 0.0])
+        assert table.locate(x) == -1
+        assert np.isnan(table.evaluate(x))
+
+    def test_save_and_load(self, table, tmp_path):
+        path = tmp_path / "table.npz"
+        table.save(path)
+        loaded = ExplicitMPCTable.load(path)
+
+        assert loaded.n_regions == table.n_regions
+        assert loaded.matches(np.array([1.0])) and not loaded.matches(np.array([2.0]))
+        for theta in _samples(20):
+            u, u_loaded = table.evaluate(_UPRIGHT + theta), loaded.evaluate(_UPRIGHT + theta)
+            assert (np.isnan(u) and np.isnan(u_loaded)) or u == u_loaded
+
+
+class TestMPCControllerExplicitMode:
+
+    def test_lookup_and_online_fallback(self):
+        mpc = MPCController(MockDynamics(), horizon=HORIZON, explicit_mpc=True, explicit_options=BUILD)
+        assert mpc._explicit_table is None  # built lazily
+
+        x = _UPRIGHT + np.array([0.05, 0.02, -0.01, 0.0, 0.1, 0.0])
+        u = mpc.compute_control(0.0, x)
+        assert mpc.explicit_hits == 1
+        assert u == pytest.approx(mpc.explicit_table.evaluate(x))
+
+        with patch("src.controllers.mpc.mpc_controller.cp", None):
+            mpc.compute_control(0.02, _UPRIGHT + np.array([0.0, 0.45, 0.0, 0.0, 0.0, 0.0]))
+        assert mpc.explicit_misses == 1
+
+    def test_table_persisted_and_reloaded(self, tmp_path):
+        path = tmp_path / "explicit.npz"
+        kwargs = dict(horizon=HORIZON, explicit_mpc=True, explicit_table_path=path,
+                      explicit_options=BUILD)
+        x = _UPRIGHT + np.array([0.0, 0.05, 0.0, 0.0, 0.0, 0.0])
+
+        u_first = MPCController(MockDynamics(), **kwargs).compute_control(0.0, x)
+        assert path.exists()
+
+        with patch.object(ExplicitMPCTable, "build", side_effect=AssertionError("rebuilt")):
+            u_reloaded = MPCController(MockDynamics(), **kwargs).compute_control(0.0, x)
+        assert u_reloaded == u_first
+
+        # A different problem invalidates the stored table
+        other = MPCController(MockDynamics(), max_force=15.0, **kwargs)
+        other.compute_control(0.0, x)
+        assert other.explicit_table.matches(ExplicitMPCTable.load(path).signature)
+
+    def test_reference_bypasses_table(self):
+        mpc = MPCController(MockDynamics(), horizon=HORIZON, explicit_mpc=True, explicit_options=BUILD)
+        mpc.set_reference(lambda t: _UPRIGHT)
+        with patch("src.controllers.mpc.mpc_controller.cp", None):
+            mpc.compute_control(0.0, _UPRIGHT)
+        assert mpc.explicit_hits == mpc.explicit_misses == 0
+        assert mpc._explicit_table is None
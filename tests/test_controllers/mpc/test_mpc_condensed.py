@@ -0,0 +1,98 @@
+#======================================================================================\\\
+#================== tests/test_controllers/mpc/test_mpc_condensed.py ==================\\\
+#======================================================================================\\\
+
+"""
+Tests for the condensed MPC formulation of MPCController.
+
+SINGLE JOB: Check that ``formulation="condensed"`` reproduces the sparse
+OSQP solution, factorizes the Hessian once per linearization, and runs
+without cvxpy.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.controllers.mpc.condensed_qp import solve_qp_active_set
+from src.controllers.mpc.mpc_controller import MPCController, _UPRIGHT
+
+from .test_mpc_constraints_solver import MockDynamics
+
+
+class JacobianDynamics(MockDynamics):
+    """MockDynamics with its analytic Jacobian (identical model every step)."""
+
+    def compute_jacobian(self, x, u):
+        A = np.zeros((6, 6))
+        A[:3, 3:] = np.eye(3)
+        A[3, 1] = -0.2 * 9.81
+        A[4, 1] = A[5, 2] = 9.81 / 0.5
+        B = np.array([0.0, 0.0, 0.0, 1.0, 2.0, 2.0])
+        return A, B
+
+
+def _states(n=15):
+    t = np.arange(n) * 0.02
+    offsets = np.column_stack([
+        0.3 * np.sin(1.5 * t), 0.08 * np.cos(3.0 * t), -0.05 * np.cos(2.5 * t),
+        0.45 * np.cos(1.5 * t), -0.24 * np.sin(3.0 * t), 0.125 * np.sin(2.5 * t),
+    ])
+    return _UPRIGHT + offsets
+
+
+def test_invalid_formulation_rejected():
+    with pytest.raises(ValueError, match="formulation"):
+        MPCController(MockDynamics(), formulation="dense")
+
+
+def test_condensed_matches_sparse_osqp():
+    pytest.importorskip("cvxpy")
+    sparse = MPCController(MockDynamics(), horizon=10, dt=0.02)
+    condensed = MPCController(MockDynamics(), horizon=10, dt=0.02, formulation="condensed")
+    with patch.object(MPCController, "_safe_fallback", side_effect=AssertionError("fallback")):
+        for k, x in enumerate(_states()):
+            u_sparse = sparse.compute_control(k * 0.02, x)
+            u_condensed = condensed.compute_control(k * 0.02, x)
+            assert u_condensed == pytest.approx(u_sparse, abs=1e-3)
+
+
+def test_factorization_reused_for_same_linearization():
+    mpc = MPCController(JacobianDynamics(), horizon=10, dt=0.02, formulation="condensed")
+    for k, x in enumerate(_states(5)):
+        mpc.compute_control(k * 0.02, x)
+    assert mpc.qp_factorizations == 1
+
+    mpc.model = MockDynamics()  # finite-difference Jacobian: new (Ad, Bd)
+    mpc.compute_control(0.1, _UPRIGHT)
+    assert mpc.qp_factorizations == 2
+
+
+def test_condensed_runs_without_cvxpy():
+    mpc = MPCController(JacobianDynamics(), horizon=10, dt=0.02, formulation="condensed")
+    with patch("src.controllers.mpc.mpc_controller.cp", None), \
+            patch.object(MPCController, "_safe_fallback", side_effect=AssertionError("fallback")):
+        u = mpc.compute_control(0.0, _states(1)[0])
+    assert np.isfinite(u) and abs(u) <= mpc.max_force
+
+
+def test_out_of_bounds_state_uses_fallback():
+    mpc = MPCController(JacobianDynamics(), horizon=10, formulation="condensed")
+    with patch.object(MPCController, "_safe_fallback", return_value=1.5) as fallback:
+        u = mpc.compute_control(0.0, _UPRIGHT + np.array([0.0, 0.6, 0.0, 0.0, 0.0, 0.0]))
+    assert u == 1.5 and fallback.call_count == 1
+
+
+def test_initial_working_set_gives_same_solution():
+    mpc = MPCController(JacobianDynamics(), horizon=10, dt=0.02, formulation="condensed")
+    x = _states(1)[0]
+    mpc.compute_control(0.0, x)
+    qp, factor = mpc._condensed[1], mpc._condensed[2]
+    # Absolute coordinates, as in the controller (reference = upright)
+    f, b = qp.gradient(x, np.tile(_UPRIGHT, (10, 1))), qp.bounds(x)
+
+    cold = solve_qp_active_set(qp.H, f, qp.G, b, H_factor=factor)
+    active = np.array(cold.active_set, dtype=int)
+    warm = solve_qp_active_set(qp.H, f, qp.G, b, z0=cold.z, H_factor=factor, working_set=active)
+    assert warm.success and warm.iterations <= 2
+    np.testing.assert_allclose(warm.z, cold.z, atol=1e-9)
@@ -328,5 +328,42 @@ class TestMPCHorizonAndTimestep:
         assert mpc._U_prev.shape == (horizon,)
 
 
+@pytest.mark.filterwarnings("ignore:.*polish.*:DeprecationWarning")
+@pytest.mark.filterwarnings("ignore:.*raise_error.*:PendingDeprecationWarning")
+class TestParametricProblem:
+    """The QP is built once and re-solved with updated parameters."""
+
+    @pytest.mark.parametrize("max_du", [None, 2.0])
+    def test_matches_per_step_rebuild(self, mock_dynamics, max_du):
+        """Parametric and rebuilt problems produce the same control sequence."""
+        pytest.importorskip("osqp")
+        kwargs = dict(dynamics_model=mock_dynamics, horizon=10, dt=0.02, max_du=max_du)
+        fast = MPCController(reuse_problem=True, **kwargs)
+        slow = MPCController(reuse_problem=False, **kwargs)
+
+        x = np.array([0.05, np.pi + 0.05, np.pi - 0.03, 0.0, 0.0, 0.0])
+        for k in range(5):
+            u_fast = fast.compute_control(k * 0.02, x)
+            u_slow = slow.compute_control(k * 0.02, x)
+            assert u_fast == pytest.approx(u_slow, abs=1e-3)
+            x = x + 0.02 * mock_dynamics.f(x, u_fast)
+
+    def test_problem_built_once(self, mock_dynamics):
+        """Subsequent steps reuse the cached problem object."""
+        mpc = MPCController(dynamics_model=mock_dynamics, horizon=8)
+        x = np.array([0.0, np.pi + 0.02, np.pi, 0.0, 0.0, 0.0])
+        mpc.compute_control(0.0, x)
+        qp = mpc._qp
+        assert qp is not None and qp.problem.is_dpp()
+        mpc.compute_control(0.02, x)
+        assert mpc._qp is qp
+        np.testing.assert_array_equal(qp.x0.value, x)
+
+    def test_rebuild_mode_keeps_no_problem(self, mock_dynamics):
+        mpc = MPCController(dynamics_model=mock_dynamics, horizon=8, reuse_problem=False)
+        mpc.compute_control(0.0, np.array([0.0, np.pi, np.pi, 0.0, 0.0, 0.0]))
+        assert mpc._qp is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+#======================================================================================\\\
+#============= tests/test_controllers/mpc/test_mpc_linearization_cache.py =============\\\
+#======================================================================================\\\
+
+"""
+Tests for the MPCController linearization cache.
+
+SINGLE JOB: Check that ``(Ad, Bd)`` are reused within ``relinearize_tol`` of
+the last linearization point, recomputed beyond it, fixed about upright in
+``linearize_about_upright`` mode, and that the hit/miss counters follow.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.controllers.mpc import mpc_controller
+from src.controllers.mpc.mpc_controller import MPCController, _UPRIGHT
+
+from .test_mpc_constraints_solver import MockDynamics
+
+
+def _offset(*dx):
+    return _UPRIGHT + np.array(dx + (0.0,) * (6 - len(dx)))
+
+
+def _run(mpc, states):
+    with patch.object(mpc_controller, "_linearize_continuous",
+                      wraps=mpc_controller._linearize_continuous) as linearize:
+        for k, x in enumerate(states):
+            mpc.compute_control(k * mpc.dt, x)
+    return [call.args[1] for call in linearize.call_args_list]
+
+
+def test_default_relinearizes_every_step():
+    mpc = MPCController(MockDynamics(), horizon=5, formulation="condensed")
+    points = _run(mpc, [_offset(0.0, 0.01), _offset(0.0, 0.011)])
+    assert len(points) == 2
+    assert (mpc.linearization_hits, mpc.linearization_misses) == (0, 2)
+
+
+def test_model_reused_within_tolerance():
+    mpc = MPCController(MockDynamics(), horizon=5, formulation="condensed", relinearize_tol=0.05)
+    states = [_offset(0.0, 0.01), _offset(0.0, 0.05), _offset(0.0, 0.07), _offset(0.0, 0.1)]
+    points = _run(mpc, states)
+
+    # 0.05 reuses the model from 0.01; 0.07 is 0.06 away and re-linearizes; 0.1 reuses 0.07
+    assert (mpc.linearization_hits, mpc.linearization_misses) == (2, 2)
+    np.testing.assert_array_equal(points[0], states[0])
+    np.testing.assert_array_equal(points[1], states[2])
+    assert mpc.qp_factorizations == 2
+
+
+def test_upright_mode_linearizes_once():
+    mpc = MPCController(MockDynamics(), horizon=5, formulation="condensed", linearize_about_upright=True)
+    points = _run(mpc, [_offset(0.1, 0.02), _offset(-0.2, 0.0, 0.1), _offset(0.0, 0.3)])
+    assert len(points) == 1
+    np.testing.assert_array_equal(points[0], _UPRIGHT)
+    assert (mpc.linearization_hits, mpc.linearization_misses) == (2, 1)
+
+
+def test_cached_control_within_tolerance_of_fresh():
+    x = _offset(0.05, 0.02, -0.01, 0.0, 0.1)
+    fresh = MPCController(MockDynamics(), horizon=10, formulation="condensed")
+    cached = MPCController(MockDynamics(), horizon=10, formulation="condensed", relinearize_tol=0.1)
+    cached.compute_control(0.0, _offset(0.0, 0.03))
+    # MockDynamics is linear: the reused model only differs by finite-difference noise
+    assert cached.compute_control(0.02, x) == pytest.approx(fresh.compute_control(0.02, x), abs=1e-6)
+    assert cached.linearization_hits == 1
+
+
+def test_negative_tolerance_rejected():
+    with pytest.raises(ValueError, match="relinearize_tol"):
+        MPCController(MockDynamics(), relinearize_tol=-0.1)
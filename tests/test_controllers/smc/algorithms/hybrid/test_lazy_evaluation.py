@@ -0,0 +1,102 @@
+#======================================================================================\\\
+#======== tests/test_controllers/smc/algorithms/hybrid/test_lazy_evaluation.py ========\\\
+#======================================================================================\\\
+
+"""
+Tests for Lazy Sub-Controller Evaluation in ModularHybridSMC.
+
+SINGLE JOB: Verify that lazy evaluation skips inactive controllers without
+changing switching decisions.
+"""
+
+import logging
+
+import pytest
+import numpy as np
+
+from src.controllers.smc.algorithms.adaptive.config import AdaptiveSMCConfig
+from src.controllers.smc.algorithms.classical.config import ClassicalSMCConfig
+from src.controllers.smc.algorithms.hybrid.config import (
+    HybridMode,
+    HybridSMCConfig,
+    SwitchingCriterion
+)
+from src.controllers.smc.algorithms.hybrid.controller import ModularHybridSMC
+from src.controllers.smc.algorithms.super_twisting.config import SuperTwistingSMCConfig
+
+
+N_STEPS = 400
+
+
+def make_controller(criterion, **kwargs):
+    config = HybridSMCConfig(
+        hybrid_mode=HybridMode.TRIPLE_HYBRID, dt=0.01, max_force=100.0,
+        classical_config=ClassicalSMCConfig(
+            gains=[10, 8, 15, 12, 50, 5], max_force=100.0, dt=0.01, boundary_layer=0.05),
+        adaptive_config=AdaptiveSMCConfig(gains=[10, 8, 15, 12, 0.5], max_force=100.0, dt=0.01),
+        supertwisting_config=SuperTwistingSMCConfig(
+            gains=[25, 10, 15, 12, 20, 15], max_force=100.0, dt=0.01),
+        switching_criterion=criterion,
+        **kwargs
+    )
+    return ModularHybridSMC(config)
+
+
+@pytest.fixture(scope="module")
+def states():
+    """Trajectory whose surface and tracking error cross the switching thresholds."""
+    t = np.arange(N_STEPS) * 0.01
+    x = np.zeros((N_STEPS, 6))
+    x[:, 1] = 0.15 * np.sin(1.3 * t) * np.exp(-0.3 * t)
+    x[:, 2] = 0.1 * np.cos(0.7 * t)
+    x[:, 4] = 0.2 * np.cos(1.3 * t)
+    return x
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def run(controller, states):
+    u = np.array([controller.compute_control(x, {}, {})['u'] for x in states])
+    switches = [(s['time'], s['from'], s['to']) for s in controller.switching_logic.switch_history]
+    return u, switches
+
+
+class TestLazyEvaluation:
+    """Lazy evaluation reproduces eager switching decisions."""
+
+    @pytest.mark.parametrize("criterion", list(SwitchingCriterion))
+    def test_switch_decisions_match_eager(self, criterion, states):
+        _, eager = run(make_controller(criterion), states)
+        lazy_controller = make_controller(criterion, lazy_evaluation=True, full_evaluation_interval=7)
+        _, lazy = run(lazy_controller, states)
+
+        assert lazy == eager
+        total = sum(lazy_controller.evaluation_counts.values())
+        assert total < len(lazy_controller.controllers) * N_STEPS
+
+    def test_interval_one_matches_eager_exactly(self, states):
+        criterion = SwitchingCriterion.TRACKING_ERROR
+        u_eager, eager = run(make_controller(criterion), states)
+        u_lazy, lazy = run(make_controller(criterion, lazy_evaluation=True, full_evaluation_interval=1), states)
+
+        assert len(eager) > 0
+        assert lazy == eager
+        np.testing.assert_array_equal(u_lazy, u_eager)
+
+    def test_only_active_controller_between_full_evaluations(self, states):
+        controller = make_controller(
+            SwitchingCriterion.CONTROL_EFFORT, lazy_evaluation=True, full_evaluation_interval=10)
+        run(controller, states[:50])
+
+        # The initial controller stays active; the others run on steps 0, 10, ..., 40
+        assert controller.evaluation_counts == {'classical': 50, 'adaptive': 5, 'supertwisting': 5}
+        assert np.isnan(controller.control_history['u_adaptive'][1:10]).all()
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError, match="Full evaluation interval"):
+            make_controller(SwitchingCriterion.SURFACE_MAGNITUDE, full_evaluation_interval=0)
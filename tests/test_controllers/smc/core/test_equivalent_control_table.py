@@ -0,0 +1,127 @@
+#======================================================================================\\\
+#========= tests/test_controllers/smc/core/test_equivalent_control_table.py ===========\\\
+#======================================================================================\\\
+
+"""
+Tests for the Tabulated Equivalent Control.
+SINGLE JOB: Test only the angle-gridded u_eq table and its ClassicalSMC integration.
+"""
+
+import warnings
+
+import pytest
+import numpy as np
+
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.controllers.smc.core.equivalent_control_table import EquivalentControlTable
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+
+
+class PhysicsMatrixModel:
+    """Exposes the simplified plant matrices through the controller hook."""
+
+    def __init__(self):
+        self._physics = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default()).physics
+
+    def _compute_physics_matrices(self, state):
+        return self._physics.get_physics_matrices(state)
+
+
+@pytest.fixture(scope="module")
+def model():
+    return PhysicsMatrixModel()
+
+
+@pytest.fixture
+def controller(model):
+    return ClassicalSMC([20, 15, 12, 8, 35, 5], 150.0, 0.02, dynamics_model=model)
+
+
+@pytest.fixture(autouse=True)
+def quiet_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        yield
+
+
+def _states(n, angle=0.2, seed=3):
+    rng = np.random.default_rng(seed)
+    low = [-1.0, -angle, -angle, -2.0, -2.0, -2.0]
+    return rng.uniform(low, np.negative(low), size=(n, 6))
+
+
+class TestEquivalentControlTable:
+    """Test table accuracy against the exact computation."""
+
+    def test_exact_at_grid_nodes_for_any_velocity(self, controller):
+        exact = controller._compute_equivalent_control_exact
+        table = EquivalentControlTable(exact, angle_range=(-0.2, 0.2), resolution=5)
+
+        states = _states(50)
+        states[:, 1] = 0.1
+        states[:, 2] = -0.2
+        assert table.max_error(exact, states) < 1e-8
+
+    def test_error_bound_holds_inside_grid(self, controller):
+        exact = controller._compute_equivalent_control_exact
+        table = EquivalentControlTable(exact, angle_range=(-0.2, 0.2), resolution=21)
+
+        assert table.error_bound < 1e-2
+        assert table.max_error(exact, _states(300)) <= table.error_bound * 1.5
+
+    def test_outside_grid_is_nan(self, controller):
+        table = EquivalentControlTable(controller._compute_equivalent_control_exact,
+                                       angle_range=(-0.1, 0.1), resolution=3)
+        state = np.array([0.0, 0.5, 0.0, 0.0, 0.0, 0.0])
+
+        assert not table.contains(state)
+        assert np.isnan(table(state))
+
+    def test_tolerance_violation_rejected(self, controller):
+        with pytest.raises(ValueError, match="exceeds tolerance"):
+            EquivalentControlTable(controller._compute_equivalent_control_exact,
+                                   angle_range=(-0.3, 0.3), resolution=3, tolerance=1e-9)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"angle_range": (0.1, -0.1)},
+        {"resolution": 1},
+        {"velocity_scale": 0.0},
+    ])
+    def test_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            EquivalentControlTable(lambda state: 0.0, **kwargs)
+
+
+class TestClassicalSMCTable:
+    """ClassicalSMC uses the table inside its range and the exact solve outside."""
+
+    def test_control_matches_exact(self, controller, model):
+        reference = ClassicalSMC([20, 15, 12, 8, 35, 5], 150.0, 0.02, dynamics_model=model)
+        table = controller.enable_equivalent_control_table(angle_range=(-0.2, 0.2), resolution=21)
+
+        for state in _states(50):
+            u = controller.compute_control(state, (), {})[0]
+            u_ref = reference.compute_control(state, (), {})[0]
+            assert abs(u - u_ref) <= table.error_bound * 1.5
+        assert controller.u_eq_table_fallbacks == 0
+
+    def test_fallback_outside_range(self, controller):
+        controller.enable_equivalent_control_table(angle_range=(-0.1, 0.1), resolution=3)
+        state = np.array([0.0, 0.4, -0.3, 0.1, 0.5, -0.5])
+
+        assert controller._compute_equivalent_control(state) == \
+            controller._compute_equivalent_control_exact(state)
+        assert controller.u_eq_table_fallbacks == 1
+
+    def test_disable_and_model_change(self, controller, model):
+        controller.enable_equivalent_control_table(resolution=3)
+        controller.disable_equivalent_control_table()
+        assert controller._u_eq_table is None
+
+        controller.enable_equivalent_control_table(resolution=3)
+        controller.dyn = model
+        assert controller._u_eq_table is None
+
+    def test_requires_dynamics_model(self):
+        with pytest.raises(ValueError, match="dynamics model"):
+            ClassicalSMC([20, 15, 12, 8, 35, 5], 150.0, 0.02).enable_equivalent_control_table()
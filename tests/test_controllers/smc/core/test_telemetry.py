@@ -0,0 +1,158 @@
+#======================================================================================\\\
+#================= tests/test_controllers/smc/core/test_telemetry.py ==================\\\
+#======================================================================================\\\
+
+"""
+Tests for SMC Telemetry Buffers.
+SINGLE JOB: Test only the preallocated telemetry buffer and its controller integration.
+"""
+
+import pytest
+import numpy as np
+
+from src.controllers.smc.adaptive_smc import AdaptiveSMC
+from src.controllers.smc.algorithms.adaptive.config import AdaptiveSMCConfig
+from src.controllers.smc.algorithms.classical.config import ClassicalSMCConfig
+from src.controllers.smc.algorithms.hybrid.config import HybridMode, HybridSMCConfig
+from src.controllers.smc.algorithms.hybrid.controller import ModularHybridSMC
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.controllers.smc.core.telemetry import TelemetryBuffer
+from src.controllers.smc.sta_smc import SuperTwistingSMC
+
+
+STATE = np.array([0.0, 0.1, -0.05, 0.0, 0.2, 0.1])
+
+
+def _run(controller, history, steps):
+    state_vars = controller.initialize_state()
+    for k in range(steps):
+        out = controller.compute_control(STATE * (1.0 + 0.01 * k), state_vars, history)
+        state_vars, history = out[1], out[2]
+    return history
+
+
+class TestTelemetryBuffer:
+    """Test ring, horizon and disabled buffers."""
+
+    def test_ring_keeps_newest_in_order(self):
+        buffer = TelemetryBuffer(("a", "b"), capacity=4)
+        for k in range(10):
+            buffer.record(k, -k)
+
+        assert len(buffer) == 4
+        assert buffer.total_records == 10
+        np.testing.assert_array_equal(buffer["a"], [6, 7, 8, 9])
+        np.testing.assert_array_equal(buffer["b"], [-6, -7, -8, -9])
+
+    def test_horizon_keeps_oldest_and_counts_dropped(self):
+        buffer = TelemetryBuffer(("a",), capacity=3, mode="horizon")
+        for k in range(5):
+            buffer.record(k)
+
+        np.testing.assert_array_equal(buffer["a"], [0, 1, 2])
+        assert buffer.dropped == 2
+        assert buffer.total_records == 5
+
+    def test_selected_channels(self):
+        buffer = TelemetryBuffer(("a", "b", "c"), capacity=8, select=("c", "a"))
+        buffer.record(1.0, 2.0, 3.0)
+
+        assert buffer.keys() == ("c", "a")
+        assert "b" not in buffer and buffer.get("b") is None
+        assert buffer.as_dict() == {"c": [3.0], "a": [1.0]}
+
+    def test_disabled_buffer_ignores_writes(self):
+        buffer = TelemetryBuffer(("a",), enabled=False)
+        buffer.record(1.0)
+
+        assert len(buffer) == 0
+        assert buffer["a"].size == 0
+
+    def test_clear_reuses_storage(self):
+        buffer = TelemetryBuffer(("a",), capacity=2)
+        storage = buffer._data
+        buffer.record(1.0)
+        buffer.clear()
+        buffer.record(2.0)
+
+        assert buffer._data is storage
+        np.testing.assert_array_equal(buffer["a"], [2.0])
+
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"mode": "fifo"}, "Unknown telemetry mode"),
+        ({"capacity": 0}, "capacity"),
+        ({"select": ("z",)}, "Unknown telemetry channels"),
+    ])
+    def test_invalid_configuration(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            TelemetryBuffer(("a", "b"), **kwargs)
+
+
+class TestControllerTelemetry:
+    """Controllers record the same values into buffers as into list histories."""
+
+    @pytest.mark.parametrize("make", [
+        lambda: ClassicalSMC([5, 4, 3, 2, 20, 1], 100.0, 0.02),
+        lambda: SuperTwistingSMC([20, 10, 5, 3, 2, 1], dt=0.01),
+        lambda: AdaptiveSMC([5, 4, 3, 2, 1], dt=0.01, max_force=100.0, leak_rate=0.1,
+                            adapt_rate_limit=50.0, K_min=0.5, K_max=80.0, smooth_switch=True,
+                            boundary_layer=0.1, dead_zone=0.02),
+    ])
+    def test_buffer_matches_list_history(self, make):
+        legacy = _run(make(), make().initialize_history(), 20)
+
+        controller = make()
+        controller.configure_telemetry(capacity=8)
+        buffer = _run(controller, controller.initialize_history(), 20)
+
+        assert isinstance(buffer, TelemetryBuffer)
+        assert set(buffer.keys()) == set(legacy.keys())
+        for name in buffer:
+            np.testing.assert_array_equal(buffer[name], np.asarray(legacy[name], dtype=float)[-8:])
+
+    def test_disable_and_reset(self):
+        controller = ClassicalSMC([5, 4, 3, 2, 20, 1], 100.0, 0.02)
+        controller.disable_telemetry()
+        history = _run(controller, controller.initialize_history(), 5)
+        assert len(history) == 0
+
+        controller.reset_telemetry()
+        assert controller.initialize_history() == {}
+
+    def test_invalid_channel_rejected_eagerly(self):
+        controller = SuperTwistingSMC([20, 10, 5, 3, 2, 1], dt=0.01)
+        with pytest.raises(ValueError, match="Unknown telemetry channels"):
+            controller.configure_telemetry(channels=("K",))
+
+
+class TestHybridControlHistory:
+    """ModularHybridSMC keeps a bounded control history."""
+
+    @pytest.fixture
+    def controller(self):
+        config = HybridSMCConfig(
+            hybrid_mode=HybridMode.CLASSICAL_ADAPTIVE, dt=0.01, max_force=100.0,
+            classical_config=ClassicalSMCConfig(
+                gains=[10, 8, 15, 12, 50, 5], max_force=100.0, dt=0.01, boundary_layer=0.05),
+            adaptive_config=AdaptiveSMCConfig(gains=[10, 8, 15, 12, 0.5], max_force=100.0, dt=0.01),
+        )
+        return ModularHybridSMC(config)
+
+    def test_history_is_bounded(self, controller):
+        controller.configure_telemetry(capacity=16)
+        for _ in range(40):
+            controller.compute_control(STATE, {}, {})
+
+        history = controller.control_history
+        assert len(history) == 16
+        assert history.total_records == 40
+        assert set(np.unique(history["active_controller"])) <= {0.0, 1.0}
+        np.testing.assert_allclose(np.diff(history["time"]), 0.01)
+
+    def test_performance_analysis_from_buffer(self, controller):
+        for _ in range(20):
+            controller.compute_control(STATE, {}, {})
+
+        stats = controller.get_comprehensive_analysis()["performance_comparison"]
+        assert sum(s["total_steps"] for s in stats.values()) == 20
+        assert sum(s["usage_percentage"] for s in stats.values()) == pytest.approx(100.0)
@@ -0,0 +1,143 @@
+#======================================================================================\\\
+#=================== tests/test_controllers/smc/test_batch_control.py =================\\\
+#======================================================================================\\\
+
+"""
+Tests for the batched SMC control laws.
+
+compute_control_batch must reproduce compute_control of per-gain controller
+objects bit for bit, including controller state propagation.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from src.controllers.smc.adaptive_smc import AdaptiveSMC
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.controllers.smc.sta_smc import SuperTwistingSMC
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+
+
+class PhysicsMatrixModel:
+    """Exposes the simplified plant matrices through the controller hook."""
+
+    def __init__(self):
+        self._physics = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default()).physics
+
+    def _compute_physics_matrices(self, state):
+        return self._physics.get_physics_matrices(state)
+
+
+def _states(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(scale=[0.2, 0.3, 0.3, 0.5, 1.0, 1.0], size=(n, 6))
+
+
+def _gains(n, low, high, seed=1):
+    return np.random.default_rng(seed).uniform(low, high, size=(n, len(low)))
+
+
+def _run_per_object(controllers, states, ctrl_state):
+    u, new_state, sigma = [], [], []
+    for ctrl, x, cs in zip(controllers, states, ctrl_state):
+        out = ctrl.compute_control(x, tuple(cs), {})
+        u.append(out[0])
+        new_state.append(out[1])
+        sigma.append(out[3] if len(out) > 3 else ctrl._compute_sliding_surface(x))
+    return np.array(u, dtype=float), np.array(new_state, dtype=float).reshape(len(u), -1), np.array(sigma)
+
+
+class TestClassicalBatch:
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"switch_method": "linear", "boundary_layer_slope": 0.5, "hysteresis_ratio": 0.3},
+        {"controllability_threshold": 0.5},
+    ])
+    @pytest.mark.parametrize("with_model", [False, True])
+    def test_matches_per_object(self, kwargs, with_model):
+        n = 32
+        gains = _gains(n, [1, 1, 1, 1, 5, 0], [20, 20, 20, 20, 50, 5])
+        model = PhysicsMatrixModel() if with_model else None
+        ref = ClassicalSMC(gains[0], 150.0, 0.05, dynamics_model=model, **kwargs)
+        controllers = [ClassicalSMC(g, 150.0, 0.05, dynamics_model=model, **kwargs) for g in gains]
+        states = _states(n)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            u, new_state, sigma = ref.compute_control_batch(states, gains)
+            u_ref, _, sigma_ref = _run_per_object(controllers, states, np.empty((n, 0)))
+
+        assert new_state.shape == (n, 0)
+        if with_model:
+            assert any(ctrl._compute_equivalent_control(x) != 0.0 for ctrl, x in zip(controllers, states))
+        np.testing.assert_array_equal(sigma, sigma_ref)
+        np.testing.assert_array_equal(u, u_ref)
+
+    def test_default_gains_and_shape_errors(self):
+        ctrl = ClassicalSMC([5, 4, 3, 2, 20, 1], 100.0, 0.02)
+        states = _states(4)
+        u, _, _ = ctrl.compute_control_batch(states)
+        assert u.shape == (4,)
+        with pytest.raises(ValueError, match="states"):
+            ctrl.compute_control_batch(states[:, :4])
+        with pytest.raises(ValueError, match="gains"):
+            ctrl.compute_control_batch(states, np.ones((4, 5)))
+
+
+class TestSuperTwistingBatch:
+
+    @pytest.mark.parametrize("switch_method", ["linear", "tanh"])
+    @pytest.mark.parametrize("with_model", [False, True])
+    def test_matches_per_object_over_steps(self, switch_method, with_model):
+        n = 24
+        gains = _gains(n, [1, 1, 1, 1, 1, 1], [30, 30, 20, 20, 10, 10])
+        model = PhysicsMatrixModel() if with_model else None
+        kwargs = dict(dt=0.01, max_force=100.0, damping_gain=0.5, boundary_layer=0.05,
+                      dynamics_model=model, switch_method=switch_method, anti_windup_gain=2.0)
+        ref = SuperTwistingSMC(gains[0], **kwargs)
+        controllers = [SuperTwistingSMC(g, **kwargs) for g in gains]
+
+        ctrl_state = ref_state = np.zeros((n, 2))
+        for step in range(5):
+            states = _states(n, seed=step)
+            u, ctrl_state, sigma = ref.compute_control_batch(states, gains, ctrl_state)
+            u_ref, ref_state, sigma_ref = _run_per_object(controllers, states, ref_state)
+            np.testing.assert_array_equal(u, u_ref)
+            np.testing.assert_array_equal(ctrl_state, ref_state)
+            np.testing.assert_array_equal(sigma, sigma_ref)
+
+    def test_two_gain_rows_use_default_surface(self):
+        gains = _gains(6, [1, 1], [30, 30])
+        ref = SuperTwistingSMC(gains[0], dt=0.01)
+        states = _states(6)
+        u, _, _ = ref.compute_control_batch(states, gains)
+        u_ref, _, _ = _run_per_object(
+            [SuperTwistingSMC(g, dt=0.01) for g in gains], states, np.zeros((6, 2)))
+        np.testing.assert_array_equal(u, u_ref)
+
+
+class TestAdaptiveBatch:
+
+    @pytest.mark.parametrize("smooth_switch", [True, False])
+    def test_matches_per_object_over_steps(self, smooth_switch):
+        n = 24
+        gains = _gains(n, [1, 1, 1, 1, 0.5], [20, 20, 10, 10, 5])
+        kwargs = dict(dt=0.01, max_force=100.0, leak_rate=0.1, adapt_rate_limit=50.0,
+                      K_min=0.5, K_max=80.0, smooth_switch=smooth_switch,
+                      boundary_layer=0.1, dead_zone=0.02, K_init=10.0, alpha=0.5)
+        ref = AdaptiveSMC(list(gains[0]), **kwargs)
+        controllers = [AdaptiveSMC(list(g), **kwargs) for g in gains]
+
+        ctrl_state = ref_state = np.tile(ref.initialize_state(), (n, 1))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            for step in range(5):
+                states = _states(n, seed=step)
+                u, ctrl_state, sigma = ref.compute_control_batch(states, gains, ctrl_state)
+                u_ref, ref_state, sigma_ref = _run_per_object(controllers, states, ref_state)
+                np.testing.assert_array_equal(u, u_ref)
+                np.testing.assert_array_equal(ctrl_state, ref_state)
+                np.testing.assert_array_equal(sigma, sigma_ref)
@@ -0,0 +1,149 @@
+#======================================================================================\\\
+#============= tests/test_controllers/specialized/test_swing_up_batch.py ==============\\\
+#======================================================================================\\\
+
+"""
+Tests for the batched swing-up controller.
+
+Every row of ``BatchedSwingUpSMC`` must reproduce an independent scalar
+``SwingUpSMC`` driven with the same state sequence: control output, mode and
+handoff time.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.controllers.specialized.swing_up_batch import BatchedSwingUpSMC
+from src.controllers.specialized.swing_up_smc import SwingUpSMC
+from src.plant.models import SimplifiedDIPConfig, SimplifiedDIPDynamics
+
+
+@pytest.fixture(scope="module")
+def plant():
+    return SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+
+
+class PendulumEnergy:
+    """Gravity-style energy: zero upright, 2.0 hanging down, plus a kinetic term."""
+
+    def total_energy(self, state: np.ndarray) -> float:
+        return (2.0 - np.cos(state[1]) - np.cos(state[2])
+                + 0.05 * (state[4] ** 2 + state[5] ** 2))
+
+
+class BatchPendulumEnergy(PendulumEnergy):
+    def total_energy_batch(self, states: np.ndarray) -> np.ndarray:
+        return (2.0 - np.cos(states[:, 1]) - np.cos(states[:, 2])
+                + 0.05 * (states[:, 4] ** 2 + states[:, 5] ** 2))
+
+
+class CountingStabilizer:
+    """Stateful stabilizer without a batched law."""
+    max_force = 15.0
+
+    def initialize_state(self):
+        return (0,)
+
+    def initialize_history(self):
+        return {}
+
+    def compute_control(self, state, svars, hist):
+        return -3.0 * state[1] + 0.1 * svars[0], (svars[0] + 1,), hist
+
+
+def _make(dyn, stabilizer_factory):
+    return SwingUpSMC(dyn, stabilizer_factory(), energy_gain=20.0, switch_energy_factor=0.6,
+                      exit_energy_factor=0.3, switch_angle_tolerance=0.5,
+                      reentry_angle_tolerance=0.8, dt=0.01, max_force=12.0)
+
+
+def _trajectories(n_rows: int, n_steps: int, seed: int = 0) -> np.ndarray:
+    """Angles sweeping between hanging and upright so rows hand off and re-enter."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_steps)[:, None] * 0.05
+    phase = rng.uniform(0, 2 * np.pi, n_rows)
+    states = np.zeros((n_steps, n_rows, 6))
+    states[:, :, 1] = 1.6 * (1 + np.cos(t + phase))
+    states[:, :, 2] = 1.6 * (1 + np.cos(1.3 * t + phase))
+    states[:, :, 4] = rng.normal(scale=2.0, size=(n_steps, n_rows))
+    states[:, :, 5] = rng.normal(scale=2.0, size=(n_steps, n_rows))
+    return states
+
+
+@pytest.mark.parametrize("dyn", [PendulumEnergy(), BatchPendulumEnergy()])
+@pytest.mark.parametrize("stabilizer_factory", [
+    CountingStabilizer,
+    lambda: ClassicalSMC([20.0, 15.0, 12.0, 8.0, 35.0, 5.0], 15.0, 0.02),
+])
+def test_rows_match_scalar_controllers(dyn, stabilizer_factory) -> None:
+    n_rows, n_steps = 12, 200
+    trajectories = _trajectories(n_rows, n_steps)
+    scalars = [_make(dyn, stabilizer_factory) for _ in range(n_rows)]
+    histories = [c.initialize_history() for c in scalars]
+    batch = BatchedSwingUpSMC(_make(dyn, stabilizer_factory), n_rows)
+
+    handoffs = 0
+    for states in trajectories:
+        u = batch.compute_control(states)
+        for b, ctrl in enumerate(scalars):
+            u_ref, _, histories[b] = ctrl.compute_control(states[b], (), histories[b])
+            assert u[b] == pytest.approx(u_ref, rel=1e-12, abs=1e-12)
+        assert list(batch.modes) == [c.mode for c in scalars]
+        handoffs += int(batch.stabilize.sum())
+
+    assert 0 < handoffs < n_rows * n_steps
+    for b, ctrl in enumerate(scalars):
+        if ctrl.switch_time is None:
+            assert np.isnan(batch.switch_time[b])
+        else:
+            assert batch.switch_time[b] == pytest.approx(ctrl.switch_time)
+
+
+def test_plant_energy_is_vectorized(plant, monkeypatch) -> None:
+    states = _trajectories(20, 5)[3]
+    batch = BatchedSwingUpSMC(_make(plant, CountingStabilizer), 20)
+    monkeypatch.setattr(plant, "compute_total_energy",
+                        lambda state: pytest.fail("per-row energy used"))
+
+    energy = batch.energy_batch(states)
+    monkeypatch.undo()
+    np.testing.assert_allclose(energy, [plant.compute_total_energy(x) for x in states], rtol=1e-12)
+
+
+def test_plant_rows_match_scalar_controllers(plant) -> None:
+    trajectories = _trajectories(8, 100)
+    scalars = [_make(plant, CountingStabilizer) for _ in range(8)]
+    histories = [c.initialize_history() for c in scalars]
+    batch = BatchedSwingUpSMC(_make(plant, CountingStabilizer), 8)
+
+    assert batch.E_bottom == pytest.approx(plant.compute_total_energy(scalars[0]._bottom_ref))
+    for states in trajectories:
+        u = batch.compute_control(states)
+        for b, ctrl in enumerate(scalars):
+            u_ref, _, histories[b] = ctrl.compute_control(states[b], (), histories[b])
+            assert u[b] == pytest.approx(u_ref, rel=1e-12, abs=1e-12)
+        assert list(batch.modes) == [c.mode for c in scalars]
+
+
+def test_missing_energy_raises() -> None:
+    with pytest.raises(TypeError, match="energy"):
+        BatchedSwingUpSMC(_make(object(), CountingStabilizer), 3)
+
+
+def test_reset() -> None:
+    batch = BatchedSwingUpSMC(_make(PendulumEnergy(), CountingStabilizer), 3)
+    states = np.zeros((3, 6))
+    states[0, 1] = 2.0  # outside the handoff gate
+
+    batch.compute_control(states)
+    np.testing.assert_array_equal(batch.stabilize, [False, True, True])
+    np.testing.assert_allclose(batch.switch_time[1:], 0.01)
+
+    batch.reset(5)
+    assert batch.stabilize.shape == (5,) and not batch.stabilize.any()
+    assert np.isnan(batch.switch_time).all()
+    with pytest.raises(ValueError):
+        batch.compute_control(states)
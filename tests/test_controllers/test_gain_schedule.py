@@ -0,0 +1,121 @@
+#======================================================================================\\\
+#==================== tests/test_controllers/test_gain_schedule.py ====================\\\
+#======================================================================================\\\
+
+"""
+Tests for compiled gain schedules and the batched scheduler paths.
+
+The compiled schedule must reproduce the hysteresis/interpolation logic of
+AdaptiveGainScheduler and SlidingSurfaceScheduler, and the batched paths must
+agree with running one scalar scheduler per row.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.controllers.adaptive_gain_scheduler import AdaptiveGainScheduler, GainScheduleConfig
+from src.controllers.gain_schedule import HIGH_SIDE, LOW_SIDE, CompiledGainSchedule
+from src.controllers.sliding_surface_scheduler import SlidingSurfaceScheduler
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.controllers.smc.sta_smc import SuperTwistingSMC
+
+
+CLASSICAL_GAINS = [20.0, 15.0, 12.0, 8.0, 35.0, 5.0]
+STA_GAINS = [25.0, 15.0, 20.0, 12.0, 8.0, 6.0]
+
+
+def _trajectory(n: int, seed: int = 0) -> np.ndarray:
+    """Random walk whose angles and |s| cross the scheduling thresholds."""
+    steps = np.random.default_rng(seed).normal(scale=0.02, size=(n, 6))
+    walk = np.cumsum(steps, axis=0)
+    return walk - walk.mean(axis=0)
+
+
+class TestCompiledGainSchedule:
+
+    def test_hysteresis_and_interpolation(self) -> None:
+        schedule = CompiledGainSchedule([2.0], [1.0], 0.1, 0.2, hysteresis_width=0.01)
+
+        gains, mode = schedule.lookup(0.105, LOW_SIDE)  # below 0.11 in the low-side regime
+        assert mode == LOW_SIDE and gains[0] == 2.0
+        gains, mode = schedule.lookup(0.25, LOW_SIDE)
+        assert mode == HIGH_SIDE and gains[0] == 1.0
+        gains, mode = schedule.lookup(0.15, HIGH_SIDE)  # transition zone keeps the regime
+        assert mode == HIGH_SIDE
+        assert gains[0] == pytest.approx(2.0 - (0.15 - 0.09) / 0.1)
+
+    def test_batch_matches_scalar(self) -> None:
+        rng = np.random.default_rng(1)
+        low, high = rng.uniform(1, 10, 6), rng.uniform(1, 10, 6)
+        schedule = CompiledGainSchedule(low, high, 0.2, 0.6, hysteresis_width=0.05)
+        metrics = rng.uniform(0.0, 0.8, 200)
+        modes = rng.integers(0, 2, 200)
+
+        gains, new_modes = schedule.lookup_batch(metrics, modes)
+        for m, mode, g, new_mode in zip(metrics, modes, gains, new_modes):
+            g_ref, mode_ref = schedule.lookup(m, mode)
+            np.testing.assert_allclose(g, g_ref, rtol=1e-15)
+            assert new_mode == mode_ref
+
+    @pytest.mark.parametrize("args", [
+        ([1.0, 2.0], [1.0], 0.1, 0.2),
+        ([1.0], [1.0], 0.2, 0.2),
+    ])
+    def test_invalid_schedule(self, args) -> None:
+        with pytest.raises(ValueError):
+            CompiledGainSchedule(*args)
+
+
+@pytest.mark.parametrize("make_scheduler", [
+    lambda base: AdaptiveGainScheduler(base, GainScheduleConfig(use_angles_only=False)),
+    lambda base: AdaptiveGainScheduler(base, conservative_gains=[10.0, 8.0, 6.0, 4.0, 20.0, 2.0]),
+    lambda base: SlidingSurfaceScheduler(base),
+])
+class TestBatchedSchedulers:
+
+    def test_schedule_gains_batch_matches_scalar_loop(self, make_scheduler) -> None:
+        states = _trajectory(300)
+        scalar = make_scheduler(ClassicalSMC(CLASSICAL_GAINS, 150.0, 0.02))
+        batched = make_scheduler(ClassicalSMC(CLASSICAL_GAINS, 150.0, 0.02))
+
+        modes = None
+        for x in states:
+            g_ref = scalar.schedule_gains(x)
+            gains, modes = batched.schedule_gains_batch(np.stack([x, x]), modes)
+            np.testing.assert_allclose(gains, [g_ref, g_ref], rtol=1e-13)
+            assert list(modes) == [scalar._mode] * 2
+
+    def test_compute_control_batch_matches_rebuilt_controllers(self, make_scheduler) -> None:
+        n = 16
+        rng = np.random.default_rng(2)
+        states = rng.normal(scale=[0.2, 0.3, 0.3, 0.5, 1.0, 1.0], size=(n, 6))
+        particle_gains = rng.uniform(5, 30, size=(n, 6))
+        scheduler = make_scheduler(SuperTwistingSMC(STA_GAINS, dt=0.01))
+
+        ctrl_state = np.zeros((n, 3))
+        ref_state = [(0.0, 0.0)] * n
+        for step in range(4):
+            x = states * (1.0 + step)
+            scheduled, _ = scheduler.schedule_gains_batch(x, ctrl_state[:, 0], particle_gains)
+            u, ctrl_state, _ = scheduler.compute_control_batch(x, particle_gains, ctrl_state)
+
+            for b in range(n):
+                out = SuperTwistingSMC(scheduled[b], dt=0.01).compute_control(x[b], ref_state[b], {})
+                ref_state[b] = out[1]
+                assert u[b] == out[0]
+            np.testing.assert_array_equal(ctrl_state[:, 1:], np.array(ref_state))
+
+
+def test_compute_control_batch_defaults_to_compiled_gains() -> None:
+    scheduler = SlidingSurfaceScheduler(ClassicalSMC(CLASSICAL_GAINS, 150.0, 0.02))
+    states = _trajectory(8)
+
+    u, ctrl_state, _ = scheduler.compute_control_batch(states)
+    scheduled, modes = scheduler.schedule_gains_batch(states)
+    u_ref, _, _ = scheduler.base_controller.compute_control_batch(states, scheduled)
+
+    np.testing.assert_array_equal(u, u_ref)
+    np.testing.assert_array_equal(ctrl_state[:, 0], modes)
+    assert ctrl_state.shape == (8, 1)
@@ -1072,6 +1072,31 @@ class TestPSOTunerEdgeCases:
         assert np.all(np.isfinite(costs))
         assert np.all(costs >= 0)
 
+    def test_compute_cost_from_traj_penalises_nonfinite_control_and_sigma(self, minimal_config, mock_controller_factory):
+        """Non-finite u or sigma with finite states costs the instability penalty."""
+        from src.simulation.engines.cost_accumulation import accumulate_trajectory_costs
+
+        tuner = PSOTuner(
+            controller_factory=mock_controller_factory,
+            config=minimal_config,
+            seed=42
+        )
+
+        rng = np.random.default_rng(0)
+        t = np.linspace(0, 1.0, 10)
+        x_b = rng.normal(scale=0.1, size=(3, 10, 6))
+        u_b = rng.normal(scale=10.0, size=(3, 10))
+        sigma_b = rng.normal(scale=0.5, size=(3, 10))
+        u_b[0, 3] = np.nan
+        sigma_b[1, 5] = np.inf
+
+        acc = accumulate_trajectory_costs(t, x_b, u_b, sigma_b)
+        costs = tuner._compute_cost_from_traj(t, x_b, u_b, sigma_b)
+
+        np.testing.assert_array_equal(acc.nonfinite, [True, True, False])
+        assert costs[0] == costs[1] == float(tuner.instability_penalty)
+        assert np.isfinite(costs[2]) and costs[2] < float(tuner.instability_penalty)
+
     def test_normalise_with_large_denominator(self, minimal_config, mock_controller_factory):
         """Test _normalise with large denominator value."""
         tuner = PSOTuner(
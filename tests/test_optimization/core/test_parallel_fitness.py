@@ -0,0 +1,142 @@
+#======================================================================================\\\
+#============== tests/test_optimization/core/test_parallel_fitness.py =================\\\
+#======================================================================================\\\
+
+"""
+Tests for the process-pool fitness backend.
+
+The pool must return exactly what ``simulate_system_batch`` returns for the
+same swarm, and ``PSOTuner`` must produce identical fitness values with the
+serial and process backends, with or without streaming cost accumulation.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from src.config import load_config
+from src.controllers.smc.classic_smc import ClassicalSMC
+from src.optimization.algorithms.pso_optimizer import PSOTuner
+from src.optimization.core.parallel_fitness import ProcessFitnessPool
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+from src.simulation.engines.vector_sim import simulate_system_batch
+
+
+_DYNAMICS = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+
+
+def classical_factory(gains):
+    """Module-level factory so the pool can pickle it under any start method."""
+    ctrl = ClassicalSMC(gains, max_force=150.0, boundary_layer=0.02)
+    ctrl.dynamics_model = _DYNAMICS
+    return ctrl
+
+
+classical_factory.n_gains = 6
+classical_factory.controller_type = "classical_smc"
+
+
+def _particles(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.abs(rng.normal([10, 8, 15, 12, 50, 5], [2, 2, 3, 3, 10, 1], size=(n, 6)))
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessFitnessPool(classical_factory, n_workers=2) as p:
+        yield p
+
+
+class TestProcessFitnessPool:
+    def test_matches_serial_batch(self, pool):
+        particles = _particles(7)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            ref = simulate_system_batch(
+                controller_factory=classical_factory, particles=particles,
+                sim_time=0.3, dt=0.001, u_max=150.0, engine="auto",
+            )
+        out = pool.simulate(particles, sim_time=0.3, dt=0.001, u_max=150.0)
+        for a, b in zip(out, ref):
+            np.testing.assert_array_equal(a, b)
+
+    def test_params_list_and_shrinking_batch(self, pool):
+        draws = [None, {"cart_mass": 3.0}]
+        for n in (5, 3):  # second call reuses the larger shared buffers
+            particles = _particles(n, seed=n)
+            ref = simulate_system_batch(
+                controller_factory=classical_factory, particles=particles,
+                sim_time=0.2, dt=0.001, params_list=draws, engine="auto",
+            )
+            out = pool.simulate(particles, sim_time=0.2, dt=0.001, params_list=draws)
+            assert len(out) == len(ref) == 2
+            for res, res_ref in zip(out, ref):
+                for a, b in zip(res, res_ref):
+                    np.testing.assert_array_equal(a, b)
+
+    def test_closed_pool_rejects_work(self):
+        p = ProcessFitnessPool(classical_factory, n_workers=1)
+        p.close()
+        assert p.closed
+        with pytest.raises(RuntimeError):
+            p.simulate(_particles(1), sim_time=0.01, dt=0.001)
+
+
+class TestPSOTunerBackend:
+    @pytest.fixture
+    def config(self):
+        cfg = load_config("config.yaml")
+        sim = cfg.simulation.model_copy(update={"duration": 0.2})
+        return cfg.model_copy(update={"simulation": sim, "physics_uncertainty": None})
+
+    def test_process_backend_matches_serial(self, config):
+        particles = _particles(6)
+        serial = PSOTuner(classical_factory, config=config, seed=0)
+        with PSOTuner(classical_factory, config=config, seed=0,
+                      fitness_backend="process", fitness_workers=2) as tuner:
+            assert tuner.fitness_backend == "process"
+            np.testing.assert_array_equal(tuner._fitness(particles), serial._fitness(particles))
+        assert tuner._fitness_pool is None
+
+    def test_backend_from_config(self, config):
+        pso = config.pso.model_copy(update={"fitness_backend": "process", "fitness_workers": 1})
+        tuner = PSOTuner(classical_factory, config=config.model_copy(update={"pso": pso}))
+        assert (tuner.fitness_backend, tuner.fitness_workers) == ("process", 1)
+        tuner.close()
+
+    def test_unknown_backend_rejected(self, config):
+        with pytest.raises(ValueError):
+            PSOTuner(classical_factory, config=config, fitness_backend="threads")
+
+
+class TestStreamingCost:
+    @pytest.fixture
+    def config(self):
+        cfg = load_config("config.yaml")
+        sim = cfg.simulation.model_copy(update={"duration": 0.5})
+        return cfg.model_copy(update={"simulation": sim, "physics_uncertainty": None})
+
+    @pytest.mark.parametrize("backend", ["serial", "process"])
+    def test_streaming_matches_trajectory_cost(self, config, backend):
+        particles = _particles(6)
+        particles[:2] = 0.1
+        reference = PSOTuner(classical_factory, config=config, seed=0)
+        with PSOTuner(classical_factory, config=config, seed=0, fitness_backend=backend,
+                      fitness_workers=2, streaming_cost=True) as tuner:
+            np.testing.assert_allclose(
+                tuner._fitness(particles), reference._fitness(particles), rtol=1e-12
+            )
+
+    def test_pool_simulate_costs_matches_serial(self, pool):
+        particles = _particles(4)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            ref = simulate_system_batch(
+                controller_factory=classical_factory, particles=particles,
+                sim_time=0.2, dt=0.001, engine="auto", accumulate_cost=True,
+            )
+        acc = pool.simulate_costs(particles, sim_time=0.2, dt=0.001)
+        assert acc.n_steps == ref.n_steps
+        np.testing.assert_array_equal(acc.ise, ref.ise)
+        np.testing.assert_array_equal(acc.failure_steps, ref.failure_steps)
@@ -0,0 +1,112 @@
+#======================================================================================\\\
+#======================= tests/test_plant/core/test_jacobians.py ======================\\\
+#======================================================================================\\\
+
+"""
+Analytic Jacobian Tests.
+
+SINGLE JOB: Test the analytic (A, B) linearization of the plant models.
+- Agreement with central differences of each model's right-hand side
+- Upright equilibrium cache
+- Consumers (MPC linearization, stability analysis)
+"""
+
+import numpy as np
+import pytest
+
+from src.plant.core import finite_difference_jacobian
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+from src.plant.models.full import FullDIPConfig, FullDIPDynamics
+from src.plant.models.lowrank import LowRankDIPConfig, LowRankDIPDynamics
+
+
+def _simplified(fast):
+    dyn = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default(), enable_fast_mode=fast)
+    if fast:
+        rhs = lambda x, u: dyn._compute_fast_dynamics(x, np.array([u]))
+    else:
+        rhs = lambda x, u: dyn.physics.compute_dynamics_rhs(x, np.array([u]))
+    return dyn, rhs
+
+
+def _full():
+    dyn = FullDIPDynamics(FullDIPConfig.create_default())
+    return dyn, lambda x, u: dyn.physics.compute_complete_dynamics_rhs(x, np.array([u]))
+
+
+def _lowrank(**overrides):
+    dyn = LowRankDIPDynamics(LowRankDIPConfig(**overrides))
+    return dyn, lambda x, u: dyn.physics.compute_simplified_dynamics_rhs(x, np.array([u]))
+
+
+MODELS = {
+    "simplified": lambda: _simplified(False),
+    "simplified_fast": lambda: _simplified(True),
+    "full": _full,
+    "lowrank_linearized": lambda: _lowrank(),
+    "lowrank_small_angle": lambda: _lowrank(enable_linearization=False),
+    "lowrank_nonlinear": lambda: _lowrank(enable_linearization=False,
+                                          enable_small_angle_approximation=False),
+}
+
+
+class TestAnalyticJacobian:
+    """Analytic Jacobians match central differences of the model RHS."""
+
+    @pytest.mark.parametrize("name", sorted(MODELS))
+    def test_matches_finite_differences(self, name):
+        dyn, rhs = MODELS[name]()
+        rng = np.random.default_rng(7)
+        for _ in range(5):
+            x = rng.normal(scale=[0.3, 0.6, 0.6, 0.5, 1.0, 1.0])
+            u = float(rng.normal(scale=3.0))
+            A, B = dyn.compute_jacobian(x, u)
+            A_fd, B_fd = finite_difference_jacobian(rhs, x, u)
+            np.testing.assert_allclose(A, A_fd, atol=1e-6)
+            np.testing.assert_allclose(B, B_fd, atol=1e-6)
+
+    def test_upright_jacobian_is_cached(self):
+        dyn, _ = _simplified(False)
+        A1, B1 = dyn.compute_jacobian(np.zeros(6), np.array([0.0]))
+        cached = dyn._upright_jacobian
+        A1[3, 1] = 1e9  # returned matrices are copies
+        A2, B2 = dyn.compute_jacobian(np.zeros(6))
+        assert dyn._upright_jacobian is cached
+        assert A2[3, 1] != 1e9
+        np.testing.assert_array_equal(B1, B2)
+
+    def test_compute_linearization_methods_agree(self):
+        dyn, _ = _simplified(False)
+        state = np.array([0.1, 0.05, -0.05, 0.0, 0.2, 0.0])
+        A, B = dyn.compute_linearization(state, np.array([0.5]))
+        A_fd, B_fd = dyn.compute_linearization(state, np.array([0.5]), method="finite_difference")
+        np.testing.assert_allclose(A, A_fd, atol=1e-4)
+        np.testing.assert_allclose(B, B_fd, atol=1e-4)
+        with pytest.raises(ValueError, match="Unknown linearization method"):
+            dyn.compute_linearization(state, np.array([0.5]), method="bogus")
+
+
+class TestJacobianConsumers:
+    """MPC and stability analysis pick up the analytic Jacobian."""
+
+    def test_mpc_linearization_uses_compute_jacobian(self):
+        from src.controllers.mpc.mpc_controller import _linearize_continuous
+
+        dyn, _ = _full()
+        state = np.array([0.0, 0.1, -0.1, 0.0, 0.3, 0.0])
+        A, B = _linearize_continuous(dyn, state, 1.0)
+        A_ref, B_ref = dyn.compute_jacobian(state, 1.0)
+        np.testing.assert_array_equal(A, A_ref)
+        np.testing.assert_array_equal(B, B_ref)
+
+    def test_stability_analyzer_linearize_model(self):
+        from src.analysis.performance.stability_analysis import StabilityAnalyzer
+
+        dyn, _ = _simplified(False)
+        A, B, C, D = StabilityAnalyzer.linearize_model(dyn)
+        A_ref, B_ref = dyn.compute_jacobian(np.zeros(6))
+        np.testing.assert_array_equal(A, A_ref)
+        np.testing.assert_array_equal(B, B_ref)
+        assert C.shape == (6, 6) and D.shape == (6, 1)
+        # The upright DIP is open-loop unstable
+        assert np.max(np.linalg.eigvals(A).real) > 0
@@ -396,7 +396,7 @@ class TestPhysicsMatricesAndLinearization:
 
             # Should raise ValueError (lines 392-394)
             with pytest.raises(ValueError, match="Cannot linearize"):
-                dynamics.compute_linearization(unstable_state, control)
+                dynamics.compute_linearization(unstable_state, control, method="finite_difference")
 
     def test_linearization_a_matrix_finite_difference(self):
         """Test linearization A matrix computation uses finite differences."""
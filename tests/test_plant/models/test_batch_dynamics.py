@@ -0,0 +1,192 @@
+#======================================================================================\\\
+#===================== tests/test_plant/models/test_batch_dynamics.py =================\\\
+#======================================================================================\\\
+
+"""
+Batched Right-Hand Side Kernel Tests.
+
+SINGLE JOB: Test compute_dynamics_batch against the per-state physics.
+- Agreement with each model's single-state right-hand side
+- Per-row physics parameters
+- Input validation and failure rows
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.plant.models import (
+    MODEL_FULL,
+    MODEL_SIMPLIFIED,
+    compute_dynamics_batch,
+    pack_batch_params,
+)
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+from src.plant.models.full import FullDIPConfig, FullDIPDynamics
+from src.plant.models.lowrank import LowRankDIPConfig, LowRankDIPDynamics
+
+
+def _simplified(fast):
+    dyn = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default(), enable_fast_mode=fast)
+    if fast:
+        rhs = lambda x, u: dyn._compute_fast_dynamics(x, np.array([u]))
+    else:
+        rhs = lambda x, u: dyn.physics.compute_dynamics_rhs(x, np.array([u]))
+    return dyn, rhs
+
+
+def _full():
+    dyn = FullDIPDynamics(FullDIPConfig.create_default())
+    return dyn, lambda x, u: dyn.physics.compute_complete_dynamics_rhs(x, np.array([u]))
+
+
+def _lowrank(**overrides):
+    dyn = LowRankDIPDynamics(LowRankDIPConfig(**overrides))
+    return dyn, lambda x, u: dyn.physics.compute_simplified_dynamics_rhs(x, np.array([u]))
+
+
+MODELS = {
+    "simplified": lambda: _simplified(False),
+    "simplified_fast": lambda: _simplified(True),
+    "full": _full,
+    "lowrank_linearized": lambda: _lowrank(),
+    "lowrank_small_angle": lambda: _lowrank(enable_linearization=False),
+    "lowrank_nonlinear": lambda: _lowrank(enable_linearization=False,
+                                          enable_small_angle_approximation=False),
+}
+
+
+def _batch(n, seed=3):
+    rng = np.random.default_rng(seed)
+    states = rng.normal(scale=[0.3, 0.5, 0.5, 0.5, 1.0, 1.0], size=(n, 6))
+    controls = rng.normal(scale=5.0, size=n)
+    return states, controls
+
+
+class TestComputeDynamicsBatch:
+    """Batched kernels reproduce the single-state physics."""
+
+    @pytest.mark.parametrize("name", sorted(MODELS))
+    def test_matches_single_state_rhs(self, name):
+        dyn, rhs = MODELS[name]()
+        states, controls = _batch(32)
+        out = compute_dynamics_batch(dyn, states, controls)
+        expected = np.array([rhs(x, u) for x, u in zip(states, controls)])
+        assert out.shape == (32, 6)
+        np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+
+    def test_per_row_parameters(self):
+        dyn, _ = _simplified(False)
+        code, row = pack_batch_params(dyn)
+        states, controls = _batch(2)
+        params = np.tile(row, (2, 1))
+        params[1, 0] *= 2.0  # heavier cart on the second row
+
+        out = compute_dynamics_batch(code, states, controls, params)
+
+        heavy = SimplifiedDIPDynamics(replace(
+            SimplifiedDIPConfig.create_default(), cart_mass=2.0 * row[0]))
+        np.testing.assert_allclose(
+            out[1], heavy.physics.compute_dynamics_rhs(states[1], controls[1:2]), rtol=1e-9)
+        np.testing.assert_allclose(
+            out[0], dyn.physics.compute_dynamics_rhs(states[0], controls[0:1]), rtol=1e-9)
+
+    def test_name_code_and_scalar_control(self):
+        dyn, _ = _full()
+        _, row = pack_batch_params(dyn)
+        states, _ = _batch(4)
+        by_name = compute_dynamics_batch("full", states, 1.5, row)
+        by_code = compute_dynamics_batch(MODEL_FULL, states, np.full(4, 1.5), row)
+        np.testing.assert_array_equal(by_name, by_code)
+
+    def test_singular_rows_are_nan(self):
+        dyn, _ = _simplified(False)
+        _, row = pack_batch_params(dyn)
+        params = np.tile(row, (2, 1))
+        params[1, :9] = 0.0  # zero masses and inertias -> singular inertia matrix
+        out = compute_dynamics_batch(MODEL_SIMPLIFIED, np.zeros((2, 6)), 0.0, params)
+        assert np.all(np.isfinite(out[0]))
+        assert np.all(np.isnan(out[1]))
+
+    def test_rejects_bad_inputs(self):
+        dyn, _ = _simplified(False)
+        _, row = pack_batch_params(dyn)
+        with pytest.raises(ValueError, match="Unknown model"):
+            compute_dynamics_batch("bogus", np.zeros((1, 6)), 0.0, row)
+        with pytest.raises(ValueError, match="params"):
+            compute_dynamics_batch(MODEL_SIMPLIFIED, np.zeros((1, 6)), 0.0, row[:5])
+        with pytest.raises(ValueError, match="states"):
+            compute_dynamics_batch(dyn, np.zeros((1, 4)), 0.0)
+        with pytest.raises(ValueError, match="not supported"):
+            pack_batch_params(FullDIPDynamics(replace(
+                FullDIPConfig.create_default(), base_excitation_enabled=True)))
+
+
+class TestTrustedStep:
+    """The compiled trusted step reproduces step() on well-formed inputs."""
+
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_euler_matches_step(self, fast):
+        dyn, _ = _simplified(fast)
+        x = np.array([0.01, 0.1, -0.05, 0.0, 0.2, 0.1])
+        expected = dyn.step(x, 2.0, 0.01)
+        np.testing.assert_allclose(dyn.trusted_step(x, 2.0, 0.01), expected, rtol=1e-12, atol=1e-15)
+
+        dyn.enable_trusted_step()
+        assert dyn.trusted_step_enabled
+        np.testing.assert_allclose(dyn.step(x, 2.0, 0.01), expected, rtol=1e-12, atol=1e-15)
+        dyn.disable_trusted_step()
+        assert not dyn.trusted_step_enabled
+
+    def test_rk4_matches_reference(self):
+        dyn, rhs = _lowrank(enable_linearization=False, enable_small_angle_approximation=False)
+        dyn.enable_trusted_step("rk4")
+        x, u, dt = np.array([0.0, 0.2, -0.1, 0.1, 0.0, 0.3]), 1.0, 0.02
+        k1 = rhs(x, u)
+        k2 = rhs(x + 0.5 * dt * k1, u)
+        k3 = rhs(x + 0.5 * dt * k2, u)
+        k4 = rhs(x + dt * k3, u)
+        expected = x + dt / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+        out = np.empty(6)
+        assert dyn.trusted_step(x, u, dt, out=out) is out
+        np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+    def test_non_finite_result_returns_input(self):
+        dyn, _ = _simplified(False)
+        x = np.array([0.0, 0.1, 0.0, 0.0, 0.0, 0.0])
+        np.testing.assert_array_equal(dyn.trusted_step(x, np.inf, 0.01), x)
+
+    def test_unknown_method(self):
+        dyn, _ = _simplified(False)
+        with pytest.raises(ValueError, match="Unknown trusted step method"):
+            dyn.enable_trusted_step("midpoint")
+
+    def test_runners_accept_trusted_mode(self):
+        from src.controllers.smc.classic_smc import ClassicalSMC
+        from src.simulation.engines.simulation_runner import run_simulation
+        from src.simulation.engines.vector_sim import simulate_system_batch
+
+        dyn, _ = _simplified(False)
+        gains = np.array([10.0, 8.0, 2.0, 2.0, 50.0, 1.0])
+
+        def factory(p):
+            ctrl = ClassicalSMC(p, max_force=150.0, boundary_layer=0.02)
+            ctrl.dynamics_model = dyn
+            return ctrl
+
+        x0 = [0.0, 0.1, -0.05, 0.0, 0.0, 0.0]
+        kwargs = dict(controller_factory=factory, particles=np.tile(gains, (3, 1)),
+                      sim_time=0.2, dt=0.01, initial_state=x0, engine="loop")
+        _, x_ref, _, _ = simulate_system_batch(**kwargs)
+        _, x_fast, _, _ = simulate_system_batch(step_mode="trusted", **kwargs)
+        np.testing.assert_allclose(x_fast, x_ref, rtol=1e-10, atol=1e-12)
+        assert not dyn.trusted_step_enabled
+
+        run = dict(controller=factory(gains), dynamics_model=dyn, sim_time=0.2, dt=0.01,
+                   initial_state=x0)
+        _, x_ref, _ = run_simulation(**run)
+        _, x_fast, _ = run_simulation(step_mode="trusted", **run)
+        np.testing.assert_allclose(x_fast, x_ref, rtol=1e-10, atol=1e-12)
+        with pytest.raises(ValueError, match="Unknown step mode"):
+            run_simulation(step_mode="bogus", **run)
@@ -163,6 +163,21 @@ class TestInertiaMatrixComputation:
         assert not np.allclose(M1, M2)
 
 
+class TestInertiaMatrixBatch:
+    """Test batched inertia matrices match the per-state computation."""
+
+    @pytest.mark.parametrize("matrices_cls", [DIPPhysicsMatrices, SimplifiedDIPPhysicsMatrices])
+    def test_batch_matches_rows(self, matrices_cls):
+        matrices = matrices_cls(MockPhysicsParameters())
+        states = np.random.default_rng(0).normal(size=(8, 6))
+
+        M = matrices.compute_inertia_matrix_batch(states)
+
+        assert M.shape == (8, 3, 3)
+        for b, state in enumerate(states):
+            np.testing.assert_allclose(M[b], matrices.compute_inertia_matrix(state), rtol=1e-14)
+
+
 class TestCoriolisMatrixComputation:
     """Test Coriolis matrix computation."""
 
@@ -17,6 +17,7 @@ from src.plant.core.numerical_stability import (
     NumericalInstabilityError,
     AdaptiveRegularizer,
     MatrixInverter,
+    cofactor_inverse_3x3,
     fast_condition_estimate,
     NumericalStabilityMonitor
 )
@@ -241,6 +242,56 @@ class TestMatrixInverter:
             assert np.all(np.isnan(result))
 
 
+    def test_3x3_solve_uses_closed_form_path(self, inverter):
+        """Well-conditioned 3x3 systems should skip the SVD path."""
+        A = np.array([[3.0, 0.5, 0.2], [0.5, 2.0, 0.3], [0.2, 0.3, 1.0]])
+        b = np.array([1.0, -2.0, 0.5])
+
+        np.testing.assert_allclose(inverter.solve_linear_system(A, b), np.linalg.solve(A, b))
+        np.testing.assert_allclose(inverter.invert_matrix(A), np.linalg.inv(A))
+
+        stats = inverter.get_statistics()
+        assert stats["fast_path_count"] == 2
+        assert stats["fallback_count"] == 0
+
+    def test_3x3_ill_conditioned_falls_back_and_counts(self, inverter):
+        """Matrices failing the cheap check should use the regularized path."""
+        A = np.diag([1.0, 1.0, 1e-15])
+        b = np.array([1.0, 1.0, 1e-15])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            x = inverter.solve_linear_system(A, b)
+
+        assert np.all(np.isfinite(x))
+        assert inverter.fallback_count == 1
+        assert inverter.get_statistics()["fallback_rate"] == 1.0
+
+        inverter.reset_counters()
+        assert inverter.fast_path_count == inverter.fallback_count == 0
+
+
+class TestCofactorInverse3x3:
+    """Test cofactor_inverse_3x3 function."""
+
+    def test_matches_numpy_inverse_and_condition(self):
+        """Should match np.linalg.inv and bound the 2-norm condition number."""
+        rng = np.random.default_rng(0)
+        A = rng.normal(size=(3, 3)) + 3.0 * np.eye(3)
+        inverse = np.empty((3, 3))
+
+        cond = cofactor_inverse_3x3(A, inverse)
+
+        np.testing.assert_allclose(inverse, np.linalg.inv(A), rtol=1e-12)
+        assert np.linalg.cond(A) <= cond <= 3.0 * np.linalg.cond(A)
+
+    def test_singular_matrix_returns_inf(self):
+        """Should report singular or invalid matrices as infinitely conditioned."""
+        inverse = np.empty((3, 3))
+        assert cofactor_inverse_3x3(np.ones((3, 3)), inverse) == np.inf
+        assert cofactor_inverse_3x3(np.full((3, 3), np.nan), inverse) == np.inf
+
+
 # ======================================================================================
 # fast_condition_estimate Tests
 # ======================================================================================
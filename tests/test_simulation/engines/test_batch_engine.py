@@ -0,0 +1,250 @@
+#======================================================================================\\\
+#================= tests/test_simulation/engines/test_batch_engine.py =================\\\
+#======================================================================================\\\
+
+"""
+Tests for the vectorized batch engine.
+
+The compiled engine must reproduce the per-particle loop of
+``simulate_system_batch`` for supported controller/plant combinations and
+refuse everything else so that ``engine="auto"`` can fall back safely.
+"""
+
+import warnings
+
+import pytest
+import numpy as np
+
+try:
+    from src.simulation.engines.vector_sim import simulate_system_batch
+    from src.simulation.engines.batch_engine import build_batch_plan
+    from src.controllers.smc.classic_smc import ClassicalSMC
+    from src.plant.models.simplified import SimplifiedDIPDynamics, SimplifiedDIPConfig
+    IMPORTS_AVAILABLE = True
+except ImportError:
+    IMPORTS_AVAILABLE = False
+
+
+def _make_factory(dyn, **kwargs):
+    params = dict(max_force=150.0, boundary_layer=0.02, boundary_layer_slope=0.5,
+                  hysteresis_ratio=0.1)
+    params.update(kwargs)
+
+    def factory(gains):
+        ctrl = ClassicalSMC(gains, **params)
+        ctrl.dynamics_model = dyn
+        return ctrl
+    return factory
+
+
+def _particles(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.abs(rng.normal([10, 8, 15, 12, 50, 5], [2, 2, 3, 3, 10, 1], size=(n, 6)))
+
+
+def _run(engine, factory, particles, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return simulate_system_batch(
+            controller_factory=factory,
+            particles=particles,
+            sim_time=kwargs.pop("sim_time", 0.5),
+            dt=0.001,
+            initial_state=kwargs.pop("initial_state", [0.0, 0.1, -0.05, 0.0, 0.0, 0.0]),
+            engine=engine,
+            **kwargs,
+        )
+
+
+@pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Batch engine modules not available")
+class TestVectorizedEngineParity:
+    """The vectorized engine matches the reference loop."""
+
+    @pytest.fixture
+    def dynamics(self):
+        return SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+
+    @pytest.mark.parametrize("switch_method", ["tanh", "linear"])
+    def test_matches_loop(self, dynamics, switch_method):
+        factory = _make_factory(dynamics, switch_method=switch_method)
+        particles = _particles(8)
+
+        t_ref, x_ref, u_ref, _ = _run("loop", factory, particles)
+        t, x, u, sigma = _run("vectorized", factory, particles)
+
+        np.testing.assert_array_equal(t, t_ref)
+        np.testing.assert_allclose(x, x_ref, rtol=1e-9, atol=1e-10)
+        np.testing.assert_allclose(u, u_ref, rtol=1e-9, atol=1e-9)
+
+        # Sliding surface is evaluated on the recorded states
+        k1, k2, lam1, lam2 = particles[:, 0], particles[:, 1], particles[:, 2], particles[:, 3]
+        expected = (lam1[:, None] * x[:, :-1, 1] + lam2[:, None] * x[:, :-1, 2]
+                    + k1[:, None] * x[:, :-1, 4] + k2[:, None] * x[:, :-1, 5])
+        np.testing.assert_allclose(sigma, expected, rtol=1e-12, atol=1e-12)
+
+    def test_u_max_override(self, dynamics):
+        factory = _make_factory(dynamics)
+        particles = _particles(4)
+
+        _, x_ref, u_ref, _ = _run("loop", factory, particles, u_max=5.0)
+        _, x, u, _ = _run("vectorized", factory, particles, u_max=5.0)
+
+        assert np.max(np.abs(u)) <= 5.0
+        np.testing.assert_allclose(u, u_ref, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(x, x_ref, rtol=1e-9, atol=1e-10)
+
+    def test_fast_mode_matches_loop(self):
+        dynamics = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default(), enable_fast_mode=True)
+        factory = _make_factory(dynamics)
+        particles = _particles(4)
+
+        _, x_ref, u_ref, _ = _run("loop", factory, particles)
+        _, x, u, _ = _run("vectorized", factory, particles)
+
+        np.testing.assert_allclose(x, x_ref, rtol=1e-9, atol=1e-10)
+        np.testing.assert_allclose(u, u_ref, rtol=1e-9, atol=1e-9)
+
+    def test_params_list_nominal_draws_match(self, dynamics):
+        factory = _make_factory(dynamics)
+        results = _run("vectorized", factory, _particles(3), params_list=[None, None])
+        assert len(results) == 2
+        np.testing.assert_array_equal(results[0][1], results[1][1])
+
+
+@pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Batch engine modules not available")
+class TestPhysicsDraws:
+    """``params_list`` draws are simulated with their own physics."""
+
+    def test_each_draw_matches_dedicated_plant(self):
+        from src.core.dynamics import DIPParams
+
+        nominal = SimplifiedDIPConfig.create_default()
+        heavy = dict(nominal.to_dict(), cart_mass=2.0 * nominal.cart_mass,
+                     joint1_friction=0.05)
+        draws = [
+            DIPParams.from_physics_config(nominal),
+            DIPParams(**{k: heavy[k] for k in (
+                "cart_mass", "pendulum1_mass", "pendulum2_mass", "pendulum1_length",
+                "pendulum2_length", "pendulum1_com", "pendulum2_com", "pendulum1_inertia",
+                "pendulum2_inertia", "gravity", "cart_friction", "joint1_friction",
+                "joint2_friction")}),
+        ]
+        particles = _particles(5)
+        results = _run("vectorized", _make_factory(SimplifiedDIPDynamics(nominal)), particles,
+                       params_list=draws)
+        assert len(results) == 2
+
+        for config, (t, x, u, sigma) in zip(
+            [nominal, SimplifiedDIPConfig.from_dict(heavy)], results
+        ):
+            t_ref, x_ref, u_ref, _ = _run("loop", _make_factory(SimplifiedDIPDynamics(config)), particles)
+            assert x.shape == x_ref.shape
+            np.testing.assert_allclose(x, x_ref, rtol=1e-9, atol=1e-10)
+            np.testing.assert_allclose(u, u_ref, rtol=1e-9, atol=1e-9)
+
+        assert not np.allclose(results[0][1], results[1][1])
+
+    def test_dict_draws_keep_missing_fields(self):
+        from src.simulation.engines.batch_engine import physics_row_from_params
+        from src.plant.models.simplified.physics import PHYSICS_PARAM_FIELDS, pack_physics_params
+
+        base = pack_physics_params(SimplifiedDIPConfig.create_default())
+        row = physics_row_from_params({"gravity": 1.62, "cart_damping": 0.3}, base)
+        expected = base.copy()
+        expected[PHYSICS_PARAM_FIELDS.index("gravity")] = 1.62
+        expected[PHYSICS_PARAM_FIELDS.index("cart_friction")] = 0.3
+        np.testing.assert_array_equal(row, expected)
+
+
+@pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Batch engine modules not available")
+class TestEngineSelection:
+    """Unsupported batches are rejected or routed to the loop."""
+
+    def test_unsupported_controller_rejected(self):
+        class Dummy:
+            dynamics_model = None
+
+        with pytest.raises(ValueError):
+            build_batch_plan([Dummy()])
+
+    def test_patched_step_rejected(self):
+        dyn = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+        dyn.step = lambda state, u, dt: state
+        with pytest.raises(ValueError):
+            build_batch_plan([_make_factory(dyn)(_particles(1)[0])])
+
+    def test_auto_falls_back_to_loop(self):
+        class ConstantController:
+            dynamics_model = None
+
+            def __init__(self, gains):
+                self.gain = float(gains[0])
+
+            def compute_control(self, state, state_vars, history):
+                return (self.gain, state_vars, history)
+
+            def step(self, state, u, dt):
+                return state + dt * u
+
+        result = _run("auto", ConstantController, np.ones((2, 1)), sim_time=0.01)
+        t, x, u, _ = result
+        assert x.shape == (2, 11, 6)
+        np.testing.assert_allclose(u, 1.0)
+
+    def test_unknown_engine(self):
+        dyn = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+        with pytest.raises(ValueError):
+            _run("turbo", _make_factory(dyn), _particles(1))
+
+    def test_loop_without_telemetry(self):
+        dyn = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+        controllers = []
+
+        def factory(gains):
+            controllers.append(_make_factory(dyn)(gains))
+            return controllers[-1]
+
+        reference = _run("loop", _make_factory(dyn), _particles(2), sim_time=0.05)
+        result = _run("loop", factory, _particles(2), sim_time=0.05, telemetry=False)
+
+        for ref, res in zip(reference, result):
+            np.testing.assert_array_equal(ref, res)
+        assert all(len(c._last_history) == 0 for c in controllers)
+
+
+@pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Batch engine modules not available")
+class TestStreamingCost:
+    """``accumulate_cost=True`` reproduces the post-hoc cost integrals."""
+
+    @pytest.mark.parametrize("engine", ["vectorized", "loop"])
+    def test_matches_post_hoc_reduction(self, engine):
+        from src.simulation.engines.cost_accumulation import accumulate_trajectory_costs
+
+        factory = _make_factory(SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default()))
+        particles = _particles(6)
+        particles[:2] = 0.1  # weak gains: the pendulum falls during the run
+        kwargs = dict(sim_time=1.0, initial_state=[0.0, 0.3, -0.2, 0.0, 0.0, 0.0])
+
+        ref = accumulate_trajectory_costs(*_run(engine, factory, particles, **kwargs))
+        acc = _run(engine, factory, particles, accumulate_cost=True, **kwargs)
+
+        assert acc.n_steps == ref.n_steps == 1000
+        assert np.any(ref.failure_steps <= ref.n_steps)
+        np.testing.assert_array_equal(acc.failure_steps, ref.failure_steps)
+        np.testing.assert_array_equal(acc.nonfinite, ref.nonfinite)
+        for name in ("ise", "u_sq", "du_sq", "sigma_sq"):
+            np.testing.assert_allclose(getattr(acc, name), getattr(ref, name), rtol=1e-12, atol=0)
+
+    def test_params_list_draws(self):
+        from src.simulation.engines.cost_accumulation import accumulate_trajectory_costs
+
+        factory = _make_factory(SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default()))
+        particles = _particles(3)
+        draws = [None, {"cart_mass": 3.0}]
+        refs = _run("vectorized", factory, particles, params_list=draws)
+        accs = _run("vectorized", factory, particles, params_list=draws, accumulate_cost=True)
+        assert len(accs) == 2
+        for acc, traj in zip(accs, refs):
+            ref = accumulate_trajectory_costs(*traj)
+            np.testing.assert_allclose(acc.ise, ref.ise, rtol=1e-12)
+            np.testing.assert_allclose(acc.u_sq, ref.u_sq, rtol=1e-12)
@@ -631,20 +631,59 @@ class TestSimulateSystemBatchEdgeCases:
 class TestSimulateEarlyStoppingBatchMode:
     """Test early stopping logic in batch mode (lines 227-235)."""
 
-    def test_early_stopping_batch_mode_any_stops(self):
-        """Test that any batch element stopping triggers early termination."""
-        # Create stop function that stops after 5 steps for one element
+    def test_early_stopping_batch_mode_per_trajectory(self):
+        """Test that a stopping batch element is deactivated while the others continue."""
         def stop_fn(state):
-            return np.sum(state**2) > 0.5  # Will trigger for growing states
+            return np.sum(state**2) > 0.5  # Triggers immediately for the second element
 
-        x0 = np.array([[0.1, 0.0], [10.0, 0.0]])  # Second element will trigger stop
+        x0 = np.array([[0.1, 0.0], [10.0, 0.0]])
         u = np.array([[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
                       [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]])
 
         result = simulate(x0, u, dt=0.1, stop_fn=stop_fn)
 
-        # Should stop early when any batch element meets condition
-        assert result.shape[1] < 11  # Stopped before 10 steps + initial
+        # The first element runs the full horizon; the second holds its state after stopping
+        assert result.shape == (2, 11, 2)
+        assert not np.allclose(result[0, -1], result[0, 1])
+        np.testing.assert_array_equal(result[1, 2:], np.broadcast_to(result[1, 1], (9, 2)))
+
+    def test_early_stopping_batch_mode_all_stop(self):
+        """Test that the output is truncated once every element has stopped."""
+        calls = []
+
+        def stop_mask_fn(states):
+            calls.append(len(states))
+            return np.abs(states[:, 0]) > np.array([0.45, 0.15])[:len(states)]
+
+        x0 = np.array([[0.1, 0.0], [0.1, 0.0]])
+        with patch('src.simulation.engines.vector_sim._step_fn',
+                   side_effect=lambda x, u, dt: x + np.array([0.1, 0.0])):
+            result = simulate(x0, np.zeros((2, 10)), dt=0.1, stop_mask_fn=stop_mask_fn)
+
+        # Element 1 stops after one step, element 0 after four
+        assert result.shape == (2, 5, 2)
+        assert calls == [2, 1, 1, 1]
+        np.testing.assert_allclose(result[1, 1:, 0], 0.2)
+        np.testing.assert_allclose(result[0, :, 0], [0.1, 0.2, 0.3, 0.4, 0.5])
+
+    def test_per_row_bounds_after_a_row_stops(self):
+        """Per-trajectory (B, D) bounds are matched to the rows still live."""
+        x0 = np.zeros((3, 2))
+        upper = np.array([[1.0, 1.0], [1.0, 1.0], [0.35, 1.0]])
+
+        def stop_first(states):
+            # Row 1 stops after the first step; the others run on
+            return np.arange(len(states)) == (1 if len(states) == 3 else -1)
+
+        with patch('src.simulation.engines.vector_sim._step_fn',
+                   side_effect=lambda x, u, dt: x + np.array([0.1, 0.0])):
+            result = simulate(x0, np.zeros((3, 3)), dt=0.1, state_bounds=(None, upper),
+                              stop_mask_fn=stop_first)
+            np.testing.assert_allclose(result[:, -1, 0], [0.3, 0.1, 0.3])
+
+            with pytest.raises(Exception, match="bound"):
+                simulate(x0, np.zeros((3, 5)), dt=0.1, state_bounds=(None, upper),
+                         stop_mask_fn=stop_first)
 
     def test_early_stopping_scalar_mode(self):
         """Test early stopping in scalar mode (lines 232-235)."""
@@ -904,3 +943,78 @@ class TestDynamicsStepExceptions:
         )
         t, x_b, u_b, sigma_b = result
         assert t.shape[0] < 101  # Early termination due to exception
+
+
+class TestSimulateSystemBatchActiveSet:
+    """active_set=True retires particles individually instead of truncating the batch."""
+
+    class _Dynamics:
+        def step(self, x, u, dt):
+            return x + dt * np.array([x[1], u])
+
+    class _Controller:
+        def __init__(self, gains):
+            self.gain = float(gains[0])
+            self.dynamics_model = TestSimulateSystemBatchActiveSet._Dynamics()
+
+        def compute_control(self, x, state_vars, history):
+            if self.gain < 0:
+                raise RuntimeError("controller failure")
+            if self.gain > 100:
+                return np.inf, state_vars, history, 1.0
+            return -self.gain * x[0] - x[1], state_vars, history, x[0]
+
+    def _run(self, particles, **kwargs):
+        return simulate_system_batch(
+            controller_factory=self._Controller, particles=np.array(particles, dtype=float),
+            sim_time=1.0, dt=0.1, initial_state=np.array([1.0, 0.0]), active_set=True, **kwargs
+        )
+
+    def test_failures_end_their_own_trajectories(self):
+        result = self._run([[1.0], [-1.0], [1000.0]])
+
+        np.testing.assert_array_equal(result.lengths, [10, 0, 0])
+        assert [result.get_status(b) for b in range(3)] == ["completed", "failed", "diverged"]
+        assert result.get_states(0).shape == (11, 2)
+        assert result.get_states(1).shape == (1, 2)
+
+    def test_per_particle_convergence(self):
+        result = self._run([[0.1], [20.0]], convergence_tol=0.95)
+
+        assert result.get_status(1) == "converged"
+        assert result.get_status(0) == "completed"
+        assert abs(result.get_extra("sigma", 1)[-1]) < 0.95
+        assert result.lengths[1] < 10
+
+    def test_matches_tuple_output_without_events(self):
+        t, x_b, u_b, sigma_b = simulate_system_batch(
+            controller_factory=self._Controller, particles=np.array([[1.0], [2.0]]),
+            sim_time=1.0, dt=0.1, initial_state=np.array([1.0, 0.0])
+        )
+        result = self._run([[1.0], [2.0]])
+
+        np.testing.assert_allclose(result.get_times(), t)
+        np.testing.assert_allclose(result.get_states(), x_b)
+        np.testing.assert_allclose(result.get_controls(), u_b)
+        np.testing.assert_allclose(result.get_extra("sigma"), sigma_b)
+
+    def test_params_list_returns_independent_copies(self):
+        results = self._run([[1.0]], params_list=[None, None])
+
+        assert len(results) == 2
+        results[0].states[:] = 0.0
+        assert results[1].states[0, 0, 0] == 1.0
+
+    def test_storage_writes_memory_mapped_batch(self, tmp_path):
+        from src.simulation.results import RaggedBatchResultContainer
+
+        result = self._run([[1.0], [-1.0]], storage=tmp_path)
+
+        assert isinstance(result.states, np.memmap)
+        reopened = RaggedBatchResultContainer.open(tmp_path)
+        np.testing.assert_array_equal(reopened.lengths, [10, 0])
+        np.testing.assert_allclose(reopened.get_extra("sigma", 0), result.get_extra("sigma", 0))
+
+    def test_rejects_vectorized_engine(self):
+        with pytest.raises(ValueError, match="active_set"):
+            self._run([[1.0]], engine="vectorized")
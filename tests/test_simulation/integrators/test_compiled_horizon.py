@@ -0,0 +1,149 @@
+# ==============================================================================
+# tests/test_simulation/integrators/test_compiled_horizon.py
+#
+# Tests for the compiled whole-horizon integrators
+#
+# Tests CompiledHorizonIntegrator including:
+# - Agreement of compiled RK4 with the Python RungeKutta4 closed loop
+# - Agreement of compiled DP45 with the Python DormandPrince45 step control
+# - Dense output accuracy on an analytical problem
+# - Truncation on right-hand side failure
+# ==============================================================================
+
+import numpy as np
+import pytest
+from numba import njit
+
+from src.plant.models.simplified import SimplifiedDIPConfig, SimplifiedDIPDynamics
+from src.simulation.integrators import DormandPrince45, RungeKutta4
+from src.simulation.integrators.compiled import (
+    CompiledHorizonIntegrator,
+    compiled_rhs,
+    saturated_linear_feedback
+)
+
+
+GAINS = np.array([2.0, -60.0, 40.0, 3.0, -8.0, 6.0, 50.0])  # K followed by u_max
+X0 = np.array([0.0, 0.1, -0.05, 0.0, 0.0, 0.0])
+
+
+@njit
+def oscillator_rhs(state, u, params, out):
+    out[0] = state[1]
+    out[1] = -params[0] * state[0] + u
+    return True
+
+
+@njit
+def zero_law(t, state, params):
+    return 0.0
+
+
+@pytest.fixture
+def plant():
+    dyn = SimplifiedDIPDynamics(SimplifiedDIPConfig.create_default())
+    rhs, params = compiled_rhs(dyn)
+
+    def dynamics_fn(t, x, u):
+        return dyn.physics.compute_dynamics_rhs(x, u)
+
+    return rhs, params, dynamics_fn
+
+
+def python_law(x):
+    return np.array([saturated_linear_feedback(0.0, x, GAINS)])
+
+
+# ==============================================================================
+# Agreement with the Python Integrators
+# ==============================================================================
+
+class TestAgreementWithPythonIntegrators:
+    """Compiled kernels reproduce the step-by-step Python integrators."""
+
+    def test_rk4_matches_runge_kutta4(self, plant):
+        rhs, params, dynamics_fn = plant
+        dt, n_steps = 0.01, 100
+
+        t, x, u = CompiledHorizonIntegrator("rk4").integrate_horizon(
+            rhs, saturated_linear_feedback, X0, dt, n_steps, params, GAINS
+        )
+
+        rk4 = RungeKutta4()
+        ref = [X0]
+        for i in range(n_steps):
+            ref.append(rk4.integrate(dynamics_fn, ref[-1], python_law(ref[-1]), dt, t=i * dt))
+
+        assert t.shape == (n_steps + 1,) and x.shape == (n_steps + 1, 6) and u.shape == (n_steps,)
+        np.testing.assert_allclose(x, np.array(ref), rtol=1e-10, atol=1e-12)
+
+    def test_dp45_matches_dormand_prince45(self, plant):
+        rhs, params, dynamics_fn = plant
+        dt, n_steps = 0.02, 50
+        integrator = CompiledHorizonIntegrator("dp45", rtol=1e-8, atol=1e-10)
+
+        _, x, _ = integrator.integrate_horizon(
+            rhs, saturated_linear_feedback, X0, dt, n_steps, params, GAINS
+        )
+
+        dp45 = DormandPrince45(rtol=1e-8, atol=1e-10)
+        y, h, ref = X0.copy(), dt, [X0]
+        for i in range(n_steps):
+            u = python_law(y)
+            t, t_end = i * dt, (i + 1) * dt
+            while True:
+                last = h >= t_end - t
+                h_try = t_end - t if last else h
+                result = dp45._adaptive_step(lambda tt, xx: dynamics_fn(tt, xx, u), t, y, h_try)
+                h = result.suggested_dt
+                if result.accepted:
+                    y = result.state
+                    t = t_end if last else t + h_try
+                    if last:
+                        break
+            ref.append(y)
+
+        np.testing.assert_allclose(x, np.array(ref), rtol=1e-8, atol=1e-10)
+        stats = integrator.get_statistics()
+        assert stats["accepted_steps"] >= n_steps
+        assert stats["function_evaluations"] > 6 * n_steps
+
+
+# ==============================================================================
+# Dense Output and Failure Handling
+# ==============================================================================
+
+class TestDenseOutputAndFailures:
+    """Dense output accuracy and truncated trajectories."""
+
+    def test_dense_output_matches_analytical_solution(self):
+        integrator = CompiledHorizonIntegrator("dp45", rtol=1e-9, atol=1e-12, sample_hold=False)
+        t, x, _ = integrator.integrate_horizon(
+            oscillator_rhs, zero_law, np.array([1.0, 0.0]), 0.01, 500, np.array([1.0])
+        )
+        # Adaptive steps are much longer than the grid, so most samples are interpolated
+        assert integrator.get_statistics()["accepted_steps"] < 250
+        np.testing.assert_allclose(x[:, 0], np.cos(t), atol=1e-7)
+        np.testing.assert_allclose(x[:, 1], -np.sin(t), atol=1e-7)
+
+    @pytest.mark.parametrize("method", ["rk4", "dp45"])
+    def test_failed_rhs_truncates_trajectory(self, plant, method):
+        rhs, params, _ = plant
+        bad = params.copy()
+        bad[:9] = 0.0  # singular inertia matrix
+        t, x, u = CompiledHorizonIntegrator(method).integrate_horizon(
+            rhs, saturated_linear_feedback, X0, 0.01, 10, bad, GAINS
+        )
+        assert t.shape == (1,) and x.shape == (1, 6) and u.shape == (0,)
+
+    def test_invalid_arguments(self, plant):
+        rhs, params, _ = plant
+        with pytest.raises(ValueError, match="Unknown method"):
+            CompiledHorizonIntegrator("midpoint")
+        with pytest.raises(ValueError, match="dt must be positive"):
+            CompiledHorizonIntegrator().integrate_horizon(
+                rhs, saturated_linear_feedback, X0, 0.0, 10, params, GAINS)
+        with pytest.raises(ValueError, match="states must have shape"):
+            CompiledHorizonIntegrator().integrate_horizon(
+                rhs, saturated_linear_feedback, X0, 0.01, 10, params, GAINS,
+                states=np.empty((10, 6)))
@@ -24,6 +24,8 @@ import time
 from src.simulation.orchestrators.batch import BatchOrchestrator
 from src.simulation.orchestrators.base import BaseOrchestrator
 from src.simulation.core.simulation_context import SimulationContext
+from src.simulation.safety.guards import BatchSafetyGuard
+from src.simulation.results import RaggedBatchResultContainer
 
 
 # ==============================================================================
@@ -501,28 +503,57 @@ class TestSafetyAndStopConditions:
         for checks in stop_checks_per_timestep:
             assert checks == batch_size
 
+    def test_stop_mask_fn_vectorized_per_row(self, orchestrator):
+        """Test stop_mask_fn sees the (B, D) live rows and deactivates rows individually."""
+        batch_size = 3
+        horizon = 4
+        initial_state = np.zeros((batch_size, 6))
+        initial_state[:, 0] = [0.0, 0.35, 0.45]
+        control_inputs = np.zeros((batch_size, horizon))
+
+        mask_calls = []
+        def stop_mask(states):
+            mask_calls.append(states[:, 0].copy())
+            return states[:, 0] > 0.5
+
+        def increment_state(state, control, dt, **kwargs):
+            return state + np.array([0.1, 0, 0, 0, 0, 0])
+
+        with patch.object(orchestrator, 'step', side_effect=increment_state):
+            orchestrator.execute(
+                initial_state, control_inputs, dt=0.01, horizon=horizon,
+                stop_mask_fn=stop_mask, safety_guards=False
+            )
+
+        # One call per step; each row leaves the live set when it crosses 0.5
+        assert [len(c) for c in mask_calls] == [3, 3, 2, 1]
+        np.testing.assert_allclose(mask_calls[-1], [0.3])
+
     # ------------------------------------------------------------------------
     # Category 5: Safety Guards Integration (5 tests)
     # ------------------------------------------------------------------------
 
-    def test_safety_guards_true_imports_and_calls(self, orchestrator):
-        """Test safety_guards=True imports and calls apply_safety_guards()."""
+    def test_safety_guards_true_checks_batch_once_per_step(self, orchestrator):
+        """Test safety_guards=True evaluates BatchSafetyGuard on the whole batch each step."""
         batch_size = 2
         horizon = 3
         initial_state = np.zeros((batch_size, 6))
         control_inputs = np.zeros((batch_size, horizon))
 
-        mock_apply_guards = Mock()
+        guard_calls = []
+        def track_guard_calls(self, states):
+            guard_calls.append(states.shape)
+            return np.zeros(len(states), dtype=bool)
 
         with patch.object(orchestrator, 'step', return_value=np.zeros(6)):
-            with patch('src.simulation.safety.guards.apply_safety_guards', mock_apply_guards):
+            with patch.object(BatchSafetyGuard, '__call__', track_guard_calls):
                 result = orchestrator.execute(
                     initial_state, control_inputs, dt=0.01, horizon=horizon,
                     safety_guards=True
                 )
 
-        # apply_safety_guards should be called for each step and batch element
-        assert mock_apply_guards.call_count == batch_size * horizon
+        # One vectorized check per step over all live rows
+        assert guard_calls == [(batch_size, 6)] * horizon
 
     def test_safety_guards_false_skips_checks(self, orchestrator):
         """Test safety_guards=False skips guard checks."""
@@ -531,99 +562,94 @@ class TestSafetyAndStopConditions:
         initial_state = np.zeros((batch_size, 6))
         control_inputs = np.zeros((batch_size, horizon))
 
-        mock_apply_guards = Mock()
+        mock_guard = Mock(return_value=np.zeros(batch_size, dtype=bool))
 
         with patch.object(orchestrator, 'step', return_value=np.zeros(6)):
-            with patch('src.simulation.safety.guards.apply_safety_guards', mock_apply_guards):
+            with patch.object(BatchSafetyGuard, '__call__', mock_guard):
                 result = orchestrator.execute(
                     initial_state, control_inputs, dt=0.01, horizon=horizon,
                     safety_guards=False
                 )
 
-        # apply_safety_guards should NOT be called
-        assert mock_apply_guards.call_count == 0
+        # The guard should NOT be evaluated
+        assert mock_guard.call_count == 0
 
-    def test_apply_safety_guards_call_signature(self, orchestrator):
-        """Test apply_safety_guards(current_states[b], i, self.config) call signature."""
-        batch_size = 2
-        horizon = 2
+    def test_guard_receives_live_rows_only(self, orchestrator):
+        """Test deactivated rows are no longer passed to the guard."""
+        batch_size = 3
+        horizon = 3
         initial_state = np.zeros((batch_size, 6))
         control_inputs = np.zeros((batch_size, horizon))
 
-        guard_calls = []
-        def track_guard_calls(state, step_idx, config):
-            guard_calls.append((state.copy(), step_idx, config))
+        guard_shapes = []
+        def flag_first_row_once(self, states):
+            guard_shapes.append(states.shape[0])
+            mask = np.zeros(len(states), dtype=bool)
+            if len(guard_shapes) == 1:
+                mask[0] = True
+            return mask
 
-        with patch.object(orchestrator, 'step', return_value=np.zeros(6)):
-            with patch('src.simulation.safety.guards.apply_safety_guards', side_effect=track_guard_calls):
-                result = orchestrator.execute(
+        with patch.object(orchestrator, 'step', side_effect=lambda s, c, dt, **kw: s):
+            with patch.object(BatchSafetyGuard, '__call__', flag_first_row_once):
+                orchestrator.execute(
                     initial_state, control_inputs, dt=0.01, horizon=horizon,
                     safety_guards=True
                 )
 
-        # Verify call signature: (state, step_index, config)
-        assert len(guard_calls) == batch_size * horizon
-        for state, step_idx, config in guard_calls:
-            assert isinstance(state, np.ndarray)
-            assert isinstance(step_idx, int)
-            assert step_idx < horizon
+        assert guard_shapes == [3, 2, 2]
 
-    def test_exception_in_safety_guards_deactivates(self, orchestrator):
-        """Test exception in apply_safety_guards() sets active_mask[b]=False."""
+    def test_guard_violation_deactivates_row(self, orchestrator):
+        """Test a guard violation sets active_mask[b]=False for that row only."""
         batch_size = 2
         horizon = 5
         initial_state = np.zeros((batch_size, 6))
         control_inputs = np.zeros((batch_size, horizon))
 
-        # Make safety guard fail on first call
-        call_count = [0]
-        def failing_guard(state, step_idx, config):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise RuntimeError("Safety violation")
+        def flag_row_zero(self, states):
+            mask = np.zeros(len(states), dtype=bool)
+            mask[0] = len(states) == batch_size
+            return mask
 
-        step_count = [0]
-        def count_steps(state, control, dt, **kwargs):
-            step_count[0] += 1
+        stepped = []
+        def track_steps(state, control, dt, **kwargs):
+            stepped.append(control.copy())
             return state
 
-        with patch.object(orchestrator, 'step', side_effect=count_steps):
-            with patch('src.simulation.safety.guards.apply_safety_guards', side_effect=failing_guard):
-                result = orchestrator.execute(
+        control_inputs[1] = 1.0
+        with patch.object(orchestrator, 'step', side_effect=track_steps):
+            with patch.object(BatchSafetyGuard, '__call__', flag_row_zero):
+                orchestrator.execute(
                     initial_state, control_inputs, dt=0.01, horizon=horizon,
                     safety_guards=True
                 )
 
-        # First element should fail, second should continue
-        # Expected: first element fails on step 1, second completes 5 steps = 6 total
-        assert step_count[0] >= 5
+        # First element fails before its first step, second completes all 5 steps
+        assert len(stepped) == horizon
+        assert all(c[0] == 1.0 for c in stepped)
 
-    def test_safety_guards_per_batch_element(self, orchestrator):
-        """Test safety guards checked per batch element independently."""
-        batch_size = 4
-        horizon = 3
+    def test_energy_limits_kwarg_deactivates_rows(self, orchestrator):
+        """Test energy_limits/state_bounds kwargs configure the vectorized guard."""
+        batch_size = 3
+        horizon = 4
         initial_state = np.zeros((batch_size, 6))
+        initial_state[1, 0] = 2.0   # energy 4 > 1
+        initial_state[2, 1] = -0.5  # outside lower bound
         control_inputs = np.zeros((batch_size, horizon))
 
-        guard_call_indices = []
-
-        def track_batch_index(state, step_idx, config):
-            # Track which batch element is being checked
-            guard_call_indices.append((step_idx, state[0]))  # Use state[0] as identifier
-
-        # Give each batch element unique initial state
-        for b in range(batch_size):
-            initial_state[b, 0] = b * 0.1
+        stepped = []
+        def track_steps(state, control, dt, **kwargs):
+            stepped.append(state.copy())
+            return state
 
-        with patch.object(orchestrator, 'step', return_value=np.zeros(6)):
-            with patch('src.simulation.safety.guards.apply_safety_guards', side_effect=track_batch_index):
-                result = orchestrator.execute(
-                    initial_state, control_inputs, dt=0.01, horizon=horizon,
-                    safety_guards=True
-                )
+        with patch.object(orchestrator, 'step', side_effect=track_steps):
+            orchestrator.execute(
+                initial_state, control_inputs, dt=0.01, horizon=horizon,
+                energy_limits=1.0, state_bounds=(-0.1, None)
+            )
 
-        # Should check each batch element independently
-        assert len(guard_call_indices) == batch_size * horizon
+        # Only the first element is stepped
+        assert len(stepped) == horizon
+        assert all(np.array_equal(s, initial_state[0]) for s in stepped)
 
 
 # ==============================================================================
@@ -879,6 +905,94 @@ class TestExecutionTracking:
             np.testing.assert_array_almost_equal(states[0], initial_state[b])
 
 
+# ==============================================================================
+# Track D: Active-Set Execution
+# ==============================================================================
+
+class TestActiveSetExecution:
+    """Test active_set=True steps only live rows and returns ragged results."""
+
+    def test_stepped_rows_shrink_as_trajectories_end(self, orchestrator):
+        """Test step_batch receives the compacted live rows each step."""
+        horizon = 5
+        initial_state = np.zeros((4, 6))
+        initial_state[:, 0] = [0.0, 0.25, 0.35, 0.45]
+        control_inputs = np.arange(4 * horizon, dtype=float).reshape(4, horizon)
+
+        batch_sizes = []
+        def step_batch(states, controls, dt, **kwargs):
+            batch_sizes.append(len(states))
+            return states + np.array([0.1, 0, 0, 0, 0, 0])
+
+        with patch.object(orchestrator, 'step_batch', side_effect=step_batch):
+            result = orchestrator.execute(
+                initial_state, control_inputs, dt=0.01, horizon=horizon,
+                stop_mask_fn=lambda x: x[:, 0] > 0.5, safety_guards=False,
+                active_set=True
+            )
+
+        assert batch_sizes == [4, 3, 2, 1, 1]
+        np.testing.assert_array_equal(result.lengths, [5, 3, 2, 1])
+        assert [result.get_status(b) for b in range(4)] == ["completed", "stopped", "stopped", "stopped"]
+        assert result.get_states(3).shape == (2, 6)
+        np.testing.assert_array_equal(result.get_controls(2), control_inputs[2, :2])
+        assert np.isnan(result.get_states()[3, 2:]).all()
+
+    def test_guard_and_divergence_statuses(self, orchestrator):
+        """Test guard violations and non-finite steps end only their own rows."""
+        horizon = 4
+        initial_state = np.zeros((3, 6))
+        initial_state[1, 0] = 2.0  # energy 4 > 1
+        control_inputs = np.zeros((3, horizon))
+        control_inputs[2, 1] = 1.0
+
+        def step_batch(states, controls, dt, **kwargs):
+            next_states = states.copy()
+            next_states[controls > 0] = np.nan
+            return next_states
+
+        with patch.object(orchestrator, 'step_batch', side_effect=step_batch):
+            result = orchestrator.execute(
+                initial_state, control_inputs, dt=0.01, horizon=horizon,
+                energy_limits=1.0, active_set=True
+            )
+
+        np.testing.assert_array_equal(result.lengths, [4, 0, 1])
+        assert [result.get_status(b) for b in range(3)] == ["completed", "guard_violation", "diverged"]
+        assert np.isfinite(result.get_states(2)).all()
+
+    def test_matches_default_path(self, orchestrator):
+        """Test both paths produce the same trajectories when nothing stops."""
+        horizon = 6
+        initial_state = np.random.default_rng(0).normal(size=(3, 6))
+        control_inputs = np.ones((3, horizon))
+
+        def step(state, control, dt, **kwargs):
+            return 0.9 * state + control[0]
+
+        with patch.object(orchestrator, 'step', side_effect=step):
+            dense = orchestrator.execute(initial_state, control_inputs, dt=0.01, horizon=horizon)
+            ragged = orchestrator.execute(initial_state, control_inputs, dt=0.01, horizon=horizon,
+                                          active_set=True)
+
+        for b in range(3):
+            np.testing.assert_allclose(ragged.get_states(b), dense.get_states(b))
+            np.testing.assert_allclose(ragged.get_times(b), dense.get_times(b))
+
+    def test_storage_fills_memory_mapped_result(self, orchestrator, tmp_path):
+        """Test storage= writes the trajectories into memory-mapped arrays."""
+        initial_state = np.zeros((2, 6))
+        control_inputs = np.ones((2, 3))
+
+        with patch.object(orchestrator, 'step', side_effect=lambda s, c, dt, **kw: s + c[0]):
+            result = orchestrator.execute(initial_state, control_inputs, dt=0.01, horizon=3,
+                                          active_set=True, storage=tmp_path)
+
+        assert isinstance(result.states, np.memmap)
+        reopened = RaggedBatchResultContainer.open(tmp_path)
+        np.testing.assert_array_equal(reopened.get_states(1)[:, 0], [0.0, 1.0, 2.0, 3.0])
+
+
 # ==============================================================================
 # Run Tests
 # ==============================================================================
@@ -0,0 +1,110 @@
+#======================================================================================\\\
+#========= tests/test_simulation/orchestrators/test_parallel_orchestrator.py ==========\\\
+#======================================================================================\\\
+
+"""
+Tests for ParallelOrchestrator thread and process modes.
+
+The process mode steps contiguous chunks in lock step and collects them
+through shared memory; its trajectories must match the thread mode (one
+sequential run per trajectory), including per-trajectory early stops.
+"""
+
+import logging
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.simulation.core.simulation_context import SimulationContext
+from src.simulation.orchestrators import ParallelOrchestrator, SequentialOrchestrator
+from src.simulation.orchestrators.parallel import simulate_chunk
+
+
+def stop_when_tilted(state):
+    """Module-level stop predicate so the process pool can pickle it."""
+    return abs(state[1]) > 0.3
+
+
+@pytest.fixture(scope="module")
+def context():
+    logging.disable(logging.INFO)
+    try:
+        yield SimulationContext()
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="module")
+def batch():
+    initial_states = np.zeros((5, 6))
+    initial_states[:, 1] = np.linspace(0.05, 0.25, 5)
+    controls = np.tile(np.linspace(-1.0, 1.0, 5)[:, None], (1, 60))
+    return initial_states, controls
+
+
+def test_invalid_mode_rejected(context):
+    with pytest.raises(ValueError, match="mode"):
+        ParallelOrchestrator(context, mode="gpu")
+
+
+def test_step_batch_matches_step(context, batch):
+    orchestrator = SequentialOrchestrator(context)
+    states, controls = batch[0], batch[1][:, 0]
+    stepped = orchestrator.step_batch(states, controls, 0.01)
+    for b in range(states.shape[0]):
+        expected = orchestrator.step(states[b], controls[b:b+1], 0.01)
+        np.testing.assert_allclose(stepped[b], expected, rtol=0, atol=1e-12)
+
+
+def test_process_mode_matches_thread_mode(context, batch):
+    initial_states, controls = batch
+    kwargs = dict(stop_fn=stop_when_tilted, t0=0.5)
+    threaded = ParallelOrchestrator(context, max_workers=2).execute(
+        initial_states, controls, 0.01, 60, **kwargs)
+    with ParallelOrchestrator(context, max_workers=2, mode="process") as orchestrator:
+        chunked = orchestrator.execute(initial_states, controls, 0.01, 60, **kwargs)
+
+    lengths = []
+    for b in range(initial_states.shape[0]):
+        expected, actual = threaded.get_states(batch_index=b), chunked.get_states(batch_index=b)
+        assert actual.shape == expected.shape
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+        np.testing.assert_array_equal(chunked.get_times(batch_index=b), threaded.get_times(batch_index=b))
+        np.testing.assert_array_equal(chunked.batch_data[b]["controls"],
+                                      threaded.batch_data[b]["controls"])
+        lengths.append(actual.shape[0])
+    # The stop predicate ends the trajectories at different steps
+    assert len(set(lengths)) > 1
+
+
+def test_closed_orchestrator_rejects_process_runs(context, batch):
+    orchestrator = ParallelOrchestrator(context, max_workers=1, mode="process")
+    orchestrator.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        orchestrator.execute(*batch, 0.01, 60)
+
+
+def test_simulate_chunk_deactivates_rows_individually():
+    orchestrator = Mock()
+    orchestrator.config = None
+
+    def step_batch(states, controls, dt, t=0.0):
+        nxt = states + 1.0
+        nxt[states[:, 0] >= 2.0] = np.nan  # row 0 diverges on its third step
+        return nxt
+
+    orchestrator.step_batch.side_effect = step_batch
+    initial = np.array([[0.0, 0.0], [-10.0, 0.0], [0.0, 5.0]])
+    states = np.zeros((3, 6, 2))
+    controls = np.zeros((3, 5))
+    lengths = np.zeros(3, dtype=np.int64)
+    simulate_chunk(orchestrator, initial, np.ones((3, 5)), 0.1, 5, states, controls, lengths,
+                   safety_guards=False, stop_fn=lambda x: x[1] >= 7.0)
+
+    # Row 0 hits NaN, row 2 stops after two steps, row 1 runs the full horizon
+    np.testing.assert_array_equal(lengths, [2, 5, 2])
+    np.testing.assert_array_equal(states[1, :, 0], [-10, -9, -8, -7, -6, -5])
+    np.testing.assert_array_equal(states[0, :3, 0], [0, 1, 2])
+    # Only live rows are passed to step_batch
+    assert [len(call.args[0]) for call in orchestrator.step_batch.call_args_list] == [3, 3, 2, 1, 1]
@@ -0,0 +1,104 @@
+#======================================================================================\\\
+#================== tests/test_simulation/results/test_containers.py ==================\\\
+#======================================================================================\\\
+
+"""Tests for the ragged batch result container."""
+
+import numpy as np
+import pytest
+
+from src.simulation.results import BatchResultContainer, RaggedBatchResultContainer
+
+
+@pytest.fixture
+def ragged():
+    container = RaggedBatchResultContainer(3, 4, 2, times=np.linspace(0.0, 0.4, 5), extras=("sigma",))
+    for b, length in enumerate([4, 2, 0]):
+        states = np.full((length + 1, 2), float(b))
+        container.add_trajectory(states, container.times[:length + 1], batch_index=b,
+                                 controls=np.arange(length, dtype=float), sigma=np.ones(length))
+    container.end_trajectory(2, 0, container.DIVERGED)
+    return container
+
+
+class TestRaggedBatchResultContainer:
+
+    def test_trimmed_views(self, ragged):
+        assert ragged.get_states(1).shape == (3, 2)
+        np.testing.assert_array_equal(ragged.get_times(1), [0.0, 0.1, 0.2])
+        np.testing.assert_array_equal(ragged.get_controls(1), [0.0, 1.0])
+        np.testing.assert_array_equal(ragged.get_extra("sigma", 0), np.ones(4))
+        assert ragged.get_states(2).shape == (1, 2)
+
+    def test_padding_and_status(self, ragged):
+        assert ragged.get_states().shape == (3, 5, 2)
+        assert np.isnan(ragged.get_states()[1, 3:]).all()
+        assert np.isnan(ragged.get_controls()[1, 2:]).all()
+        assert [ragged.get_status(b) for b in range(3)] == ["completed", "stopped", "diverged"]
+
+    def test_batch_data_matches_batch_container_layout(self, ragged):
+        dense = BatchResultContainer()
+        for b in range(ragged.get_batch_count()):
+            dense.add_trajectory(ragged.get_states(b), ragged.get_times(b),
+                                 controls=ragged.get_controls(b), batch_index=b)
+
+        assert ragged.get_batch_count() == dense.get_batch_count()
+        for b in range(3):
+            np.testing.assert_array_equal(ragged.batch_data[b]['states'], dense.get_states(b))
+            np.testing.assert_array_equal(ragged.batch_data[b]['controls'], dense.batch_data[b]['controls'])
+
+    def test_csv_export_writes_one_file_per_trajectory(self, ragged, tmp_path):
+        ragged.export("csv", str(tmp_path / "run.csv"))
+
+        lines = (tmp_path / "run_batch_1.csv").read_text().strip().splitlines()
+        assert lines[0] == "time,state_0,state_1,control"
+        assert len(lines) == 4
+
+    def test_copy_is_independent(self, ragged):
+        other = ragged.copy()
+        other.states[:] = 0.0
+        other.lengths[:] = 0
+        assert ragged.states[1, 0, 0] == 1.0
+        assert ragged.lengths[0] == 4
+
+
+class TestMemoryMappedStorage:
+
+    def test_written_batch_reopens_lazily(self, tmp_path):
+        store = RaggedBatchResultContainer(2, 3, 2, extras=("sigma",), storage=tmp_path / "run")
+        store.add_trajectory(np.ones((4, 2)), store.times, batch_index=0, controls=np.ones(3), sigma=np.zeros(3))
+        store.add_trajectory(np.ones((2, 2)), store.times[:2], batch_index=1, controls=np.ones(1))
+        store.metadata['seed'] = 7
+        store.flush()
+
+        reopened = RaggedBatchResultContainer.open(tmp_path / "run")
+        assert isinstance(reopened.states, np.memmap)
+        np.testing.assert_array_equal(reopened.lengths, [3, 1])
+        assert reopened.get_status(1) == "stopped"
+        assert reopened.get_states(1).shape == (2, 2)
+        np.testing.assert_array_equal(reopened.get_extra("sigma", 0), np.zeros(3))
+        assert reopened.metadata == {'seed': 7}
+        with pytest.raises(ValueError):
+            reopened.states[0, 0, 0] = 0.0
+
+    def test_copy_is_held_in_memory(self, tmp_path):
+        store = RaggedBatchResultContainer(1, 2, 1, storage=tmp_path)
+        other = store.copy()
+        assert other.storage is None
+        assert not isinstance(other.states, np.memmap)
+
+
+class TestBatchResultContainerToRagged:
+
+    def test_packs_trajectories_on_longest_grid(self, tmp_path):
+        dense = BatchResultContainer()
+        times = np.linspace(0.0, 0.3, 4)
+        dense.add_trajectory(np.zeros((4, 2)), times, controls=np.arange(3.0), batch_index=0)
+        dense.add_trajectory(np.ones((2, 2)), times[:2], controls=np.array([5.0]), batch_index=1)
+
+        packed = dense.to_ragged(storage=tmp_path)
+
+        np.testing.assert_array_equal(packed.get_times(), times)
+        np.testing.assert_array_equal(packed.lengths, [3, 1])
+        np.testing.assert_array_equal(packed.get_controls(1), [5.0])
+        assert RaggedBatchResultContainer.open(tmp_path).get_status(0) == "completed"
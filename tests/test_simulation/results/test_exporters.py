@@ -0,0 +1,66 @@
+#======================================================================================\\\
+#================== tests/test_simulation/results/test_exporters.py ===================\\\
+#======================================================================================\\\
+
+"""Tests for CSV and HDF5 result exporters."""
+
+import csv
+
+import numpy as np
+import pytest
+
+from src.simulation.results import CSVExporter, HDF5Exporter, RaggedBatchResultContainer, StandardResultContainer
+
+
+@pytest.fixture
+def ragged():
+    container = RaggedBatchResultContainer(3, 4, 2, times=np.linspace(0.0, 0.4, 5), extras=("sigma",))
+    rng = np.random.default_rng(3)
+    for b, length in enumerate([4, 2, 1]):
+        container.add_trajectory(rng.normal(size=(length + 1, 2)), container.times[:length + 1],
+                                 batch_index=b, controls=rng.normal(size=length),
+                                 sigma=np.ones(length))
+    return container
+
+
+class TestCSVExporter:
+
+    def test_rows_match_values(self, tmp_path):
+        result = StandardResultContainer()
+        result.add_trajectory(np.array([[0.5, 1.0], [0.25, 2.0], [0.125, 3.0]]),
+                              np.array([0.0, 0.1, 0.2]), controls=np.array([1.5, -1.5]))
+        path = tmp_path / "single.csv"
+        CSVExporter().export(result, str(path))
+
+        assert path.read_text().splitlines() == [
+            "time,state_0,state_1,control",
+            "0.0,0.5,1.0,1.5",
+            "0.1,0.25,2.0,-1.5",
+            "0.2,0.125,3.0",
+        ]
+
+    def test_ragged_batch_writes_trimmed_files(self, ragged, tmp_path):
+        CSVExporter().export_batch(ragged, str(tmp_path / "run.csv"))
+
+        for b in range(3):
+            with open(tmp_path / f"run_batch_{b}.csv", newline="") as f:
+                rows = [[float(v) for v in row] for row in list(csv.reader(f))[1:]]
+            np.testing.assert_allclose([row[1:3] for row in rows], ragged.get_states(b))
+            np.testing.assert_allclose([row[3] for row in rows[:-1]], ragged.get_controls(b))
+            assert len(rows[-1]) == 3
+
+
+class TestHDF5Exporter:
+
+    def test_ragged_batch_written_columnar(self, ragged, tmp_path):
+        h5py = pytest.importorskip("h5py")
+        path = tmp_path / "run.h5"
+        HDF5Exporter().export_batch(ragged, str(path))
+
+        with h5py.File(path, "r") as f:
+            assert f.attrs["layout"] == "columnar"
+            assert f["states"].shape == (3, 5, 2)
+            assert f["states"].chunks == (1, 5, 2)
+            np.testing.assert_array_equal(f["lengths"][:], [4, 2, 1])
+            np.testing.assert_array_equal(f["states"][1, :3], ragged.get_states(1))
+            np.testing.assert_array_equal(f["extras/sigma"][0], np.ones(4))
@@ -20,7 +20,8 @@ try:
     from src.simulation.safety.guards import (
         SafetyViolationError, NaNGuard, EnergyGuard, BoundsGuard,
         SafetyGuardManager, guard_no_nan, guard_energy, guard_bounds,
-        apply_safety_guards, create_default_guards
+        apply_safety_guards, create_default_guards,
+        BatchSafetyGuard, rowwise_mask
     )
 
     # Import interfaces
@@ -514,6 +515,61 @@ class TestSafetyGuardIntegration:
         assert not any(isinstance(guard, BoundsGuard) for guard in manager.guards)
 
 
+@pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Safety guard modules not available")
+class TestBatchSafetyGuard:
+    """Test the vectorized (B, D) guard masks."""
+
+    def test_mask_matches_per_state_guards(self):
+        """Each row is flagged exactly when the per-state guards raise."""
+        rng = np.random.default_rng(0)
+        states = rng.normal(scale=1.5, size=(200, 4))
+        states[::17, 2] = np.nan
+        states[5, 0] = np.inf
+        bounds = (np.array([-3.0, -3.0, -3.0, -3.0]), 3.0)
+        guard = BatchSafetyGuard(max_energy=9.0, state_bounds=bounds)
+
+        expected = []
+        for state in states:
+            try:
+                guard_no_nan(state, 0)
+                guard_energy(state, {"max": 9.0})
+                guard_bounds(state, bounds, 0.0)
+                expected.append(False)
+            except SafetyViolationError:
+                expected.append(True)
+
+        mask = guard(states)
+        assert mask.shape == (200,)
+        np.testing.assert_array_equal(mask, expected)
+
+    def test_disabled_sides_and_nan_check(self):
+        """None disables a bound side; check_nan=False ignores non-finite rows."""
+        states = np.array([[-5.0, 0.0], [5.0, 0.0], [np.nan, 0.0]])
+        np.testing.assert_array_equal(BatchSafetyGuard(state_bounds=(None, 1.0))(states), [False, True, True])
+        np.testing.assert_array_equal(BatchSafetyGuard(check_nan=False)(states), [False, False, False])
+        assert not BatchSafetyGuard(check_nan=False).enabled
+
+    def test_from_config_matches_apply_safety_guards(self):
+        """Limits are read from the configuration apply_safety_guards uses."""
+        config = Mock()
+        config.simulation.safety.energy_limits = {"max": 2.0}
+        config.simulation.safety.state_bounds = None
+        guard = BatchSafetyGuard.from_config(config)
+        assert guard.max_energy == 2.0 and guard.lower is None
+
+        # Explicit limits take precedence
+        guard = BatchSafetyGuard.from_config(config, energy_limits=5.0, state_bounds=(-1.0, 1.0))
+        np.testing.assert_array_equal(guard(np.array([[1.5, 0.0], [0.5, 0.5]])), [True, False])
+
+        assert BatchSafetyGuard.from_config({}).max_energy is None
+
+    def test_rowwise_mask_adapts_predicates(self):
+        """A per-state predicate becomes a batch mask."""
+        mask_fn = rowwise_mask(lambda x: x[0] > 1.0)
+        np.testing.assert_array_equal(mask_fn(np.array([[0.0, 5.0], [2.0, 0.0]])), [False, True])
+        assert mask_fn(np.empty((0, 2))).shape == (0,)
+
+
 @pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Safety guard modules not available")
 class TestSafetyGuardPerformance:
     """Test performance characteristics of safety guards."""
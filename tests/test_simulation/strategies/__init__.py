@@ -0,0 +1 @@
+# tests/test_simulation/strategies/__init__.py
@@ -0,0 +1,121 @@
+#======================================================================================\\\
+#================ tests/test_simulation/strategies/test_monte_carlo.py ================\\\
+#======================================================================================\\\
+
+"""
+Tests for MonteCarloStrategy sampling and parallel execution.
+
+Each sample is seeded independently, so the chunked parallel executor must
+reproduce the sequential run exactly, whatever the chunking and completion
+order.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.simulation.strategies import MonteCarloStrategy
+
+
+DISTRIBUTIONS = {
+    'distributions': {
+        'gain': {'type': 'normal', 'mean': 2.0, 'std': 0.5},
+        'offset': {'type': 'uniform', 'low': -1.0, 'high': 1.0},
+        'dt': {'type': 'constant', 'value': 0.01},
+    },
+    'fixed': {'steps': 20},
+}
+
+
+class Trajectory:
+    def __init__(self, states):
+        self.states = states
+
+    def get_states(self):
+        return self.states
+
+
+def noisy_simulation(params):
+    """Stochastic first-order system; fails for large gains."""
+    if params['gain'] > 2.8:
+        raise RuntimeError("unstable")
+    rng = np.random.default_rng(params['seed'])
+    x = np.zeros((params['steps'] + 1, 2))
+    for k in range(params['steps']):
+        x[k + 1, 0] = x[k, 0] + params['dt'] * (params['offset'] - params['gain'] * x[k, 0])
+        x[k + 1, 1] = x[k, 1] + rng.normal(scale=0.1)
+    return Trajectory(x)
+
+
+def run(parallel, **kwargs):
+    strategy = MonteCarloStrategy(n_samples=60, parallel=parallel, seed=7, seed_param='seed', **kwargs)
+    return strategy.analyze(noisy_simulation, DISTRIBUTIONS)
+
+
+def test_parallel_matches_sequential_bit_for_bit():
+    sequential = run(parallel=False)
+    parallel = run(parallel=True, max_workers=3, target_chunk_time=1e-4)
+
+    assert 0.0 < sequential['success_rate'] < 1.0
+    assert parallel['success_rate'] == sequential['success_rate']
+    assert parallel['statistics'] == sequential['statistics']
+    for a, b in zip(parallel['raw_results'], sequential['raw_results']):
+        np.testing.assert_array_equal(a.get_states(), b.get_states())
+
+
+def test_process_mode_matches_sequential():
+    sequential = run(parallel=False)
+    parallel = run(parallel=True, max_workers=2, mode='process')
+    assert parallel['statistics'] == sequential['statistics']
+
+
+def test_master_seed_drawn_from_global_generator():
+    # Without seed_param the simulation only sees sampled and fixed parameters
+    parameters = {**DISTRIBUTIONS, 'fixed': {'steps': 20, 'seed': 0}}
+    analyses = []
+    for _ in range(2):
+        np.random.seed(3)
+        analyses.append(MonteCarloStrategy(n_samples=10, parallel=False).analyze(noisy_simulation, parameters))
+    assert analyses[0]['master_seed'] == analyses[1]['master_seed']
+    assert analyses[0]['statistics'] == analyses[1]['statistics']
+
+
+def test_progress_reports_every_sample_once():
+    calls = []
+    strategy = MonteCarloStrategy(n_samples=40, max_workers=2, seed=1, seed_param='seed',
+                                  progress_callback=lambda *args: calls.append(args))
+    strategy.analyze(noisy_simulation, DISTRIBUTIONS)
+
+    completed = [c[0] for c in calls]
+    assert completed == sorted(completed) and completed[-1] == 40
+    assert all(total == 40 and throughput > 0 for _, total, throughput in calls)
+
+
+def test_chunks_grow_with_measured_cost():
+    strategy = MonteCarloStrategy(target_chunk_time=0.1)
+    assert strategy._chunk_size(None, 100, 4) == 1  # pilot chunk
+    assert strategy._chunk_size(0.01, 100, 4) == 10
+    assert strategy._chunk_size(1e-6, 100, 4) == 25  # even share of the rest
+    assert strategy._chunk_size(1.0, 100, 4) == 1
+
+
+def test_chunk_sizes_adapt_during_run():
+    sizes = []
+
+    def slow_simulation(params):
+        time.sleep(0.002)
+        return noisy_simulation(params)
+
+    strategy = MonteCarloStrategy(n_samples=50, max_workers=2, seed=1, seed_param='seed',
+                                  target_chunk_time=0.02,
+                                  progress_callback=lambda done, *_: sizes.append(done))
+    strategy.analyze(slow_simulation, DISTRIBUTIONS)
+
+    chunks = np.diff([0] + sizes)
+    assert chunks[0] == 1 and chunks.max() > 1
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError, match="mode"):
+        MonteCarloStrategy(mode="gpu")